@@ -0,0 +1 @@
+# API modules for Beamtenrechner NRW
@@ -0,0 +1,131 @@
+"""
+Lasttest für die JSON-API des Beamtenpensions-Rechners NRW
+Öffnet mehrere Keep-Alive-Verbindungen, schickt zufällige Profile an einen
+Endpunkt und misst Latenzen (p50/p99) sowie Anfragen pro Sekunde.
+
+Aufruf (Server muss laufen, siehe api/server.py):
+    python -m api.lasttest [--endpunkt /ruhegehalt] [--verbindungen 64] [--anfragen 5000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from data.besoldung import get_besoldungsgruppen
+
+
+def _zufallsprofil(zufall: random.Random, gruppen: list) -> dict:
+    """Zufälliges Eingabeprofil mit allen Feldern der Endpunkte."""
+    geburtsjahr = zufall.randint(1960, 2000)
+    return {
+        "besoldungsgruppe": zufall.choice(gruppen),
+        "stufe": zufall.randint(1, 12),
+        "geburtsjahr": geburtsjahr,
+        "jahr_verbeamtung": geburtsjahr + zufall.randint(20, 35),
+        "jahr_pension": geburtsjahr + zufall.randint(60, 67),
+        "jahr_du": zufall.randint(2025, 2045),
+        "verheiratet": zufall.random() < 0.5,
+        "anzahl_kinder": zufall.randint(0, 3),
+        "arbeitszeit_faktor": zufall.choice([1.0, 0.8, 0.5]),
+        "brutto_monatlich": round(zufall.uniform(2500, 9000), 2),
+        "steuerklasse": zufall.choice([1, 3, 4, 5]),
+    }
+
+
+async def _client(host: str, port: int, endpunkt: str, bodies: list, latenzen: list, fehler: list):
+    """Eine Keep-Alive-Verbindung, die ihre Anfragen nacheinander abarbeitet."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            writer.write(
+                f"POST {endpunkt} HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1")
+                + body
+            )
+            await writer.drain()
+
+            status = int((await reader.readline()).split()[1])
+            laenge = 0
+            while True:
+                zeile = await reader.readline()
+                if zeile in (b"\r\n", b""):
+                    break
+                name, _, wert = zeile.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    laenge = int(wert)
+            await reader.readexactly(laenge)
+
+            latenzen.append(time.perf_counter() - start)
+            if status != 200:
+                fehler.append(status)
+    finally:
+        writer.close()
+
+
+def _perzentil(werte: list, p: float) -> float:
+    """Perzentil einer sortierten Liste (nächster Rang)."""
+    index = min(len(werte) - 1, max(0, int(round(p / 100 * len(werte) + 0.5)) - 1))
+    return werte[index]
+
+
+async def fuehre_lasttest_aus(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    endpunkt: str = "/ruhegehalt",
+    verbindungen: int = 64,
+    anfragen: int = 5000,
+    seed: int = 42
+) -> dict:
+    """
+    Führt den Lasttest aus.
+
+    Returns:
+        Dictionary mit Anfragen, Fehlern, Dauer, Anfragen pro Sekunde und
+        Latenzen (p50/p99/max in Millisekunden)
+    """
+    zufall = random.Random(seed)
+    gruppen = get_besoldungsgruppen()
+    bodies = [json.dumps(_zufallsprofil(zufall, gruppen)).encode("utf-8") for _ in range(anfragen)]
+
+    latenzen = []
+    fehler = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, endpunkt, bodies[i::verbindungen], latenzen, fehler)
+        for i in range(verbindungen)
+    ))
+    dauer = time.perf_counter() - start
+
+    latenzen.sort()
+    return {
+        "anfragen": len(latenzen),
+        "fehler": len(fehler),
+        "dauer_s": round(dauer, 3),
+        "anfragen_pro_sekunde": round(len(latenzen) / dauer, 1),
+        "p50_ms": round(_perzentil(latenzen, 50) * 1000, 2),
+        "p99_ms": round(_perzentil(latenzen, 99) * 1000, 2),
+        "max_ms": round(latenzen[-1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lasttest für die Beamtenrechner-API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--endpunkt", default="/ruhegehalt")
+    parser.add_argument("--verbindungen", type=int, default=64)
+    parser.add_argument("--anfragen", type=int, default=5000)
+    args = parser.parse_args()
+
+    ergebnis = asyncio.run(fuehre_lasttest_aus(
+        args.host, args.port, args.endpunkt, args.verbindungen, args.anfragen
+    ))
+    for name, wert in ergebnis.items():
+        print(f"{name:>22}: {wert}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Lokale JSON-HTTP-API für den Beamtenpensions-Rechner NRW
+Stellt Gehalt, Netto, Ruhegehalt, DU-Rente und Zeitreihen als JSON-Endpunkte
+bereit (asyncio, HTTP/1.1 mit Keep-Alive, ohne weitere Abhängigkeiten).
+
+Gleichzeitig eintreffende Anfragen an denselben Endpunkt werden für wenige
+Millisekunden gesammelt und gemeinsam als ein vektorisierter Batch über
+calculator/batch.py berechnet.
+
+Endpunkte (POST, Body = JSON-Objekt oder Liste von Objekten):
+    /gehalt, /netto, /ruhegehalt, /du-rente,
+    /du-entwicklung (Option jahre_voraus),
+    /pension-nach-alter (Optionen von_alter, bis_alter)
+    GET /health
+
+Aufruf:
+    python -m api.server [--host 127.0.0.1] [--port 8080]
+"""
+
+import argparse
+import asyncio
+import json
+from functools import partial
+
+from calculator.batch import (
+    berechne_gehalt_batch,
+    berechne_netto_batch,
+    berechne_ruhegehalt_batch,
+    berechne_du_rente_batch,
+    berechne_du_entwicklung_batch,
+    berechne_pension_nach_alter_batch,
+    GEHALT_FELDER,
+    NETTO_FELDER,
+    RUHEGEHALT_FELDER,
+    DU_RENTE_FELDER,
+    DU_ENTWICKLUNG_FELDER,
+    PENSION_NACH_ALTER_FELDER
+)
+from calculator.eingaben import pruefe_eintraege
+
+
+# Sammelfenster für Micro-Batching in Sekunden
+SAMMEL_WARTEZEIT = 0.002
+
+# Maximale Anzahl Einträge pro Batch
+MAX_BATCH_GROESSE = 512
+
+# Maximale Größe eines Request-Bodys in Bytes
+MAX_BODY_GROESSE = 1024 * 1024
+
+# Endpunkt -> (Batch-Funktion, Eingabefelder, erlaubte Optionen mit Standardwerten)
+ENDPUNKTE = {
+    "/gehalt": (berechne_gehalt_batch, GEHALT_FELDER, {}),
+    "/netto": (berechne_netto_batch, NETTO_FELDER, {}),
+    "/ruhegehalt": (berechne_ruhegehalt_batch, RUHEGEHALT_FELDER, {}),
+    "/du-rente": (berechne_du_rente_batch, DU_RENTE_FELDER, {}),
+    "/du-entwicklung": (berechne_du_entwicklung_batch, DU_ENTWICKLUNG_FELDER, {"jahre_voraus": 30}),
+    "/pension-nach-alter": (
+        berechne_pension_nach_alter_batch, PENSION_NACH_ALTER_FELDER, {"von_alter": 60, "bis_alter": 67}
+    ),
+}
+
+STATUS_TEXTE = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class _Sammler:
+    """
+    Sammelt Einträge für eine Batch-Funktion und berechnet sie gemeinsam.
+
+    Der erste Eintrag startet das Sammelfenster; ist es abgelaufen oder die
+    maximale Batch-Größe erreicht, wird der Batch einmal geprüft und
+    berechnet. Jede wartende Anfrage erhält ihr Ergebnis; ungültige Einträge
+    erhalten ihre Fehlermeldung, ohne die übrigen aufzuhalten.
+    """
+
+    def __init__(self, funktion, felder: tuple, wartezeit: float, max_groesse: int):
+        self.funktion = funktion
+        self.felder = felder
+        self.wartezeit = wartezeit
+        self.max_groesse = max_groesse
+        self._eintraege = []
+        self._futures = []
+        self._timer = None
+        self.batches = 0
+        self.eintraege_gesamt = 0
+
+    async def berechne(self, eintraege: list) -> list:
+        """Reiht Einträge ein und wartet auf deren Ergebnisse."""
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in eintraege]
+        self._eintraege.extend(eintraege)
+        self._futures.extend(futures)
+
+        if len(self._eintraege) >= self.max_groesse:
+            self._ausfuehren()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.wartezeit, self._ausfuehren)
+        return await asyncio.gather(*futures)
+
+    def _ausfuehren(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        eintraege, self._eintraege = self._eintraege, []
+        futures, self._futures = self._futures, []
+        if not eintraege:
+            return
+        self.batches += 1
+        self.eintraege_gesamt += len(eintraege)
+
+        try:
+            # Ungültige Einträge bekommen ihre Meldung, gerechnet wird nur der Rest
+            eingaben = pruefe_eintraege(eintraege, self.felder)
+            for zeile, meldung in eingaben.get_fehler_je_zeile().items():
+                futures[zeile].set_exception(ValueError(meldung))
+
+            ergebnisse = self.funktion(eingaben)
+            for zeile, ergebnis in zip(eingaben.zeilen.tolist(), ergebnisse):
+                futures[zeile].set_result(ergebnis)
+        except (ValueError, TypeError) as fehler:
+            # z.B. ungültige Optionen: betrifft alle noch offenen Einträge
+            self._abbrechen(futures, ValueError(str(fehler)))
+        except Exception as fehler:
+            # Unerwartete Fehler dürfen keine Anfrage hängen lassen
+            self._abbrechen(futures, fehler)
+
+    @staticmethod
+    def _abbrechen(futures: list, fehler: Exception):
+        for future in futures:
+            if not future.done():
+                future.set_exception(fehler)
+
+
+class RechnerServer:
+    """
+    HTTP-Server mit je einem Sammler pro Endpunkt und Optionssatz.
+
+    Args:
+        wartezeit: Sammelfenster in Sekunden (0 = kein Micro-Batching)
+        max_batch_groesse: Maximale Einträge pro Batch
+    """
+
+    def __init__(self, wartezeit: float = SAMMEL_WARTEZEIT, max_batch_groesse: int = MAX_BATCH_GROESSE):
+        self.wartezeit = wartezeit
+        self.max_batch_groesse = max_batch_groesse
+        self._sammler = {}
+        self.anfragen = 0
+
+    def _get_sammler(self, pfad: str, optionen: dict) -> _Sammler:
+        schluessel = (pfad, tuple(sorted(optionen.items())))
+        sammler = self._sammler.get(schluessel)
+        if sammler is None:
+            funktion, felder, _ = ENDPUNKTE[pfad]
+            sammler = _Sammler(partial(funktion, **optionen), felder, self.wartezeit, self.max_batch_groesse)
+            self._sammler[schluessel] = sammler
+        return sammler
+
+    def _statistik(self) -> dict:
+        batches = sum(s.batches for s in self._sammler.values())
+        eintraege = sum(s.eintraege_gesamt for s in self._sammler.values())
+        return {
+            "status": "ok",
+            "anfragen": self.anfragen,
+            "batches": batches,
+            "eintraege": eintraege,
+            "mittlere_batch_groesse": round(eintraege / batches, 2) if batches else 0,
+        }
+
+    async def _bearbeite(self, methode: str, pfad: str, body: bytes) -> tuple:
+        """
+        Bearbeitet eine Anfrage.
+
+        Returns:
+            Tuple (HTTP-Status, JSON-serialisierbare Antwort)
+        """
+        if pfad == "/health":
+            return 200, self._statistik()
+        if pfad not in ENDPUNKTE:
+            return 404, {"fehler": f"Endpunkt {pfad} nicht gefunden"}
+        if methode != "POST":
+            return 405, {"fehler": f"Methode {methode} nicht erlaubt"}
+
+        try:
+            daten = json.loads(body or b"null")
+        except ValueError:
+            return 400, {"fehler": "Ungültiges JSON"}
+
+        ist_liste = isinstance(daten, list)
+        eintraege = daten if ist_liste else [daten]
+        if not eintraege or not all(isinstance(e, dict) for e in eintraege):
+            return 400, {"fehler": "Erwartet JSON-Objekt oder Liste von Objekten"}
+
+        # Optionen (z.B. jahre_voraus) gelten pro Anfrage und bestimmen den Sammler
+        standard_optionen = ENDPUNKTE[pfad][2]
+        optionen = {}
+        for name, standard in standard_optionen.items():
+            werte = [e.pop(name, standard) for e in eintraege]
+            wert = werte[0]
+            if any(w != wert for w in werte):
+                return 400, {"fehler": f"Option {name} muss für alle Einträge gleich sein"}
+            if not isinstance(wert, int) or isinstance(wert, bool):
+                return 400, {"fehler": f"Option {name} muss eine ganze Zahl sein"}
+            optionen[name] = wert
+
+        self.anfragen += 1
+        try:
+            ergebnisse = await self._get_sammler(pfad, optionen).berechne(eintraege)
+        except ValueError as fehler:
+            return 400, {"fehler": str(fehler)}
+        except Exception as fehler:
+            return 500, {"fehler": f"Interner Fehler: {type(fehler).__name__}"}
+        return 200, ergebnisse if ist_liste else ergebnisse[0]
+
+    async def verbindung(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Bedient eine (Keep-Alive-)Verbindung bis zum Schließen."""
+        try:
+            while True:
+                anfrage_zeile = await reader.readline()
+                if not anfrage_zeile:
+                    break
+                try:
+                    methode, ziel, version = anfrage_zeile.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                kopfzeilen = {}
+                while True:
+                    zeile = await reader.readline()
+                    if zeile in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, wert = zeile.decode("latin-1").partition(":")
+                    kopfzeilen[name.strip().lower()] = wert.strip()
+
+                try:
+                    laenge = int(kopfzeilen.get("content-length", 0) or 0)
+                except ValueError:
+                    laenge = -1
+                if laenge < 0:
+                    status, antwort = 400, {"fehler": "Ungültige Content-Length"}
+                    offen = False
+                elif laenge > MAX_BODY_GROESSE:
+                    status, antwort = 413, {"fehler": "Anfrage zu groß"}
+                    offen = False
+                else:
+                    body = await reader.readexactly(laenge) if laenge else b""
+                    status, antwort = await self._bearbeite(methode, ziel.split("?", 1)[0], body)
+                    verbindung_kopf = kopfzeilen.get("connection", "").lower()
+                    offen = verbindung_kopf != "close" and (version == "HTTP/1.1" or verbindung_kopf == "keep-alive")
+
+                inhalt = json.dumps(antwort, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXTE[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(inhalt)}\r\n"
+                    f"Connection: {'keep-alive' if offen else 'close'}\r\n\r\n".encode("latin-1")
+                    + inhalt
+                )
+                await writer.drain()
+                if not offen:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def starte_server(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    wartezeit: float = SAMMEL_WARTEZEIT,
+    max_batch_groesse: int = MAX_BATCH_GROESSE
+) -> asyncio.AbstractServer:
+    """
+    Startet den API-Server.
+
+    Returns:
+        Laufender asyncio-Server
+    """
+    server = RechnerServer(wartezeit, max_batch_groesse)
+    return await asyncio.start_server(server.verbindung, host, port)
+
+
+async def _main_async(args):
+    server = await starte_server(args.host, args.port, args.wartezeit / 1000, args.max_batch)
+    print(f"Beamtenrechner-API auf http://{args.host}:{args.port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON-API für den Beamtenpensions-Rechner NRW")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--wartezeit", type=float, default=SAMMEL_WARTEZEIT * 1000,
+                        help="Sammelfenster in Millisekunden (0 = aus)")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH_GROESSE)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_main_async(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,49 @@ Streamlit-Hauptanwendung für die Berechnung von Beamtenpensionen und Dienstunf
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 import datetime
 import sys
 import os
+import time
+from io import BytesIO, StringIO
 
 # Projektpfad hinzufügen
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from data.besoldung import get_besoldungsgruppen, get_max_stufe, get_min_stufe
 from data.familienzuschlag import STANDARD_MIETENSTUFE
-from calculator.gehalt import berechne_bruttogehalt
-from calculator.steuer import berechne_netto
-from calculator.pension import berechne_ruhegehalt, berechne_pension_nach_alter
-from calculator.dienstunfaehigkeit import berechne_du_rente
+from calculator.stichtag import get_aktuelles_jahr
+from calculator.familie import KINDERGELD_MONATLICH
+from calculator.kennfeld import berechne_pension_kennfeld, berechne_du_kennfeld
+from calculator.steuer import berechne_netto_pension
+from calculator.befoerderung import (
+    optimiere_befoerderungen,
+    MINDESTDAUER_RUHEGEHALTSFAEHIG,
+    ZIEL_LEBENSEINKOMMEN,
+    ZIEL_RUHEGEHALT
+)
+from export.formatierung import format_euro as fmt_euro
+from ui.rechengraph import RECHENGRAPH
+from ui.diagramme import (
+    diagramm_versorgungsluecke,
+    diagramm_du_szenarien,
+    diagramm_pensionsluecke,
+    diagramm_pensionsluecke_verlauf,
+    diagramm_pensionsentwicklung,
+    diagramm_vergleich,
+    diagramm_kennfeld,
+    diagramm_befoerderungsjahr
+)
+from diagnose import instrumentierung
+from diagnose.instrumentierung import messung
+
+# Diagnose nur serverseitig über BEAMTENRECHNER_PROFILING=1: die
+# Instrumentierung wird beim Import von diagnose.instrumentierung für den
+# ganzen Prozess eingeschaltet; jeder Lauf sammelt seine eigenen Messwerte
+DIAGNOSE_AKTIV = os.environ.get(instrumentierung.UMGEBUNGSVARIABLE) == "1"
+if DIAGNOSE_AKTIV:
+    diagnose_lauf = instrumentierung.starte_lauf()
+    diagnose_start = time.perf_counter()
 
 # Pfad zum Favicon
 FAVICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "favicon.png")
@@ -113,7 +142,7 @@ st.sidebar.markdown("### Eingabedaten")
 
 # 1. Persönliche Daten
 st.sidebar.markdown("## Persönliche Daten")
-aktuelles_jahr = datetime.datetime.now().year
+aktuelles_jahr = get_aktuelles_jahr()
 
 geburtsjahr = st.sidebar.number_input(
     "Geburtsjahr",
@@ -235,61 +264,43 @@ du_szenario_jahr = st.sidebar.number_input(
 )
 
 
-# Berechnungen durchführen
-gehalt = berechne_bruttogehalt(
-    besoldungsgruppe=besoldungsgruppe,
-    stufe=stufe,
-    verheiratet=verheiratet,
-    anzahl_kinder=anzahl_kinder,
-    mietenstufe=mietenstufe,
-    arbeitszeit_faktor=arbeitszeit_faktor
-)
-
-netto_daten = berechne_netto(
-    brutto_monatlich=gehalt["brutto"],
-    steuerklasse=steuerklasse,
-    kirchensteuer=kirchensteuer,
-    pkv_beitrag=pkv_beitrag
+# Berechnungen durchführen (nur Knoten mit geänderten Eingaben werden neu berechnet)
+lebenserwartung = 85  # statistische Lebenserwartung für Gesamtlücken
+rechnung = RECHENGRAPH.lauf(
+    {
+        "besoldungsgruppe": besoldungsgruppe,
+        "stufe": stufe,
+        "geburtsjahr": geburtsjahr,
+        "jahr_verbeamtung": jahr_verbeamtung,
+        "verheiratet": verheiratet,
+        "anzahl_kinder": anzahl_kinder,
+        "mietenstufe": mietenstufe,
+        "steuerklasse": steuerklasse,
+        "kirchensteuer": kirchensteuer,
+        "pkv_beitrag": pkv_beitrag,
+        "teilzeitjahre": teilzeitjahre,
+        "teilzeitanteil": teilzeitanteil,
+        "arbeitszeit_faktor": arbeitszeit_faktor,
+        "ist_polizei_feuerwehr": ist_polizei_feuerwehr,
+        "gewuenschtes_pensionsalter": gewuenschtes_pensionsalter,
+        "du_szenario_jahr": du_szenario_jahr,
+        "aktuelles_jahr": aktuelles_jahr,
+        "regelaltersgrenze": regelaltersgrenze,
+        "lebenserwartung": lebenserwartung,
+    },
+    st.session_state
 )
 
+gehalt = rechnung["gehalt"]
+netto_daten = rechnung["netto_daten"]
 jahr_pension = geburtsjahr + gewuenschtes_pensionsalter
-pension = berechne_ruhegehalt(
-    besoldungsgruppe=besoldungsgruppe,
-    stufe=stufe,
-    geburtsjahr=geburtsjahr,
-    jahr_verbeamtung=jahr_verbeamtung,
-    jahr_pension=jahr_pension,
-    verheiratet=verheiratet,
-    mietenstufe=mietenstufe,
-    teilzeitjahre=teilzeitjahre,
-    teilzeitanteil=teilzeitanteil,
-    arbeitszeit_faktor=arbeitszeit_faktor,
-    ist_polizei_feuerwehr=ist_polizei_feuerwehr
-)
-
-du_rente = berechne_du_rente(
-    besoldungsgruppe=besoldungsgruppe,
-    stufe=stufe,
-    geburtsjahr=geburtsjahr,
-    jahr_verbeamtung=jahr_verbeamtung,
-    jahr_du=du_szenario_jahr,
-    verheiratet=verheiratet,
-    mietenstufe=mietenstufe,
-    teilzeitjahre=teilzeitjahre,
-    teilzeitanteil=teilzeitanteil,
-    arbeitszeit_faktor=arbeitszeit_faktor,
-    ist_polizei_feuerwehr=ist_polizei_feuerwehr
-)
+pension = rechnung["pension"]
+du_rente = rechnung["du_rente"]
 
 versorgungsluecke = gehalt["brutto"] - du_rente["du_rente_brutto"]
 
 # Kindergeld berechnen (nur zur Info, nicht im Netto enthalten)
-KINDERGELD_PRO_KIND = 259.0  # Stand 2026
-kindergeld_gesamt = anzahl_kinder * KINDERGELD_PRO_KIND
-
-# Hilfsfunktion für Euro-Formatierung
-def fmt_euro(betrag):
-    return f"{betrag:,.2f} €".replace(",", "X").replace(".", ",").replace("X", ".")
+kindergeld_gesamt = anzahl_kinder * KINDERGELD_MONATLICH
 
 # Hauptbereich - Ergebnisse
 st.markdown("## Übersicht")
@@ -346,7 +357,16 @@ with col4:
 # Versorgungslücke
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
-with st.expander("Versorgungslücke bei Dienstunfähigkeit", expanded=True):
+@st.fragment
+def zeige_versorgungsluecke_du(gehalt: dict, du_rente: dict, versorgungsluecke: float, regelaltersgrenze: int, du_szenario_jahr: int):
+    """
+    Versorgungslücke und Absicherungsbedarf bei DU.
+
+    Läuft als Fragment: Die Slider für Absicherung und Inflation führen nur
+    diesen Block erneut aus und verwenden die bereits berechneten Werte
+    (beim Fragment-Rerun übergibt Streamlit die Argumente des letzten
+    vollständigen Durchlaufs), statt das ganze Skript neu zu rechnen.
+    """
     # Absicherungs-Einstellungen
     col_slider1, col_slider2 = st.columns(2)
     with col_slider1:
@@ -410,27 +430,7 @@ with st.expander("Versorgungslücke bei Dienstunfähigkeit", expanded=True):
             st.success("Keine Versorgungslücke - DU-Rente deckt das aktuelle Brutto.")
 
     with col_vl2:
-        fig_luecke = go.Figure()
-
-        fig_luecke.add_trace(go.Bar(
-            x=["Brutto", "DU-Rente"],
-            y=[gehalt["brutto"], du_rente["du_rente_brutto"]],
-            marker_color=["#2e7d32", "#c62828"],
-            text=[fmt_euro(gehalt["brutto"]), fmt_euro(du_rente["du_rente_brutto"])],
-            textposition="inside",
-            textfont=dict(color="white", size=11)
-        ))
-
-        fig_luecke.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin=dict(l=20, r=20, t=30, b=20),
-            height=200,
-            yaxis=dict(showgrid=True, gridwidth=1),
-            xaxis=dict(showgrid=False),
-            showlegend=False
-        )
-
+        fig_luecke = diagramm_versorgungsluecke(gehalt["brutto"], du_rente["du_rente_brutto"])
         st.plotly_chart(fig_luecke, use_container_width=True, theme="streamlit")
 
     # Absicherungsbedarf
@@ -456,38 +456,14 @@ with st.expander("Versorgungslücke bei Dienstunfähigkeit", expanded=True):
             delta=None
         )
 
+
+with st.expander("Versorgungslücke bei Dienstunfähigkeit", expanded=True), messung("app.du_luecke"):
+    zeige_versorgungsluecke_du(gehalt, du_rente, versorgungsluecke, regelaltersgrenze, du_szenario_jahr)
+
     # Schnell-Vergleich: DU jetzt vs. in 10/20 Jahren
     st.markdown("### Szenarien-Vergleich")
 
-    # Berechne DU für verschiedene Zeitpunkte
-    from calculator.dienstunfaehigkeit import berechne_du_rente as calc_du
-
-    szenarien = []
-    for jahre_offset in [0, 5, 10, 15, 20]:
-        if aktuelles_alter + jahre_offset < regelaltersgrenze:
-            szenario_jahr = aktuelles_jahr + jahre_offset
-            szenario_du = calc_du(
-                besoldungsgruppe=besoldungsgruppe,
-                stufe=stufe,
-                geburtsjahr=geburtsjahr,
-                jahr_verbeamtung=jahr_verbeamtung,
-                jahr_du=szenario_jahr,
-                verheiratet=verheiratet,
-                mietenstufe=mietenstufe,
-                teilzeitjahre=teilzeitjahre,
-                teilzeitanteil=teilzeitanteil,
-                arbeitszeit_faktor=arbeitszeit_faktor,
-                ist_polizei_feuerwehr=ist_polizei_feuerwehr
-            )
-            szenarien.append({
-                "jahre": jahre_offset,
-                "jahr": szenario_jahr,
-                "alter": aktuelles_alter + jahre_offset,
-                "du_rente": szenario_du['du_rente_brutto'],
-                "hat_anspruch": szenario_du.get('hat_anspruch', True),
-                "luecke": gehalt['brutto'] - szenario_du['du_rente_brutto'] if szenario_du.get('hat_anspruch', True) else gehalt['brutto'],
-                "jahre_bis_pension": regelaltersgrenze - (aktuelles_alter + jahre_offset)
-            })
+    szenarien = rechnung["du_szenarien"]
 
     if szenarien:
         col_sz1, col_sz2 = st.columns([1, 2])
@@ -503,56 +479,21 @@ with st.expander("Versorgungslücke bei Dienstunfähigkeit", expanded=True):
 
         with col_sz2:
             # Timeline-Chart
-            fig_timeline = go.Figure()
-
-            jahre_labels = [f"+{s['jahre']}J ({s['alter']})" for s in szenarien]
-            du_werte = [s['du_rente'] if s['hat_anspruch'] else 0 for s in szenarien]
-            luecke_werte = [s['luecke'] for s in szenarien]
-
-            fig_timeline.add_trace(go.Bar(
-                name='DU-Rente',
-                x=jahre_labels,
-                y=du_werte,
-                marker_color='#2e7d32',
-                text=[fmt_euro(v) for v in du_werte],
-                textposition="inside",
-                textfont=dict(color="white", size=9)
-            ))
-
-            fig_timeline.add_trace(go.Bar(
-                name='Lücke',
-                x=jahre_labels,
-                y=luecke_werte,
-                marker_color='#c62828',
-                text=[fmt_euro(v) for v in luecke_werte],
-                textposition="inside",
-                textfont=dict(color="white", size=9)
-            ))
-
-            fig_timeline.update_layout(
-                barmode='stack',
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                margin=dict(l=20, r=20, t=30, b=30),
-                height=220,
-                yaxis=dict(showgrid=True, gridwidth=1),
-                xaxis=dict(showgrid=False, title="DU-Szenario"),
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                showlegend=True
-            )
+            jahre_labels = tuple(f"+{s['jahre']}J ({s['alter']})" for s in szenarien)
+            du_werte = tuple(s['du_rente'] if s['hat_anspruch'] else 0 for s in szenarien)
+            luecke_werte = tuple(s['luecke'] for s in szenarien)
 
+            fig_timeline = diagramm_du_szenarien(jahre_labels, du_werte, luecke_werte)
             st.plotly_chart(fig_timeline, use_container_width=True, theme="streamlit")
             st.caption("Grün = DU-Rente, Rot = Versorgungslücke")
 
 # Versorgungslücke zur Pension
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
-with st.expander("Versorgungslücke zur Pension", expanded=False):
+with st.expander("Versorgungslücke zur Pension", expanded=False), messung("app.pensionsluecke"):
     # Berechnungen für Pensions-Versorgungslücke
     versorgungsluecke_pension = gehalt['brutto'] - pension['ruhegehalt_brutto']
 
-    # Lebenserwartung für Gesamtlücke (statistische Lebenserwartung ~85 Jahre)
-    lebenserwartung = 85
     jahre_in_pension = max(0, lebenserwartung - gewuenschtes_pensionsalter)
     gesamtluecke_pension = versorgungsluecke_pension * 12 * jahre_in_pension if versorgungsluecke_pension > 0 else 0
 
@@ -572,61 +513,13 @@ with st.expander("Versorgungslücke zur Pension", expanded=False):
             st.success("Keine Versorgungslücke - Pension deckt das aktuelle Brutto.")
 
     with col_pl2:
-        fig_pension_luecke = go.Figure()
-
-        fig_pension_luecke.add_trace(go.Bar(
-            x=["Brutto", "Pension"],
-            y=[gehalt["brutto"], pension["ruhegehalt_brutto"]],
-            marker_color=["#2e7d32", "#f57c00"],
-            text=[fmt_euro(gehalt["brutto"]), fmt_euro(pension["ruhegehalt_brutto"])],
-            textposition="inside",
-            textfont=dict(color="white", size=11)
-        ))
-
-        fig_pension_luecke.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin=dict(l=20, r=20, t=30, b=20),
-            height=200,
-            yaxis=dict(showgrid=True, gridwidth=1),
-            xaxis=dict(showgrid=False),
-            showlegend=False
-        )
-
+        fig_pension_luecke = diagramm_pensionsluecke(gehalt["brutto"], pension["ruhegehalt_brutto"])
         st.plotly_chart(fig_pension_luecke, use_container_width=True, theme="streamlit")
 
     # Pensionsalter-Vergleich
     st.markdown("### Vergleich nach Pensionsalter")
 
-    # Berechne Pension für verschiedene Pensionsalter
-    pension_szenarien = []
-    von_alter = 55 if ist_polizei_feuerwehr else 63
-    bis_alter = 60 if ist_polizei_feuerwehr else 67
-
-    for alter in range(von_alter, bis_alter + 1):
-        jahr_p = geburtsjahr + alter
-        p = berechne_ruhegehalt(
-            besoldungsgruppe=besoldungsgruppe,
-            stufe=stufe,
-            geburtsjahr=geburtsjahr,
-            jahr_verbeamtung=jahr_verbeamtung,
-            jahr_pension=jahr_p,
-            verheiratet=verheiratet,
-            mietenstufe=mietenstufe,
-            teilzeitjahre=teilzeitjahre,
-            teilzeitanteil=teilzeitanteil,
-            arbeitszeit_faktor=arbeitszeit_faktor,
-            ist_polizei_feuerwehr=ist_polizei_feuerwehr
-        )
-        luecke_p = gehalt['brutto'] - p['ruhegehalt_brutto']
-        jahre_pension_p = max(0, lebenserwartung - alter)
-        pension_szenarien.append({
-            "alter": alter,
-            "pension": p['ruhegehalt_brutto'],
-            "abschlag": p['versorgungsabschlag_prozent'],
-            "luecke": luecke_p,
-            "gesamtluecke": luecke_p * 12 * jahre_pension_p if luecke_p > 0 else 0
-        })
+    pension_szenarien = rechnung["pension_szenarien"]
 
     col_ps1, col_ps2 = st.columns([1, 2])
 
@@ -637,59 +530,208 @@ with st.expander("Versorgungslücke zur Pension", expanded=False):
         st.markdown(pension_text)
 
     with col_ps2:
-        fig_pension_timeline = go.Figure()
-
-        alter_labels = [str(ps['alter']) for ps in pension_szenarien]
-        pension_werte = [ps['pension'] for ps in pension_szenarien]
-        luecke_pension_werte = [max(0, ps['luecke']) for ps in pension_szenarien]
-
-        fig_pension_timeline.add_trace(go.Bar(
-            name='Pension',
-            x=alter_labels,
-            y=pension_werte,
-            marker_color='#f57c00',
-            text=[fmt_euro(v) for v in pension_werte],
-            textposition="inside",
-            textfont=dict(color="white", size=9)
-        ))
-
-        fig_pension_timeline.add_trace(go.Bar(
-            name='Lücke',
-            x=alter_labels,
-            y=luecke_pension_werte,
-            marker_color='#c62828',
-            text=[fmt_euro(v) for v in luecke_pension_werte],
-            textposition="inside",
-            textfont=dict(color="white", size=9)
-        ))
-
-        fig_pension_timeline.update_layout(
-            barmode='stack',
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin=dict(l=20, r=20, t=30, b=30),
-            height=220,
-            yaxis=dict(showgrid=True, gridwidth=1),
-            xaxis=dict(showgrid=False, title="Pensionsalter"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            showlegend=True
-        )
+        alter_labels = tuple(str(ps['alter']) for ps in pension_szenarien)
+        pension_werte = tuple(ps['pension'] for ps in pension_szenarien)
+        luecke_pension_werte = tuple(max(0, ps['luecke']) for ps in pension_szenarien)
 
+        fig_pension_timeline = diagramm_pensionsluecke_verlauf(alter_labels, pension_werte, luecke_pension_werte)
         st.plotly_chart(fig_pension_timeline, use_container_width=True, theme="streamlit")
         st.caption("Orange = Pension, Rot = Versorgungslücke")
 
-# Detailierte Berechnungen
+# Kennfeld (Heatmap)
+st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+
+@st.cache_data(max_entries=64)
+def lade_pension_kennfeld(profil: tuple, pensionsalter: tuple, faktoren: tuple, jahr: int) -> dict:
+    """Gecachtes Ruhegehalt-Kennfeld, Schlüssel = Personenprofil."""
+    gruppe, stufe_p, geburtsjahr_p, verbeamtung_p, verheiratet_p, tz_jahre, tz_anteil, polizei = profil
+    return berechne_pension_kennfeld(
+        besoldungsgruppe=gruppe,
+        stufe=stufe_p,
+        geburtsjahr=geburtsjahr_p,
+        jahr_verbeamtung=verbeamtung_p,
+        pensionsalter=list(pensionsalter),
+        arbeitszeit_faktoren=list(faktoren),
+        verheiratet=verheiratet_p,
+        teilzeitjahre=tz_jahre,
+        teilzeitanteil=tz_anteil,
+        ist_polizei_feuerwehr=polizei,
+        aktuelles_jahr=jahr
+    )
+
+
+@st.cache_data(max_entries=64)
+def lade_du_kennfeld(profil: tuple, du_jahre: tuple, faktoren: tuple) -> dict:
+    """Gecachtes DU-Kennfeld, Schlüssel = Personenprofil."""
+    gruppe, stufe_p, geburtsjahr_p, verbeamtung_p, verheiratet_p, tz_jahre, tz_anteil, _ = profil
+    return berechne_du_kennfeld(
+        besoldungsgruppe=gruppe,
+        stufe=stufe_p,
+        geburtsjahr=geburtsjahr_p,
+        jahr_verbeamtung=verbeamtung_p,
+        du_jahre=list(du_jahre),
+        arbeitszeit_faktoren=list(faktoren),
+        verheiratet=verheiratet_p,
+        teilzeitjahre=tz_jahre,
+        teilzeitanteil=tz_anteil
+    )
+
+
+with st.expander("Kennfeld", expanded=False), messung("app.kennfeld"):
+    kennfeld_art = st.radio(
+        "Darstellung",
+        options=["Altersrente: Pensionsalter × Arbeitszeit", "DU-Rente: DU-Jahr × Arbeitszeit"],
+        horizontal=True
+    )
+
+    kennfeld_profil = (
+        besoldungsgruppe, stufe, geburtsjahr, jahr_verbeamtung,
+        verheiratet, teilzeitjahre, teilzeitanteil, ist_polizei_feuerwehr
+    )
+    kennfeld_faktoren = tuple(f / 100 for f in range(50, 101, 5))
+
+    if kennfeld_art.startswith("Altersrente"):
+        kennfeld_zeilen = tuple(range(55 if ist_polizei_feuerwehr else 60, 71))
+        kennfeld = lade_pension_kennfeld(kennfeld_profil, kennfeld_zeilen, kennfeld_faktoren, aktuelles_jahr)
+        kennfeld_werte = kennfeld["ruhegehalt_brutto"]
+        kennfeld_titel = "Pensionsalter"
+    else:
+        kennfeld_zeilen = tuple(
+            j for j in range(aktuelles_jahr, aktuelles_jahr + 41)
+            if j - geburtsjahr < regelaltersgrenze
+        )
+        kennfeld = lade_du_kennfeld(kennfeld_profil, kennfeld_zeilen, kennfeld_faktoren)
+        kennfeld_werte = kennfeld["du_rente_brutto"]
+        kennfeld_titel = "DU-Jahr"
+
+    if kennfeld_zeilen:
+        fig_kennfeld = diagramm_kennfeld(kennfeld_werte, kennfeld_faktoren, kennfeld_zeilen, kennfeld_titel)
+        st.plotly_chart(fig_kennfeld, width="stretch", theme="streamlit")
+        st.caption("Monatliche Bruttobezüge je Kombination aus Eintrittszeitpunkt und Arbeitszeit-Faktor")
+    else:
+        st.info("Kein DU-Szenario vor der Regelaltersgrenze.")
+
+# Beförderungspfade
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
-with st.expander("Details", expanded=False):
-    tab1, tab2, tab3, tab4 = st.tabs(["Gehalt", "Altersrente", "DU-Rente", "Vergleich"])
 
-    with tab1:
-        col_g1, col_g2 = st.columns(2)
+@st.cache_data(max_entries=64)
+def lade_befoerderungen(profil: tuple, stationen: tuple, szenario: tuple, ziel: str, jahr: int) -> dict:
+    """Gecachte Beförderungs-Optimierung, Schlüssel = Personenprofil, Stationen und Szenario."""
+    gruppe, stufe_p, geburtsjahr_p, verbeamtung_p, verheiratet_p, tz_jahre, tz_anteil, polizei = profil
+    jahr_pension_p, faktor, lebenserwartung_p = szenario
+    return optimiere_befoerderungen(
+        besoldungsgruppe=gruppe,
+        stufe=stufe_p,
+        geburtsjahr=geburtsjahr_p,
+        jahr_verbeamtung=verbeamtung_p,
+        jahr_pension=jahr_pension_p,
+        stationen=list(stationen),
+        verheiratet=verheiratet_p,
+        teilzeitjahre=tz_jahre,
+        teilzeitanteil=tz_anteil,
+        arbeitszeit_faktor=faktor,
+        ist_polizei_feuerwehr=polizei,
+        ziel=ziel,
+        lebenserwartung=lebenserwartung_p,
+        aktuelles_jahr=jahr
+    )
+
+
+befoerderung = st.expander("Beförderung", expanded=False, key="befoerderung_offen", on_change="rerun")
+with befoerderung, messung("app.befoerderung"):
+    if befoerderung.open:
+        gruppen = get_besoldungsgruppen()
+        hoehere_gruppen = gruppen[gruppen.index(besoldungsgruppe) + 1:]
+        col_b1, col_b2 = st.columns(2)
+        with col_b1:
+            stationen = st.multiselect(
+                "Beförderungsämter (in Reihenfolge)",
+                options=hoehere_gruppen,
+                default=hoehere_gruppen[:1]
+            )
+        with col_b2:
+            ziel_label = st.radio(
+                "Ziel",
+                options=["Lebenseinkommen", "Ruhegehalt"],
+                horizontal=True
+            )
 
-        with col_g1:
-            st.markdown("**Gehaltsbestandteile**")
+        if not stationen:
+            st.info("Keine höhere Besoldungsgruppe ausgewählt.")
+        elif jahr_pension <= aktuelles_jahr + 1:
+            st.info("Bis zur Pension ist keine Beförderung mehr möglich.")
+        else:
+            ziel = ZIEL_LEBENSEINKOMMEN if ziel_label == "Lebenseinkommen" else ZIEL_RUHEGEHALT
+            optimierung = lade_befoerderungen(
+                kennfeld_profil,
+                tuple(sorted(stationen, key=gruppen.index)),
+                (jahr_pension, arbeitszeit_faktor, lebenserwartung),
+                ziel,
+                aktuelles_jahr
+            )
+            bester = optimierung["bester_pfad"]
+            ohne = optimierung["ohne_befoerderung"]
+
+            col_b3, col_b4, col_b5 = st.columns(3)
+            col_b3.metric("Ruhegehalt ohne Beförderung", fmt_euro(ohne["pension"]))
+            col_b4.metric(
+                "Ruhegehalt bester Pfad",
+                fmt_euro(bester["pension"]),
+                delta=fmt_euro(bester["pension"] - ohne["pension"])
+            )
+            col_b5.metric(f"{ziel_label} (Zielwert)", fmt_euro(optimierung["wert"]))
+
+            zeilen = []
+            for i, pfad in enumerate(optimierung["alternativen"][:5], start=1):
+                schritte = ", ".join(
+                    f"{b['besoldungsgruppe']} {b['jahr']} ({b['alter']} J.)" for b in pfad["befoerderungen"]
+                ) or "–"
+                zeilen.append(
+                    f"| {i} | {schritte} | {pfad['ruhegehaltsfaehiges_amt']} "
+                    f"| {fmt_euro(pfad['pension'])} | {fmt_euro(pfad['wert'])} |"
+                )
+            zeilen = "\n".join(zeilen)
             st.markdown(f"""
+| # | Beförderungen | Ruhegehaltsfähig | Ruhegehalt | Zielwert |
+|---|---------------|------------------|-----------:|---------:|
+{zeilen}
+            """)
+
+            nach_jahr = optimierung["nach_jahr"]
+            fig_befoerderung = diagramm_befoerderungsjahr(
+                tuple(nach_jahr),
+                tuple(tuple(werte) for werte in nach_jahr.values()),
+                tuple(tuple(werte.values()) for werte in nach_jahr.values()),
+                "€/Monat" if ziel == ZIEL_RUHEGEHALT else "€ gesamt"
+            )
+            st.plotly_chart(fig_befoerderung, width="stretch", theme="streamlit")
+            st.caption(
+                f"Bester erreichbarer Zielwert je Beförderungsjahr; ein Amt wird erst nach "
+                f"{MINDESTDAUER_RUHEGEHALTSFAEHIG} Jahren ruhegehaltsfähig "
+                f"({optimierung['bewertete_pfade']} Pfade bewertet)"
+            )
+
+# Detailierte Berechnungen
+st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
+# Details werden nur ausgeführt, wenn der Bereich geöffnet ist, und dann nur
+# der sichtbare Tab (lazy Ausführung über on_change="rerun" und .open)
+details = st.expander("Details", expanded=False, key="details_offen", on_change="rerun")
+with details, messung("app.details"):
+    if details.open:
+        tab1, tab2, tab3, tab4 = st.tabs(
+            ["Gehalt", "Altersrente", "DU-Rente", "Vergleich"], key="details_tab", on_change="rerun"
+        )
+
+        with tab1:
+            if tab1.open:
+                col_g1, col_g2 = st.columns(2)
+
+                with col_g1:
+                    st.markdown("**Gehaltsbestandteile**")
+                    st.markdown(f"""
 | Bestandteil | Betrag |
 |-------------|-------:|
 | Grundgehalt ({besoldungsgruppe}, Stufe {stufe}) | {fmt_euro(gehalt['grundgehalt'])} |
@@ -699,12 +741,12 @@ with st.expander("Details", expanded=False):
 | **Brutto (Vollzeit)** | **{fmt_euro(gehalt['brutto_vollzeit'])}** |
 | Arbeitszeit-Faktor | {arbeitszeit_faktor * 100:.0f}% |
 | **Brutto (aktuell)** | **{fmt_euro(gehalt['brutto'])}** |
-            """)
+                    """)
 
-        with col_g2:
-            st.markdown("**Abzüge**")
-            pkv_label = "PKV-Beitrag" if pkv_beitrag > 0 else "PKV-Beitrag (nicht angegeben)"
-            st.markdown(f"""
+                with col_g2:
+                    st.markdown("**Abzüge**")
+                    pkv_label = "PKV-Beitrag" if pkv_beitrag > 0 else "PKV-Beitrag (nicht angegeben)"
+                    st.markdown(f"""
 | Abzug | Betrag |
 |-------|-------:|
 | Lohnsteuer | {fmt_euro(netto_daten['lohnsteuer'])} |
@@ -713,29 +755,33 @@ with st.expander("Details", expanded=False):
 | {pkv_label} | {fmt_euro(netto_daten['pkv_beitrag'])} |
 | **Abzüge gesamt** | **{fmt_euro(netto_daten['abzuege_gesamt'])}** |
 | **Netto** | **{fmt_euro(netto_daten['netto'])}** |
-            """)
+                    """)
 
-            # Kindergeld Info
-            if anzahl_kinder > 0:
-                st.markdown("---")
-                st.markdown("**Kindergeld (Info)**")
-                st.markdown(f"""
+                    # Kindergeld Info
+                    if anzahl_kinder > 0:
+                        st.markdown("---")
+                        st.markdown("**Kindergeld (Info)**")
+                        st.markdown(f"""
 | Info | Betrag |
 |------|-------:|
-| Kindergeld pro Kind | {fmt_euro(KINDERGELD_PRO_KIND)} |
+| Kindergeld pro Kind | {fmt_euro(KINDERGELD_MONATLICH)} |
 | Kindergeld gesamt ({anzahl_kinder} Kinder) | {fmt_euro(kindergeld_gesamt)} |
-                """)
-                st.caption("Kindergeld wird separat ausgezahlt und ist nicht im Netto enthalten.")
-
-    with tab2:
-        col_p1, col_p2 = st.columns([1, 2])
-
-        with col_p1:
-            st.markdown("**Parameter**")
-            stufe_info = f"Stufe {pension.get('stufe_bei_pension', stufe)}"
-            if pension.get('stufe_bei_pension', stufe) == pension.get('max_stufe', 12):
-                stufe_info += " (max)"
-            st.markdown(f"""
+                        """)
+                        st.caption("Kindergeld wird separat ausgezahlt und ist nicht im Netto enthalten.")
+
+        with tab2:
+            if tab2.open:
+                col_p1, col_p2 = st.columns([1, 2])
+
+                with col_p1:
+                    pension_netto = berechne_netto_pension(
+                        pension['ruhegehalt_brutto'], jahr_pension, steuerklasse, kirchensteuer
+                    )
+                    st.markdown("**Parameter**")
+                    stufe_info = f"Stufe {pension.get('stufe_bei_pension', stufe)}"
+                    if pension.get('stufe_bei_pension', stufe) == pension.get('max_stufe', 12):
+                        stufe_info += " (max)"
+                    st.markdown(f"""
 | Parameter | Wert |
 |-----------|-----:|
 | Pensionsalter | {gewuenschtes_pensionsalter} Jahre |
@@ -748,63 +794,32 @@ with st.expander("Details", expanded=False):
 | **Eff. Satz** | **{pension['effektiver_ruhegehaltssatz']:.2f}%** |
 | Ruhegehaltsfähige Bezüge | {fmt_euro(pension['ruhegehaltsfaehige_bezuege'])} |
 | **Ruhegehalt brutto** | **{fmt_euro(pension['ruhegehalt_brutto'])}** |
-            """)
-            st.caption(f"Aktuelle Stufe: {stufe} → Bei Pension: {pension.get('stufe_bei_pension', stufe)}")
-
-        with col_p2:
-            st.markdown("**Pensionsentwicklung nach Alter**")
-
-            # Antragsaltersgrenze: 63 für normale Beamte, 55 für Polizei/FW (Übersicht)
-            von_alter_vergleich = 55 if ist_polizei_feuerwehr else 63
-
-            pension_verlauf = berechne_pension_nach_alter(
-                besoldungsgruppe=besoldungsgruppe,
-                stufe=stufe,
-                geburtsjahr=geburtsjahr,
-                jahr_verbeamtung=jahr_verbeamtung,
-                verheiratet=verheiratet,
-                mietenstufe=mietenstufe,
-                teilzeitjahre=teilzeitjahre,
-                teilzeitanteil=teilzeitanteil,
-                arbeitszeit_faktor=arbeitszeit_faktor,
-                ist_polizei_feuerwehr=ist_polizei_feuerwehr,
-                von_alter=von_alter_vergleich,
-                bis_alter=67
-            )
-
-            alter_liste = [p["pensionsalter"] for p in pension_verlauf]
-            pension_liste = [p["ruhegehalt_brutto"] for p in pension_verlauf]
-            abschlag_liste = [p["versorgungsabschlag_prozent"] for p in pension_verlauf]
-
-            fig_pension = go.Figure()
-
-            fig_pension.add_trace(go.Bar(
-                x=alter_liste,
-                y=pension_liste,
-                marker_color=["#c62828" if a > 0 else "#2e7d32" for a in abschlag_liste],
-                text=[fmt_euro(p) for p in pension_liste],
-                textposition="inside",
-                textfont=dict(color="white", size=9)
-            ))
-
-            fig_pension.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                margin=dict(l=20, r=20, t=10, b=30),
-                height=250,
-                yaxis=dict(showgrid=True, gridwidth=1),
-                xaxis=dict(showgrid=False, title="Pensionsalter"),
-                showlegend=False
-            )
-
-            st.plotly_chart(fig_pension, use_container_width=True, theme="streamlit")
-            st.caption("Rot = mit Abschlag, Grün = ohne Abschlag")
-
-    with tab3:
-        st.markdown("**DU-Renten-Berechnung**")
-        if not du_rente.get('hat_anspruch', True):
-            st.error(f"**Kein Anspruch auf DU-Rente** - Die 5-jährige Wartezeit ist nicht erfüllt.")
-            st.markdown(f"""
+| Versorgungsfreibetrag + Zuschlag (Jahr) | {fmt_euro(pension_netto['versorgungsfreibetrag'] + pension_netto['zuschlag_versorgungsfreibetrag'])} |
+| Steuern | {fmt_euro(pension_netto['steuern_gesamt'])} |
+| **Ruhegehalt netto** | **{fmt_euro(pension_netto['netto'])}** |
+                    """)
+                    st.caption(f"Aktuelle Stufe: {stufe} → Bei Pension: {pension.get('stufe_bei_pension', stufe)}")
+                    st.caption(f"Netto ohne PKV-Beitrag, Versorgungsfreibetrag nach Versorgungsbeginn {jahr_pension}")
+
+                with col_p2:
+                    st.markdown("**Pensionsentwicklung nach Alter**")
+
+                    pension_verlauf = rechnung["pension_verlauf"]
+
+                    alter_liste = tuple(p["pensionsalter"] for p in pension_verlauf)
+                    pension_liste = tuple(p["ruhegehalt_brutto"] for p in pension_verlauf)
+                    abschlag_liste = tuple(p["versorgungsabschlag_prozent"] for p in pension_verlauf)
+
+                    fig_pension = diagramm_pensionsentwicklung(alter_liste, pension_liste, abschlag_liste)
+                    st.plotly_chart(fig_pension, width="stretch", theme="streamlit")
+                    st.caption("Rot = mit Abschlag, Grün = ohne Abschlag")
+
+        with tab3:
+            if tab3.open:
+                st.markdown("**DU-Renten-Berechnung**")
+                if not du_rente.get('hat_anspruch', True):
+                    st.error(f"**Kein Anspruch auf DU-Rente** - Die 5-jährige Wartezeit ist nicht erfüllt.")
+                    st.markdown(f"""
 | Parameter | Wert |
 |-----------|-----:|
 | DU-Szenario Jahr | {du_szenario_jahr} |
@@ -813,10 +828,10 @@ with st.expander("Details", expanded=False):
 | **Wartezeit erforderlich** | **5,00 Jahre** |
 | **Fehlende Dienstjahre** | **{du_rente['fehlende_dienstjahre']:.2f} Jahre** |
 | DU-Rente | **0,00 €** |
-            """)
-            st.info("Nach Erfüllung der 5-jährigen Wartezeit besteht Anspruch auf mindestens die Mindestversorgung.")
-        else:
-            st.markdown(f"""
+                    """)
+                    st.info("Nach Erfüllung der 5-jährigen Wartezeit besteht Anspruch auf mindestens die Mindestversorgung.")
+                else:
+                    st.markdown(f"""
 | Parameter | Wert |
 |-----------|-----:|
 | DU-Szenario Jahr | {du_szenario_jahr} |
@@ -831,48 +846,28 @@ with st.expander("Details", expanded=False):
 | **DU-Rente brutto** | **{fmt_euro(du_rente['du_rente_brutto'])}** |
 | Mindestversorgung | {fmt_euro(du_rente['mindestversorgung'])} |
 | Mindestversorgung aktiv? | {'Ja' if du_rente['wird_mindestversorgung'] else 'Nein'} |
-            """)
+                    """)
 
-    with tab4:
-        col_v1, col_v2 = st.columns([2, 1])
-
-        with col_v1:
-            fig_vergleich = go.Figure()
-
-            kategorien = ["Brutto", "Netto", "DU-Rente", "Altersrente"]
-            werte = [gehalt["brutto"], netto_daten["netto"], du_rente["du_rente_brutto"], pension["ruhegehalt_brutto"]]
-            farben = ["#757575", "#2e7d32", "#c62828", "#f57c00"]
-
-            fig_vergleich.add_trace(go.Bar(
-                x=kategorien,
-                y=werte,
-                marker_color=farben,
-                text=[fmt_euro(w) for w in werte],
-                textposition="inside",
-                textfont=dict(color="white", size=11)
-            ))
-
-            fig_vergleich.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                margin=dict(l=20, r=20, t=20, b=30),
-                height=280,
-                yaxis=dict(showgrid=True, gridwidth=1),
-                xaxis=dict(showgrid=False),
-                showlegend=False
-            )
+        with tab4:
+            if tab4.open:
+                col_v1, col_v2 = st.columns([2, 1])
 
-            st.plotly_chart(fig_vergleich, use_container_width=True, theme="streamlit")
+                with col_v1:
+                    fig_vergleich = diagramm_vergleich(
+                        gehalt["brutto"], netto_daten["netto"], du_rente["du_rente_brutto"], pension["ruhegehalt_brutto"]
+                    )
+                    st.plotly_chart(fig_vergleich, width="stretch", theme="streamlit")
 
-        with col_v2:
-            st.markdown("**Pensionsalter-Vergleich**")
+                with col_v2:
+                    st.markdown("**Pensionsalter-Vergleich**")
 
-            vergleich_text = "| Alter | Stufe | Pension | Abschlag |\n|------:|------:|--------:|---------:|\n"
-            for p in pension_verlauf:
-                stufe_p = p.get('stufe_bei_pension', stufe)
-                vergleich_text += f"| {p['pensionsalter']} | {stufe_p} | {fmt_euro(p['ruhegehalt_brutto'])} | {p['versorgungsabschlag_prozent']:.2f}% |\n"
+                    pension_verlauf = rechnung["pension_verlauf"]
+                    vergleich_text = "| Alter | Stufe | Pension | Abschlag |\n|------:|------:|--------:|---------:|\n"
+                    for p in pension_verlauf:
+                        stufe_p = p.get('stufe_bei_pension', stufe)
+                        vergleich_text += f"| {p['pensionsalter']} | {stufe_p} | {fmt_euro(p['ruhegehalt_brutto'])} | {p['versorgungsabschlag_prozent']:.2f}% |\n"
 
-            st.markdown(vergleich_text)
+                    st.markdown(vergleich_text)
 
 # PDF-Export
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
@@ -903,21 +898,51 @@ with st.expander("Export", expanded=False):
     }
 
     try:
-        from export.pdf_report import erstelle_pdf_report
+        from export.pdf_report import schreibe_pdf_report
+        if DIAGNOSE_AKTIV:
+            # Nachgeladene Module (ReportLab-Export) mit instrumentieren
+            instrumentierung.aktivieren()
 
         if st.button("PDF-Report erstellen"):
-            with st.spinner("PDF wird erstellt..."):
-                pdf_bytes = erstelle_pdf_report(st.session_state.export_data)
+            with st.spinner("PDF wird erstellt..."), messung("app.pdf_export"):
+                # Direkt in den Download-Puffer schreiben (keine Kopie per getvalue)
+                pdf_puffer = BytesIO()
+                schreibe_pdf_report(st.session_state.export_data, pdf_puffer)
+                pdf_puffer.seek(0)
 
                 st.download_button(
                     label="PDF herunterladen",
-                    data=pdf_bytes,
+                    data=pdf_puffer,
                     file_name=f"Beamtenpension_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                     mime="application/pdf"
                 )
     except ImportError:
         st.warning("PDF-Export-Modul nicht verfügbar.")
 
+# Diagnose der letzten Ausführung (nur mit BEAMTENRECHNER_PROFILING=1)
+if DIAGNOSE_AKTIV:
+    with st.expander("Diagnose", expanded=False):
+        statistik = instrumentierung.get_statistik(diagnose_lauf)
+        st.caption(
+            f"Ausführung: {(time.perf_counter() - diagnose_start) * 1000:.1f} ms | "
+            f"{sum(e['aufrufe'] for e in statistik)} gemessene Aufrufe"
+        )
+        st.dataframe(statistik, width="stretch", hide_index=True)
+        st.caption(
+            f"Neu berechnet: {', '.join(rechnung.neu_berechnet) or '-'} | "
+            f"Wiederverwendet: {', '.join(rechnung.wiederverwendet) or '-'} | "
+            f"Aus persistentem Cache: {', '.join(rechnung.aus_cache) or '-'}"
+        )
+
+        flamegraph_puffer = StringIO()
+        instrumentierung.schreibe_flamegraph(flamegraph_puffer, diagnose_lauf)
+        st.download_button(
+            label="Flamegraph (gefaltete Stacks)",
+            data=flamegraph_puffer.getvalue(),
+            file_name="beamtenrechner.folded",
+            mime="text/plain"
+        )
+
 # Footer
 st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 st.caption("Beamtenrechner NRW | Alle Angaben ohne Gewähr | Stand Februar 2025")
@@ -0,0 +1,88 @@
+"""
+Benchmark Rechenkerne
+Misst Ruhegehalt, Pensionsverlauf und DU-Entwicklung (skalar und als Batch)
+mit festem Stichtag, damit Ergebnisse und Laufzeiten unabhängig vom
+Ausführungsdatum vergleichbar bleiben.
+
+Aufruf: python -m benchmarks.berechnung
+"""
+
+import random
+import timeit
+
+from calculator.batch import (
+    berechne_ruhegehalt_batch,
+    berechne_du_entwicklung_batch,
+    berechne_barwert_ruhegehalt_batch,
+    berechne_anrechnung_ruhegehalt_batch,
+    RUHEGEHALT_FELDER
+)
+from calculator.eingaben import pruefe_eintraege
+from calculator.dienstunfaehigkeit import berechne_du_entwicklung
+from calculator.pension import berechne_ruhegehalt, berechne_pension_nach_alter
+from calculator.stichtag import stichtag
+from data.besoldung import get_besoldungsgruppen
+
+
+# Fester Stichtag für alle Messungen
+BENCHMARK_STICHTAG = "2025-02-01"
+
+ANZAHL_PROFILE = 1000
+WIEDERHOLUNGEN = 5
+
+
+def _profile(anzahl: int) -> list:
+    """Reproduzierbare Zufallsprofile."""
+    zufall = random.Random(42)
+    gruppen = get_besoldungsgruppen()
+    profile = []
+    for _ in range(anzahl):
+        geburtsjahr = zufall.randint(1960, 2000)
+        profile.append({
+            "besoldungsgruppe": zufall.choice(gruppen),
+            "stufe": zufall.randint(1, 12),
+            "geburtsjahr": geburtsjahr,
+            "jahr_verbeamtung": geburtsjahr + zufall.randint(20, 35),
+            "jahr_pension": geburtsjahr + zufall.randint(60, 67),
+            "verheiratet": zufall.random() < 0.5,
+        })
+    return profile
+
+
+def main():
+    profile = _profile(ANZAHL_PROFILE)
+    ohne_pension = [{k: v for k, v in p.items() if k != "jahr_pension"} for p in profile]
+    # Einmal geprüft, danach rechnen die Kerne ohne weitere Prüfungen
+    geprueft = pruefe_eintraege(profile, RUHEGEHALT_FELDER)
+    # Gesetzliche Rente ab 67 und befristeter Hinzuverdienst je Profil
+    renten = [[(p["geburtsjahr"] + 67, None, 800.0)] for p in profile]
+    hinzuverdienst = [[(p["jahr_pension"], p["jahr_pension"] + 3, 1500.0)] for p in profile]
+
+    messungen = {
+        "berechne_ruhegehalt": lambda: [berechne_ruhegehalt(**p) for p in profile],
+        "berechne_ruhegehalt_batch": lambda: berechne_ruhegehalt_batch(profile),
+        "pruefe_eintraege": lambda: pruefe_eintraege(profile, RUHEGEHALT_FELDER),
+        "berechne_ruhegehalt_batch (geprüft)": lambda: berechne_ruhegehalt_batch(geprueft),
+        "berechne_ruhegehalt_batch (Festkomma)": lambda: berechne_ruhegehalt_batch(geprueft, festkomma=True),
+        "berechne_barwert_ruhegehalt_batch (geprüft)": lambda: berechne_barwert_ruhegehalt_batch(geprueft),
+        "berechne_anrechnung_ruhegehalt_batch (geprüft)": lambda: berechne_anrechnung_ruhegehalt_batch(
+            geprueft, renten, hinzuverdienst
+        ),
+        "berechne_pension_nach_alter": lambda: [berechne_pension_nach_alter(**p) for p in ohne_pension],
+        "berechne_du_entwicklung": lambda: [berechne_du_entwicklung(**p) for p in ohne_pension],
+        "berechne_du_entwicklung_batch": lambda: berechne_du_entwicklung_batch(ohne_pension),
+        "berechne_du_entwicklung_batch (Festkomma)": lambda: berechne_du_entwicklung_batch(ohne_pension, festkomma=True),
+    }
+
+    with stichtag(BENCHMARK_STICHTAG):
+        # Gleicher Stichtag -> gleiche Ergebnisse, unabhängig vom Ausführungsdatum
+        assert [berechne_ruhegehalt(**p) for p in profile] == berechne_ruhegehalt_batch(profile)
+
+        print(f"{ANZAHL_PROFILE} Profile, Stichtag {BENCHMARK_STICHTAG}, bestes von {WIEDERHOLUNGEN} Läufen")
+        for name, funktion in messungen.items():
+            dauer = min(timeit.repeat(funktion, number=1, repeat=WIEDERHOLUNGEN))
+            print(f"  {name:<48} {dauer * 1000:8.2f} ms  ({dauer / ANZAHL_PROFILE * 1e6:7.1f} µs/Profil)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark Euro-Formatierung
+Vergleicht die frühere Formatierung (f-String + 3× replace) mit format_euro.
+
+Aufruf: python -m benchmarks.formatierung
+"""
+
+import random
+import timeit
+
+from export.formatierung import format_euro, format_euro_liste
+
+
+ANZAHL_WERTE = 10000
+WIEDERHOLUNGEN = 20
+
+
+def format_euro_alt(betrag: float) -> str:
+    """Frühere Implementierung aus app.py und export/pdf_report.py."""
+    return f"{betrag:,.2f} €".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def main():
+    random.seed(42)
+    # Typische Report-Beträge: wenige verschiedene Werte, viele Wiederholungen
+    werte = [round(random.uniform(0, 10000), 2) for _ in range(ANZAHL_WERTE // 10)] * 10
+
+    assert [format_euro_alt(w) for w in werte] == format_euro_liste(werte)
+
+    messungen = {
+        "alt (3× replace)": lambda: [format_euro_alt(w) for w in werte],
+        "format_euro (kalt)": lambda: (format_euro.cache_clear(), [format_euro(w) for w in werte]),
+        "format_euro (warm)": lambda: [format_euro(w) for w in werte],
+        "format_euro_liste (warm)": lambda: format_euro_liste(werte),
+    }
+
+    print(f"{ANZAHL_WERTE} Beträge, bestes von {WIEDERHOLUNGEN} Läufen")
+    for name, funktion in messungen.items():
+        dauer = min(timeit.repeat(funktion, number=1, repeat=WIEDERHOLUNGEN))
+        print(f"  {name:<26} {dauer * 1000:8.2f} ms  ({dauer / ANZAHL_WERTE * 1e9:6.0f} ns/Betrag)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Ruhensregelung (Anrechnung anderer Einkünfte) für Beamte NRW
+Kürzt Ruhegehalt bzw. DU-Rente, wenn sie mit Renten oder Erwerbseinkommen
+zusammentreffen und dabei eine Höchstgrenze überschritten wird.
+
+- Renten (gesetzliche Rente, Zusatzversorgung): Versorgung und Rente
+  zusammen höchstens 71,75 % der ruhegehaltsfähigen Bezüge aus der Endstufe,
+  mit einem Ruhegehaltssatz für die Zeit ab dem 17. Lebensjahr bis zum
+  Versorgungsbeginn (§ 68 LBeamtVG NRW, vereinfacht).
+- Erwerbseinkommen: Versorgung und Hinzuverdienst zusammen höchstens die
+  ruhegehaltsfähigen Bezüge aus der Endstufe, bei Dienstunfähigkeit 71,75 %
+  davon zuzüglich eines Freibetrags (§ 66 LBeamtVG NRW, vereinfacht). Ab der
+  Regelaltersgrenze wird Erwerbseinkommen nicht mehr angerechnet.
+
+Zuerst werden Renten angerechnet, dann Erwerbseinkommen auf die danach
+verbleibende Versorgung. In jedem Fall bleiben 20 % der Versorgung erhalten.
+
+Einkünfte werden als Ströme (von_jahr, bis_jahr, betrag_monatlich)
+angegeben; bis_jahr None bedeutet unbefristet (z.B. eine Rente ab 2045).
+"""
+
+from itertools import chain
+
+import numpy as np
+
+from calculator.gehalt import berechne_ruhegehaltsfaehige_bezuege
+from calculator.pension import (
+    berechne_ruhegehalt,
+    MAX_RUHEGEHALTSSATZ,
+    RUHEGEHALTSSATZ_PRO_JAHR,
+    REGELALTERSGRENZE_NORMAL,
+    REGELALTERSGRENZE_POLIZEI
+)
+from calculator.dienstunfaehigkeit import berechne_du_rente
+from calculator.vektor import (
+    berechne_ruhegehaltsfaehige_bezuege_vec,
+    MAX_STUFE_TABELLE,
+    _runde
+)
+from calculator.stichtag import get_aktuelles_jahr
+from data.besoldung import get_max_stufe
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+
+
+# Höchstgrenze für Renten: ruhegehaltsfähige Zeit ab dem 17. Lebensjahr
+HOECHSTGRENZE_ALTER_BEGINN = 17
+
+# Freibetrag auf die Höchstgrenze für Erwerbseinkommen bei DU
+# (Geringfügigkeitsgrenze 2025, monatlich)
+HINZUVERDIENST_FREIBETRAG_DU = 556.0
+
+# Mindestbelassung in Prozent der Versorgung
+MINDESTBELASSUNG = 20.0
+
+
+def berechne_hoechstgrenzen(
+    besoldungsgruppe: str,
+    geburtsjahr: int,
+    jahr_versorgungsbeginn: int,
+    verheiratet: bool = False,
+    ist_du: bool = False
+) -> dict:
+    """
+    Berechnet die Höchstgrenzen für das Zusammentreffen mit Renten und
+    Erwerbseinkommen.
+
+    Args:
+        besoldungsgruppe: z.B. "A13"
+        geburtsjahr: Geburtsjahr
+        jahr_versorgungsbeginn: Jahr des Ruhestands bzw. der DU
+        verheiratet: True wenn verheiratet (Familienzuschlag Stufe 1)
+        ist_du: True bei Ruhestand wegen Dienstunfähigkeit
+
+    Returns:
+        Dictionary mit Endstufen-Bezügen und beiden Höchstgrenzen (monatlich)
+    """
+    endstufe = berechne_ruhegehaltsfaehige_bezuege(
+        besoldungsgruppe, get_max_stufe(besoldungsgruppe), verheiratet
+    )
+    jahre = max(0, jahr_versorgungsbeginn - geburtsjahr - HOECHSTGRENZE_ALTER_BEGINN)
+    satz = min(MAX_RUHEGEHALTSSATZ, jahre * RUHEGEHALTSSATZ_PRO_JAHR)
+    if ist_du:
+        grenze_erwerb = endstufe * MAX_RUHEGEHALTSSATZ / 100 + HINZUVERDIENST_FREIBETRAG_DU
+    else:
+        grenze_erwerb = endstufe
+    return {
+        "bezuege_endstufe": endstufe,
+        "hoechstgrenze_rente": round(endstufe * satz / 100, 2),
+        "hoechstgrenze_erwerb": round(grenze_erwerb, 2),
+    }
+
+
+def berechne_hoechstgrenzen_vec(gruppe_idx, geburtsjahr, jahr_versorgungsbeginn, verheiratet=False, ist_du=False) -> dict:
+    """
+    Vektorisierte Variante von berechne_hoechstgrenzen.
+
+    Returns:
+        Dictionary mit Arrays der Berechnungsergebnisse
+    """
+    endstufe = berechne_ruhegehaltsfaehige_bezuege_vec(gruppe_idx, MAX_STUFE_TABELLE[gruppe_idx], verheiratet)
+    jahre = np.maximum(0, np.asarray(jahr_versorgungsbeginn) - np.asarray(geburtsjahr) - HOECHSTGRENZE_ALTER_BEGINN)
+    satz = np.minimum(MAX_RUHEGEHALTSSATZ, jahre * RUHEGEHALTSSATZ_PRO_JAHR)
+    grenze_erwerb = np.where(
+        np.asarray(ist_du, dtype=bool),
+        endstufe * MAX_RUHEGEHALTSSATZ / 100 + HINZUVERDIENST_FREIBETRAG_DU,
+        endstufe
+    )
+    return {
+        "bezuege_endstufe": endstufe,
+        "hoechstgrenze_rente": _runde(endstufe * satz / 100),
+        "hoechstgrenze_erwerb": _runde(grenze_erwerb),
+    }
+
+
+def berechne_anrechnung(
+    versorgung: float,
+    rente: float,
+    erwerbseinkommen: float,
+    hoechstgrenze_rente: float,
+    hoechstgrenze_erwerb: float,
+    erwerb_anrechnen: bool = True
+) -> dict:
+    """
+    Wendet die Ruhensregelung für einen Monat an.
+
+    Args:
+        versorgung: Ruhegehalt bzw. DU-Rente brutto
+        rente: Renten im selben Monat
+        erwerbseinkommen: Erwerbseinkommen im selben Monat
+        hoechstgrenze_rente: Höchstgrenze für Renten
+        hoechstgrenze_erwerb: Höchstgrenze für Erwerbseinkommen
+        erwerb_anrechnen: False ab der Regelaltersgrenze
+
+    Returns:
+        Dictionary mit Ruhensbeträgen und Versorgung nach Anrechnung
+    """
+    mindestbelassung = versorgung * MINDESTBELASSUNG / 100
+    nach_rente = max(versorgung - max(0.0, versorgung + rente - hoechstgrenze_rente), mindestbelassung)
+    if erwerb_anrechnen:
+        nach_erwerb = max(nach_rente - max(0.0, nach_rente + erwerbseinkommen - hoechstgrenze_erwerb), mindestbelassung)
+    else:
+        nach_erwerb = nach_rente
+    return {
+        "ruhensbetrag_rente": round(versorgung - nach_rente, 2),
+        "ruhensbetrag_erwerb": round(nach_rente - nach_erwerb, 2),
+        "versorgung_nach_anrechnung": round(nach_erwerb, 2),
+        "ist_gekuerzt": nach_erwerb < versorgung,
+    }
+
+
+def berechne_anrechnung_vec(
+    versorgung,
+    rente,
+    erwerbseinkommen,
+    hoechstgrenze_rente,
+    hoechstgrenze_erwerb,
+    erwerb_anrechnen=True
+) -> dict:
+    """
+    Vektorisierte Variante von berechne_anrechnung, z.B. für eine
+    (Personen × Jahre)-Matrix.
+
+    Returns:
+        Dictionary mit Arrays der Berechnungsergebnisse
+    """
+    versorgung = np.asarray(versorgung, dtype=float)
+    mindestbelassung = versorgung * MINDESTBELASSUNG / 100
+    nach_rente = np.maximum(
+        versorgung - np.maximum(0.0, versorgung + rente - hoechstgrenze_rente), mindestbelassung
+    )
+    nach_erwerb = np.where(
+        erwerb_anrechnen,
+        np.maximum(nach_rente - np.maximum(0.0, nach_rente + erwerbseinkommen - hoechstgrenze_erwerb), mindestbelassung),
+        nach_rente
+    )
+    return {
+        "ruhensbetrag_rente": _runde(versorgung - nach_rente),
+        "ruhensbetrag_erwerb": _runde(nach_rente - nach_erwerb),
+        "versorgung_nach_anrechnung": _runde(nach_erwerb),
+        "ist_gekuerzt": nach_erwerb < versorgung,
+    }
+
+
+def summe_im_jahr(stroeme: list, jahr: int) -> float:
+    """Summe der monatlichen Beträge aller Ströme, die im Jahr laufen."""
+    return sum(
+        betrag for von_jahr, bis_jahr, betrag in stroeme
+        if von_jahr <= jahr and (bis_jahr is None or jahr <= bis_jahr)
+    )
+
+
+def berechne_einkommen_matrix(stroeme: list, beginn, anzahl_jahre: int) -> np.ndarray:
+    """
+    Monatliche Einkünfte je Person und Jahr aus Strömen: Beginn und Ende
+    jedes Stroms werden als +betrag/-betrag eingetragen und kumuliert.
+
+    Args:
+        stroeme: Liste (pro Person) von Listen mit (von_jahr, bis_jahr, betrag_monatlich)
+        beginn: Erstes Jahr der Zeitleiste je Person
+        anzahl_jahre: Länge der Zeitleiste
+
+    Returns:
+        (Personen × Jahre)-Matrix der monatlichen Einkünfte
+    """
+    beginn = np.broadcast_to(np.asarray(beginn, dtype=np.int64), (len(stroeme),))
+    zeilen = np.repeat(np.arange(len(stroeme)), [len(s) for s in stroeme])
+    alle = list(chain.from_iterable(stroeme))
+    von = np.array([s[0] for s in alle], dtype=np.int64)
+    bis = np.array([0 if s[1] is None else s[1] for s in alle], dtype=np.int64)
+    unbefristet = np.array([s[1] is None for s in alle], dtype=bool)
+    betrag = np.array([s[2] for s in alle], dtype=float)
+
+    start = beginn[zeilen]
+    ende = np.where(unbefristet, anzahl_jahre, bis + 1 - start)
+    aenderungen = np.zeros((len(stroeme), anzahl_jahre + 1))
+    np.add.at(aenderungen, (zeilen, np.clip(von - start, 0, anzahl_jahre)), betrag)
+    np.add.at(aenderungen, (zeilen, np.clip(ende, 0, anzahl_jahre)), -betrag)
+    return _runde(np.cumsum(aenderungen, axis=1)[:, :anzahl_jahre])
+
+
+def _zeitleiste(
+    versorgung: float,
+    grenzen: dict,
+    renten: list,
+    erwerbseinkommen: list,
+    beginn: int,
+    jahre_voraus: int,
+    erwerb_bis_jahr: int
+) -> list:
+    """Wendet die Anrechnung für jedes Jahr ab Versorgungsbeginn an."""
+    ergebnisse = []
+    for jahr in range(beginn, beginn + jahre_voraus + 1):
+        rente = round(summe_im_jahr(renten, jahr), 2)
+        erwerb = round(summe_im_jahr(erwerbseinkommen, jahr), 2)
+        ergebnis = {"jahr": jahr, "versorgung_brutto": versorgung, "rente": rente, "erwerbseinkommen": erwerb}
+        ergebnis.update(grenzen)
+        ergebnis.update(berechne_anrechnung(
+            versorgung, rente, erwerb,
+            grenzen["hoechstgrenze_rente"], grenzen["hoechstgrenze_erwerb"],
+            jahr < erwerb_bis_jahr
+        ))
+        ergebnisse.append(ergebnis)
+    return ergebnisse
+
+
+def berechne_anrechnung_ruhegehalt(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_pension: int,
+    renten: list = (),
+    erwerbseinkommen: list = (),
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    jahre_voraus: int = 30,
+    aktuelles_jahr: int = None
+) -> list:
+    """
+    Ruhegehalt nach Anrechnung für jedes Jahr ab dem Pensionsantritt.
+
+    Args:
+        renten: Renten als (von_jahr, bis_jahr, betrag_monatlich)
+        erwerbseinkommen: Hinzuverdienst als (von_jahr, bis_jahr, betrag_monatlich)
+        jahre_voraus: Anzahl Jahre nach dem Pensionsantritt
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+
+    Returns:
+        Liste von Dictionaries mit Versorgung, Einkünften, Höchstgrenzen und
+        Ruhensbeträgen pro Jahr
+    """
+    ruhegehalt = berechne_ruhegehalt(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_pension=jahr_pension,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+        aktuelles_jahr=get_aktuelles_jahr(aktuelles_jahr)
+    )
+    grenzen = berechne_hoechstgrenzen(besoldungsgruppe, geburtsjahr, jahr_pension, verheiratet)
+    return _zeitleiste(
+        ruhegehalt["ruhegehalt_brutto"], grenzen, renten, erwerbseinkommen,
+        jahr_pension, jahre_voraus, geburtsjahr + ruhegehalt["regelaltersgrenze"]
+    )
+
+
+def berechne_anrechnung_du(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_du: int,
+    renten: list = (),
+    erwerbseinkommen: list = (),
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    jahre_voraus: int = 30
+) -> list:
+    """
+    DU-Rente nach Anrechnung für jedes Jahr ab Eintritt der Dienstunfähigkeit.
+
+    Args:
+        renten: Renten als (von_jahr, bis_jahr, betrag_monatlich)
+        erwerbseinkommen: Hinzuverdienst als (von_jahr, bis_jahr, betrag_monatlich)
+        jahre_voraus: Anzahl Jahre nach Eintritt der DU
+
+    Returns:
+        Liste von Dictionaries mit Versorgung, Einkünften, Höchstgrenzen und
+        Ruhensbeträgen pro Jahr
+    """
+    du_rente = berechne_du_rente(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_du=jahr_du,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr
+    )
+    grenzen = berechne_hoechstgrenzen(besoldungsgruppe, geburtsjahr, jahr_du, verheiratet, ist_du=True)
+    regelaltersgrenze = REGELALTERSGRENZE_POLIZEI if ist_polizei_feuerwehr else REGELALTERSGRENZE_NORMAL
+    return _zeitleiste(
+        du_rente["du_rente_brutto"], grenzen, renten, erwerbseinkommen,
+        jahr_du, jahre_voraus, geburtsjahr + regelaltersgrenze
+    )
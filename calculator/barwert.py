@@ -0,0 +1,291 @@
+"""
+Barwert (versicherungsmathematischer Gegenwartswert) von Ruhegehalt und DU-Rente
+Kapitalisiert einen monatlichen Versorgungsbezug über die Sterbetafel in
+data/sterbetafel.py, eine Zinskurve und eine optionale jährliche
+Besoldungsanpassung, z.B. für Haushaltsplanung oder Versorgungsausgleich.
+
+Zahlungsmodell:
+- Jahr k = 0, 1, ... ab dem Stichtag; der Bezug beginnt im Jahr
+  beginn = Versorgungsbeginn - Stichtag (frühestens sofort).
+- Jahresbetrag = 12 × Monatsbetrag × (1 + anpassung)^k, gezahlt zur
+  Jahresmitte und mit der mittleren Überlebenswahrscheinlichkeit des
+  Jahres gewichtet (Erleben bis zum Beginn ist eingerechnet).
+- Abzinsung mit dem Kassazins der Laufzeit: (1 + z_k)^-(k + 0,5).
+
+Die Zahlungsströme werden als (Personen × Jahre)-Matrix in Blöcken
+berechnet; pro Person bleibt nur ein Zugriff auf die rückwärts
+kumulierte Summe ab Versorgungsbeginn.
+"""
+
+import numpy as np
+
+from calculator.pension import berechne_ruhegehalt
+from calculator.dienstunfaehigkeit import berechne_du_rente
+from calculator.stichtag import get_aktuelles_jahr
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+from data.sterbetafel import MAX_ALTER, STERBETAFELN, STERBEWAHRSCHEINLICHKEITEN
+
+
+# Rechnungszins (Näherung an den Durchschnittszins nach § 253 Abs. 2 HGB)
+STANDARD_ZINS = 0.019
+
+# Jährliche Besoldungsanpassung (0 = keine Dynamik)
+STANDARD_ANPASSUNG = 0.0
+
+# Standard-Sterbetafel
+STANDARD_STERBETAFEL = "unisex"
+
+# Zeilen pro Block (begrenzt den Speicher der Zahlungsstrom-Matrix)
+BLOCKGROESSE = 8192
+
+# Sterbewahrscheinlichkeiten als Matrix (Tafel × Alter 0..MAX_ALTER)
+STERBE_TABELLE = np.array([STERBEWAHRSCHEINLICHKEITEN[t] for t in STERBETAFELN], dtype=float)
+TAFEL_INDEX = {tafel: i for i, tafel in enumerate(STERBETAFELN)}
+
+
+def tafel_index(sterbetafel: str) -> int:
+    """Gibt den Zeilenindex einer Sterbetafel in STERBE_TABELLE zurück."""
+    if sterbetafel not in TAFEL_INDEX:
+        raise ValueError(f"Sterbetafel {sterbetafel} nicht gefunden")
+    return TAFEL_INDEX[sterbetafel]
+
+
+def berechne_gewichte(horizont: int, zins=STANDARD_ZINS, anpassung: float = STANDARD_ANPASSUNG) -> np.ndarray:
+    """
+    Abzinsung und Anpassung je Jahr (ohne Sterblichkeit).
+
+    Args:
+        horizont: Anzahl der Jahre
+        zins: Fester Zins oder Zinskurve (Kassazinsen für Laufzeit 1, 2, ...
+            Jahre; nach dem letzten Wert wird dieser fortgeschrieben)
+        anpassung: Jährliche Besoldungsanpassung (z.B. 0.02 für 2 %)
+
+    Returns:
+        Array der Länge horizont
+    """
+    kurve = np.atleast_1d(np.asarray(zins, dtype=float))
+    if kurve.size == 0:
+        raise ValueError("Zinskurve leer")
+    if np.any(kurve <= -1):
+        raise ValueError("Zins muss größer als -100 % sein")
+    jahre = np.arange(horizont)
+    kassazins = kurve[np.minimum(jahre, kurve.size - 1)]
+    return (1 + anpassung) ** jahre * (1 + kassazins) ** -(jahre + 0.5)
+
+
+def berechne_barwert_vec(
+    betrag_monatlich,
+    alter,
+    beginn,
+    tafel=TAFEL_INDEX[STANDARD_STERBETAFEL],
+    zins=STANDARD_ZINS,
+    anpassung: float = STANDARD_ANPASSUNG,
+    horizont: int = None
+) -> dict:
+    """
+    Vektorisierter Barwert lebenslanger Monatsbezüge.
+    Alle Argumente außer zins, anpassung und horizont dürfen Arrays sein
+    und werden gegeneinander gebroadcastet.
+
+    Args:
+        betrag_monatlich: Monatlicher Bezug bei Versorgungsbeginn (heutige Höhe)
+        alter: Alter am Stichtag (vollendete Jahre)
+        beginn: Jahre vom Stichtag bis zum Versorgungsbeginn (negativ = läuft bereits)
+        tafel: Index der Sterbetafel (siehe TAFEL_INDEX)
+        zins: Fester Zins oder Zinskurve (siehe berechne_gewichte)
+        anpassung: Jährliche Besoldungsanpassung
+        horizont: Betrachtete Jahre (Standard: bis zum Höchstalter der Tafel)
+
+    Returns:
+        Dictionary mit Arrays: barwert, rentenfaktor (Barwert je 1 €
+        Jahresbezug), erwartete_bezugsjahre, erlebenswahrscheinlichkeit
+        (Versorgungsbeginn wird erlebt)
+    """
+    betrag, alter, beginn, tafel = np.broadcast_arrays(
+        np.asarray(betrag_monatlich, dtype=float),
+        np.asarray(alter, dtype=np.int64),
+        np.asarray(beginn, dtype=np.int64),
+        np.asarray(tafel, dtype=np.int64)
+    )
+    form = betrag.shape
+    betrag, alter, beginn, tafel = (a.ravel() for a in (betrag, alter, beginn, tafel))
+    anzahl = betrag.size
+
+    alter = np.clip(alter, 0, MAX_ALTER)
+    if horizont is None:
+        horizont = MAX_ALTER - int(alter.min()) + 1 if anzahl else 1
+    beginn = np.clip(beginn, 0, horizont)
+    gewichte = berechne_gewichte(horizont, zins, anpassung)
+    jahre = np.arange(horizont)
+
+    faktor = np.empty(anzahl)
+    bezugsjahre = np.empty(anzahl)
+    erleben = np.empty(anzahl)
+    for start in range(0, anzahl, BLOCKGROESSE):
+        block = slice(start, start + BLOCKGROESSE)
+        zeilen = np.arange(min(BLOCKGROESSE, anzahl - start))
+
+        # Überlebenswahrscheinlichkeit bis Jahresanfang (Spalte k) bzw. -ende (k + 1)
+        q = STERBE_TABELLE[tafel[block, np.newaxis], np.minimum(alter[block, np.newaxis] + jahre, MAX_ALTER)]
+        leben = np.ones((zeilen.size, horizont + 1))
+        np.cumprod(1 - q, axis=1, out=leben[:, 1:])
+        mitte = 0.5 * (leben[:, :-1] + leben[:, 1:])
+
+        # Rückwärts kumulierte Summen: Spalte b = Summe über alle Jahre ab b
+        rest = np.zeros((zeilen.size, horizont + 1))
+        rest[:, :-1] = np.cumsum((mitte * gewichte)[:, ::-1], axis=1)[:, ::-1]
+        jahre_rest = np.zeros((zeilen.size, horizont + 1))
+        jahre_rest[:, :-1] = np.cumsum(mitte[:, ::-1], axis=1)[:, ::-1]
+
+        b = beginn[block]
+        faktor[block] = rest[zeilen, b]
+        bezugsjahre[block] = jahre_rest[zeilen, b]
+        erleben[block] = leben[zeilen, b]
+
+    return {
+        "barwert": np.round(12 * betrag * faktor, 2).reshape(form),
+        "rentenfaktor": np.round(faktor, 4).reshape(form),
+        "erwartete_bezugsjahre": np.round(bezugsjahre, 2).reshape(form),
+        "erlebenswahrscheinlichkeit": np.round(erleben, 4).reshape(form),
+    }
+
+
+def berechne_barwert(
+    betrag_monatlich: float,
+    alter: int,
+    beginn: int,
+    sterbetafel: str = STANDARD_STERBETAFEL,
+    zins=STANDARD_ZINS,
+    anpassung: float = STANDARD_ANPASSUNG,
+    horizont: int = None
+) -> dict:
+    """
+    Barwert eines lebenslangen Monatsbezugs für eine Person.
+
+    Args:
+        betrag_monatlich: Monatlicher Bezug bei Versorgungsbeginn
+        alter: Alter am Stichtag
+        beginn: Jahre vom Stichtag bis zum Versorgungsbeginn
+        sterbetafel: "maennlich", "weiblich" oder "unisex"
+        zins: Fester Zins oder Zinskurve
+        anpassung: Jährliche Besoldungsanpassung
+        horizont: Betrachtete Jahre (Standard: bis zum Höchstalter)
+
+    Returns:
+        Dictionary mit barwert, rentenfaktor, erwartete_bezugsjahre,
+        erlebenswahrscheinlichkeit
+    """
+    ergebnis = berechne_barwert_vec(
+        betrag_monatlich, alter, beginn, tafel_index(sterbetafel), zins, anpassung, horizont
+    )
+    return {schluessel: float(wert) for schluessel, wert in ergebnis.items()}
+
+
+def berechne_barwert_ruhegehalt(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_pension: int,
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    sterbetafel: str = STANDARD_STERBETAFEL,
+    zins=STANDARD_ZINS,
+    anpassung: float = STANDARD_ANPASSUNG,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Berechnet das Ruhegehalt und dessen Barwert am Stichtag.
+
+    Args:
+        sterbetafel: "maennlich", "weiblich" oder "unisex"
+        zins: Fester Zins oder Zinskurve
+        anpassung: Jährliche Besoldungsanpassung
+        aktuelles_jahr: Stichtagsjahr (Standard: Stichtag)
+
+    Returns:
+        Ergebnis von berechne_ruhegehalt ergänzt um die Barwert-Felder
+    """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    ergebnis = berechne_ruhegehalt(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_pension=jahr_pension,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+        aktuelles_jahr=aktuelles_jahr
+    )
+    ergebnis.update(berechne_barwert(
+        ergebnis["ruhegehalt_brutto"],
+        aktuelles_jahr - geburtsjahr,
+        jahr_pension - aktuelles_jahr,
+        sterbetafel,
+        zins,
+        anpassung
+    ))
+    return ergebnis
+
+
+def berechne_barwert_du_rente(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_du: int,
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    sterbetafel: str = STANDARD_STERBETAFEL,
+    zins=STANDARD_ZINS,
+    anpassung: float = STANDARD_ANPASSUNG,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Berechnet die DU-Rente und deren Barwert am Stichtag (Eintritt der
+    Dienstunfähigkeit im Jahr jahr_du vorausgesetzt).
+
+    Args:
+        sterbetafel: "maennlich", "weiblich" oder "unisex"
+        zins: Fester Zins oder Zinskurve
+        anpassung: Jährliche Besoldungsanpassung
+        aktuelles_jahr: Stichtagsjahr (Standard: Stichtag)
+
+    Returns:
+        Ergebnis von berechne_du_rente ergänzt um die Barwert-Felder
+    """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    ergebnis = berechne_du_rente(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_du=jahr_du,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr
+    )
+    ergebnis.update(berechne_barwert(
+        ergebnis["du_rente_brutto"],
+        aktuelles_jahr - geburtsjahr,
+        jahr_du - aktuelles_jahr,
+        sterbetafel,
+        zins,
+        anpassung
+    ))
+    return ergebnis
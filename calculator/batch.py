@@ -0,0 +1,852 @@
+"""
+Batch-Berechnungen für viele Beamte auf einmal
+Nimmt Listen von Eingabe-Dictionaries entgegen (gleiche Feldnamen wie die
+Skalar-Funktionen) und berechnet alle Einträge in einem vektorisierten
+Durchlauf über calculator/vektor.py.
+
+Die Ergebnis-Dictionaries haben dieselben Schlüssel und Werte wie die der
+Skalar-Funktionen (berechne_bruttogehalt, berechne_netto, berechne_ruhegehalt,
+berechne_du_rente, berechne_du_entwicklung, berechne_pension_nach_alter,
+berechne_haushalt).
+
+Die Eingaben werden einmalig über calculator/eingaben.py geprüft und
+normalisiert. Listen werden strikt geprüft (ValueError beim ersten
+ungültigen Eintrag); für große Bestände stattdessen vorab
+pruefe_eintraege(eintraege, <X>_FELDER) aufrufen und die BatchEingaben
+übergeben: ungültige Zeilen landen dann im Fehlerbericht, die Ergebnisse
+gelten für die gültigen Zeilen (siehe BatchEingaben.einordnen).
+
+Versorgungskerne rechnen je Eintrag nach dem Regelwerk seines Dienstherrn
+(Feld regelwerk, Standard NRW; siehe calculator/regelwerk.py). Gemischte
+Bestände werden einmal nach Regelwerk gruppiert, jede Gruppe läuft mit
+ihren Parametern durch denselben Kern.
+
+Mit festkomma=True rechnen Gehalt, Ruhegehalt und DU-Rente in int64-Cent
+(calculator/festkomma.py) mit kaufmännischer Rundung an festen Stellen;
+die Ergebnisse werden erst am Ende in Euro umgerechnet.
+
+Die Barwert-Varianten ergänzen Ruhegehalt bzw. DU-Rente um den
+Gegenwartswert des lebenslangen Bezugs (calculator/barwert.py), die
+Hinterbliebenen-Varianten um Witwen- und Waisengeld
+(calculator/hinterbliebene.py), die Netto-Varianten um die Besteuerung
+der Versorgungsbezüge mit Versorgungsfreibetrag – jeweils aus demselben
+Durchlauf. Die Anrechnungs-Varianten wenden die Ruhensregelung für Renten
+und Erwerbseinkommen (calculator/anrechnung.py) Jahr für Jahr an. Der
+Tarifvergleich rechnet einen Bestand in einem Durchlauf gegen zwei
+Tarifstände (calculator/tarifvergleich.py).
+"""
+
+import numpy as np
+
+from calculator.vektor import (
+    berechne_bruttogehalt_vec,
+    berechne_netto_vec,
+    berechne_ruhegehalt_vec,
+    berechne_du_rente_vec,
+    berechne_familienzuschlag_vec,
+    berechne_netto_pension_vec,
+    _runde
+)
+from calculator.festkomma import (
+    berechne_bruttogehalt_fix,
+    berechne_ruhegehalt_fix,
+    berechne_du_rente_fix,
+    als_euro
+)
+from calculator.barwert import (
+    berechne_barwert_vec,
+    tafel_index,
+    STANDARD_STERBETAFEL,
+    STANDARD_ZINS,
+    STANDARD_ANPASSUNG
+)
+from calculator.hinterbliebene import berechne_hinterbliebenenversorgung_vec
+from calculator.haushalt import berechne_haushalt_vec
+from calculator.anrechnung import (
+    berechne_anrechnung_vec,
+    berechne_einkommen_matrix,
+    berechne_hoechstgrenzen_vec
+)
+from calculator.tarifvergleich import (
+    berechne_tarifvergleich_vec,
+    berechne_differenzen,
+    berechne_tarifstatistik,
+    get_tarifstand
+)
+from calculator.familie import berechne_kinder_matrix, KINDERGELD_ALTERSGRENZE, KINDERGELD_MONATLICH
+from calculator.eingaben import BatchEingaben, pruefe_eintraege
+from calculator.regelwerk import get_parameter_tabelle, gruppiere_nach_regelwerk
+from calculator.stichtag import get_aktuelles_jahr
+
+
+# Eingabefelder der Batch-Funktionen (siehe calculator/eingaben.py)
+GEHALT_FELDER = (
+    "besoldungsgruppe", "stufe", "verheiratet", "anzahl_kinder", "mietenstufe", "arbeitszeit_faktor"
+)
+NETTO_FELDER = ("brutto_monatlich", "steuerklasse", "kirchensteuer", "pkv_beitrag")
+PROFIL_FELDER = (
+    "besoldungsgruppe", "stufe", "geburtsjahr", "jahr_verbeamtung", "verheiratet",
+    "teilzeitjahre", "teilzeitanteil", "arbeitszeit_faktor"
+)
+RUHEGEHALT_FELDER = PROFIL_FELDER + ("jahr_pension", "ist_polizei_feuerwehr", "regelwerk")
+DU_RENTE_FELDER = PROFIL_FELDER + ("jahr_du", "regelwerk")
+DU_ENTWICKLUNG_FELDER = PROFIL_FELDER + ("regelwerk",)
+PENSION_NACH_ALTER_FELDER = PROFIL_FELDER + ("ist_polizei_feuerwehr", "regelwerk")
+NETTO_PENSION_FELDER = RUHEGEHALT_FELDER + ("steuerklasse", "kirchensteuer", "pkv_beitrag")
+NETTO_PENSION_NACH_ALTER_FELDER = PENSION_NACH_ALTER_FELDER + ("steuerklasse", "kirchensteuer", "pkv_beitrag")
+HINTERBLIEBENE_RUHESTAND_FELDER = RUHEGEHALT_FELDER + ("anzahl_kinder",)
+HINTERBLIEBENE_DIENST_FELDER = PROFIL_FELDER + ("jahr_tod", "anzahl_kinder", "regelwerk")
+DU_ENTWICKLUNG_FAMILIE_FELDER = DU_ENTWICKLUNG_FELDER + ("mietenstufe",)
+ANRECHNUNG_RUHEGEHALT_FELDER = RUHEGEHALT_FELDER
+ANRECHNUNG_DU_FELDER = DU_RENTE_FELDER + ("ist_polizei_feuerwehr",)
+HAUSHALT_FELDER = ("brutto_monatlich", "brutto_monatlich_partner", "partner_beamter")
+TARIFVERGLEICH_FELDER = GEHALT_FELDER + (
+    "geburtsjahr", "jahr_verbeamtung", "teilzeitjahre", "teilzeitanteil", "jahr_pension",
+    "ist_polizei_feuerwehr", "steuerklasse", "kirchensteuer", "pkv_beitrag"
+)
+
+
+def _spalten(eintraege, felder) -> dict:
+    """
+    Gibt die geprüften Eingabespalten zurück.
+
+    Listen werden strikt geprüft (erster ungültiger Eintrag bricht ab);
+    bereits geprüfte BatchEingaben werden ohne erneute Prüfung verwendet.
+
+    Raises:
+        ValueError: Bei ungültigen Einträgen oder fehlenden Feldern
+    """
+    if not isinstance(eintraege, BatchEingaben):
+        eintraege = pruefe_eintraege(eintraege, felder, strikt=True)
+    spalten = eintraege.spalten
+    for feld in felder:
+        if (feld == "besoldungsgruppe" and "gruppe_idx" not in spalten) or \
+                (feld != "besoldungsgruppe" and feld not in spalten):
+            raise ValueError(f"Feld {feld} fehlt")
+    return spalten
+
+
+def _kern(float_kern, fix_kern, festkomma: bool):
+    """
+    Wählt den float- oder Festkomma-Kern; Festkomma-Ergebnisse in Euro.
+
+    Enthalten die Argumente eine Spalte regelwerk (Regelwerk-Indizes), läuft
+    der Kern je Regelwerk-Gruppe mit dessen Parametern; die Ergebnisse
+    werden in die ursprüngliche Zeilenfolge zurückgeschrieben.
+    """
+    kern = float_kern if not festkomma else lambda **argumente: als_euro(fix_kern(**argumente))
+
+    def je_regelwerk(regelwerk=None, **argumente):
+        if regelwerk is None:
+            return kern(**argumente)
+        regelwerk = np.ravel(regelwerk)
+        gruppen = gruppiere_nach_regelwerk(regelwerk)
+        if len(gruppen) == 1:
+            return kern(regeln=gruppen[0][0], **argumente)
+
+        anzahl = len(regelwerk)
+        ergebnis = {}
+        for regeln, zeilen in gruppen:
+            teil = kern(regeln=regeln, **{
+                name: wert[zeilen] if np.ndim(wert) and np.shape(wert)[0] == anzahl else wert
+                for name, wert in argumente.items()
+            })
+            for schluessel, werte in teil.items():
+                form = (len(zeilen),) + np.shape(werte)[1:]
+                if schluessel not in ergebnis:
+                    ergebnis[schluessel] = np.empty((anzahl,) + form[1:], dtype=np.asarray(werte).dtype)
+                ergebnis[schluessel][zeilen] = np.broadcast_to(werte, form)
+        return ergebnis
+    return je_regelwerk
+
+
+def _anzahl(eintraege) -> int:
+    return eintraege.anzahl if isinstance(eintraege, BatchEingaben) else len(eintraege)
+
+
+def _zeilen(ergebnis: dict, anzahl: int) -> list:
+    """Wandelt ein Dictionary von Arrays in eine Liste von Dictionaries (Python-Typen) um."""
+    spalten = {
+        schluessel: np.broadcast_to(werte, (anzahl,) + np.shape(werte)[1:]).tolist()
+        for schluessel, werte in ergebnis.items()
+    }
+    return [
+        {schluessel: werte[i] for schluessel, werte in spalten.items()}
+        for i in range(anzahl)
+    ]
+
+
+def _matrix_zeilen(ergebnis: dict, form: tuple) -> list:
+    """
+    Wandelt ein Dictionary von (Einträge × Spalten)-Arrays in eine Liste
+    (pro Eintrag) von Listen von Dictionaries (Python-Typen) um.
+    """
+    matrix = {schluessel: np.broadcast_to(werte, form).tolist() for schluessel, werte in ergebnis.items()}
+    return [
+        [{schluessel: werte[i][j] for schluessel, werte in matrix.items()} for j in range(form[1])]
+        for i in range(form[0])
+    ]
+
+
+def _je_zeile(eintraege, werte: list) -> list:
+    """Wählt aus einer zur ursprünglichen Liste parallelen Liste die gültigen Zeilen."""
+    if isinstance(eintraege, BatchEingaben):
+        return [werte[zeile] for zeile in eintraege.zeilen.tolist()]
+    return list(werte)
+
+
+def _profil_spalten(spalten: dict) -> dict:
+    """Gemeinsame Eingaben für Ruhegehalt und DU-Rente (inkl. Regelwerk)."""
+    return {feld: spalten[feld] for feld in ("gruppe_idx",) + PROFIL_FELDER[1:] + ("regelwerk",)}
+
+
+def berechne_gehalt_batch(eintraege, festkomma: bool = False) -> list:
+    """
+    Batch-Variante von berechne_bruttogehalt.
+
+    Args:
+        eintraege: Liste von Dictionaries mit besoldungsgruppe, stufe und
+            optional verheiratet, anzahl_kinder, mietenstufe, arbeitszeit_faktor
+            (oder bereits geprüfte BatchEingaben)
+        festkomma: In Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, GEHALT_FELDER)
+    ergebnis = _kern(berechne_bruttogehalt_vec, berechne_bruttogehalt_fix, festkomma)(
+        gruppe_idx=spalten["gruppe_idx"],
+        stufe=spalten["stufe"],
+        verheiratet=spalten["verheiratet"],
+        anzahl_kinder=spalten["anzahl_kinder"],
+        mietenstufe=spalten["mietenstufe"],
+        arbeitszeit_faktor=spalten["arbeitszeit_faktor"]
+    )
+    ergebnis["arbeitszeit_faktor"] = spalten["arbeitszeit_faktor"]
+    ergebnis["brutto_teilzeit"] = ergebnis["brutto"]
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_netto_batch(eintraege) -> list:
+    """
+    Batch-Variante von berechne_netto.
+
+    Args:
+        eintraege: Liste von Dictionaries mit brutto_monatlich, steuerklasse
+            und optional kirchensteuer, pkv_beitrag (oder bereits geprüfte
+            BatchEingaben)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, NETTO_FELDER)
+    ergebnis = berechne_netto_vec(**{feld: spalten[feld] for feld in NETTO_FELDER})
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_haushalt_batch(eintraege) -> list:
+    """
+    Batch-Variante von berechne_haushalt: alle Steuerklassen-Kombinationen
+    für alle Haushalte in einem Tarif-Durchlauf.
+
+    Args:
+        eintraege: Liste von Dictionaries mit brutto_monatlich,
+            brutto_monatlich_partner und optional partner_beamter (oder
+            bereits geprüfte BatchEingaben)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, HAUSHALT_FELDER)
+    ergebnis = berechne_haushalt_vec(**{feld: spalten[feld] for feld in HAUSHALT_FELDER})
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_ruhegehalt_batch(eintraege, aktuelles_jahr: int = None, festkomma: bool = False) -> list:
+    """
+    Batch-Variante von berechne_ruhegehalt.
+
+    Args:
+        eintraege: Liste von Dictionaries mit den Argumenten von
+            berechne_ruhegehalt (inkl. jahr_pension) oder bereits geprüfte
+            BatchEingaben
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+        festkomma: In Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, RUHEGEHALT_FELDER)
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=spalten["jahr_pension"],
+        aktuelles_jahr=get_aktuelles_jahr(aktuelles_jahr),
+        ist_polizei_feuerwehr=spalten["ist_polizei_feuerwehr"],
+        **_profil_spalten(spalten)
+    )
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_du_rente_batch(eintraege, festkomma: bool = False) -> list:
+    """
+    Batch-Variante von berechne_du_rente.
+
+    Args:
+        eintraege: Liste von Dictionaries mit den Argumenten von
+            berechne_du_rente (inkl. jahr_du) oder bereits geprüfte
+            BatchEingaben
+        festkomma: In Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, DU_RENTE_FELDER)
+    ergebnis = _kern(berechne_du_rente_vec, berechne_du_rente_fix, festkomma)(
+        jahr_du=spalten["jahr_du"], **_profil_spalten(spalten)
+    )
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_barwert_ruhegehalt_batch(
+    eintraege,
+    sterbetafel: str = STANDARD_STERBETAFEL,
+    zins=STANDARD_ZINS,
+    anpassung: float = STANDARD_ANPASSUNG,
+    horizont: int = None,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Batch-Variante von berechne_barwert_ruhegehalt: Ruhegehalt und Barwert
+    für einen ganzen Bestand in einem Durchlauf.
+
+    Args:
+        eintraege: Wie bei berechne_ruhegehalt_batch
+        sterbetafel: "maennlich", "weiblich" oder "unisex"
+        zins: Fester Zins oder Zinskurve (siehe calculator/barwert.py)
+        anpassung: Jährliche Besoldungsanpassung
+        horizont: Betrachtete Jahre (Standard: bis zum Höchstalter der Tafel)
+        aktuelles_jahr: Stichtagsjahr (Standard: Stichtag)
+        festkomma: Ruhegehalt in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    tafel = tafel_index(sterbetafel)
+    spalten = _spalten(eintraege, RUHEGEHALT_FELDER)
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=spalten["jahr_pension"],
+        aktuelles_jahr=aktuelles_jahr,
+        ist_polizei_feuerwehr=spalten["ist_polizei_feuerwehr"],
+        **_profil_spalten(spalten)
+    )
+    ergebnis.update(berechne_barwert_vec(
+        ergebnis["ruhegehalt_brutto"],
+        aktuelles_jahr - spalten["geburtsjahr"],
+        spalten["jahr_pension"] - aktuelles_jahr,
+        tafel, zins, anpassung, horizont
+    ))
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_barwert_du_rente_batch(
+    eintraege,
+    sterbetafel: str = STANDARD_STERBETAFEL,
+    zins=STANDARD_ZINS,
+    anpassung: float = STANDARD_ANPASSUNG,
+    horizont: int = None,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Batch-Variante von berechne_barwert_du_rente: DU-Rente und Barwert
+    für einen ganzen Bestand in einem Durchlauf.
+
+    Args:
+        eintraege: Wie bei berechne_du_rente_batch
+        sterbetafel, zins, anpassung, horizont: Siehe berechne_barwert_ruhegehalt_batch
+        aktuelles_jahr: Stichtagsjahr (Standard: Stichtag)
+        festkomma: DU-Rente in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    tafel = tafel_index(sterbetafel)
+    spalten = _spalten(eintraege, DU_RENTE_FELDER)
+    ergebnis = _kern(berechne_du_rente_vec, berechne_du_rente_fix, festkomma)(
+        jahr_du=spalten["jahr_du"], **_profil_spalten(spalten)
+    )
+    ergebnis.update(berechne_barwert_vec(
+        ergebnis["du_rente_brutto"],
+        aktuelles_jahr - spalten["geburtsjahr"],
+        spalten["jahr_du"] - aktuelles_jahr,
+        tafel, zins, anpassung, horizont
+    ))
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_netto_pension_batch(
+    eintraege,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Ruhegehalt brutto und netto in einem Durchlauf (Versorgungsbeginn =
+    jahr_pension).
+
+    Args:
+        eintraege: Wie bei berechne_ruhegehalt_batch, zusätzlich
+            steuerklasse und optional kirchensteuer, pkv_beitrag
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+        festkomma: Ruhegehalt in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries: Felder von berechne_ruhegehalt und
+        berechne_netto_pension
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, NETTO_PENSION_FELDER)
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=spalten["jahr_pension"],
+        aktuelles_jahr=get_aktuelles_jahr(aktuelles_jahr),
+        ist_polizei_feuerwehr=spalten["ist_polizei_feuerwehr"],
+        **_profil_spalten(spalten)
+    )
+    ergebnis.update(berechne_netto_pension_vec(
+        ergebnis["ruhegehalt_brutto"],
+        spalten["jahr_pension"],
+        spalten["steuerklasse"],
+        spalten["kirchensteuer"],
+        spalten["pkv_beitrag"],
+        kirchensteuersatz=get_parameter_tabelle("kirchensteuersatz")[spalten["regelwerk"]]
+    ))
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_hinterbliebene_ruhestand_batch(
+    eintraege,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Batch-Variante von berechne_hinterbliebene_ruhestand: Ruhegehalt sowie
+    Witwen- und Waisengeld aus demselben Kern-Durchlauf.
+
+    Args:
+        eintraege: Wie bei berechne_ruhegehalt_batch, zusätzlich optional
+            anzahl_kinder (waisengeldberechtigte Kinder)
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+        festkomma: Ruhegehalt in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, HINTERBLIEBENE_RUHESTAND_FELDER)
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=spalten["jahr_pension"],
+        aktuelles_jahr=get_aktuelles_jahr(aktuelles_jahr),
+        ist_polizei_feuerwehr=spalten["ist_polizei_feuerwehr"],
+        **_profil_spalten(spalten)
+    )
+    ergebnis.update(berechne_hinterbliebenenversorgung_vec(
+        ergebnis["ruhegehalt_brutto"], spalten["verheiratet"], spalten["anzahl_kinder"],
+        mindestversorgung=get_parameter_tabelle("mindestversorgung")[spalten["regelwerk"]]
+    ))
+    return _zeilen(ergebnis, anzahl)
+
+
+def berechne_hinterbliebene_im_dienst_batch(eintraege, festkomma: bool = False) -> list:
+    """
+    Batch-Variante von berechne_hinterbliebene_im_dienst: DU-Ruhegehalt im
+    Todesjahr sowie Witwen- und Waisengeld aus demselben Kern-Durchlauf.
+
+    Args:
+        eintraege: Wie bei berechne_du_rente_batch, aber mit jahr_tod statt
+            jahr_du und optional anzahl_kinder
+        festkomma: DU-Rente in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Liste von Ergebnis-Dictionaries (gleiche Reihenfolge)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    spalten = _spalten(eintraege, HINTERBLIEBENE_DIENST_FELDER)
+    ergebnis = _kern(berechne_du_rente_vec, berechne_du_rente_fix, festkomma)(
+        jahr_du=spalten["jahr_tod"], **_profil_spalten(spalten)
+    )
+    ergebnis.update(berechne_hinterbliebenenversorgung_vec(
+        ergebnis["du_rente_brutto"], spalten["verheiratet"], spalten["anzahl_kinder"],
+        mindestversorgung=get_parameter_tabelle("mindestversorgung")[spalten["regelwerk"]]
+    ))
+    return _zeilen(ergebnis, anzahl)
+
+
+def _anrechnung_matrix(
+    versorgung: np.ndarray,
+    grenzen: dict,
+    renten: list,
+    erwerbseinkommen: list,
+    beginn: np.ndarray,
+    jahre_voraus: int,
+    erwerb_bis_jahr: np.ndarray
+) -> dict:
+    """Ruhensregelung für die (Einträge × Jahre)-Matrix ab Versorgungsbeginn."""
+    anzahl_jahre = jahre_voraus + 1
+    jahre = beginn[:, np.newaxis] + np.arange(anzahl_jahre)
+    rente = berechne_einkommen_matrix(renten, beginn, anzahl_jahre)
+    erwerb = berechne_einkommen_matrix(erwerbseinkommen, beginn, anzahl_jahre)
+    grenzen = {k: v[:, np.newaxis] for k, v in grenzen.items()}
+
+    ergebnis = {"jahr": jahre, "versorgung_brutto": versorgung[:, np.newaxis], "rente": rente, "erwerbseinkommen": erwerb}
+    ergebnis.update(grenzen)
+    ergebnis.update(berechne_anrechnung_vec(
+        versorgung[:, np.newaxis], rente, erwerb,
+        grenzen["hoechstgrenze_rente"], grenzen["hoechstgrenze_erwerb"],
+        jahre < erwerb_bis_jahr[:, np.newaxis]
+    ))
+    return {k: np.broadcast_to(v, jahre.shape) for k, v in ergebnis.items()}
+
+
+def anrechnung_als_zeilen(ergebnis: dict) -> list:
+    """
+    Wandelt das Ergebnis der Anrechnungs-Batches in Zeilen um (für Ausgabe
+    und Serialisierung; die Batches selbst bleiben spaltenweise).
+
+    Args:
+        ergebnis: Dictionary Feld -> Array (Einträge × Jahre)
+
+    Returns:
+        Liste (pro Eintrag) von Listen mit einem Dictionary pro Jahr, wie
+        berechne_anrechnung_ruhegehalt bzw. berechne_anrechnung_du
+    """
+    if not ergebnis:
+        return []
+    return _matrix_zeilen(ergebnis, ergebnis["jahr"].shape)
+
+
+def berechne_anrechnung_ruhegehalt_batch(
+    eintraege,
+    renten: list,
+    erwerbseinkommen: list,
+    jahre_voraus: int = 30,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> dict:
+    """
+    Batch-Variante von berechne_anrechnung_ruhegehalt: Ruhegehalt einmal je
+    Eintrag, Anrechnung vektorisiert über (Einträge × Jahre).
+
+    Args:
+        eintraege: Wie bei berechne_ruhegehalt_batch
+        renten: Liste (pro Eintrag der ursprünglichen Liste) von Listen mit
+            (von_jahr, bis_jahr, betrag_monatlich)
+        erwerbseinkommen: Wie renten, für Hinzuverdienst
+        festkomma: Ruhegehalt in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Dictionary Feld -> Array (Einträge × Jahre) mit Versorgung nach
+        Anrechnung pro Jahr (Zeilen: anrechnung_als_zeilen)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return {}
+    spalten = _spalten(eintraege, ANRECHNUNG_RUHEGEHALT_FELDER)
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=spalten["jahr_pension"],
+        aktuelles_jahr=get_aktuelles_jahr(aktuelles_jahr),
+        ist_polizei_feuerwehr=spalten["ist_polizei_feuerwehr"],
+        **_profil_spalten(spalten)
+    )
+    grenzen = berechne_hoechstgrenzen_vec(
+        spalten["gruppe_idx"], spalten["geburtsjahr"], spalten["jahr_pension"], spalten["verheiratet"]
+    )
+    return _anrechnung_matrix(
+        np.asarray(ergebnis["ruhegehalt_brutto"]), grenzen,
+        _je_zeile(eintraege, renten), _je_zeile(eintraege, erwerbseinkommen),
+        spalten["jahr_pension"], jahre_voraus,
+        spalten["geburtsjahr"] + ergebnis["regelaltersgrenze"]
+    )
+
+
+def berechne_anrechnung_du_batch(
+    eintraege,
+    renten: list,
+    erwerbseinkommen: list,
+    jahre_voraus: int = 30,
+    festkomma: bool = False
+) -> dict:
+    """
+    Batch-Variante von berechne_anrechnung_du: DU-Rente einmal je Eintrag,
+    Anrechnung vektorisiert über (Einträge × Jahre).
+
+    Args:
+        eintraege: Wie bei berechne_du_rente_batch, optional ist_polizei_feuerwehr
+        renten: Liste (pro Eintrag der ursprünglichen Liste) von Listen mit
+            (von_jahr, bis_jahr, betrag_monatlich)
+        erwerbseinkommen: Wie renten, für Hinzuverdienst
+        festkomma: DU-Rente in Cent rechnen (siehe calculator/festkomma.py)
+
+    Returns:
+        Dictionary Feld -> Array (Einträge × Jahre) mit Versorgung nach
+        Anrechnung pro Jahr (Zeilen: anrechnung_als_zeilen)
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return {}
+    spalten = _spalten(eintraege, ANRECHNUNG_DU_FELDER)
+    ergebnis = _kern(berechne_du_rente_vec, berechne_du_rente_fix, festkomma)(
+        jahr_du=spalten["jahr_du"], **_profil_spalten(spalten)
+    )
+    grenzen = berechne_hoechstgrenzen_vec(
+        spalten["gruppe_idx"], spalten["geburtsjahr"], spalten["jahr_du"], spalten["verheiratet"], ist_du=True
+    )
+    regelaltersgrenze = np.where(
+        spalten["ist_polizei_feuerwehr"],
+        get_parameter_tabelle("regelaltersgrenze_polizei")[spalten["regelwerk"]],
+        get_parameter_tabelle("regelaltersgrenze_normal")[spalten["regelwerk"]]
+    )
+    return _anrechnung_matrix(
+        np.asarray(ergebnis["du_rente_brutto"]), grenzen,
+        _je_zeile(eintraege, renten), _je_zeile(eintraege, erwerbseinkommen),
+        spalten["jahr_du"], jahre_voraus,
+        spalten["geburtsjahr"] + regelaltersgrenze
+    )
+
+
+def berechne_du_entwicklung_batch(
+    eintraege,
+    jahre_voraus: int = 30,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Batch-Variante von berechne_du_entwicklung: DU-Rente für die nächsten
+    Jahre für alle Einträge in einer (Einträge × Jahre)-Matrix.
+
+    Returns:
+        Liste (pro Eintrag) von Listen mit DU-Renten pro Jahr
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    jahre = aktuelles_jahr + np.arange(jahre_voraus + 1)
+
+    spalten = _profil_spalten(_spalten(eintraege, DU_ENTWICKLUNG_FELDER))
+    spalten = {k: v[:, np.newaxis] for k, v in spalten.items()}
+    ergebnis = _kern(berechne_du_rente_vec, berechne_du_rente_fix, festkomma)(
+        jahr_du=jahre[np.newaxis, :], **spalten
+    )
+    ergebnis["jahr_du"] = jahre
+
+    return _matrix_zeilen(ergebnis, (anzahl, len(jahre)))
+
+
+def berechne_du_entwicklung_familie_batch(
+    eintraege,
+    geburtsjahre_kinder: list,
+    jahre_voraus: int = 30,
+    altersgrenze: int = KINDERGELD_ALTERSGRENZE,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Batch-Variante von berechne_du_entwicklung_familie: die Kinderzahl je
+    Eintrag und Jahr kommt aus einem Ereignis-Durchlauf über die ganze
+    (Einträge × Jahre)-Matrix (siehe berechne_kinder_matrix).
+
+    Args:
+        eintraege: Wie bei berechne_du_entwicklung_batch, optional mietenstufe
+        geburtsjahre_kinder: Liste (pro Eintrag der ursprünglichen Liste) von
+            Listen mit Geburtsjahren der Kinder
+        altersgrenze: Alter, ab dem ein Kind nicht mehr zählt
+
+    Returns:
+        Liste (pro Eintrag) von Listen mit DU-Rente und Kinderanteil pro Jahr
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    geburtsjahre_kinder = _je_zeile(eintraege, geburtsjahre_kinder)
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    jahre = aktuelles_jahr + np.arange(jahre_voraus + 1)
+
+    geprueft = _spalten(eintraege, DU_ENTWICKLUNG_FAMILIE_FELDER)
+    spalten = {k: v[:, np.newaxis] for k, v in _profil_spalten(geprueft).items()}
+    ergebnis = _kern(berechne_du_rente_vec, berechne_du_rente_fix, festkomma)(
+        jahr_du=jahre[np.newaxis, :], **spalten
+    )
+    kinder = berechne_kinder_matrix(geburtsjahre_kinder, jahre, altersgrenze)
+    familie = berechne_familienzuschlag_vec(
+        spalten["gruppe_idx"], spalten["verheiratet"], kinder, geprueft["mietenstufe"][:, np.newaxis]
+    )
+    kinderzuschlag = np.where(ergebnis["hat_anspruch"], familie["kinderzuschlag"], 0.0)
+    ergebnis["jahr_du"] = jahre
+    ergebnis["anzahl_kinder"] = kinder
+    ergebnis["kinderzuschlag"] = kinderzuschlag
+    ergebnis["kindergeld"] = _runde(kinder * KINDERGELD_MONATLICH)
+    ergebnis["du_versorgung_gesamt"] = _runde(ergebnis["du_rente_brutto"] + kinderzuschlag)
+
+    return _matrix_zeilen(ergebnis, (anzahl, len(jahre)))
+
+
+def berechne_pension_nach_alter_batch(
+    eintraege,
+    von_alter: int = 60,
+    bis_alter: int = 67,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Batch-Variante von berechne_pension_nach_alter: Ruhegehalt für mehrere
+    Pensionsalter für alle Einträge in einer (Einträge × Alter)-Matrix.
+
+    Returns:
+        Liste (pro Eintrag) von Listen mit Ruhegehalt pro Pensionsalter
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    alter = np.arange(von_alter, bis_alter + 1)
+
+    geprueft = _spalten(eintraege, PENSION_NACH_ALTER_FELDER)
+    spalten = {k: v[:, np.newaxis] for k, v in _profil_spalten(geprueft).items()}
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=spalten["geburtsjahr"] + alter[np.newaxis, :],
+        aktuelles_jahr=aktuelles_jahr,
+        ist_polizei_feuerwehr=geprueft["ist_polizei_feuerwehr"][:, np.newaxis],
+        **spalten
+    )
+    ergebnis["pensionsalter"] = alter
+
+    return _matrix_zeilen(ergebnis, (anzahl, len(alter)))
+
+
+def berechne_netto_pension_nach_alter_batch(
+    eintraege,
+    von_alter: int = 60,
+    bis_alter: int = 67,
+    aktuelles_jahr: int = None,
+    festkomma: bool = False
+) -> list:
+    """
+    Wie berechne_pension_nach_alter_batch, zusätzlich netto: der
+    Versorgungsfreibetrag folgt je Pensionsalter dem jeweiligen Jahr des
+    Versorgungsbeginns. Die ganze (Einträge × Alter)-Matrix wird in einem
+    Tarif-Durchlauf besteuert.
+
+    Args:
+        eintraege: Wie bei berechne_pension_nach_alter_batch, zusätzlich
+            steuerklasse und optional kirchensteuer, pkv_beitrag
+
+    Returns:
+        Liste (pro Eintrag) von Listen mit Ruhegehalt brutto/netto pro Pensionsalter
+    """
+    anzahl = _anzahl(eintraege)
+    if not anzahl:
+        return []
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    alter = np.arange(von_alter, bis_alter + 1)
+
+    geprueft = _spalten(eintraege, NETTO_PENSION_NACH_ALTER_FELDER)
+    spalten = {k: v[:, np.newaxis] for k, v in _profil_spalten(geprueft).items()}
+    jahr_pension = spalten["geburtsjahr"] + alter[np.newaxis, :]
+    ergebnis = _kern(berechne_ruhegehalt_vec, berechne_ruhegehalt_fix, festkomma)(
+        jahr_pension=jahr_pension,
+        aktuelles_jahr=aktuelles_jahr,
+        ist_polizei_feuerwehr=geprueft["ist_polizei_feuerwehr"][:, np.newaxis],
+        **spalten
+    )
+    ergebnis.update(berechne_netto_pension_vec(
+        ergebnis["ruhegehalt_brutto"],
+        jahr_pension,
+        geprueft["steuerklasse"][:, np.newaxis],
+        geprueft["kirchensteuer"][:, np.newaxis],
+        geprueft["pkv_beitrag"][:, np.newaxis],
+        kirchensteuersatz=get_parameter_tabelle("kirchensteuersatz")[geprueft["regelwerk"]][:, np.newaxis]
+    ))
+    ergebnis["pensionsalter"] = alter
+
+    return _matrix_zeilen(ergebnis, (anzahl, len(alter)))
+
+
+def berechne_tarifvergleich_batch(
+    eintraege,
+    alt=None,
+    neu=None,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Vergleicht Brutto, Netto und Ruhegehalt (brutto/netto) eines Bestands
+    unter zwei Tarifständen in einem Durchlauf.
+
+    Args:
+        eintraege: Liste von Dictionaries mit den Feldern aus
+            TARIFVERGLEICH_FELDER oder bereits geprüfte BatchEingaben
+        alt: Bisheriger Tarifstand (siehe get_tarifstand) oder Name einer
+            Parameterversion (Standard: aktive Version)
+        neu: Neuer Tarifstand oder Name einer Parameterversion (Standard:
+            aktive Version)
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+
+    Returns:
+        Dictionary mit alt, neu (Namen der Tarifstände), personen (Liste von
+        Dictionaries mit alt, neu und Differenz je Kennzahl, gleiche
+        Reihenfolge) und statistik (siehe berechne_tarifstatistik)
+    """
+    tarifstaende = [t if isinstance(t, dict) else get_tarifstand(t) for t in (alt, neu)]
+    anzahl = _anzahl(eintraege)
+    personen, statistik = [], berechne_tarifstatistik({}, [])
+    if anzahl:
+        spalten = _spalten(eintraege, TARIFVERGLEICH_FELDER)
+        werte = berechne_tarifvergleich_vec(
+            spalten["gruppe_idx"], spalten["stufe"], spalten["geburtsjahr"], spalten["jahr_verbeamtung"],
+            spalten["jahr_pension"], get_aktuelles_jahr(aktuelles_jahr), spalten["steuerklasse"], tarifstaende,
+            verheiratet=spalten["verheiratet"],
+            anzahl_kinder=spalten["anzahl_kinder"],
+            mietenstufe=spalten["mietenstufe"],
+            teilzeitjahre=spalten["teilzeitjahre"],
+            teilzeitanteil=spalten["teilzeitanteil"],
+            arbeitszeit_faktor=spalten["arbeitszeit_faktor"],
+            ist_polizei_feuerwehr=spalten["ist_polizei_feuerwehr"],
+            kirchensteuer=spalten["kirchensteuer"],
+            pkv_beitrag=spalten["pkv_beitrag"]
+        )
+        differenzen = berechne_differenzen(werte)
+        personen = _zeilen(differenzen, anzahl)
+        statistik = berechne_tarifstatistik(differenzen, spalten["gruppe_idx"])
+    return {
+        "alt": tarifstaende[0]["name"],
+        "neu": tarifstaende[1]["name"],
+        "personen": personen,
+        "statistik": statistik,
+    }
@@ -0,0 +1,455 @@
+"""
+Beförderungs-Pfade für Beamte NRW
+Modelliert eine Laufbahn mit Beförderungen (z.B. A13 -> A14 -> A15) und sucht
+per dynamischer Programmierung die günstigsten Beförderungsjahre.
+
+Modell:
+- Jedes Jahr zwischen Stichtag und Pensionierung wird in genau einem Amt
+  verbracht; eine Beförderung wirkt ab dem 1. Januar des Beförderungsjahrs.
+- Die Erfahrungsstufe läuft über calculator/pension.py bzw.
+  data/besoldung.py (berechne_stufe_nach_dienstjahren) weiter und wird auf
+  den Stufenbereich des jeweiligen Amts begrenzt; sie hängt also nur vom
+  Amt und vom Jahr ab, nicht vom Weg dorthin.
+- Ruhegehaltsfähig ist das letzte Amt, das mindestens zwei Jahre bekleidet
+  wurde (Mindestdauer nach § 5 Abs. 3 LBeamtVG NRW); wer kürzer im letzten
+  Amt war, erhält das Ruhegehalt aus dem zuletzt lange genug bekleideten
+  Amt davor. Das Ausgangsamt zählt immer.
+- Zwischen zwei Beförderungen liegt mindestens die Sperrfrist.
+
+Die Jahreswerte (Bezüge pro Amt und Jahr, Ruhegehalt pro ruhegehaltsfähigem
+Amt) werden einmal vorberechnet; jeder Pfad kostet danach nur noch
+Präfixsummen-Zugriffe. Die besten Alternativen liefert eine Bestensuche
+über die Tabellen der dynamischen Programmierung, ohne alle Pfade
+aufzuzählen.
+"""
+
+import heapq
+from functools import lru_cache
+from itertools import accumulate
+
+from calculator.gehalt import berechne_ruhegehaltsfaehige_bezuege
+from calculator.pension import berechne_ruhegehalt
+from calculator.stichtag import get_aktuelles_jahr
+from data.besoldung import BESOLDUNG_A, berechne_stufe_nach_dienstjahren
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+
+
+# Mindestdauer im Amt, damit es ruhegehaltsfähig wird (Jahre)
+MINDESTDAUER_RUHEGEHALTSFAEHIG = 2
+
+# Mindestabstand zwischen zwei Beförderungen (Jahre)
+SPERRFRIST_JAHRE = 1
+
+# Zielgrößen der Optimierung
+ZIEL_RUHEGEHALT = "ruhegehalt"  # monatliches Ruhegehalt
+ZIEL_LEBENSEINKOMMEN = "lebenseinkommen"  # Bezüge bis zur Pension + Versorgung
+ZIELE = (ZIEL_RUHEGEHALT, ZIEL_LEBENSEINKOMMEN)
+
+# Anzahl der zurückgegebenen Alternativen
+ANZAHL_ALTERNATIVEN = 10
+
+# Statistische Lebenserwartung für die Versorgungssumme
+STANDARD_LEBENSERWARTUNG = 85
+
+
+class _Laufbahn:
+    """
+    Vorberechnete Jahreswerte einer Laufbahn über mehrere Ämter.
+
+    Amt 0 ist das aktuelle Amt, Amt k die k-te Beförderungsstation.
+    """
+
+    def __init__(
+        self,
+        aemter: tuple,
+        stufe: int,
+        geburtsjahr: int,
+        jahr_verbeamtung: int,
+        jahr_pension: int,
+        verheiratet: bool,
+        mietenstufe: int,
+        teilzeitjahre: float,
+        teilzeitanteil: float,
+        arbeitszeit_faktor: float,
+        ist_polizei_feuerwehr: bool,
+        lebenserwartung: int,
+        aktuelles_jahr: int
+    ):
+        for amt in aemter:
+            if amt not in BESOLDUNG_A:
+                raise ValueError(f"Besoldungsgruppe {amt} nicht gefunden")
+        if jahr_pension <= aktuelles_jahr:
+            raise ValueError(f"Jahr der Pensionierung {jahr_pension} liegt nicht nach {aktuelles_jahr}")
+
+        self.aemter = aemter
+        self.start = aktuelles_jahr
+        self.ende = jahr_pension
+        self.jahre = list(range(aktuelles_jahr, jahr_pension))
+        self.geburtsjahr = geburtsjahr
+
+        # Stufe und Bezüge (monatlich) pro Amt und Jahr
+        self.stufen = [
+            [berechne_stufe_nach_dienstjahren(amt, stufe, jahr - aktuelles_jahr) for jahr in self.jahre]
+            for amt in aemter
+        ]
+        self.bezuege = [
+            [
+                berechne_ruhegehaltsfaehige_bezuege(amt, s, verheiratet, mietenstufe, arbeitszeit_faktor)
+                for s in stufen
+            ]
+            for amt, stufen in zip(aemter, self.stufen)
+        ]
+        # Präfixsummen der Jahresbezüge: summe[k][i] = Bezüge in Amt k für Jahre [start, start + i)
+        self.summe = [[0.0] + list(accumulate(12 * b for b in bezuege)) for bezuege in self.bezuege]
+
+        # Ruhegehalt, falls Amt k ruhegehaltsfähig ist
+        self.ruhegehalt = [
+            berechne_ruhegehalt(
+                besoldungsgruppe=amt,
+                stufe=stufe,
+                geburtsjahr=geburtsjahr,
+                jahr_verbeamtung=jahr_verbeamtung,
+                jahr_pension=jahr_pension,
+                verheiratet=verheiratet,
+                mietenstufe=mietenstufe,
+                teilzeitjahre=teilzeitjahre,
+                teilzeitanteil=teilzeitanteil,
+                arbeitszeit_faktor=arbeitszeit_faktor,
+                ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+                aktuelles_jahr=aktuelles_jahr
+            )
+            for amt in aemter
+        ]
+        self.versorgungsjahre = max(0, lebenserwartung - (jahr_pension - geburtsjahr))
+
+    def besoldung(self, k: int, von: int, bis: int) -> float:
+        """Bezüge in Amt k für die Jahre [von, bis)."""
+        return self.summe[k][bis - self.start] - self.summe[k][von - self.start]
+
+    @staticmethod
+    def ruhegehaltsfaehig_nach(k: int, seit: int, bis: int, bisher: int) -> int:
+        """
+        Ruhegehaltsfähiges Amt, nachdem Amt k in den Jahren [seit, bis)
+        bekleidet wurde; bisher ist das ruhegehaltsfähige Amt davor.
+        """
+        if k == 0 or bis - seit >= MINDESTDAUER_RUHEGEHALTSFAEHIG:
+            return k
+        return bisher
+
+    def ruhegehaltsfaehig(self, jahre: tuple) -> int:
+        """Ruhegehaltsfähiges Amt eines Pfads mit Beförderungsjahren jahre (Station 1..n)."""
+        grenzen = (self.start,) + tuple(jahre) + (self.ende,)
+        amt = 0
+        for k in range(len(grenzen) - 1):
+            amt = self.ruhegehaltsfaehig_nach(k, grenzen[k], grenzen[k + 1], amt)
+        return amt
+
+    def versorgung(self, k: int) -> float:
+        """Versorgungssumme bis zur Lebenserwartung aus Amt k."""
+        return self.ruhegehalt[k]["ruhegehalt_brutto"] * 12 * self.versorgungsjahre
+
+    def wert(self, k: int, von: int, bis: int, ziel: str) -> float:
+        """Beitrag der Jahre [von, bis) in Amt k zur Zielgröße."""
+        if ziel == ZIEL_RUHEGEHALT:
+            return 0.0
+        return self.besoldung(k, von, bis)
+
+    def abschluss(self, amt: int, ziel: str) -> float:
+        """Beitrag der Pensionierung mit ruhegehaltsfähigem Amt amt zur Zielgröße."""
+        if ziel == ZIEL_RUHEGEHALT:
+            return self.ruhegehalt[amt]["ruhegehalt_brutto"]
+        return self.versorgung(amt)
+
+    def bewerte(self, jahre: tuple, ziel: str) -> float:
+        """Zielgröße eines Pfads mit Beförderungsjahren jahre (Station 1..n)."""
+        grenzen = (self.start,) + tuple(jahre) + (self.ende,)
+        summe = sum(self.wert(k, grenzen[k], grenzen[k + 1], ziel) for k in range(len(grenzen) - 1))
+        return summe + self.abschluss(self.ruhegehaltsfaehig(jahre), ziel)
+
+
+@lru_cache(maxsize=64)
+def _get_laufbahn(*argumente) -> _Laufbahn:
+    """Gecachte Laufbahn (gleiche Eingaben -> gleiche Vorberechnung)."""
+    return _Laufbahn(*argumente)
+
+
+def _stationen(stationen, fruehestens: int, spaetestens: int) -> tuple:
+    """
+    Normalisiert Stationen zu (Amt, frühestens, spätestens).
+
+    Eine Station ist entweder eine Besoldungsgruppe ("A14") oder ein Tupel
+    (Besoldungsgruppe, frühestens, spätestens) mit eigenem Zeitfenster.
+    """
+    ergebnis = []
+    for station in stationen:
+        if isinstance(station, str):
+            amt, von, bis = station, fruehestens, spaetestens
+        else:
+            amt, von, bis = station
+            von = fruehestens if von is None else max(von, fruehestens)
+            bis = spaetestens if bis is None else min(bis, spaetestens)
+        ergebnis.append((amt, von, bis))
+    return tuple(ergebnis)
+
+
+def _pfad_dict(laufbahn: _Laufbahn, jahre: tuple, wert: float) -> dict:
+    """Kompakte Beschreibung eines Pfads."""
+    amt = laufbahn.ruhegehaltsfaehig(jahre)
+    return {
+        "befoerderungen": [
+            {"jahr": jahr, "besoldungsgruppe": laufbahn.aemter[k + 1], "alter": jahr - laufbahn.geburtsjahr}
+            for k, jahr in enumerate(jahre)
+        ],
+        "ruhegehaltsfaehiges_amt": laufbahn.aemter[amt],
+        "pension": laufbahn.ruhegehalt[amt]["ruhegehalt_brutto"],
+        "wert": round(wert, 2),
+    }
+
+
+def berechne_karrierepfad(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_pension: int,
+    befoerderungen: list = (),
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    lebenserwartung: int = STANDARD_LEBENSERWARTUNG,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Berechnet Besoldung und Ruhegehalt für einen festen Beförderungspfad.
+
+    Args:
+        besoldungsgruppe: Aktuelles Amt, z.B. "A13"
+        stufe: Aktuelle Erfahrungsstufe
+        geburtsjahr: Geburtsjahr
+        jahr_verbeamtung: Jahr der Verbeamtung
+        jahr_pension: Jahr der Pensionierung
+        befoerderungen: Liste von (Jahr, Besoldungsgruppe) in zeitlicher Folge
+        verheiratet: True wenn verheiratet
+        mietenstufe: Mietenstufe
+        teilzeitjahre: Jahre in Teilzeit
+        teilzeitanteil: Anteil der Teilzeit
+        arbeitszeit_faktor: Aktueller Arbeitszeit-Faktor
+        ist_polizei_feuerwehr: True für Polizei/Feuerwehr
+        lebenserwartung: Alter bis zu dem die Versorgung gezahlt wird
+        aktuelles_jahr: Bezugsjahr (Standard: Stichtag)
+
+    Returns:
+        Dictionary mit Jahresverlauf, ruhegehaltsfähigem Amt, Ruhegehalt
+        und Summen
+    """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    befoerderungen = sorted(befoerderungen)
+    jahre = tuple(jahr for jahr, _ in befoerderungen)
+
+    vorher = aktuelles_jahr
+    for jahr in jahre:
+        if jahr <= vorher or jahr >= jahr_pension:
+            raise ValueError(f"Beförderungsjahr {jahr} ungültig")
+        if jahr != jahre[0] and jahr - vorher < SPERRFRIST_JAHRE:
+            raise ValueError(f"Beförderungsjahr {jahr} ungültig (Sperrfrist)")
+        vorher = jahr
+
+    laufbahn = _get_laufbahn(
+        (besoldungsgruppe,) + tuple(amt for _, amt in befoerderungen),
+        stufe, geburtsjahr, jahr_verbeamtung, jahr_pension, verheiratet, mietenstufe,
+        teilzeitjahre, teilzeitanteil, arbeitszeit_faktor, ist_polizei_feuerwehr,
+        lebenserwartung, aktuelles_jahr
+    )
+
+    verlauf = []
+    grenzen = (aktuelles_jahr,) + jahre + (jahr_pension,)
+    for k in range(len(grenzen) - 1):
+        for jahr in range(grenzen[k], grenzen[k + 1]):
+            i = jahr - aktuelles_jahr
+            verlauf.append({
+                "jahr": jahr,
+                "alter": jahr - geburtsjahr,
+                "besoldungsgruppe": laufbahn.aemter[k],
+                "stufe": laufbahn.stufen[k][i],
+                "bezuege": laufbahn.bezuege[k][i],
+            })
+
+    amt = laufbahn.ruhegehaltsfaehig(jahre)
+    besoldung_summe = laufbahn.bewerte(jahre, ZIEL_LEBENSEINKOMMEN) - laufbahn.versorgung(amt)
+    return {
+        "verlauf": verlauf,
+        "ruhegehaltsfaehiges_amt": laufbahn.aemter[amt],
+        "letztes_amt_ruhegehaltsfaehig": amt == len(jahre),
+        "pension": laufbahn.ruhegehalt[amt],
+        "besoldung_summe": round(besoldung_summe, 2),
+        "versorgung_summe": round(laufbahn.versorgung(amt), 2),
+        "lebenseinkommen": round(besoldung_summe + laufbahn.versorgung(amt), 2),
+    }
+
+
+def optimiere_befoerderungen(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_pension: int,
+    stationen: list,
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    fruehestens: int = None,
+    spaetestens: int = None,
+    ziel: str = ZIEL_LEBENSEINKOMMEN,
+    lebenserwartung: int = STANDARD_LEBENSERWARTUNG,
+    anzahl_alternativen: int = ANZAHL_ALTERNATIVEN,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Sucht die Beförderungsjahre mit dem höchsten Zielwert.
+
+    Jede Station kann erreicht werden oder nicht (Pfade dürfen nach jeder
+    Station enden). Die Suche läuft als dynamische Programmierung über
+    (Station, Beförderungsjahr): rückwärts der beste Rest ab einer
+    Beförderung, vorwärts der beste Weg dorthin. Gerechnet wird in ganzen
+    Cent, Gleichstände sind also exakt. Bei gleichem Wert gewinnt die
+    frühere Beförderung, eine Beförderung auch gegen das Enden ohne sie
+    (Pfade werden als Jahresfolgen verglichen, Enden zählt als unendlich
+    spätes Jahr). Dieselbe Reihenfolge gilt für die Alternativen, deren
+    erste daher der beste Pfad ist.
+
+    Args:
+        besoldungsgruppe: Aktuelles Amt, z.B. "A13"
+        stufe: Aktuelle Erfahrungsstufe
+        geburtsjahr: Geburtsjahr
+        jahr_verbeamtung: Jahr der Verbeamtung
+        jahr_pension: Jahr der Pensionierung
+        stationen: Beförderungsämter in Reihenfolge, z.B. ["A14", "A15"]
+            oder mit eigenem Zeitfenster [("A14", 2027, 2030), "A15"]
+        fruehestens: Frühestes Beförderungsjahr (Standard: Stichtag + 1)
+        spaetestens: Spätestes Beförderungsjahr (Standard: Pension - 1)
+        ziel: ZIEL_RUHEGEHALT oder ZIEL_LEBENSEINKOMMEN
+        lebenserwartung: Alter bis zu dem die Versorgung gezahlt wird
+        anzahl_alternativen: Anzahl der zurückgegebenen besten Pfade
+        aktuelles_jahr: Bezugsjahr (Standard: Stichtag)
+
+    Returns:
+        Dictionary mit bestem Pfad, Pfad ohne Beförderung, besten
+        Alternativen und bestem Wert je Station und Beförderungsjahr
+    """
+    if ziel not in ZIELE:
+        raise ValueError(f"Ziel {ziel} nicht gefunden")
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    fruehestens = aktuelles_jahr + 1 if fruehestens is None else max(fruehestens, aktuelles_jahr + 1)
+    spaetestens = jahr_pension - 1 if spaetestens is None else min(spaetestens, jahr_pension - 1)
+    stationen = _stationen(stationen, fruehestens, spaetestens)
+
+    laufbahn = _get_laufbahn(
+        (besoldungsgruppe,) + tuple(amt for amt, _, _ in stationen),
+        stufe, geburtsjahr, jahr_verbeamtung, jahr_pension, verheiratet, mietenstufe,
+        teilzeitjahre, teilzeitanteil, arbeitszeit_faktor, ist_polizei_feuerwehr,
+        lebenserwartung, aktuelles_jahr
+    )
+    anzahl = len(stationen)
+    ende = jahr_pension
+
+    def moegliche_jahre(k: int, seit: int) -> range:
+        """Beförderungsjahre für Station k (1..n), wenn Amt k-1 seit seit bekleidet wird."""
+        _, von, bis = stationen[k - 1]
+        frueheste = seit + SPERRFRIST_JAHRE if k > 1 else seit + 1
+        return range(max(von, frueheste), bis + 1)
+
+    def cent(betrag: float) -> int:
+        """Betrag in ganzen Cent (Summen und Vergleiche ohne Rundungsfehler)."""
+        return round(betrag * 100)
+
+    def abschluss(k: int, zustand: tuple) -> int:
+        """Wert der Pensionierung aus Amt k im Zustand (seit, ruhegehaltsfähiges Amt davor)."""
+        seit, amt = zustand
+        amt = laufbahn.ruhegehaltsfaehig_nach(k, seit, ende, amt)
+        return cent(laufbahn.wert(k, seit, ende, ziel)) + cent(laufbahn.abschluss(amt, ziel))
+
+    def nachfolger(k: int, zustand: tuple):
+        """Beförderungen zu Station k+1 in Jahresfolge: (Jahr, Folgezustand, Wert bis dahin in Amt k)."""
+        seit, amt = zustand
+        for jahr in moegliche_jahre(k + 1, seit):
+            folge = (jahr, laufbahn.ruhegehaltsfaehig_nach(k, seit, jahr, amt))
+            yield jahr, folge, cent(laufbahn.wert(k, seit, jahr, ziel))
+
+    # Zustand je Station: (Beförderungsjahr, ruhegehaltsfähiges Amt davor);
+    # Letzteres entscheidet, worauf eine zu kurz bekleidete Station zurückfällt.
+    # Vorwärts: weg[k][zustand] = bester Wert vor der Beförderung zu Station k
+    start = (aktuelles_jahr, 0)
+    weg = [{start: 0}] + [dict() for _ in range(anzahl)]
+    for k in range(anzahl):
+        for zustand, bisher in weg[k].items():
+            for _, folge, wert in nachfolger(k, zustand):
+                if bisher + wert > weg[k + 1].get(folge, float("-inf")):
+                    weg[k + 1][folge] = bisher + wert
+
+    # Rückwärts: rest[k][zustand] = bester Wert ab Amt k bis zur Versorgung;
+    # bei Gleichstand die früheste Beförderung, Enden nur bei echtem Vorteil
+    rest = [dict() for _ in range(anzahl + 1)]
+    wahl = [dict() for _ in range(anzahl + 1)]
+    for k in range(anzahl, -1, -1):
+        for zustand in sorted(weg[k]):
+            bester, beste_wahl = float("-inf"), None
+            if k < anzahl:
+                for _, folge, wert in nachfolger(k, zustand):
+                    if wert + rest[k + 1][folge] > bester:
+                        bester, beste_wahl = wert + rest[k + 1][folge], folge
+            if abschluss(k, zustand) > bester:
+                bester, beste_wahl = abschluss(k, zustand), None
+            rest[k][zustand] = bester
+            wahl[k][zustand] = beste_wahl
+
+    # Bester Pfad aus den gespeicherten Entscheidungen
+    jahre = []
+    k, zustand = 0, start
+    while wahl[k][zustand] is not None:
+        zustand = wahl[k][zustand]
+        jahre.append(zustand[0])
+        k += 1
+    bester_wert = rest[0][start]
+
+    nach_jahr = {}
+    for k in range(1, anzahl + 1):
+        werte = {}
+        for zustand, bisher in weg[k].items():
+            werte[zustand[0]] = max(werte.get(zustand[0], float("-inf")), bisher + rest[k][zustand])
+        nach_jahr[laufbahn.aemter[k]] = {jahr: round(wert / 100, 2) for jahr, wert in sorted(werte.items())}
+
+    # Beste Alternativen per Bestensuche: rest ist die exakte Obergrenze für
+    # jeden Teilpfad, fertige Pfade kommen daher absteigend nach Wert aus dem
+    # Heap, bei gleichem Wert nach Jahresfolge mit Enden als unendlich spätem
+    # Jahr (dieselbe Reihenfolge wie beim besten Pfad)
+    bewertete_pfade = 0
+    alternativen = []
+    kandidaten = [(-bester_wert, (), 0, start, 0)]
+    while kandidaten and len(alternativen) < anzahl_alternativen:
+        negativ, schluessel, k, zustand, bisher = heapq.heappop(kandidaten)
+        pfad = schluessel[:-1] if k is None else schluessel
+        if k is None:
+            alternativen.append(_pfad_dict(laufbahn, pfad, -negativ / 100))
+            continue
+        bewertete_pfade += 1
+        heapq.heappush(kandidaten, (-(bisher + abschluss(k, zustand)), pfad + (float("inf"),), None, None, 0))
+        if k < anzahl:
+            for jahr, folge, wert in nachfolger(k, zustand):
+                obergrenze = bisher + wert + rest[k + 1][folge]
+                heapq.heappush(kandidaten, (-obergrenze, pfad + (jahr,), k + 1, folge, bisher + wert))
+
+    return {
+        "ziel": ziel,
+        "bester_pfad": _pfad_dict(laufbahn, tuple(jahre), bester_wert / 100),
+        "wert": round(bester_wert / 100, 2),
+        "ohne_befoerderung": _pfad_dict(laufbahn, (), laufbahn.bewerte((), ziel)),
+        "alternativen": alternativen,
+        "nach_jahr": nach_jahr,
+        "bewertete_pfade": bewertete_pfade,
+    }
@@ -13,26 +13,31 @@ from calculator.pension import (
 )
 from data.besoldung import MINDESTVERSORGUNG_GRUNDGEHALT
 from data.familienzuschlag import STANDARD_MIETENSTUFE
+from calculator.stichtag import get_aktuelles_jahr
+from data.parameter import get_parameter
 
 
+# Konstanten aus der aktiven Parameterdatei (data/parameterdateien/)
+_DU = get_parameter()["dienstunfaehigkeit"]
+
 # Zurechnungszeit-Grenzen
 # Vor 2019: Zurechnungszeit bis 60 Jahre
 # Ab 2019: Zurechnungszeit bis 62 Jahre
-ZURECHNUNGSZEIT_GRENZE_ALT = 60  # vor 2019
-ZURECHNUNGSZEIT_GRENZE_NEU = 62  # ab 2019
-ZURECHNUNGSZEIT_UEBERGANGSJAHR = 2019
+ZURECHNUNGSZEIT_GRENZE_ALT = _DU["zurechnungszeit_grenze_alt"]  # vor 2019
+ZURECHNUNGSZEIT_GRENZE_NEU = _DU["zurechnungszeit_grenze_neu"]  # ab 2019
+ZURECHNUNGSZEIT_UEBERGANGSJAHR = _DU["zurechnungszeit_uebergangsjahr"]
 
 # Faktor für Zurechnungszeit (2/3)
-ZURECHNUNGSZEIT_FAKTOR = 2 / 3
+ZURECHNUNGSZEIT_FAKTOR = _DU["zurechnungszeit_faktor"]
 
 # DU-Abschlag ab Alter unter 63
-DU_ABSCHLAG_ALTERSGRENZE = 63
+DU_ABSCHLAG_ALTERSGRENZE = _DU["du_abschlag_altersgrenze"]
 
 # Mindestversorgungssatz
-MINDESTVERSORGUNGSSATZ = 65.0  # Prozent
+MINDESTVERSORGUNGSSATZ = _DU["mindestversorgungssatz"]  # Prozent
 
 # Wartezeit für Versorgungsanspruch
-WARTEZEIT_JAHRE = 5  # Mindestens 5 Jahre Dienstzeit für Anspruch
+WARTEZEIT_JAHRE = _DU["wartezeit_jahre"]  # Mindestens 5 Jahre Dienstzeit für Anspruch
 
 
 def berechne_zurechnungszeit(
@@ -228,19 +233,20 @@ def berechne_du_entwicklung(
     teilzeitanteil: float = 1.0,
     arbeitszeit_faktor: float = 1.0,
     ist_polizei_feuerwehr: bool = False,
-    jahre_voraus: int = 30
+    jahre_voraus: int = 30,
+    aktuelles_jahr: int = None
 ) -> list:
     """
     Berechnet die DU-Rente für die nächsten Jahre.
 
     Args:
         jahre_voraus: Anzahl Jahre in die Zukunft
+        aktuelles_jahr: Erstes Jahr der Entwicklung (Standard: Stichtag)
 
     Returns:
         Liste von Dictionaries mit DU-Rente pro Jahr
     """
-    import datetime
-    aktuelles_jahr = datetime.datetime.now().year
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
 
     ergebnisse = []
 
@@ -0,0 +1,420 @@
+"""
+Geprüfte Eingaben für Batch-Läufe
+Prüft und normalisiert die Eingabe-Dictionaries einer Liste (z.B. eines
+Personalbestands) einmalig, bevor gerechnet wird:
+
+- Besoldungsgruppen werden vereinheitlicht ("a 13" -> "A13") und in
+  Gruppenindizes der Lookup-Tabellen übersetzt, Regelwerke (Dienstherren)
+  in Indizes aus calculator/regelwerk.py,
+- Stufen werden auf den gültigen Bereich der Gruppe, Mietenstufen auf 1-7
+  begrenzt (wie in data/besoldung.py bzw. data/familienzuschlag.py),
+- Jahre, Faktoren, Steuerklassen und Wahrheitswerte werden auf Typ und
+  Wertebereich geprüft.
+
+Das Ergebnis (BatchEingaben) enthält nur noch gültige Zeilen als Spalten
+(numpy-Arrays); die Rechenkerne in calculator/vektor.py laufen darauf ohne
+weitere Prüfungen. Ungültige Zeilen brechen den Lauf nicht ab, sondern
+landen im Fehlerbericht.
+
+Beispiel:
+    eingaben = pruefe_eintraege(bestand, RUHEGEHALT_FELDER)
+    ergebnisse = eingaben.einordnen(berechne_ruhegehalt_batch(eingaben))
+    bericht = eingaben.fehlerbericht()
+"""
+
+import math
+
+import numpy as np
+
+from calculator.regelwerk import REGELWERK_INDEX, STANDARD_REGELWERK
+from calculator.vektor import GRUPPEN, GRUPPEN_INDEX, MAX_STUFE_TABELLE
+from data.besoldung import get_min_stufe
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+
+
+# Plausible Kalenderjahre für Geburt, Verbeamtung, Pension und DU
+MIN_JAHR = 1900
+MAX_JAHR = 2150
+
+# Plausibler Eingabebereich für Stufen (innerhalb wird je Gruppe begrenzt)
+# und Kinderzahlen
+MIN_STUFE_EINGABE = 0
+MAX_STUFE_EINGABE = 99
+MAX_KINDER = 20
+
+# Wertebereich der Ganzzahlspalten (int64)
+_INT64 = np.iinfo(np.int64)
+
+# Kleinste Stufe je Gruppe (Zeilenindex wie in calculator/vektor.py)
+MIN_STUFE_TABELLE = np.array([get_min_stufe(g) for g in GRUPPEN], dtype=np.int64)
+
+# Kennzeichnung für Pflichtfelder
+_PFLICHT = object()
+
+
+def _als_ganzzahl(wert) -> int:
+    if isinstance(wert, (bool, np.bool_)):
+        raise ValueError("keine ganze Zahl")
+    if isinstance(wert, float):
+        if not wert.is_integer():
+            raise ValueError("keine ganze Zahl")
+        return int(wert)
+    try:
+        zahl = int(wert)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("keine ganze Zahl")
+    if not _INT64.min <= zahl <= _INT64.max:
+        raise ValueError("außerhalb des Zahlenbereichs")
+    return zahl
+
+
+def _als_zahl(wert) -> float:
+    if isinstance(wert, (bool, np.bool_)):
+        raise ValueError("keine Zahl")
+    try:
+        zahl = float(wert)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("keine Zahl")
+    if not math.isfinite(zahl):
+        raise ValueError("keine endliche Zahl")
+    return zahl
+
+
+def _als_wahrheitswert(wert) -> bool:
+    if isinstance(wert, (bool, np.bool_)):
+        return bool(wert)
+    if isinstance(wert, (int, float, np.integer)) and wert in (0, 1):
+        return bool(wert)
+    raise ValueError("kein Wahrheitswert")
+
+
+def _feld(art: str, standard=_PFLICHT, minimum=None, maximum=None,
+          minimum_ausgeschlossen: bool = False, begrenzen: bool = False) -> dict:
+    """
+    Beschreibt ein Eingabefeld.
+
+    Args:
+        art: "gruppe", "regelwerk", "ganzzahl", "zahl" oder "wahrheitswert"
+        standard: Standardwert (ohne Angabe: Pflichtfeld)
+        minimum, maximum: Erlaubter Wertebereich
+        minimum_ausgeschlossen: Minimum selbst ist nicht erlaubt
+        begrenzen: Werte außerhalb auf den Bereich begrenzen statt ablehnen
+    """
+    return {
+        "art": art,
+        "standard": standard,
+        "minimum": minimum,
+        "maximum": maximum,
+        "minimum_ausgeschlossen": minimum_ausgeschlossen,
+        "begrenzen": begrenzen,
+    }
+
+
+# Eingabefelder aller Batch-Funktionen
+FELDER = {
+    "besoldungsgruppe": _feld("gruppe"),
+    # Stufe wird je Gruppe begrenzt (siehe _begrenze_stufe)
+    "stufe": _feld("ganzzahl", minimum=MIN_STUFE_EINGABE, maximum=MAX_STUFE_EINGABE),
+    "geburtsjahr": _feld("ganzzahl", minimum=MIN_JAHR, maximum=MAX_JAHR),
+    "jahr_verbeamtung": _feld("ganzzahl", minimum=MIN_JAHR, maximum=MAX_JAHR),
+    "jahr_pension": _feld("ganzzahl", minimum=MIN_JAHR, maximum=MAX_JAHR),
+    "jahr_du": _feld("ganzzahl", minimum=MIN_JAHR, maximum=MAX_JAHR),
+    "jahr_tod": _feld("ganzzahl", minimum=MIN_JAHR, maximum=MAX_JAHR),
+    "verheiratet": _feld("wahrheitswert", False),
+    "anzahl_kinder": _feld("ganzzahl", 0, minimum=0, maximum=MAX_KINDER),
+    "mietenstufe": _feld("ganzzahl", STANDARD_MIETENSTUFE, minimum=1, maximum=7, begrenzen=True),
+    "teilzeitjahre": _feld("zahl", 0.0, minimum=0.0),
+    "teilzeitanteil": _feld("zahl", 1.0, minimum=0.0, maximum=1.0),
+    "arbeitszeit_faktor": _feld("zahl", 1.0, minimum=0.0, maximum=1.0, minimum_ausgeschlossen=True),
+    "ist_polizei_feuerwehr": _feld("wahrheitswert", False),
+    "brutto_monatlich": _feld("zahl", minimum=0.0),
+    "brutto_monatlich_partner": _feld("zahl", minimum=0.0),
+    "partner_beamter": _feld("wahrheitswert", True),
+    "steuerklasse": _feld("ganzzahl", minimum=1, maximum=6),
+    "kirchensteuer": _feld("wahrheitswert", False),
+    # Negative PKV-Beiträge zählen wie in berechne_netto als 0
+    "pkv_beitrag": _feld("zahl", 0.0, minimum=0.0, begrenzen=True),
+    "regelwerk": _feld("regelwerk", STANDARD_REGELWERK),
+}
+
+# Spalten-dtype und (für den schnellen Weg) zulässige Python-Typen je Art
+_DTYPES = {"gruppe": np.int64, "regelwerk": np.int64, "ganzzahl": np.int64, "zahl": float, "wahrheitswert": bool}
+_SAUBERE_TYPEN = {"ganzzahl": {int}, "zahl": {int, float}, "wahrheitswert": {bool}}
+_PLATZHALTER = {"gruppe": "", "regelwerk": STANDARD_REGELWERK, "ganzzahl": 0, "zahl": 0.0, "wahrheitswert": False}
+
+
+def _bereich_text(feld: dict) -> str:
+    links = "(" if feld["minimum_ausgeschlossen"] else "["
+    if feld["maximum"] is None:
+        return f"mindestens {feld['minimum']}" if links == "[" else f"größer {feld['minimum']}"
+    return f"außerhalb {links}{feld['minimum']}, {feld['maximum']}]"
+
+
+def _pruefe_wert(name: str, feld: dict, wert):
+    """
+    Prüft und normalisiert einen Einzelwert.
+
+    Returns:
+        Normalisierter Wert (bei Besoldungsgruppen der Gruppenindex, bei
+        Regelwerken der Regelwerk-Index)
+
+    Raises:
+        ValueError: Mit lesbarer Meldung, wenn der Wert ungültig ist
+    """
+    art = feld["art"]
+    if art == "gruppe":
+        gruppe = "".join(wert.split()).upper() if isinstance(wert, str) else None
+        if gruppe not in GRUPPEN_INDEX:
+            raise ValueError(f"Besoldungsgruppe {wert} nicht gefunden")
+        return GRUPPEN_INDEX[gruppe]
+    if art == "regelwerk":
+        if not isinstance(wert, str) or wert not in REGELWERK_INDEX:
+            raise ValueError(f"Regelwerk {wert} nicht gefunden")
+        return REGELWERK_INDEX[wert]
+
+    try:
+        if art == "wahrheitswert":
+            return _als_wahrheitswert(wert)
+        zahl = _als_ganzzahl(wert) if art == "ganzzahl" else _als_zahl(wert)
+    except ValueError as e:
+        raise ValueError(f"Feld {name} ungültig: {wert!r} ({e})")
+
+    minimum, maximum = feld["minimum"], feld["maximum"]
+    if feld["begrenzen"]:
+        zahl = max(minimum, zahl)
+        return zahl if maximum is None else min(zahl, maximum)
+    zu_klein = minimum is not None and (zahl <= minimum if feld["minimum_ausgeschlossen"] else zahl < minimum)
+    if zu_klein or (maximum is not None and zahl > maximum):
+        raise ValueError(f"Feld {name} ungültig: {wert!r} ({_bereich_text(feld)})")
+    return zahl
+
+
+def _pruefe_spalte(feld: dict, werte: list) -> tuple:
+    """
+    Schneller Weg: prüft eine ganze Spalte vektorisiert.
+
+    Returns:
+        Tuple (Array, Maske gültiger Zeilen) oder None, wenn die Spalte
+        Werte enthält, die einzeln geprüft werden müssen
+    """
+    art = feld["art"]
+    if art == "gruppe":
+        indizes = [GRUPPEN_INDEX.get(w, -1) if type(w) is str else -1 for w in werte]
+        array = np.array(indizes, dtype=np.int64)
+        return array, array >= 0
+    if art == "regelwerk":
+        indizes = [REGELWERK_INDEX.get(w, -1) if type(w) is str else -1 for w in werte]
+        array = np.array(indizes, dtype=np.int64)
+        return array, array >= 0
+
+    if not set(map(type, werte)) <= _SAUBERE_TYPEN[art]:
+        return None
+    try:
+        array = np.array(werte, dtype=_DTYPES[art])
+    except OverflowError:
+        # Ganzzahlen außerhalb von int64 bzw. float: einzeln prüfen
+        return None
+    gueltig = np.ones(len(werte), dtype=bool)
+    if art == "wahrheitswert":
+        return array, gueltig
+
+    minimum, maximum = feld["minimum"], feld["maximum"]
+    if art == "zahl":
+        gueltig &= np.isfinite(array)
+    if feld["begrenzen"]:
+        return np.clip(array, minimum, maximum), gueltig
+    if minimum is not None:
+        gueltig &= array > minimum if feld["minimum_ausgeschlossen"] else array >= minimum
+    if maximum is not None:
+        gueltig &= array <= maximum
+    return array, gueltig
+
+
+def _begrenze_stufe(stufe, gruppe_idx):
+    """Stufe auf den Bereich der Gruppe begrenzen (wie get_grundgehalt)."""
+    return np.clip(stufe, MIN_STUFE_TABELLE[gruppe_idx], MAX_STUFE_TABELLE[gruppe_idx])
+
+
+def pruefe_eintrag(eintrag: dict, felder) -> tuple:
+    """
+    Prüft und normalisiert einen einzelnen Eintrag.
+
+    Args:
+        eintrag: Eingabe-Dictionary
+        felder: Namen der benötigten Felder (Schlüssel von FELDER)
+
+    Returns:
+        Tuple (normalisierte Werte als Dictionary, Liste von Fehlern); jeder
+        Fehler ist ein Dictionary mit feld, wert und meldung
+    """
+    werte = {}
+    fehler = []
+    for name in felder:
+        feld = FELDER[name]
+        wert = eintrag.get(name)
+        if wert is None:
+            if feld["standard"] is _PFLICHT:
+                fehler.append({"feld": name, "wert": None, "meldung": f"Feld {name} fehlt"})
+            else:
+                werte[name] = feld["standard"]
+            continue
+        try:
+            werte[name] = _pruefe_wert(name, feld, wert)
+        except ValueError as e:
+            fehler.append({"feld": name, "wert": wert, "meldung": str(e)})
+
+    if "besoldungsgruppe" in werte:
+        gruppe_idx = werte["besoldungsgruppe"]
+        werte["besoldungsgruppe"] = GRUPPEN[gruppe_idx]
+        if "stufe" in werte:
+            werte["stufe"] = int(_begrenze_stufe(werte["stufe"], gruppe_idx))
+    if isinstance(werte.get("regelwerk"), int):
+        werte["regelwerk"] = list(REGELWERK_INDEX)[werte["regelwerk"]]
+    return werte, fehler
+
+
+class BatchEingaben:
+    """
+    Geprüfte und normalisierte Eingaben eines Batch-Laufs als Spalten.
+
+    Attributes:
+        spalten: Feldname -> numpy-Array (nur gültige Zeilen); statt
+            besoldungsgruppe enthält es gruppe_idx, regelwerk enthält
+            Regelwerk-Indizes
+        zeilen: Index jeder gültigen Zeile in der ursprünglichen Liste
+        anzahl_eintraege: Anzahl Einträge insgesamt
+        fehler: Liste der Fehler (zeile, feld, wert, meldung)
+    """
+
+    def __init__(self, spalten: dict, zeilen: np.ndarray, anzahl_eintraege: int, fehler: list):
+        self.spalten = spalten
+        self.zeilen = zeilen
+        self.anzahl_eintraege = anzahl_eintraege
+        self.fehler = fehler
+
+    @property
+    def anzahl(self) -> int:
+        """Anzahl gültiger Zeilen."""
+        return len(self.zeilen)
+
+    def get_fehler_je_zeile(self) -> dict:
+        """
+        Gibt die Fehlermeldungen gruppiert nach Zeile zurück.
+
+        Returns:
+            Dictionary Zeile -> Meldung (mehrere Fehler mit "; " verbunden)
+        """
+        meldungen = {}
+        for f in self.fehler:
+            meldungen.setdefault(f["zeile"], []).append(f["meldung"])
+        return {zeile: "; ".join(m) for zeile, m in meldungen.items()}
+
+    def einordnen(self, ergebnisse: list, fehlend=None) -> list:
+        """
+        Ordnet Ergebnisse der gültigen Zeilen wieder in die ursprüngliche
+        Reihenfolge ein.
+
+        Args:
+            ergebnisse: Ergebnisse in der Reihenfolge von zeilen
+            fehlend: Platzhalter für ungültige Zeilen
+
+        Returns:
+            Liste mit einem Eintrag pro ursprünglicher Zeile
+        """
+        alle = [fehlend] * self.anzahl_eintraege
+        for zeile, ergebnis in zip(self.zeilen.tolist(), ergebnisse):
+            alle[zeile] = ergebnis
+        return alle
+
+    def fehlerbericht(self) -> dict:
+        """
+        Fasst die Prüfung zusammen.
+
+        Returns:
+            Dictionary mit Anzahl Einträge, gültigen und fehlerhaften Zeilen,
+            Fehlern je Feld und der Fehlerliste
+        """
+        je_feld = {}
+        for f in self.fehler:
+            je_feld[f["feld"]] = je_feld.get(f["feld"], 0) + 1
+        fehlerhaft = self.anzahl_eintraege - self.anzahl
+        return {
+            "eintraege": self.anzahl_eintraege,
+            "gueltig": self.anzahl,
+            "fehlerhaft": fehlerhaft,
+            "fehler_je_feld": je_feld,
+            "fehler": self.fehler,
+        }
+
+
+def pruefe_eintraege(eintraege: list, felder, strikt: bool = False) -> BatchEingaben:
+    """
+    Prüft und normalisiert alle Einträge einmalig und baut die Spalten auf.
+
+    Args:
+        eintraege: Liste von Eingabe-Dictionaries
+        felder: Namen der benötigten Felder (Schlüssel von FELDER)
+        strikt: Beim ersten ungültigen Eintrag abbrechen statt ihn zu
+            überspringen
+
+    Returns:
+        BatchEingaben mit den gültigen Zeilen und dem Fehlerbericht
+
+    Raises:
+        ValueError: Bei unbekannten Feldern oder (strikt) ungültigen Einträgen
+    """
+    for name in felder:
+        if name not in FELDER:
+            raise ValueError(f"Feld {name} nicht gefunden")
+
+    anzahl = len(eintraege)
+    ist_objekt = np.array([isinstance(e, dict) for e in eintraege], dtype=bool)
+    gueltig = ist_objekt.copy()
+    fehler = [
+        {"zeile": zeile, "feld": None, "wert": eintraege[zeile], "meldung": "Eintrag ist kein Objekt"}
+        for zeile in np.flatnonzero(~ist_objekt).tolist()
+    ]
+
+    spalten = {}
+    for name in felder:
+        feld = FELDER[name]
+        standard = feld["standard"]
+        rohwerte = [e.get(name) if isinstance(e, dict) else None for e in eintraege]
+        fehlend = np.array([wert is None for wert in rohwerte], dtype=bool)
+        pruefbar = ist_objekt
+        if fehlend.any():
+            if standard is _PFLICHT:
+                pruefbar = ist_objekt & ~fehlend
+                for zeile in np.flatnonzero(ist_objekt & fehlend).tolist():
+                    fehler.append({"zeile": zeile, "feld": name, "wert": None, "meldung": f"Feld {name} fehlt"})
+                    gueltig[zeile] = False
+            # Platzhalter für fehlende Werte, damit die Spalte einheitlich bleibt
+            ersatz = _PLATZHALTER[feld["art"]] if standard is _PFLICHT else standard
+            rohwerte = [ersatz if wert is None else wert for wert in rohwerte]
+
+        ergebnis = _pruefe_spalte(feld, rohwerte)
+        if ergebnis is not None:
+            array, spalte_gueltig = ergebnis
+            nachpruefen = np.flatnonzero(~spalte_gueltig & pruefbar).tolist()
+        else:
+            array = np.zeros(anzahl, dtype=_DTYPES[feld["art"]])
+            nachpruefen = np.flatnonzero(pruefbar).tolist()
+
+        # Langsamer Weg nur für auffällige Zeilen: normalisieren oder Meldung erzeugen
+        for zeile in nachpruefen:
+            wert = rohwerte[zeile]
+            try:
+                array[zeile] = _pruefe_wert(name, feld, wert)
+            except ValueError as e:
+                fehler.append({"zeile": zeile, "feld": name, "wert": wert, "meldung": str(e)})
+                gueltig[zeile] = False
+        spalten["gruppe_idx" if name == "besoldungsgruppe" else name] = array
+
+    fehler.sort(key=lambda f: f["zeile"])
+    if strikt and fehler:
+        raise ValueError(fehler[0]["meldung"])
+
+    spalten = {name: array[gueltig] for name, array in spalten.items()}
+    if "stufe" in spalten and "gruppe_idx" in spalten:
+        spalten["stufe"] = _begrenze_stufe(spalten["stufe"], spalten["gruppe_idx"])
+    return BatchEingaben(spalten, np.flatnonzero(gueltig), anzahl, fehler)
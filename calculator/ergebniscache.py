@@ -0,0 +1,195 @@
+"""
+Persistenter Ergebnis-Cache (SQLite)
+Speichert Berechnungsergebnisse über Sitzungen und Neustarts hinweg.
+
+Schlüssel ist ein SHA-256-Hash aus Funktionsname, kanonisch serialisierten
+Eingaben, Tarifversion und Bezugsjahr (Stichtag, siehe
+calculator/stichtag.py). Die Tarifversion ist ein Hash über die Quelltexte
+von data/, calculator/ und ui/ (dort liegen die Knoten des Rechengraphen,
+ui/rechengraph.py) und die aktive Parameterversion (data/parameter.py) -
+jede Änderung an Tabellen, Parametern, Rechenregeln oder Knoten macht alte
+Einträge damit automatisch ungültig.
+
+Mehrere Worker-Prozesse können dieselbe Datei gleichzeitig nutzen (WAL-Modus,
+Busy-Timeout, eine Verbindung pro Prozess und Thread). Bei Überschreiten der
+maximalen Größe werden die am längsten nicht genutzten Einträge entfernt.
+
+Aktivierung über die Umgebungsvariable BEAMTENRECHNER_CACHE=<Pfad>.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from calculator.stichtag import get_aktuelles_jahr
+from data.parameter import get_parameterversion, get_quellen_pruefsumme
+
+
+# Umgebungsvariable mit dem Pfad der Cache-Datei
+CACHE_UMGEBUNGSVARIABLE = "BEAMTENRECHNER_CACHE"
+
+# Maximale Anzahl gespeicherter Ergebnisse
+STANDARD_MAX_EINTRAEGE = 50_000
+
+# Anteil der Einträge, der beim Überlauf auf einmal entfernt wird
+VERDRAENGUNGS_ANTEIL = 0.1
+
+# Größenprüfung nur alle N Schreibvorgänge (COUNT(*) durchsucht den Index)
+PRUEF_INTERVALL = 100
+
+# Wartezeit bei gesperrter Datenbank (andere Prozesse schreiben)
+SPERR_TIMEOUT_S = 5.0
+
+# Pakete, deren Quelltexte die Tarifversion bestimmen
+VERSIONS_PAKETE = ("data", "calculator", "ui")
+
+_PROJEKTPFAD = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@lru_cache(maxsize=1)
+def get_tarifversion() -> str:
+    """
+    Gibt die Version der Tarifdaten und Rechenregeln zurück.
+
+    Returns:
+        Kurzer Hash über alle Quelltexte in data/, calculator/ und ui/, die
+        Parameterdateien und die aktive Parameterversion
+    """
+    pruefsumme = hashlib.sha256()
+    for paket in VERSIONS_PAKETE:
+        verzeichnis = os.path.join(_PROJEKTPFAD, paket)
+        for datei in sorted(os.listdir(verzeichnis)):
+            if datei.endswith(".py"):
+                pruefsumme.update(datei.encode("utf-8"))
+                with open(os.path.join(verzeichnis, datei), "rb") as f:
+                    pruefsumme.update(f.read())
+    pruefsumme.update(f"{get_quellen_pruefsumme()}:{get_parameterversion()}".encode("utf-8"))
+    return pruefsumme.hexdigest()[:16]
+
+
+def berechne_schluessel(name: str, argumente: dict) -> str:
+    """
+    Berechnet den Cache-Schlüssel für einen Aufruf.
+
+    Args:
+        name: Name der Berechnung
+        argumente: JSON-serialisierbare Eingaben
+
+    Returns:
+        Hex-Schlüssel (SHA-256)
+    """
+    kanonisch = json.dumps(
+        [name, argumente, get_tarifversion(), get_aktuelles_jahr()],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(kanonisch.encode("utf-8")).hexdigest()
+
+
+class ErgebnisCache:
+    """
+    Größenbegrenzter, prozessübergreifender Ergebnis-Cache in einer SQLite-Datei.
+
+    Args:
+        pfad: Pfad der Cache-Datei
+        max_eintraege: Maximale Anzahl gespeicherter Ergebnisse
+    """
+
+    def __init__(self, pfad: str, max_eintraege: int = STANDARD_MAX_EINTRAEGE):
+        self.pfad = pfad
+        self.max_eintraege = max_eintraege
+        self._lokal = threading.local()
+        self.treffer = 0
+        self.fehlschlaege = 0
+        self._schreibvorgaenge = 0
+        with self._verbindung() as verbindung:
+            verbindung.execute(
+                "CREATE TABLE IF NOT EXISTS ergebnisse ("
+                " schluessel TEXT PRIMARY KEY,"
+                " wert TEXT NOT NULL,"
+                " zugriff REAL NOT NULL)"
+            )
+            verbindung.execute("CREATE INDEX IF NOT EXISTS ergebnisse_zugriff ON ergebnisse (zugriff)")
+
+    def _verbindung(self) -> sqlite3.Connection:
+        """Verbindung für den aktuellen Prozess und Thread (nach fork neu)."""
+        verbindung = getattr(self._lokal, "verbindung", None)
+        if verbindung is None or self._lokal.pid != os.getpid():
+            verbindung = sqlite3.connect(self.pfad, timeout=SPERR_TIMEOUT_S, isolation_level=None)
+            verbindung.execute("PRAGMA journal_mode=WAL")
+            verbindung.execute("PRAGMA synchronous=NORMAL")
+            self._lokal.verbindung = verbindung
+            self._lokal.pid = os.getpid()
+        return verbindung
+
+    def get(self, name: str, argumente: dict) -> tuple:
+        """
+        Sucht ein Ergebnis.
+
+        Returns:
+            Tuple (gefunden, Ergebnis oder None)
+        """
+        schluessel = berechne_schluessel(name, argumente)
+        verbindung = self._verbindung()
+        zeile = verbindung.execute(
+            "SELECT wert FROM ergebnisse WHERE schluessel = ?", (schluessel,)
+        ).fetchone()
+        if zeile is None:
+            self.fehlschlaege += 1
+            return False, None
+
+        self.treffer += 1
+        verbindung.execute(
+            "UPDATE ergebnisse SET zugriff = ? WHERE schluessel = ?", (time.time(), schluessel)
+        )
+        return True, json.loads(zeile[0])
+
+    def set(self, name: str, argumente: dict, wert):
+        """Speichert ein Ergebnis und verdrängt bei Bedarf alte Einträge."""
+        schluessel = berechne_schluessel(name, argumente)
+        daten = json.dumps(wert, separators=(",", ":"), ensure_ascii=False)
+        verbindung = self._verbindung()
+        verbindung.execute(
+            "INSERT OR REPLACE INTO ergebnisse (schluessel, wert, zugriff) VALUES (?, ?, ?)",
+            (schluessel, daten, time.time())
+        )
+        self._schreibvorgaenge += 1
+        if self._schreibvorgaenge % PRUEF_INTERVALL == 0 and self.groesse() > self.max_eintraege:
+            self._verdraengen(verbindung)
+
+    def _verdraengen(self, verbindung: sqlite3.Connection):
+        """Entfernt die am längsten nicht genutzten Einträge."""
+        anzahl = max(1, int(self.max_eintraege * VERDRAENGUNGS_ANTEIL))
+        verbindung.execute(
+            "DELETE FROM ergebnisse WHERE schluessel IN ("
+            " SELECT schluessel FROM ergebnisse ORDER BY zugriff LIMIT"
+            " (SELECT MAX(0, COUNT(*) - ?) FROM ergebnisse))",
+            (self.max_eintraege - anzahl,)
+        )
+
+    def groesse(self) -> int:
+        """Anzahl gespeicherter Ergebnisse."""
+        return self._verbindung().execute("SELECT COUNT(*) FROM ergebnisse").fetchone()[0]
+
+    def leeren(self):
+        """Entfernt alle Einträge."""
+        self._verbindung().execute("DELETE FROM ergebnisse")
+
+
+@lru_cache(maxsize=1)
+def get_standard_cache():
+    """
+    Gibt den über BEAMTENRECHNER_CACHE konfigurierten Cache zurück.
+
+    Returns:
+        ErgebnisCache oder None, wenn kein Cache konfiguriert ist
+    """
+    pfad = os.environ.get(CACHE_UMGEBUNGSVARIABLE)
+    if not pfad:
+        return None
+    return ErgebnisCache(pfad)
@@ -0,0 +1,201 @@
+"""
+Familien-Zeitleiste für Beamte NRW
+Leitet aus den Geburtsjahren der Kinder ab, in welchen Jahren wie viele
+Kinder kindergeldberechtigt sind und damit beim Familienzuschlag zählen
+(Stufe 2-5 bzw. Erhöhungsbetrag ab dem 5. Kind).
+
+Statt die Kinderzahl für jedes Jahr neu zu ermitteln, wird ein Ereignis-
+Durchlauf über die sortierten Änderungsjahre gemacht (Geburt +1, Erreichen
+der Altersgrenze -1). Zwischen zwei Ereignissen ist die Kinderzahl konstant,
+Familienzuschlag und Kindergeld werden nur einmal je Abschnitt bestimmt.
+
+Gerechnet wird jahresgenau: ein Kind zählt ab seinem Geburtsjahr bis
+einschließlich dem Jahr vor Erreichen der Altersgrenze.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+from calculator.dienstunfaehigkeit import berechne_du_entwicklung
+from calculator.stichtag import get_aktuelles_jahr
+from data.parameter import get_parameter
+from data.familienzuschlag import (
+    get_familienzuschlag_gesamt,
+    get_kinderzuschlag,
+    STANDARD_MIETENSTUFE
+)
+
+
+# Kindergeld bis 18, in Ausbildung/Studium bis 25 (§ 32 Abs. 4 EStG)
+KINDERGELD_ALTERSGRENZE = 18
+KINDERGELD_ALTERSGRENZE_AUSBILDUNG = 25
+
+# Kindergeld pro Kind und Monat (aus der aktiven Parameterdatei)
+KINDERGELD_MONATLICH = get_parameter()["kindergeld"]["monatlich"]
+
+
+def berechne_kinder_ereignisse(
+    geburtsjahre_kinder: list,
+    altersgrenze: int = KINDERGELD_ALTERSGRENZE
+) -> list:
+    """
+    Ereignis-Durchlauf über Geburt und Erreichen der Altersgrenze.
+
+    Args:
+        geburtsjahre_kinder: Geburtsjahre der Kinder
+        altersgrenze: Alter, ab dem ein Kind nicht mehr zählt
+
+    Returns:
+        Sortierte Liste von (jahr, anzahl_kinder) ab dem jeweiligen Jahr;
+        Ereignisse im selben Jahr sind zusammengefasst
+    """
+    aenderungen = {}
+    for geburtsjahr in geburtsjahre_kinder:
+        aenderungen[geburtsjahr] = aenderungen.get(geburtsjahr, 0) + 1
+        ende = geburtsjahr + altersgrenze
+        aenderungen[ende] = aenderungen.get(ende, 0) - 1
+
+    ereignisse = []
+    anzahl = 0
+    for jahr in sorted(aenderungen):
+        if aenderungen[jahr]:
+            anzahl += aenderungen[jahr]
+            ereignisse.append((jahr, anzahl))
+    return ereignisse
+
+
+def berechne_familien_zeitleiste(
+    besoldungsgruppe: str,
+    geburtsjahre_kinder: list,
+    von_jahr: int,
+    bis_jahr: int,
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    altersgrenze: int = KINDERGELD_ALTERSGRENZE
+) -> list:
+    """
+    Zerlegt einen Zeitraum in Abschnitte mit konstanter Kinderzahl.
+
+    Args:
+        besoldungsgruppe: z.B. "A13"
+        geburtsjahre_kinder: Geburtsjahre der Kinder
+        von_jahr: Erstes Jahr des Zeitraums
+        bis_jahr: Letztes Jahr des Zeitraums (einschließlich)
+        verheiratet: True wenn verheiratet
+        mietenstufe: Mietenstufe 1-7
+        altersgrenze: Alter, ab dem ein Kind nicht mehr zählt
+
+    Returns:
+        Liste von Dictionaries mit von_jahr, bis_jahr, Kinderzahl,
+        Familienzuschlag, Kinderzuschlag und Kindergeld (monatlich) je Abschnitt
+    """
+    # Kinderzahl zu Beginn des Zeitraums und Änderungen danach
+    anzahl = 0
+    wechsel = []
+    for jahr, anzahl_ab in berechne_kinder_ereignisse(geburtsjahre_kinder, altersgrenze):
+        if jahr <= von_jahr:
+            anzahl = anzahl_ab
+        elif jahr <= bis_jahr:
+            wechsel.append((jahr, anzahl_ab))
+
+    abschnitte = []
+    beginn = von_jahr
+    for jahr, anzahl_ab in wechsel + [(bis_jahr + 1, None)]:
+        abschnitte.append({
+            "von_jahr": beginn,
+            "bis_jahr": jahr - 1,
+            "anzahl_kinder": anzahl,
+            "familienzuschlag_gesamt": get_familienzuschlag_gesamt(
+                verheiratet, anzahl, mietenstufe, besoldungsgruppe
+            ),
+            "kinderzuschlag": get_kinderzuschlag(anzahl, mietenstufe, besoldungsgruppe),
+            "kindergeld": round(anzahl * KINDERGELD_MONATLICH, 2),
+        })
+        beginn, anzahl = jahr, anzahl_ab
+    return abschnitte
+
+
+def berechne_kinder_matrix(geburtsjahre_kinder: list, jahre, altersgrenze: int = KINDERGELD_ALTERSGRENZE) -> np.ndarray:
+    """
+    Vektorisierter Ereignis-Durchlauf für viele Haushalte: Geburten und
+    Altersgrenzen werden als +1/-1 in eine (Haushalte × Jahre)-Matrix
+    eingetragen und kumuliert.
+
+    Args:
+        geburtsjahre_kinder: Liste (pro Haushalt) von Listen mit Geburtsjahren
+        jahre: Aufeinanderfolgende Jahre der Zeitleiste
+        altersgrenze: Alter, ab dem ein Kind nicht mehr zählt
+
+    Returns:
+        int64-Matrix mit der Kinderzahl je Haushalt und Jahr
+    """
+    jahre = np.asarray(jahre, dtype=np.int64)
+    anzahl_jahre = len(jahre)
+    zeilen = np.repeat(np.arange(len(geburtsjahre_kinder)), [len(k) for k in geburtsjahre_kinder])
+    geburt = np.fromiter(chain.from_iterable(geburtsjahre_kinder), dtype=np.int64, count=len(zeilen))
+
+    aenderungen = np.zeros((len(geburtsjahre_kinder), anzahl_jahre + 1), dtype=np.int64)
+    np.add.at(aenderungen, (zeilen, np.clip(geburt - jahre[0], 0, anzahl_jahre)), 1)
+    np.add.at(aenderungen, (zeilen, np.clip(geburt + altersgrenze - jahre[0], 0, anzahl_jahre)), -1)
+    return np.cumsum(aenderungen, axis=1)[:, :anzahl_jahre]
+
+
+def berechne_du_entwicklung_familie(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    geburtsjahre_kinder: list,
+    verheiratet: bool = False,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    jahre_voraus: int = 30,
+    altersgrenze: int = KINDERGELD_ALTERSGRENZE,
+    aktuelles_jahr: int = None
+) -> list:
+    """
+    Wie berechne_du_entwicklung, zusätzlich mit der Kinderzahl des jeweiligen
+    Jahres: der Kinderanteil des Familienzuschlags wird neben der DU-Rente
+    weitergezahlt, solange die Kinder kindergeldberechtigt sind.
+
+    Args:
+        geburtsjahre_kinder: Geburtsjahre der Kinder
+        altersgrenze: Alter, ab dem ein Kind nicht mehr zählt
+        aktuelles_jahr: Erstes Jahr der Entwicklung (Standard: Stichtag)
+
+    Returns:
+        Liste von Dictionaries mit DU-Rente, Kinderzahl, Kinderzuschlag,
+        Kindergeld und DU-Versorgung gesamt pro Jahr
+    """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+    entwicklung = berechne_du_entwicklung(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+        jahre_voraus=jahre_voraus,
+        aktuelles_jahr=aktuelles_jahr
+    )
+    abschnitte = berechne_familien_zeitleiste(
+        besoldungsgruppe, geburtsjahre_kinder, aktuelles_jahr, aktuelles_jahr + jahre_voraus,
+        verheiratet, mietenstufe, altersgrenze
+    )
+    for abschnitt in abschnitte:
+        for jahr in range(abschnitt["von_jahr"], abschnitt["bis_jahr"] + 1):
+            ergebnis = entwicklung[jahr - aktuelles_jahr]
+            kinderzuschlag = abschnitt["kinderzuschlag"] if ergebnis["hat_anspruch"] else 0.0
+            ergebnis["anzahl_kinder"] = abschnitt["anzahl_kinder"]
+            ergebnis["kinderzuschlag"] = kinderzuschlag
+            ergebnis["kindergeld"] = abschnitt["kindergeld"]
+            ergebnis["du_versorgung_gesamt"] = round(ergebnis["du_rente_brutto"] + kinderzuschlag, 2)
+    return entwicklung
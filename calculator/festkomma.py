@@ -0,0 +1,423 @@
+"""
+Festkomma-Rechenkerne für Beamte NRW
+Ganzzahlige Varianten der Kerne aus calculator/vektor.py: Geldbeträge sind
+int64-Cent, Prozentsätze Hundertstel-Prozent (71,75 % = 7175), Dienstjahre
+ganzzahlige Bruchteile eines Jahres (DIENSTJAHR_EINHEIT, exakt für
+Drittel wie bei der Zurechnungszeit).
+
+Statt jedes Zwischenergebnis als float mit round(x, 2) zu runden, wird nur
+an festen Stellen kaufmännisch (halbe Einheit von der Null weg) gerundet:
+
+1. Ruhegehaltssatz auf zwei Dezimalstellen (auch bei der DU-Rente),
+2. ruhegehaltsfähige Bezüge bzw. Brutto nach dem Arbeitszeit-Faktor auf Cent,
+3. Ruhegehalt bzw. DU-Rente (Satz und Versorgungsabschlag in einem Schritt)
+   auf Cent.
+
+Alle übrigen Schritte sind exakt. Gegenüber den float-Kernen können
+Ergebnisse an Halb-Cent-Grenzen um einen Cent abweichen, bei der DU-Rente
+zusätzlich durch den auf zwei Stellen gerundeten Ruhegehaltssatz.
+
+Die Ergebnis-Dictionaries haben dieselben Schlüssel wie die der float-Kerne;
+als_euro() wandelt sie in deren Einheiten (Euro, Prozent, Jahre) um.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from calculator.regelwerk import get_regelwerk
+from calculator.vektor import (
+    GRUNDGEHALT_TABELLE,
+    STRUKTURZULAGE_TABELLE,
+    FAMILIENZUSCHLAG_STUFE1_TABELLE,
+    MAX_STUFE_TABELLE,
+    KINDER_BASIS_TABELLE,
+    KINDER_ERHOEHUNG_TABELLE,
+    MAX_STUFE_INDEX,
+    berechne_stufe_vec
+)
+from data.besoldung import MINDESTVERSORGUNG_GRUNDGEHALT
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+
+
+# Einheiten
+CENT_PRO_EURO = 100
+SATZ_EINHEIT = 100                 # Hundertstel-Prozent je Prozent
+FAKTOR_EINHEIT = 1_000_000         # Arbeitszeit-/Teilzeitfaktoren in Millionstel
+DIENSTJAHR_EINHEIT = 3_000_000     # Bruchteile je Dienstjahr (durch 3 teilbar)
+SATZ_PRO_JAHR_EINHEIT = 100_000    # Ruhegehaltssatz pro Jahr in 1/100000 Prozent
+
+
+def _als_einheit(wert: float, einheit: int) -> int:
+    """Wandelt eine Konstante exakt in eine ganzzahlige Einheit um."""
+    ganzzahl = round(wert * einheit)
+    if abs(ganzzahl - wert * einheit) > 1e-6:
+        raise ValueError(f"Konstante {wert} ist in Einheit 1/{einheit} nicht darstellbar")
+    return ganzzahl
+
+
+# 100 % in Hundertstel-Prozent
+HUNDERT_PROZENT = 100 * SATZ_EINHEIT
+
+
+def in_cent(euro) -> np.ndarray:
+    """
+    Wandelt Euro-Beträge (float) in int64-Cent um.
+
+    Returns:
+        Cent-Beträge als Array
+    """
+    return np.rint(np.asarray(euro, dtype=float) * CENT_PRO_EURO).astype(np.int64)
+
+
+def in_einheit(werte, einheit: int) -> np.ndarray:
+    """Wandelt Faktoren bzw. Jahre (float) in ganzzahlige Bruchteile um."""
+    return np.rint(np.asarray(werte, dtype=float) * einheit).astype(np.int64)
+
+
+def teile_kaufmaennisch(zaehler, nenner: int) -> np.ndarray:
+    """
+    Ganzzahlige Division mit kaufmännischer Rundung (halbe Einheit von der
+    Null weg), z.B. 5/10 -> 1, -5/10 -> -1, 4/10 -> 0.
+
+    Args:
+        zaehler: int64-Array (Produkt in der feineren Einheit)
+        nenner: Positiver Teiler
+
+    Returns:
+        Gerundeter Quotient als int64-Array
+    """
+    zaehler = np.asarray(zaehler, dtype=np.int64)
+    betrag = (2 * np.abs(zaehler) + nenner) // (2 * nenner)
+    return np.where(zaehler < 0, -betrag, betrag)
+
+
+# Lookup-Tabellen in Cent (aus den Euro-Tabellen von calculator/vektor.py)
+GRUNDGEHALT_CENT = in_cent(GRUNDGEHALT_TABELLE)
+STRUKTURZULAGE_CENT = in_cent(STRUKTURZULAGE_TABELLE)
+FAMILIENZUSCHLAG_STUFE1_CENT = in_cent(FAMILIENZUSCHLAG_STUFE1_TABELLE)
+KINDER_BASIS_CENT = in_cent(KINDER_BASIS_TABELLE)
+KINDER_ERHOEHUNG_CENT = in_cent(KINDER_ERHOEHUNG_TABELLE)
+
+
+@lru_cache(maxsize=None)
+def kompiliere_festkomma(regeln) -> dict:
+    """
+    Übersetzt die Parameter eines Regelwerks exakt in ganzzahlige Einheiten
+    (einmal je Regelwerk).
+
+    Args:
+        regeln: Regelwerk (siehe calculator/regelwerk.py)
+
+    Returns:
+        Dictionary mit Sätzen in Hundertstel-Prozent (Satz pro Jahr in
+        SATZ_PRO_JAHR_EINHEIT), Zurechnungszeit-Faktor als Bruch und
+        Mindestversorgung in Cent
+
+    Raises:
+        ValueError: Wenn ein Parameter in seiner Einheit nicht exakt darstellbar ist
+    """
+    mindestversorgung_satz = _als_einheit(regeln.mindestversorgungssatz, SATZ_EINHEIT)
+    return {
+        "satz_pro_jahr": _als_einheit(regeln.ruhegehaltssatz_pro_jahr, SATZ_PRO_JAHR_EINHEIT),
+        "max_satz": _als_einheit(regeln.max_ruhegehaltssatz, SATZ_EINHEIT),
+        "min_satz": _als_einheit(regeln.min_ruhegehaltssatz, SATZ_EINHEIT),
+        "abschlag_pro_jahr": _als_einheit(regeln.abschlag_pro_jahr, SATZ_EINHEIT),
+        "max_abschlag": _als_einheit(regeln.max_abschlag, SATZ_EINHEIT),
+        "zurechnungszeit": Fraction(regeln.zurechnungszeit_faktor).limit_denominator(100),
+        "mindestversorgung": int(teile_kaufmaennisch(
+            int(in_cent(MINDESTVERSORGUNG_GRUNDGEHALT)) * mindestversorgung_satz, HUNDERT_PROZENT
+        )),
+    }
+
+# Umrechnung der Ergebnisfelder in die Einheiten der float-Kerne
+CENT_FELDER = (
+    "grundgehalt", "strukturzulage", "familienzuschlag_stufe1", "kinderzuschlag",
+    "familienzuschlag_gesamt", "brutto_vollzeit", "brutto",
+    "ruhegehaltsfaehige_bezuege", "ruhegehalt_brutto", "du_rente_brutto", "mindestversorgung",
+)
+SATZ_FELDER = (
+    "ruhegehaltssatz", "ruhegehaltssatz_roh", "versorgungsabschlag_prozent", "du_abschlag_prozent",
+    "effektiver_ruhegehaltssatz",
+)
+DIENSTJAHR_FELDER = (
+    "dienstjahre", "ist_dienstjahre", "zurechnungszeit", "gesamt_dienstjahre", "fehlende_dienstjahre",
+)
+
+
+def als_euro(ergebnis: dict) -> dict:
+    """
+    Wandelt ein Festkomma-Ergebnis in die Einheiten der float-Kerne um
+    (Euro, Prozent, Dienstjahre auf zwei Stellen).
+
+    Args:
+        ergebnis: Dictionary eines *_fix-Kerns
+
+    Returns:
+        Neues Dictionary mit float-Arrays für Geld-, Satz- und Jahresfelder
+    """
+    umgerechnet = dict(ergebnis)
+    for feld, werte in ergebnis.items():
+        if feld in CENT_FELDER:
+            umgerechnet[feld] = werte / CENT_PRO_EURO
+        elif feld in SATZ_FELDER:
+            umgerechnet[feld] = werte / SATZ_EINHEIT
+        elif feld in DIENSTJAHR_FELDER:
+            umgerechnet[feld] = teile_kaufmaennisch(werte * 100, DIENSTJAHR_EINHEIT) / 100
+    return umgerechnet
+
+
+def berechne_dienstjahre_fix(
+    jahr_verbeamtung,
+    jahr_ende,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0
+) -> np.ndarray:
+    """
+    Festkomma-Variante von berechne_dienstjahre.
+
+    Returns:
+        Ruhegehaltsfähige Dienstjahre in DIENSTJAHR_EINHEIT
+    """
+    gesamtjahre = np.asarray(jahr_ende, dtype=np.int64) - np.asarray(jahr_verbeamtung, dtype=np.int64)
+    teilzeit = in_einheit(teilzeitjahre, DIENSTJAHR_EINHEIT)
+    anrechenbar = teile_kaufmaennisch(teilzeit * in_einheit(teilzeitanteil, FAKTOR_EINHEIT), FAKTOR_EINHEIT)
+    return gesamtjahre * DIENSTJAHR_EINHEIT - teilzeit + anrechenbar
+
+
+def berechne_ruhegehaltssatz_fix(dienstjahre, regeln=None) -> np.ndarray:
+    """
+    Ruhegehaltssatz aus Dienstjahren, kaufmännisch auf zwei Dezimalstellen.
+
+    Args:
+        dienstjahre: Dienstjahre in DIENSTJAHR_EINHEIT
+        regeln: Regelwerk (Standard: NRW)
+
+    Returns:
+        Ungekappter Satz in Hundertstel-Prozent
+    """
+    return teile_kaufmaennisch(
+        np.asarray(dienstjahre, dtype=np.int64) * kompiliere_festkomma(regeln or get_regelwerk())["satz_pro_jahr"],
+        DIENSTJAHR_EINHEIT * (SATZ_PRO_JAHR_EINHEIT // SATZ_EINHEIT)
+    )
+
+
+def berechne_ruhegehaltsfaehige_bezuege_fix(
+    gruppe_idx,
+    stufe,
+    verheiratet=False,
+    arbeitszeit_faktor=1.0
+) -> np.ndarray:
+    """
+    Festkomma-Variante von berechne_ruhegehaltsfaehige_bezuege.
+
+    Returns:
+        Ruhegehaltsfähige Bezüge in Cent
+    """
+    stufe = np.clip(np.asarray(stufe, dtype=np.int64), 0, MAX_STUFE_INDEX)
+    familienzuschlag = np.where(
+        np.asarray(verheiratet, dtype=bool), FAMILIENZUSCHLAG_STUFE1_CENT[gruppe_idx], 0
+    )
+    bezuege = GRUNDGEHALT_CENT[gruppe_idx, stufe] + STRUKTURZULAGE_CENT[gruppe_idx] + familienzuschlag
+    return teile_kaufmaennisch(bezuege * in_einheit(arbeitszeit_faktor, FAKTOR_EINHEIT), FAKTOR_EINHEIT)
+
+
+def _versorgung(bezuege, satz, abschlag) -> np.ndarray:
+    """Bezüge × Satz × (1 - Abschlag), in einem Schritt auf Cent gerundet."""
+    return teile_kaufmaennisch(bezuege * satz * (HUNDERT_PROZENT - abschlag), HUNDERT_PROZENT * HUNDERT_PROZENT)
+
+
+def berechne_ruhegehalt_fix(
+    gruppe_idx,
+    stufe,
+    geburtsjahr,
+    jahr_verbeamtung,
+    jahr_pension,
+    aktuelles_jahr: int,
+    verheiratet=False,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0,
+    arbeitszeit_faktor=1.0,
+    ist_polizei_feuerwehr=False,
+    regeln=None
+) -> dict:
+    """
+    Festkomma-Variante von berechne_ruhegehalt_vec (gleiche Argumente).
+
+    Returns:
+        Dictionary mit Arrays; Geld in Cent, Sätze in Hundertstel-Prozent,
+        Dienstjahre in DIENSTJAHR_EINHEIT
+    """
+    regeln = regeln or get_regelwerk()
+    parameter = kompiliere_festkomma(regeln)
+    jahr_pension = np.asarray(jahr_pension, dtype=np.int64)
+    alter_pension = jahr_pension - np.asarray(geburtsjahr, dtype=np.int64)
+    regelaltersgrenze = np.where(
+        np.asarray(ist_polizei_feuerwehr, dtype=bool),
+        regeln.regelaltersgrenze_polizei,
+        regeln.regelaltersgrenze_normal
+    )
+
+    dienstjahre = berechne_dienstjahre_fix(jahr_verbeamtung, jahr_pension, teilzeitjahre, teilzeitanteil)
+
+    jahre_bis_pension = np.maximum(0, jahr_pension - aktuelles_jahr)
+    stufe_bei_pension = berechne_stufe_vec(gruppe_idx, stufe, jahre_bis_pension)
+
+    ruhegehaltssatz = np.clip(
+        berechne_ruhegehaltssatz_fix(dienstjahre, regeln), parameter["min_satz"], parameter["max_satz"]
+    )
+    ruhegehaltssatz = np.where(dienstjahre < regeln.min_dienstjahre * DIENSTJAHR_EINHEIT, 0, ruhegehaltssatz)
+
+    jahre_vor_grenze = regelaltersgrenze - alter_pension
+    versorgungsabschlag = np.clip(
+        jahre_vor_grenze * parameter["abschlag_pro_jahr"], 0, parameter["max_abschlag"]
+    )
+
+    ruhegehaltsfaehige_bezuege = berechne_ruhegehaltsfaehige_bezuege_fix(
+        gruppe_idx, stufe_bei_pension, verheiratet, arbeitszeit_faktor
+    )
+
+    return {
+        "alter_pension": alter_pension,
+        "regelaltersgrenze": regelaltersgrenze,
+        "dienstjahre": dienstjahre,
+        "ruhegehaltssatz": ruhegehaltssatz,
+        "versorgungsabschlag_prozent": versorgungsabschlag,
+        "effektiver_ruhegehaltssatz": teile_kaufmaennisch(
+            ruhegehaltssatz * (HUNDERT_PROZENT - versorgungsabschlag), HUNDERT_PROZENT
+        ),
+        "ruhegehaltsfaehige_bezuege": ruhegehaltsfaehige_bezuege,
+        "ruhegehalt_brutto": _versorgung(ruhegehaltsfaehige_bezuege, ruhegehaltssatz, versorgungsabschlag),
+        "ist_vorzeitig": alter_pension < regelaltersgrenze,
+        "jahre_vor_grenze": np.maximum(0, jahre_vor_grenze),
+        "stufe_bei_pension": stufe_bei_pension,
+        "max_stufe": MAX_STUFE_TABELLE[gruppe_idx],
+    }
+
+
+def berechne_du_rente_fix(
+    gruppe_idx,
+    stufe,
+    geburtsjahr,
+    jahr_verbeamtung,
+    jahr_du,
+    verheiratet=False,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0,
+    arbeitszeit_faktor=1.0,
+    regeln=None
+) -> dict:
+    """
+    Festkomma-Variante von berechne_du_rente_vec (gleiche Argumente).
+
+    Returns:
+        Dictionary mit Arrays; Geld in Cent, Sätze in Hundertstel-Prozent,
+        Dienstjahre in DIENSTJAHR_EINHEIT
+    """
+    regeln = regeln or get_regelwerk()
+    parameter = kompiliere_festkomma(regeln)
+    mindestversorgung = parameter["mindestversorgung"]
+    jahr_du = np.asarray(jahr_du, dtype=np.int64)
+    alter_bei_du = jahr_du - np.asarray(geburtsjahr, dtype=np.int64)
+
+    ist_dienstjahre = berechne_dienstjahre_fix(jahr_verbeamtung, jahr_du, teilzeitjahre, teilzeitanteil)
+    hat_anspruch = ist_dienstjahre >= regeln.wartezeit_jahre * DIENSTJAHR_EINHEIT
+
+    # Zurechnungszeit (2/3 der Zeit bis zur Grenze, exakt in DIENSTJAHR_EINHEIT)
+    grenze = np.where(
+        jahr_du < regeln.zurechnungszeit_uebergangsjahr,
+        regeln.zurechnungszeit_grenze_alt,
+        regeln.zurechnungszeit_grenze_neu
+    )
+    zurechnungszeit = (
+        np.maximum(0, grenze - alter_bei_du) * DIENSTJAHR_EINHEIT
+        * parameter["zurechnungszeit"].numerator // parameter["zurechnungszeit"].denominator
+    )
+    gesamt_dienstjahre = ist_dienstjahre + zurechnungszeit
+
+    ruhegehaltssatz_roh = berechne_ruhegehaltssatz_fix(gesamt_dienstjahre, regeln)
+    ruhegehaltssatz = np.clip(ruhegehaltssatz_roh, parameter["min_satz"], parameter["max_satz"])
+
+    du_abschlag = np.clip(
+        (regeln.du_abschlag_altersgrenze - alter_bei_du) * parameter["abschlag_pro_jahr"], 0, parameter["max_abschlag"]
+    )
+
+    ruhegehaltsfaehige_bezuege = berechne_ruhegehaltsfaehige_bezuege_fix(
+        gruppe_idx, stufe, verheiratet, arbeitszeit_faktor
+    )
+
+    du_rente_brutto = _versorgung(ruhegehaltsfaehige_bezuege, ruhegehaltssatz, du_abschlag)
+    wird_mindestversorgung = hat_anspruch & (du_rente_brutto < mindestversorgung)
+    du_rente_brutto = np.maximum(du_rente_brutto, mindestversorgung)
+
+    return {
+        "alter_bei_du": alter_bei_du,
+        "ist_dienstjahre": ist_dienstjahre,
+        "zurechnungszeit": np.where(hat_anspruch, zurechnungszeit, 0),
+        "gesamt_dienstjahre": np.where(hat_anspruch, gesamt_dienstjahre, ist_dienstjahre),
+        "ruhegehaltssatz_roh": np.where(hat_anspruch, ruhegehaltssatz_roh, 0),
+        "ruhegehaltssatz": np.where(hat_anspruch, ruhegehaltssatz, 0),
+        "du_abschlag_prozent": np.where(hat_anspruch, du_abschlag, 0),
+        "effektiver_ruhegehaltssatz": np.where(
+            hat_anspruch,
+            teile_kaufmaennisch(ruhegehaltssatz * (HUNDERT_PROZENT - du_abschlag), HUNDERT_PROZENT),
+            0
+        ),
+        "ruhegehaltsfaehige_bezuege": np.where(hat_anspruch, ruhegehaltsfaehige_bezuege, 0),
+        "du_rente_brutto": np.where(hat_anspruch, du_rente_brutto, 0),
+        "mindestversorgung": np.full(np.shape(hat_anspruch), mindestversorgung, dtype=np.int64),
+        "wird_mindestversorgung": wird_mindestversorgung,
+        "hat_anspruch": hat_anspruch,
+        "fehlende_dienstjahre": np.where(
+            hat_anspruch, 0, regeln.wartezeit_jahre * DIENSTJAHR_EINHEIT - ist_dienstjahre
+        ),
+    }
+
+
+def berechne_bruttogehalt_fix(
+    gruppe_idx,
+    stufe,
+    verheiratet=False,
+    anzahl_kinder=0,
+    mietenstufe=STANDARD_MIETENSTUFE,
+    arbeitszeit_faktor=1.0
+) -> dict:
+    """
+    Festkomma-Variante von berechne_bruttogehalt_vec (gleiche Argumente).
+
+    Returns:
+        Dictionary mit Arrays aller Gehaltsbestandteile in Cent
+    """
+    stufe = np.clip(np.asarray(stufe, dtype=np.int64), 0, MAX_STUFE_INDEX)
+    verheiratet = np.asarray(verheiratet, dtype=bool)
+    kinder = np.asarray(anzahl_kinder, dtype=np.int64)
+    mietenstufe = np.clip(np.asarray(mietenstufe, dtype=np.int64), 1, 7)
+
+    grundgehalt = GRUNDGEHALT_CENT[gruppe_idx, stufe]
+    strukturzulage = STRUKTURZULAGE_CENT[gruppe_idx]
+    stufe1 = FAMILIENZUSCHLAG_STUFE1_CENT[gruppe_idx]
+
+    # Familienzuschlag mit Kindern: Stufe 2-5 plus Erhöhungsbeträge ab dem 5. Kind
+    mit_kindern = (
+        KINDER_BASIS_CENT[gruppe_idx, np.clip(kinder, 0, 4), mietenstufe]
+        + KINDER_ERHOEHUNG_CENT[gruppe_idx, mietenstufe] * np.maximum(0, kinder - 4)
+    )
+    gesamt = np.where(
+        kinder == 0,
+        np.where(verheiratet, stufe1, 0),
+        np.where(verheiratet, mit_kindern, mit_kindern - stufe1)
+    )
+
+    brutto_vollzeit = grundgehalt + strukturzulage + gesamt
+    brutto = teile_kaufmaennisch(brutto_vollzeit * in_einheit(arbeitszeit_faktor, FAKTOR_EINHEIT), FAKTOR_EINHEIT)
+
+    return {
+        "grundgehalt": grundgehalt,
+        "strukturzulage": strukturzulage,
+        "familienzuschlag_stufe1": np.where(verheiratet, stufe1, 0),
+        "kinderzuschlag": np.where(kinder == 0, 0, mit_kindern - stufe1),
+        "familienzuschlag_gesamt": gesamt,
+        "brutto_vollzeit": brutto_vollzeit,
+        "brutto": brutto,
+    }
@@ -0,0 +1,195 @@
+"""
+Haushaltsmodus: Zusammenveranlagung (Ehegattensplitting) und
+Steuerklassen-Kombinationen für Ehepaare, bei denen einer oder beide
+Beamte sind.
+
+Bei Zusammenveranlagung ist die Jahressteuer für alle Kombinationen gleich:
+das Doppelte der Grundtarif-Steuer auf das halbierte gemeinsame zvE. Die
+Steuerklassen bestimmen nur den Lohnsteuerabzug im Laufe des Jahres und
+damit Nachzahlung oder Erstattung bei der Veranlagung:
+
+- 4/4: beide Grundtarif auf das eigene zvE
+- 3/5: Splittingtarif auf das zvE des Partners in Klasse 3; Klasse 5 nach
+  § 39b Abs. 2 Satz 7 EStG: 2 × (ESt(1,25 × zvE) - ESt(0,75 × zvE)),
+  mindestens 14 % des zvE (vereinfacht ohne die Sonderregeln für hohe zvE)
+- 4/4 mit Faktor: Grundtarif × Faktor (Splittingsteuer / Summe der
+  Grundtarif-Steuern, auf drei Stellen abgerundet, nur wenn kleiner 1)
+
+Ausgewiesen wird die Kombination mit dem geringsten Lohnsteuerabzug
+(höchstes monatliches Netto). Das ist keine Ersparnis: die Differenz zur
+Jahressteuer wird nachgezahlt, der geringere Abzug gegenüber 4/4 erhöht
+also genau die Nachzahlung (lohnsteuer_differenz_zu_4_4 = Differenz der
+nachzahlung_*-Werte). Verglichen wird die Einkommensteuer (ohne
+Solidaritätszuschlag und Kirchensteuer, die proportional folgen).
+"""
+
+import math
+
+import numpy as np
+
+from calculator.vektor import berechne_einkommensteuer_vec, _runde
+from data.lohnsteuer import (
+    berechne_einkommensteuer,
+    MONATE_BEAMTE,
+    WERBUNGSKOSTEN_PAUSCHALE,
+    SONDERAUSGABEN_PAUSCHALE,
+    VORSORGE_ANTEIL_BEAMTE
+)
+
+
+# Kombinationen (Partner 1 / Partner 2) in Vergleichsreihenfolge
+KOMBINATIONEN = ("4/4", "4/4 mit Faktor", "3/5", "5/3")
+
+# Monatsgehälter pro Jahr (Beamte mit Sonderzahlung aus data/lohnsteuer.py)
+MONATE_ANGESTELLTE = 12
+
+# Vorsorgeaufwendungen vereinfacht in Prozent des Jahresbruttos (Beamte:
+# PKV-Basisanteil aus data/lohnsteuer.py)
+VORSORGE_ANTEIL_ANGESTELLTE = 0.20  # Renten-, Kranken- und Pflegeversicherung
+
+# Lohnsteuer Klasse 5: Mindestsatz in Prozent des zvE
+MINDESTSATZ_KLASSE_5 = 14.0
+
+
+def _zve(brutto_monatlich: float, beamter: bool) -> float:
+    """Zu versteuerndes Jahreseinkommen einer Person (vereinfacht)."""
+    jahresbrutto = brutto_monatlich * (MONATE_BEAMTE if beamter else MONATE_ANGESTELLTE)
+    vorsorge = jahresbrutto * (VORSORGE_ANTEIL_BEAMTE if beamter else VORSORGE_ANTEIL_ANGESTELLTE)
+    werbungskosten = min(WERBUNGSKOSTEN_PAUSCHALE, jahresbrutto)
+    return max(0.0, jahresbrutto - werbungskosten - SONDERAUSGABEN_PAUSCHALE - vorsorge)
+
+
+def berechne_splittingsteuer(zve_gemeinsam: float) -> float:
+    """Einkommensteuer nach dem Splittingtarif (Jahresbetrag)."""
+    return 2 * berechne_einkommensteuer(zve_gemeinsam / 2)
+
+
+def berechne_lohnsteuer_klasse_5(zve: float) -> float:
+    """Jahreslohnsteuer in Steuerklasse 5 (vereinfacht)."""
+    steuer = 2 * (berechne_einkommensteuer(zve * 1.25) - berechne_einkommensteuer(zve * 0.75))
+    return round(max(steuer, zve * MINDESTSATZ_KLASSE_5 / 100), 2)
+
+
+def berechne_haushalt(
+    brutto_monatlich: float,
+    brutto_monatlich_partner: float,
+    partner_beamter: bool = True
+) -> dict:
+    """
+    Vergleicht die Steuerklassen-Kombinationen eines Ehepaars.
+
+    Args:
+        brutto_monatlich: Monatliches Brutto des Beamten (Partner 1)
+        brutto_monatlich_partner: Monatliches Brutto des Ehegatten (Partner 2)
+        partner_beamter: True wenn auch Partner 2 Beamter ist
+
+    Returns:
+        Dictionary mit Jahressteuer (Splitting und Einzelveranlagung),
+        Lohnsteuer und Nachzahlung je Kombination, Kombination mit dem
+        geringsten Lohnsteuerabzug und dessen Differenz zu 4/4 (bei der
+        Veranlagung nachzuzahlen, keine Ersparnis)
+    """
+    zve_1 = _zve(brutto_monatlich, True)
+    zve_2 = _zve(brutto_monatlich_partner, partner_beamter)
+
+    steuer_1 = berechne_einkommensteuer(zve_1)
+    steuer_2 = berechne_einkommensteuer(zve_2)
+    einzeln = steuer_1 + steuer_2
+    splitting = berechne_splittingsteuer(zve_1 + zve_2)
+
+    faktor = math.floor(splitting / einzeln * 1000) / 1000 if einzeln > 0 else 1.0
+    faktor = min(faktor, 1.0)
+
+    lohnsteuer = {
+        "4/4": einzeln,
+        "4/4 mit Faktor": faktor * einzeln,
+        "3/5": berechne_splittingsteuer(zve_1) + berechne_lohnsteuer_klasse_5(zve_2),
+        "5/3": berechne_lohnsteuer_klasse_5(zve_1) + berechne_splittingsteuer(zve_2),
+    }
+    beste = min(KOMBINATIONEN, key=lambda kombination: lohnsteuer[kombination])
+
+    ergebnis = {
+        "zve": round(zve_1, 2),
+        "zve_partner": round(zve_2, 2),
+        "steuer_splitting": round(splitting, 2),
+        "steuer_einzelveranlagung": round(einzeln, 2),
+        "splittingvorteil": round(einzeln - splitting, 2),
+        "faktor": faktor,
+    }
+    for kombination in KOMBINATIONEN:
+        schluessel = _schluessel(kombination)
+        ergebnis[f"lohnsteuer_{schluessel}"] = round(lohnsteuer[kombination], 2)
+        ergebnis[f"nachzahlung_{schluessel}"] = round(splitting - lohnsteuer[kombination], 2)
+    ergebnis["kombination_geringster_abzug"] = beste
+    ergebnis["lohnsteuer_differenz_zu_4_4"] = round(lohnsteuer["4/4"] - lohnsteuer[beste], 2)
+    return ergebnis
+
+
+def _schluessel(kombination: str) -> str:
+    """Ergebnisschlüssel einer Kombination, z.B. "4/4 mit Faktor" -> "4_4_faktor"."""
+    return kombination.replace(" mit ", "_").replace("/", "_").lower()
+
+
+def _zve_vec(brutto_monatlich, beamter) -> np.ndarray:
+    jahresbrutto = brutto_monatlich * np.where(beamter, MONATE_BEAMTE, MONATE_ANGESTELLTE)
+    vorsorge = jahresbrutto * np.where(beamter, VORSORGE_ANTEIL_BEAMTE, VORSORGE_ANTEIL_ANGESTELLTE)
+    werbungskosten = np.minimum(WERBUNGSKOSTEN_PAUSCHALE, jahresbrutto)
+    return np.maximum(0.0, jahresbrutto - werbungskosten - SONDERAUSGABEN_PAUSCHALE - vorsorge)
+
+
+def berechne_haushalt_vec(brutto_monatlich, brutto_monatlich_partner, partner_beamter=True) -> dict:
+    """
+    Vektorisierte Variante von berechne_haushalt: alle Kombinationen für
+    alle Haushalte in einem Tarif-Durchlauf.
+
+    Returns:
+        Dictionary mit Arrays der Berechnungsergebnisse
+    """
+    brutto_1, brutto_2, beamter_2 = np.broadcast_arrays(
+        np.asarray(brutto_monatlich, dtype=float),
+        np.asarray(brutto_monatlich_partner, dtype=float),
+        np.asarray(partner_beamter, dtype=bool)
+    )
+    zve_1 = _zve_vec(brutto_1, True)
+    zve_2 = _zve_vec(brutto_2, beamter_2)
+
+    # Alle benötigten Tarifauswertungen gestapelt in einem Aufruf
+    argumente = np.stack([
+        zve_1, zve_2, (zve_1 + zve_2) / 2, zve_1 / 2, zve_2 / 2,
+        zve_1 * 1.25, zve_1 * 0.75, zve_2 * 1.25, zve_2 * 0.75
+    ])
+    (steuer_1, steuer_2, halb_gemeinsam, halb_1, halb_2,
+     hoch_1, tief_1, hoch_2, tief_2) = berechne_einkommensteuer_vec(argumente)
+
+    einzeln = steuer_1 + steuer_2
+    splitting = 2 * halb_gemeinsam
+    klasse_5_1 = _runde(np.maximum(2 * (hoch_1 - tief_1), zve_1 * MINDESTSATZ_KLASSE_5 / 100))
+    klasse_5_2 = _runde(np.maximum(2 * (hoch_2 - tief_2), zve_2 * MINDESTSATZ_KLASSE_5 / 100))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        faktor = np.where(einzeln > 0, np.floor(splitting / einzeln * 1000) / 1000, 1.0)
+    faktor = np.minimum(faktor, 1.0)
+
+    lohnsteuer = np.stack([
+        einzeln,
+        faktor * einzeln,
+        2 * halb_1 + klasse_5_2,
+        klasse_5_1 + 2 * halb_2,
+    ])
+    beste = np.argmin(lohnsteuer, axis=0)
+
+    ergebnis = {
+        "zve": _runde(zve_1),
+        "zve_partner": _runde(zve_2),
+        "steuer_splitting": _runde(splitting),
+        "steuer_einzelveranlagung": _runde(einzeln),
+        "splittingvorteil": _runde(einzeln - splitting),
+        "faktor": faktor,
+    }
+    for i, kombination in enumerate(KOMBINATIONEN):
+        schluessel = _schluessel(kombination)
+        ergebnis[f"lohnsteuer_{schluessel}"] = _runde(lohnsteuer[i])
+        ergebnis[f"nachzahlung_{schluessel}"] = _runde(splitting - lohnsteuer[i])
+    ergebnis["kombination_geringster_abzug"] = np.array(KOMBINATIONEN, dtype=object)[beste]
+    ergebnis["lohnsteuer_differenz_zu_4_4"] = _runde(lohnsteuer[0] - np.take_along_axis(lohnsteuer, beste[np.newaxis], 0)[0])
+    return ergebnis
@@ -0,0 +1,208 @@
+"""
+Hinterbliebenenversorgung (Witwengeld/Waisengeld) für Beamte NRW
+Leitet Witwen- und Waisengeld aus dem Ruhegehalt ab, das der verstorbene
+Beamte erhalten hat bzw. bei Tod im Dienst erhalten hätte.
+
+- Tod im Ruhestand: Grundlage ist das Ruhegehalt (calculator/pension.py).
+- Tod im Dienst: Grundlage ist das Ruhegehalt wie bei Dienstunfähigkeit im
+  Todesjahr, also mit Zurechnungszeit und Mindestversorgung
+  (calculator/dienstunfaehigkeit.py).
+
+In beiden Fällen gilt die amtsunabhängige Mindestversorgung des Regelwerks
+als Untergrenze der Bemessungsgrundlage, sofern ein Versorgungsanspruch
+besteht.
+
+Witwengeld 55 %, Waisengeld 12 % (Halbwaise) bzw. 20 % (Vollwaise). Kinder
+sind Halbwaisen, wenn ein Ehegatte hinterbleibt, sonst Vollwaisen. Witwen-
+und Waisengeld zusammen dürfen die Bemessungsgrundlage nicht übersteigen;
+darüber werden alle Beträge anteilig gekürzt.
+
+Die Funktionen rechnen auf bereits berechneten Ergebnissen weiter, damit
+Ruhegehalt bzw. DU-Rente pro Person nur einmal berechnet werden.
+"""
+
+import numpy as np
+
+from calculator.pension import berechne_ruhegehalt
+from calculator.dienstunfaehigkeit import berechne_du_rente, berechne_mindestversorgung
+from calculator.vektor import _runde
+from calculator.stichtag import get_aktuelles_jahr
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+
+
+# Sätze in Prozent der Bemessungsgrundlage
+WITWENGELD_SATZ = 55.0
+HALBWAISENGELD_SATZ = 12.0
+VOLLWAISENGELD_SATZ = 20.0
+
+
+def berechne_hinterbliebenenversorgung(
+    ruhegehalt: float,
+    verheiratet: bool = True,
+    anzahl_kinder: int = 0,
+    mindestversorgung: float = None
+) -> dict:
+    """
+    Berechnet Witwen- und Waisengeld aus einem bereits berechneten Ruhegehalt.
+
+    Args:
+        ruhegehalt: Ruhegehalt (bzw. DU-Rente) des Verstorbenen in Euro
+        verheiratet: True wenn ein Ehegatte hinterbleibt
+        anzahl_kinder: Anzahl waisengeldberechtigter Kinder
+        mindestversorgung: Mindestversorgung des Regelwerks in Euro
+            (Standard: NRW, siehe berechne_mindestversorgung)
+
+    Returns:
+        Dictionary mit Bemessungsgrundlage, Witwengeld, Waisengeld und Summe
+    """
+    if mindestversorgung is None:
+        mindestversorgung = berechne_mindestversorgung()
+    hat_anspruch = ruhegehalt > 0
+    grundlage = max(ruhegehalt, mindestversorgung) if hat_anspruch else 0.0
+
+    waisensatz = HALBWAISENGELD_SATZ if verheiratet else VOLLWAISENGELD_SATZ
+    witwensatz = WITWENGELD_SATZ if verheiratet else 0.0
+
+    # Höchstgrenze: zusammen höchstens 100 % der Bemessungsgrundlage
+    gesamtsatz = witwensatz + anzahl_kinder * waisensatz
+    kuerzung = max(0.0, 1 - 100 / gesamtsatz) if gesamtsatz > 0 else 0.0
+
+    witwengeld = grundlage * witwensatz / 100 * (1 - kuerzung)
+    waisengeld = grundlage * waisensatz / 100 * (1 - kuerzung) if anzahl_kinder > 0 else 0.0
+
+    return {
+        "bemessungsgrundlage_hinterbliebene": round(grundlage, 2),
+        "mindestversorgung_angewendet": hat_anspruch and ruhegehalt < mindestversorgung,
+        "witwengeld": round(witwengeld, 2),
+        "waisengeld_je_kind": round(waisengeld, 2),
+        "ist_vollwaise": not verheiratet,
+        "waisengeld_gesamt": round(waisengeld * anzahl_kinder, 2),
+        "hinterbliebenenversorgung_gesamt": round(witwengeld + waisengeld * anzahl_kinder, 2),
+        "hoechstgrenze_kuerzung_prozent": round(kuerzung * 100, 2),
+    }
+
+
+def berechne_hinterbliebenenversorgung_vec(ruhegehalt, verheiratet=True, anzahl_kinder=0, mindestversorgung=None) -> dict:
+    """
+    Vektorisierte Variante von berechne_hinterbliebenenversorgung.
+    Alle Argumente dürfen Arrays sein und werden gegeneinander gebroadcastet
+    (mindestversorgung z.B. je Zeile aus dem Regelwerk).
+
+    Returns:
+        Dictionary mit Arrays der Berechnungsergebnisse
+    """
+    ruhegehalt = np.asarray(ruhegehalt, dtype=float)
+    verheiratet = np.asarray(verheiratet, dtype=bool)
+    anzahl_kinder = np.asarray(anzahl_kinder)
+
+    if mindestversorgung is None:
+        mindestversorgung = berechne_mindestversorgung()
+    hat_anspruch = ruhegehalt > 0
+    grundlage = np.where(hat_anspruch, np.maximum(ruhegehalt, mindestversorgung), 0.0)
+
+    waisensatz = np.where(verheiratet, HALBWAISENGELD_SATZ, VOLLWAISENGELD_SATZ)
+    witwensatz = np.where(verheiratet, WITWENGELD_SATZ, 0.0)
+
+    gesamtsatz = witwensatz + anzahl_kinder * waisensatz
+    with np.errstate(divide="ignore"):
+        kuerzung = np.where(gesamtsatz > 0, np.maximum(0.0, 1 - 100 / gesamtsatz), 0.0)
+
+    witwengeld = grundlage * witwensatz / 100 * (1 - kuerzung)
+    waisengeld = np.where(anzahl_kinder > 0, grundlage * waisensatz / 100 * (1 - kuerzung), 0.0)
+
+    return {
+        "bemessungsgrundlage_hinterbliebene": _runde(grundlage),
+        "mindestversorgung_angewendet": hat_anspruch & (ruhegehalt < mindestversorgung),
+        "witwengeld": _runde(witwengeld),
+        "waisengeld_je_kind": _runde(waisengeld),
+        "ist_vollwaise": ~verheiratet,
+        "waisengeld_gesamt": _runde(waisengeld * anzahl_kinder),
+        "hinterbliebenenversorgung_gesamt": _runde(witwengeld + waisengeld * anzahl_kinder),
+        "hoechstgrenze_kuerzung_prozent": _runde(kuerzung * 100),
+    }
+
+
+def berechne_hinterbliebene_ruhestand(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_pension: int,
+    verheiratet: bool = False,
+    anzahl_kinder: int = 0,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Ruhegehalt und Hinterbliebenenversorgung bei Tod im Ruhestand in einem
+    Durchlauf (das Ruhegehalt wird einmal berechnet und weiterverwendet).
+
+    Args:
+        anzahl_kinder: Anzahl waisengeldberechtigter Kinder
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+
+    Returns:
+        Ergebnis von berechne_ruhegehalt ergänzt um die Hinterbliebenen-Felder
+    """
+    ergebnis = berechne_ruhegehalt(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_pension=jahr_pension,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+        aktuelles_jahr=get_aktuelles_jahr(aktuelles_jahr)
+    )
+    ergebnis.update(berechne_hinterbliebenenversorgung(ergebnis["ruhegehalt_brutto"], verheiratet, anzahl_kinder))
+    return ergebnis
+
+
+def berechne_hinterbliebene_im_dienst(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    jahr_tod: int,
+    verheiratet: bool = False,
+    anzahl_kinder: int = 0,
+    mietenstufe: int = STANDARD_MIETENSTUFE,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    arbeitszeit_faktor: float = 1.0,
+    ist_polizei_feuerwehr: bool = False
+) -> dict:
+    """
+    DU-Ruhegehalt und Hinterbliebenenversorgung bei Tod im Dienst in einem
+    Durchlauf (Grundlage ist die DU-Rente im Todesjahr).
+
+    Args:
+        jahr_tod: Todesjahr
+        anzahl_kinder: Anzahl waisengeldberechtigter Kinder
+
+    Returns:
+        Ergebnis von berechne_du_rente ergänzt um die Hinterbliebenen-Felder
+    """
+    ergebnis = berechne_du_rente(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_du=jahr_tod,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr
+    )
+    ergebnis.update(berechne_hinterbliebenenversorgung(ergebnis["du_rente_brutto"], verheiratet, anzahl_kinder))
+    return ergebnis
@@ -0,0 +1,112 @@
+"""
+Kennfelder (2-D-Übersichten) für Ruhegehalt und DU-Rente
+Berechnet die komplette Matrix in einem vektorisierten Durchlauf.
+"""
+
+import numpy as np
+
+from calculator.vektor import (
+    gruppen_index,
+    berechne_ruhegehalt_vec,
+    berechne_du_rente_vec
+)
+from calculator.stichtag import get_aktuelles_jahr
+
+
+def berechne_pension_kennfeld(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    pensionsalter: list,
+    arbeitszeit_faktoren: list,
+    verheiratet: bool = False,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0,
+    ist_polizei_feuerwehr: bool = False,
+    aktuelles_jahr: int = None
+) -> dict:
+    """
+    Berechnet das Ruhegehalt für alle Kombinationen aus Pensionsalter und
+    Arbeitszeit-Faktor.
+
+    Args:
+        pensionsalter: Pensionsalter (Zeilen der Matrix)
+        arbeitszeit_faktoren: Arbeitszeit-Faktoren (Spalten der Matrix)
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+
+    Returns:
+        Dictionary mit Achsen und Matrizen (Zeilen = Pensionsalter)
+    """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+
+    alter = np.asarray(pensionsalter)[:, np.newaxis]
+    faktoren = np.asarray(arbeitszeit_faktoren, dtype=float)[np.newaxis, :]
+
+    ergebnis = berechne_ruhegehalt_vec(
+        gruppe_idx=gruppen_index(besoldungsgruppe)[0],
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_pension=geburtsjahr + alter,
+        aktuelles_jahr=aktuelles_jahr,
+        verheiratet=verheiratet,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=faktoren,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr
+    )
+
+    form = (alter.shape[0], faktoren.shape[1])
+    return {
+        "pensionsalter": list(pensionsalter),
+        "arbeitszeit_faktoren": list(arbeitszeit_faktoren),
+        "ruhegehalt_brutto": np.broadcast_to(ergebnis["ruhegehalt_brutto"], form),
+        "versorgungsabschlag_prozent": np.broadcast_to(ergebnis["versorgungsabschlag_prozent"], form),
+    }
+
+
+def berechne_du_kennfeld(
+    besoldungsgruppe: str,
+    stufe: int,
+    geburtsjahr: int,
+    jahr_verbeamtung: int,
+    du_jahre: list,
+    arbeitszeit_faktoren: list,
+    verheiratet: bool = False,
+    teilzeitjahre: float = 0,
+    teilzeitanteil: float = 1.0
+) -> dict:
+    """
+    Berechnet die DU-Rente für alle Kombinationen aus DU-Jahr und
+    Arbeitszeit-Faktor.
+
+    Args:
+        du_jahre: Jahre des DU-Eintritts (Zeilen der Matrix)
+        arbeitszeit_faktoren: Arbeitszeit-Faktoren (Spalten der Matrix)
+
+    Returns:
+        Dictionary mit Achsen und Matrizen (Zeilen = DU-Jahr)
+    """
+    jahre = np.asarray(du_jahre)[:, np.newaxis]
+    faktoren = np.asarray(arbeitszeit_faktoren, dtype=float)[np.newaxis, :]
+
+    ergebnis = berechne_du_rente_vec(
+        gruppe_idx=gruppen_index(besoldungsgruppe)[0],
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_du=jahre,
+        verheiratet=verheiratet,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=faktoren
+    )
+
+    form = (jahre.shape[0], faktoren.shape[1])
+    return {
+        "du_jahre": list(du_jahre),
+        "arbeitszeit_faktoren": list(arbeitszeit_faktoren),
+        "du_rente_brutto": np.broadcast_to(ergebnis["du_rente_brutto"], form),
+        "hat_anspruch": np.broadcast_to(ergebnis["hat_anspruch"], form),
+    }
@@ -5,23 +5,26 @@ Ruhegehalt-Berechnung (Altersrente) für Beamte NRW
 from calculator.gehalt import berechne_ruhegehaltsfaehige_bezuege
 from data.familienzuschlag import STANDARD_MIETENSTUFE
 from data.besoldung import berechne_stufe_nach_dienstjahren, get_max_stufe
+from calculator.stichtag import get_aktuelles_jahr
+from data.parameter import get_parameter
 
 
-# Konstanten
-RUHEGEHALTSSATZ_PRO_JAHR = 1.79375  # Prozent pro Dienstjahr
-MAX_RUHEGEHALTSSATZ = 71.75  # Maximum in Prozent
-MIN_RUHEGEHALTSSATZ = 35.0  # Minimum bei mindestens 5 Jahren Dienstzeit
-MIN_DIENSTJAHRE = 5  # Mindestens 5 Jahre für Pensionsanspruch
+# Konstanten aus der aktiven Parameterdatei (data/parameterdateien/)
+_VERSORGUNG = get_parameter()["versorgung"]
+RUHEGEHALTSSATZ_PRO_JAHR = _VERSORGUNG["ruhegehaltssatz_pro_jahr"]  # Prozent pro Dienstjahr
+MAX_RUHEGEHALTSSATZ = _VERSORGUNG["max_ruhegehaltssatz"]  # Maximum in Prozent
+MIN_RUHEGEHALTSSATZ = _VERSORGUNG["min_ruhegehaltssatz"]  # Minimum bei mindestens 5 Jahren Dienstzeit
+MIN_DIENSTJAHRE = _VERSORGUNG["min_dienstjahre"]  # Mindestens 5 Jahre für Pensionsanspruch
 
 # Altersgrenzen
-REGELALTERSGRENZE_NORMAL = 67
-REGELALTERSGRENZE_POLIZEI = 60
-ANTRAGSALTERSGRENZE_NORMAL = 63
-ANTRAGSALTERSGRENZE_POLIZEI = 60
+REGELALTERSGRENZE_NORMAL = _VERSORGUNG["regelaltersgrenze_normal"]
+REGELALTERSGRENZE_POLIZEI = _VERSORGUNG["regelaltersgrenze_polizei"]
+ANTRAGSALTERSGRENZE_NORMAL = _VERSORGUNG["antragsaltersgrenze_normal"]
+ANTRAGSALTERSGRENZE_POLIZEI = _VERSORGUNG["antragsaltersgrenze_polizei"]
 
 # Versorgungsabschlag
-ABSCHLAG_PRO_JAHR = 3.6  # Prozent pro Jahr vor Altersgrenze
-MAX_ABSCHLAG = 10.8  # Maximum Versorgungsabschlag NRW (§16 LBeamtVG NRW)
+ABSCHLAG_PRO_JAHR = _VERSORGUNG["abschlag_pro_jahr"]  # Prozent pro Jahr vor Altersgrenze
+MAX_ABSCHLAG = _VERSORGUNG["max_abschlag"]  # Maximum Versorgungsabschlag NRW (§16 LBeamtVG NRW)
 
 
 def berechne_dienstjahre(
@@ -122,7 +125,8 @@ def berechne_ruhegehalt(
     teilzeitjahre: float = 0,
     teilzeitanteil: float = 1.0,
     arbeitszeit_faktor: float = 1.0,
-    ist_polizei_feuerwehr: bool = False
+    ist_polizei_feuerwehr: bool = False,
+    aktuelles_jahr: int = None
 ) -> dict:
     """
     Berechnet das vollständige Ruhegehalt.
@@ -139,12 +143,12 @@ def berechne_ruhegehalt(
         teilzeitanteil: Anteil der Teilzeit
         arbeitszeit_faktor: Aktueller Arbeitszeit-Faktor
         ist_polizei_feuerwehr: True für Polizei/Feuerwehr
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
 
     Returns:
         Dictionary mit allen Berechnungsergebnissen
     """
-    import datetime
-    aktuelles_jahr = datetime.datetime.now().year
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
 
     # Alter bei Pensionierung
     alter_pension = jahr_pension - geburtsjahr
@@ -225,14 +229,19 @@ def berechne_pension_nach_alter(
     arbeitszeit_faktor: float = 1.0,
     ist_polizei_feuerwehr: bool = False,
     von_alter: int = 60,
-    bis_alter: int = 67
+    bis_alter: int = 67,
+    aktuelles_jahr: int = None
 ) -> list:
     """
     Berechnet die Pension für verschiedene Pensionsalter.
 
+    Args:
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion (Standard: Stichtag)
+
     Returns:
         Liste von Dictionaries mit Pension pro Alter
     """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
     ergebnisse = []
 
     for alter in range(von_alter, bis_alter + 1):
@@ -248,7 +257,8 @@ def berechne_pension_nach_alter(
             teilzeitjahre=teilzeitjahre,
             teilzeitanteil=teilzeitanteil,
             arbeitszeit_faktor=arbeitszeit_faktor,
-            ist_polizei_feuerwehr=ist_polizei_feuerwehr
+            ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+            aktuelles_jahr=aktuelles_jahr
         )
         ergebnis["pensionsalter"] = alter
         ergebnisse.append(ergebnis)
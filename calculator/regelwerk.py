@@ -0,0 +1,246 @@
+"""
+Regelwerke verschiedener Dienstherren (NRW, Bund)
+Die versorgungsrechtlichen Parameter eines Dienstherrn sind reine Daten
+(REGELWERKE); get_regelwerk() übersetzt sie einmalig in ein unveränderliches
+Regelwerk-Objekt, das die Rechenkerne in calculator/vektor.py und
+calculator/festkomma.py direkt verwenden.
+
+Gemischte Bestände werden nicht zeilenweise nachgeschlagen:
+gruppiere_nach_regelwerk() sortiert die Zeilen einmal nach Regelwerk, und
+jeder Kern läuft je Gruppe mit skalaren Parametern (siehe
+calculator/batch.py).
+
+Das NRW-Regelwerk verwendet die Konstanten aus calculator/pension.py,
+calculator/dienstunfaehigkeit.py und data/besoldung.py. Besoldungstabellen
+und Familienzuschläge kommen für alle Regelwerke aus data/besoldung.py
+(NRW); ein Regelwerk wird deshalb erst eingetragen, wenn auch seine
+Besoldungstabellen vorliegen. Für das Bundesrecht (BeamtVG, vereinfacht,
+u.a. ohne Übergangsregelungen) stehen die abweichenden Parameter in
+BUND_ABWEICHUNGEN bereit, die Bundesbesoldungstabellen (BBesG) fehlen noch.
+
+Weitere Dienstherren lassen sich mit registriere_regelwerk() ergänzen;
+eingetragen werden nur Regelwerke mit belegten Parametern, keine
+ungeprüften Kopien.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from calculator.pension import (
+    RUHEGEHALTSSATZ_PRO_JAHR,
+    MAX_RUHEGEHALTSSATZ,
+    MIN_RUHEGEHALTSSATZ,
+    MIN_DIENSTJAHRE,
+    REGELALTERSGRENZE_NORMAL,
+    REGELALTERSGRENZE_POLIZEI,
+    ABSCHLAG_PRO_JAHR,
+    MAX_ABSCHLAG
+)
+from calculator.dienstunfaehigkeit import (
+    ZURECHNUNGSZEIT_GRENZE_ALT,
+    ZURECHNUNGSZEIT_GRENZE_NEU,
+    ZURECHNUNGSZEIT_UEBERGANGSJAHR,
+    ZURECHNUNGSZEIT_FAKTOR,
+    DU_ABSCHLAG_ALTERSGRENZE,
+    MINDESTVERSORGUNGSSATZ,
+    WARTEZEIT_JAHRE
+)
+from data.besoldung import MINDESTVERSORGUNG_GRUNDGEHALT
+from data.lohnsteuer import KIRCHENSTEUERSATZ_STANDARD
+
+
+STANDARD_REGELWERK = "NRW"
+
+# Parameter eines Regelwerks (Prozentsätze in Prozent, Grenzen in Jahren)
+PARAMETER_NAMEN = (
+    "ruhegehaltssatz_pro_jahr",
+    "max_ruhegehaltssatz",
+    "min_ruhegehaltssatz",
+    "min_dienstjahre",
+    "regelaltersgrenze_normal",
+    "regelaltersgrenze_polizei",
+    "abschlag_pro_jahr",
+    "max_abschlag",
+    "zurechnungszeit_grenze_alt",
+    "zurechnungszeit_grenze_neu",
+    "zurechnungszeit_uebergangsjahr",
+    "zurechnungszeit_faktor",
+    "du_abschlag_altersgrenze",
+    "mindestversorgungssatz",
+    "wartezeit_jahre",
+    "kirchensteuersatz",
+)
+
+_NRW = {
+    "ruhegehaltssatz_pro_jahr": RUHEGEHALTSSATZ_PRO_JAHR,
+    "max_ruhegehaltssatz": MAX_RUHEGEHALTSSATZ,
+    "min_ruhegehaltssatz": MIN_RUHEGEHALTSSATZ,
+    "min_dienstjahre": MIN_DIENSTJAHRE,
+    "regelaltersgrenze_normal": REGELALTERSGRENZE_NORMAL,
+    "regelaltersgrenze_polizei": REGELALTERSGRENZE_POLIZEI,
+    "abschlag_pro_jahr": ABSCHLAG_PRO_JAHR,
+    "max_abschlag": MAX_ABSCHLAG,
+    "zurechnungszeit_grenze_alt": ZURECHNUNGSZEIT_GRENZE_ALT,
+    "zurechnungszeit_grenze_neu": ZURECHNUNGSZEIT_GRENZE_NEU,
+    "zurechnungszeit_uebergangsjahr": ZURECHNUNGSZEIT_UEBERGANGSJAHR,
+    "zurechnungszeit_faktor": ZURECHNUNGSZEIT_FAKTOR,
+    "du_abschlag_altersgrenze": DU_ABSCHLAG_ALTERSGRENZE,
+    "mindestversorgungssatz": MINDESTVERSORGUNGSSATZ,
+    "wartezeit_jahre": WARTEZEIT_JAHRE,
+    "kirchensteuersatz": KIRCHENSTEUERSATZ_STANDARD,
+}
+
+# Abweichungen des Bundesrechts (BeamtVG) von NRW: Zurechnungszeit bis 60
+# ohne Stichtagsregel, DU-Abschlag vor 65. Nicht eingetragen, solange die
+# Bundesbesoldungstabellen fehlen (sonst rechnete "Bund" mit NRW-Besoldung).
+BUND_ABWEICHUNGEN = {
+    "regelaltersgrenze_polizei": 62,
+    "zurechnungszeit_grenze_alt": 60,
+    "zurechnungszeit_grenze_neu": 60,
+    "du_abschlag_altersgrenze": 65,
+}
+
+# Regelwerk-Name -> Parameter (Reihenfolge = Index in Batch-Spalten)
+REGELWERKE = {
+    "NRW": _NRW,
+}
+
+# Regelwerk-Name -> Index (für geprüfte Batch-Spalten)
+REGELWERK_INDEX = {name: i for i, name in enumerate(REGELWERKE)}
+
+
+class Regelwerk:
+    """
+    Übersetztes, unveränderliches Regelwerk eines Dienstherrn.
+
+    Attributes:
+        name: Name des Regelwerks
+        index: Index in REGELWERK_INDEX
+        <Parameter>: Alle Werte aus PARAMETER_NAMEN
+        mindestversorgung: Amtsunabhängige Mindestversorgung in Euro
+    """
+
+    __slots__ = ("name", "index", "mindestversorgung") + PARAMETER_NAMEN
+
+    def __init__(self, name: str, index: int, parameter: dict):
+        fehlend = [p for p in PARAMETER_NAMEN if p not in parameter]
+        unbekannt = [p for p in parameter if p not in PARAMETER_NAMEN]
+        if fehlend or unbekannt:
+            raise ValueError(f"Regelwerk {name} ungültig: fehlend {fehlend}, unbekannt {unbekannt}")
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "index", index)
+        for parameter_name in PARAMETER_NAMEN:
+            object.__setattr__(self, parameter_name, parameter[parameter_name])
+        object.__setattr__(self, "mindestversorgung", round(
+            MINDESTVERSORGUNG_GRUNDGEHALT * (parameter["mindestversorgungssatz"] / 100), 2
+        ))
+
+    def __setattr__(self, name, wert):
+        raise AttributeError("Regelwerk ist unveränderlich")
+
+    def __repr__(self) -> str:
+        return f"Regelwerk({self.name!r})"
+
+
+@lru_cache(maxsize=None)
+def get_regelwerk(name: str = STANDARD_REGELWERK) -> Regelwerk:
+    """
+    Gibt das übersetzte Regelwerk eines Dienstherrn zurück (einmal je Name).
+
+    Args:
+        name: z.B. "NRW"
+
+    Returns:
+        Regelwerk-Objekt
+    """
+    if name not in REGELWERKE:
+        raise ValueError(f"Regelwerk {name} nicht gefunden")
+    return Regelwerk(name, REGELWERK_INDEX[name], REGELWERKE[name])
+
+
+def registriere_regelwerk(name: str, basis: str = STANDARD_REGELWERK, **abweichungen) -> Regelwerk:
+    """
+    Ergänzt oder ersetzt ein Regelwerk als Abwandlung eines bestehenden.
+
+    Args:
+        name: Name des neuen Regelwerks
+        basis: Regelwerk, dessen Parameter übernommen werden
+        abweichungen: Abweichende Parameter
+
+    Returns:
+        Übersetztes Regelwerk
+    """
+    if basis not in REGELWERKE:
+        raise ValueError(f"Regelwerk {basis} nicht gefunden")
+    parameter = {**REGELWERKE[basis], **abweichungen}
+    # Vorab prüfen, damit ungültige Regelwerke nicht registriert werden
+    Regelwerk(name, len(REGELWERKE), parameter)
+    REGELWERKE[name] = parameter
+    REGELWERK_INDEX.setdefault(name, len(REGELWERK_INDEX))
+    get_regelwerk.cache_clear()
+    return get_regelwerk(name)
+
+
+def get_regelwerke() -> list:
+    """Gibt die Namen aller Regelwerke zurück."""
+    return list(REGELWERKE)
+
+
+def gruppiere_nach_regelwerk(regelwerk_idx) -> list:
+    """
+    Teilt Zeilen nach Regelwerk auf (eine Sortierung für den ganzen Bestand).
+
+    Args:
+        regelwerk_idx: Regelwerk-Index je Zeile
+
+    Returns:
+        Liste von (Regelwerk, Zeilenindizes) je vorkommendem Regelwerk
+    """
+    regelwerk_idx = np.asarray(regelwerk_idx, dtype=np.int64)
+    reihenfolge = np.argsort(regelwerk_idx, kind="stable")
+    grenzen = np.flatnonzero(np.diff(regelwerk_idx[reihenfolge])) + 1
+    namen = list(REGELWERK_INDEX)
+    return [
+        (get_regelwerk(namen[regelwerk_idx[zeilen[0]]]), zeilen)
+        for zeilen in np.split(reihenfolge, grenzen)
+        if len(zeilen)
+    ]
+
+
+def get_parameter_tabelle(parameter: str) -> np.ndarray:
+    """
+    Lookup-Tabelle eines Parameters über alle Regelwerke (Index wie
+    REGELWERK_INDEX), für zeilenweise Werte in gemischten Beständen.
+
+    Args:
+        parameter: Name aus PARAMETER_NAMEN oder "mindestversorgung"
+
+    Returns:
+        Array mit dem Parameterwert je Regelwerk-Index
+    """
+    if parameter not in PARAMETER_NAMEN + ("mindestversorgung",):
+        raise ValueError(f"Parameter {parameter} nicht gefunden")
+    return np.array([getattr(get_regelwerk(name), parameter) for name in REGELWERK_INDEX])
+
+
+def staple_regelwerke(regelwerke: list) -> Regelwerk:
+    """
+    Stapelt Regelwerke entlang einer führenden Achse: jeder Parameter wird
+    ein Array der Form (Anzahl Regelwerke, 1), das die Kerne gegen die
+    Zeilen eines Bestands broadcasten (ein Durchlauf für alle Regelwerke,
+    siehe calculator/tarifvergleich.py).
+
+    Args:
+        regelwerke: Liste von Regelwerk-Objekten
+
+    Returns:
+        Regelwerk mit gestapelten Parametern (nicht registriert, Index -1)
+    """
+    gestapelt = object.__new__(Regelwerk)
+    object.__setattr__(gestapelt, "name", " | ".join(r.name for r in regelwerke))
+    object.__setattr__(gestapelt, "index", -1)
+    for parameter_name in PARAMETER_NAMEN + ("mindestversorgung",):
+        werte = np.array([getattr(r, parameter_name) for r in regelwerke])
+        object.__setattr__(gestapelt, parameter_name, werte[:, np.newaxis])
+    return gestapelt
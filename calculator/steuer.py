@@ -1,9 +1,21 @@
 """
 Netto-Berechnung für Beamte NRW
 Beamte zahlen keine Sozialversicherungsbeiträge!
+
+Versorgungsbezüge (Ruhegehalt, DU-Rente) werden wie Arbeitslohn nach der
+Steuerklasse besteuert, aber nach Abzug des Versorgungsfreibetrags samt
+Zuschlag (abhängig vom Jahr des Versorgungsbeginns) und mit dem
+Werbungskosten-Pauschbetrag für Versorgungsbezüge.
 """
 
-from data.lohnsteuer import berechne_lohnsteuer_monatlich
+from data.lohnsteuer import (
+    berechne_lohnsteuer_monatlich,
+    berechne_steuern_monatlich,
+    berechne_versorgungsfreibetrag,
+    WERBUNGSKOSTEN_VERSORGUNG,
+    SONDERAUSGABEN_PAUSCHALE,
+    VORSORGE_ANTEIL_BEAMTE
+)
 
 
 def berechne_netto(
@@ -73,3 +85,58 @@ def berechne_netto_einfach(
     """
     ergebnis = berechne_netto(brutto_monatlich, steuerklasse, kirchensteuer)
     return ergebnis["netto"]
+
+
+def berechne_netto_pension(
+    ruhegehalt_monatlich: float,
+    jahr_versorgungsbeginn: int,
+    steuerklasse: int,
+    kirchensteuer: bool = False,
+    pkv_beitrag: float = None
+) -> dict:
+    """
+    Berechnet die Netto-Pension (Ruhegehalt oder DU-Rente) eines Beamten.
+
+    Args:
+        ruhegehalt_monatlich: Monatliches Ruhegehalt brutto
+        jahr_versorgungsbeginn: Jahr des Versorgungsbeginns (bestimmt den
+            Versorgungsfreibetrag)
+        steuerklasse: Steuerklasse 1-6
+        kirchensteuer: True wenn Kirchensteuer zu zahlen ist
+        pkv_beitrag: PKV-Beitrag in Euro (optional, wenn None oder 0 wird 0 verwendet)
+
+    Returns:
+        Dictionary mit Brutto, Freibeträgen, Abzügen und Netto
+    """
+    jahresbezug = ruhegehalt_monatlich * 12
+    freibetraege = berechne_versorgungsfreibetrag(jahresbezug, jahr_versorgungsbeginn)
+
+    zve = max(
+        0.0,
+        jahresbezug
+        - freibetraege["versorgungsfreibetrag"]
+        - freibetraege["zuschlag_versorgungsfreibetrag"]
+        - WERBUNGSKOSTEN_VERSORGUNG
+        - SONDERAUSGABEN_PAUSCHALE
+        - jahresbezug * VORSORGE_ANTEIL_BEAMTE
+    )
+    steuern = berechne_steuern_monatlich(zve, steuerklasse, kirchensteuer)
+
+    if pkv_beitrag is None or pkv_beitrag <= 0:
+        pkv_beitrag = 0.0
+
+    abzuege_gesamt = steuern["gesamt"] + pkv_beitrag
+    netto = ruhegehalt_monatlich - abzuege_gesamt
+
+    return {
+        "brutto": round(ruhegehalt_monatlich, 2),
+        **freibetraege,
+        "zve": round(zve, 2),
+        "lohnsteuer": steuern["lohnsteuer"],
+        "solidaritaetszuschlag": steuern["solidaritaetszuschlag"],
+        "kirchensteuer": steuern["kirchensteuer"],
+        "steuern_gesamt": steuern["gesamt"],
+        "pkv_beitrag": round(pkv_beitrag, 2),
+        "abzuege_gesamt": round(abzuege_gesamt, 2),
+        "netto": round(netto, 2),
+    }
@@ -0,0 +1,92 @@
+"""
+Stichtag (Bewertungsdatum) für alle Berechnungen
+Statt in jeder Funktion datetime.now() aufzurufen, wird "heute" an einer
+Stelle aufgelöst: explizit übergebenes aktuelles_jahr, sonst der für den
+aktuellen Kontext gesetzte Stichtag, sonst das Tagesdatum.
+
+Ein Stichtag lässt sich für einen Block festlegen (Batch-Läufe, Benchmarks,
+reproduzierbare Berichte):
+
+    with stichtag("2025-02-01"):
+        berechne_ruhegehalt(...)
+
+oder prozessweit über die Umgebungsvariable BEAMTENRECHNER_STICHTAG=2025-02-01.
+Der Stichtag ist kontextlokal (contextvars) und damit sicher für Threads und
+asyncio-Tasks.
+"""
+
+import contextvars
+import datetime
+import os
+from contextlib import contextmanager
+
+
+# Umgebungsvariable für einen prozessweiten Stichtag (ISO-Datum)
+STICHTAG_UMGEBUNGSVARIABLE = "BEAMTENRECHNER_STICHTAG"
+
+_stichtag = contextvars.ContextVar("stichtag", default=None)
+
+
+def _als_datum(datum) -> datetime.date:
+    """Wandelt ein Datum, einen ISO-String oder ein Jahr in ein datetime.date um."""
+    if isinstance(datum, datetime.datetime):
+        return datum.date()
+    if isinstance(datum, datetime.date):
+        return datum
+    if isinstance(datum, int):
+        return datetime.date(datum, 1, 1)
+    try:
+        return datetime.date.fromisoformat(datum)
+    except (TypeError, ValueError):
+        raise ValueError(f"Stichtag {datum!r} ungültig")
+
+
+_PROZESS_STICHTAG = (
+    _als_datum(os.environ[STICHTAG_UMGEBUNGSVARIABLE])
+    if os.environ.get(STICHTAG_UMGEBUNGSVARIABLE) else None
+)
+
+
+def get_stichtag() -> datetime.date:
+    """
+    Gibt den gültigen Stichtag zurück.
+
+    Returns:
+        Gesetzter Stichtag des Kontexts bzw. Prozesses, sonst das Tagesdatum
+    """
+    datum = _stichtag.get()
+    if datum is not None:
+        return datum
+    if _PROZESS_STICHTAG is not None:
+        return _PROZESS_STICHTAG
+    return datetime.date.today()
+
+
+def get_aktuelles_jahr(aktuelles_jahr: int = None) -> int:
+    """
+    Löst das Bezugsjahr einer Berechnung auf.
+
+    Args:
+        aktuelles_jahr: Explizit übergebenes Jahr (hat Vorrang)
+
+    Returns:
+        Bezugsjahr
+    """
+    if aktuelles_jahr is not None:
+        return aktuelles_jahr
+    return get_stichtag().year
+
+
+@contextmanager
+def stichtag(datum):
+    """
+    Legt den Stichtag für einen Block fest.
+
+    Args:
+        datum: datetime.date, ISO-String ("2025-02-01") oder Jahr
+    """
+    token = _stichtag.set(_als_datum(datum))
+    try:
+        yield
+    finally:
+        _stichtag.reset(token)
@@ -0,0 +1,175 @@
+"""
+Gemeinsame Tariftabellen für mehrere Worker-Prozesse
+Schreibt die Lookup-Tabellen aus calculator/vektor.py einmalig in eine
+Datei (standardmäßig im Shared Memory unter /dev/shm), die weitere Prozesse
+schreibgeschützt per mmap einblenden. Die Seiten liegen damit nur einmal im
+Speicher, und die Worker sparen den Aufbau der Tabellen beim Import.
+
+Die Datei enthält die Tarifversion (siehe calculator/ergebniscache.py);
+passt sie nicht zum aktuellen Code, wird sie ignoriert und die Tabellen
+werden wie bisher lokal aufgebaut.
+
+Verwendung:
+    python -m calculator.tabellenspeicher            # veröffentlicht, gibt Pfad aus
+    BEAMTENRECHNER_TABELLEN=<Pfad> streamlit run app.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from calculator.ergebniscache import get_tarifversion
+
+
+# Umgebungsvariable mit dem Pfad der veröffentlichten Tabellen
+TABELLEN_UMGEBUNGSVARIABLE = "BEAMTENRECHNER_TABELLEN"
+
+# Kennung am Dateianfang
+DATEI_KENNUNG = b"BRNRWTAB"
+
+# Ausrichtung der Arrays in der Datei (Bytes)
+AUSRICHTUNG = 64
+
+# Tabellen aus calculator/vektor.py, die veröffentlicht werden
+TABELLEN_NAMEN = (
+    "GRUNDGEHALT_TABELLE",
+    "STUFEN_TABELLE",
+    "STRUKTURZULAGE_TABELLE",
+    "FAMILIENZUSCHLAG_STUFE1_TABELLE",
+    "MAX_STUFE_TABELLE",
+    "KINDER_BASIS_TABELLE",
+    "KINDER_ERHOEHUNG_TABELLE",
+    "STEUERKLASSEN_FAKTOR_TABELLE",
+    "VERSORGUNGSFREIBETRAG_TABELLE",
+)
+
+
+def _ausrichten(position: int) -> int:
+    return -(-position // AUSRICHTUNG) * AUSRICHTUNG
+
+
+def get_standard_pfad() -> str:
+    """Standardpfad im Shared Memory (bzw. Temp-Verzeichnis), je Tarifversion."""
+    verzeichnis = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(verzeichnis, f"beamtenrechner_tabellen_{get_tarifversion()}.bin")
+
+
+def schreibe_tabellen(tabellen: dict, pfad: str):
+    """
+    Schreibt Tabellen in eine Datei (atomar über Umbenennen).
+
+    Aufbau: Kennung, Kopflänge (8 Bytes), JSON-Kopf mit Tarifversion und
+    Lage jedes Arrays, danach die ausgerichteten Rohdaten.
+
+    Args:
+        tabellen: Dictionary Name -> numpy-Array
+        pfad: Zieldatei
+    """
+    eintraege = {}
+    position = 0
+    for name, tabelle in tabellen.items():
+        tabelle = np.ascontiguousarray(tabelle)
+        position = _ausrichten(position)
+        eintraege[name] = {
+            "dtype": tabelle.dtype.str,
+            "form": list(tabelle.shape),
+            "offset": position,
+        }
+        position += tabelle.nbytes
+
+    kopf = json.dumps({"tarifversion": get_tarifversion(), "tabellen": eintraege}).encode("utf-8")
+    daten_start = _ausrichten(len(DATEI_KENNUNG) + 8 + len(kopf))
+
+    temp_pfad = f"{pfad}.{os.getpid()}.tmp"
+    with open(temp_pfad, "wb") as datei:
+        datei.write(DATEI_KENNUNG)
+        datei.write(len(kopf).to_bytes(8, "little"))
+        datei.write(kopf)
+        for name, tabelle in tabellen.items():
+            datei.seek(daten_start + eintraege[name]["offset"])
+            datei.write(np.ascontiguousarray(tabelle).tobytes())
+    os.replace(temp_pfad, pfad)
+
+
+def lade_tabellen(pfad: str) -> dict:
+    """
+    Blendet veröffentlichte Tabellen schreibgeschützt ein.
+
+    Args:
+        pfad: Datei aus schreibe_tabellen
+
+    Returns:
+        Dictionary Name -> schreibgeschütztes numpy-Array (mmap)
+
+    Raises:
+        ValueError: Wenn die Datei ungültig ist oder die Tarifversion nicht passt
+    """
+    with open(pfad, "rb") as datei:
+        if datei.read(len(DATEI_KENNUNG)) != DATEI_KENNUNG:
+            raise ValueError(f"Tabellendatei {pfad} ungültig")
+        kopf_laenge = int.from_bytes(datei.read(8), "little")
+        kopf = json.loads(datei.read(kopf_laenge))
+
+    if kopf["tarifversion"] != get_tarifversion():
+        raise ValueError(
+            f"Tabellendatei {pfad} hat Tarifversion {kopf['tarifversion']}, erwartet {get_tarifversion()}"
+        )
+
+    daten_start = _ausrichten(len(DATEI_KENNUNG) + 8 + kopf_laenge)
+    speicher = np.memmap(pfad, mode="r", dtype=np.uint8)
+    tabellen = {}
+    for name, eintrag in kopf["tabellen"].items():
+        dtype = np.dtype(eintrag["dtype"])
+        anzahl = int(np.prod(eintrag["form"], dtype=np.int64))
+        start = daten_start + eintrag["offset"]
+        tabellen[name] = (
+            speicher[start:start + anzahl * dtype.itemsize]
+            .view(dtype)
+            .reshape(eintrag["form"])
+            .view(np.ndarray)
+        )
+    return tabellen
+
+
+def lade_veroeffentlichte_tabellen():
+    """
+    Lädt die über BEAMTENRECHNER_TABELLEN veröffentlichten Tabellen.
+
+    Returns:
+        Dictionary Name -> Array, oder None wenn nichts (Passendes)
+        veröffentlicht ist
+    """
+    pfad = os.environ.get(TABELLEN_UMGEBUNGSVARIABLE)
+    if not pfad or not os.path.exists(pfad):
+        return None
+    try:
+        tabellen = lade_tabellen(pfad)
+    except (ValueError, KeyError, OSError):
+        return None
+    if not all(name in tabellen for name in TABELLEN_NAMEN):
+        return None
+    return tabellen
+
+
+def veroeffentliche_tabellen(pfad: str = None) -> str:
+    """
+    Veröffentlicht die Tabellen aus calculator/vektor.py.
+
+    Args:
+        pfad: Zieldatei (Standard: /dev/shm, je Tarifversion)
+
+    Returns:
+        Pfad der Datei (für BEAMTENRECHNER_TABELLEN)
+    """
+    from calculator import vektor
+
+    pfad = pfad or get_standard_pfad()
+    schreibe_tabellen({name: getattr(vektor, name) for name in TABELLEN_NAMEN}, pfad)
+    return pfad
+
+
+if __name__ == "__main__":
+    print(veroeffentliche_tabellen(sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,236 @@
+"""
+Tarifvergleich: Auswirkung eines neuen Tarifstands auf einen ganzen Bestand
+Ein Tarifstand besteht aus einer Parameterversion (data/parameter.py:
+Versorgung, Einkommen-/Lohnsteuer) und optional einer linearen
+Besoldungsanpassung in Prozent auf die Tabellen aus data/besoldung.py und
+data/familienzuschlag.py (auf Cent gerundet).
+
+Statt den Bestand für jeden Tarifstand getrennt durchzurechnen, werden die
+Tarifstände entlang einer führenden Achse gestapelt (Tabellen der Form
+(Tarifstände, ...), Parameter der Form (Tarifstände, 1)). Die Kerne aus
+calculator/vektor.py broadcasten sie gegen die Zeilen des Bestands: alles
+Tarifunabhängige (Dienstjahre, Stufenprojektion, Altersgrenzen) wird einmal
+gerechnet, nur die Tarifgrößen laufen über beide Tarifstände.
+
+Verglichen werden Brutto und Netto im Dienst sowie Ruhegehalt brutto und
+netto (monatlich). Die Batch-Variante steht in calculator/batch.py
+(berechne_tarifvergleich_batch).
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from calculator.regelwerk import (
+    PARAMETER_NAMEN,
+    REGELWERKE,
+    STANDARD_REGELWERK,
+    Regelwerk,
+    staple_regelwerke
+)
+from calculator import vektor
+from calculator.vektor import (
+    berechne_bruttogehalt_vec,
+    berechne_netto_vec,
+    berechne_ruhegehalt_vec,
+    berechne_netto_pension_vec,
+    GRUPPEN,
+    _runde
+)
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+from data.parameter import SCHEMA, get_parameter, get_parameterversion
+
+
+# Tabellen aus calculator/vektor.py, die eine Besoldungsanpassung verändert
+BESOLDUNGS_TABELLEN = (
+    "GRUNDGEHALT_TABELLE",
+    "STRUKTURZULAGE_TABELLE",
+    "FAMILIENZUSCHLAG_STUFE1_TABELLE",
+    "KINDER_BASIS_TABELLE",
+    "KINDER_ERHOEHUNG_TABELLE",
+)
+
+# Verglichene Kennzahlen (monatlich in Euro)
+KENNZAHLEN = ("brutto", "netto", "ruhegehalt_brutto", "ruhegehalt_netto")
+
+
+@lru_cache(maxsize=None)
+def get_tarifstand(version: str = None, besoldungsanpassung: float = 0.0) -> dict:
+    """
+    Baut einen Tarifstand aus einer Parameterversion und einer
+    Besoldungsanpassung auf (einmal je Kombination).
+
+    Args:
+        version: Parameterversion, z.B. "2026" (Standard: aktive Version)
+        besoldungsanpassung: Lineare Anpassung der Besoldung in Prozent
+
+    Returns:
+        Dictionary mit name, version, besoldungsanpassung, parameter,
+        regeln (Regelwerk) und tabellen
+    """
+    version = version or get_parameterversion()
+    parameter = get_parameter(version)
+    name = version if not besoldungsanpassung else f"{version} (Besoldung {besoldungsanpassung:+.2f} %)"
+
+    # Versorgungsparameter der Version, übrige (Kirchensteuer) wie NRW
+    werte = {**REGELWERKE[STANDARD_REGELWERK], **parameter["versorgung"], **parameter["dienstunfaehigkeit"]}
+    regeln = Regelwerk(name, -1, {p: werte[p] for p in PARAMETER_NAMEN})
+
+    faktor = 1 + besoldungsanpassung / 100
+    tabellen = {}
+    for tabelle in BESOLDUNGS_TABELLEN:
+        basis = getattr(vektor, tabelle)
+        tabellen[tabelle] = _runde(basis * faktor) if besoldungsanpassung else basis
+    return {
+        "name": name,
+        "version": version,
+        "besoldungsanpassung": besoldungsanpassung,
+        "parameter": parameter,
+        "regeln": regeln,
+        "tabellen": tabellen,
+    }
+
+
+def staple_tarifstaende(tarifstaende: list) -> dict:
+    """
+    Stapelt Tarifstände entlang einer führenden Achse.
+
+    Returns:
+        Dictionary mit parameter (Abschnitt -> Name -> Array (T, 1)),
+        regeln (gestapeltes Regelwerk) und tabellen (Arrays (T, ...))
+    """
+    return {
+        "parameter": {
+            abschnitt: {
+                name: np.array([t["parameter"][abschnitt][name] for t in tarifstaende])[:, np.newaxis]
+                for name in felder
+            }
+            for abschnitt, felder in SCHEMA.items()
+        },
+        "regeln": staple_regelwerke([t["regeln"] for t in tarifstaende]),
+        "tabellen": {
+            tabelle: np.stack([t["tabellen"][tabelle] for t in tarifstaende])
+            for tabelle in BESOLDUNGS_TABELLEN
+        },
+    }
+
+
+def berechne_tarifvergleich_vec(
+    gruppe_idx,
+    stufe,
+    geburtsjahr,
+    jahr_verbeamtung,
+    jahr_pension,
+    aktuelles_jahr: int,
+    steuerklasse,
+    tarifstaende: list,
+    verheiratet=False,
+    anzahl_kinder=0,
+    mietenstufe=STANDARD_MIETENSTUFE,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0,
+    arbeitszeit_faktor=1.0,
+    ist_polizei_feuerwehr=False,
+    kirchensteuer=False,
+    pkv_beitrag=0.0
+) -> dict:
+    """
+    Rechnet einen Bestand (eindimensionale Spalten) in einem Durchlauf für
+    mehrere Tarifstände.
+
+    Args:
+        tarifstaende: Liste von Tarifständen (siehe get_tarifstand)
+
+    Returns:
+        Dictionary Kennzahl -> Array der Form (Tarifstände, Einträge)
+    """
+    gestapelt = staple_tarifstaende(tarifstaende)
+    form = (len(tarifstaende), len(gruppe_idx))
+
+    gehalt = berechne_bruttogehalt_vec(
+        gruppe_idx, stufe, verheiratet, anzahl_kinder, mietenstufe, arbeitszeit_faktor,
+        tabellen=gestapelt["tabellen"]
+    )
+    netto = berechne_netto_vec(
+        gehalt["brutto"], steuerklasse, kirchensteuer, pkv_beitrag, parameter=gestapelt["parameter"]
+    )
+    pension = berechne_ruhegehalt_vec(
+        gruppe_idx, stufe, geburtsjahr, jahr_verbeamtung, jahr_pension, aktuelles_jahr,
+        verheiratet, teilzeitjahre, teilzeitanteil, arbeitszeit_faktor, ist_polizei_feuerwehr,
+        regeln=gestapelt["regeln"], tabellen=gestapelt["tabellen"]
+    )
+    pension_netto = berechne_netto_pension_vec(
+        pension["ruhegehalt_brutto"], jahr_pension, steuerklasse, kirchensteuer, pkv_beitrag,
+        parameter=gestapelt["parameter"]
+    )
+    return {
+        "brutto": np.broadcast_to(gehalt["brutto"], form),
+        "netto": np.broadcast_to(netto["netto"], form),
+        "ruhegehalt_brutto": np.broadcast_to(pension["ruhegehalt_brutto"], form),
+        "ruhegehalt_netto": np.broadcast_to(pension_netto["netto"], form),
+    }
+
+
+def berechne_differenzen(werte: dict) -> dict:
+    """
+    Differenzen je Eintrag zwischen dem ersten (alt) und zweiten (neu)
+    Tarifstand.
+
+    Args:
+        werte: Ergebnis von berechne_tarifvergleich_vec
+
+    Returns:
+        Dictionary mit <kennzahl>_alt, _neu, _differenz und
+        _differenz_prozent (Arrays je Eintrag)
+    """
+    differenzen = {}
+    for kennzahl in KENNZAHLEN:
+        alt, neu = werte[kennzahl][0], werte[kennzahl][1]
+        differenzen[f"{kennzahl}_alt"] = alt
+        differenzen[f"{kennzahl}_neu"] = neu
+        differenzen[f"{kennzahl}_differenz"] = _runde(neu - alt)
+        differenzen[f"{kennzahl}_differenz_prozent"] = np.where(
+            alt > 0, _runde((neu - alt) / np.where(alt > 0, alt, 1.0) * 100), 0.0
+        )
+    return differenzen
+
+
+def berechne_tarifstatistik(differenzen: dict, gruppe_idx) -> dict:
+    """
+    Kennzahlen über den ganzen Bestand.
+
+    Args:
+        differenzen: Ergebnis von berechne_differenzen
+        gruppe_idx: Gruppenindex je Eintrag
+
+    Returns:
+        Dictionary Kennzahl -> Summen (alt, neu, Differenz), Verteilung der
+        Differenzen (Mittel, Median, Minimum, Maximum), Anteil gestiegener
+        bzw. gesunkener Beträge und Summe der Differenzen je Besoldungsgruppe
+    """
+    gruppe_idx = np.asarray(gruppe_idx, dtype=np.int64)
+    anzahl = len(gruppe_idx)
+    statistik = {"anzahl": anzahl}
+    for kennzahl in KENNZAHLEN:
+        if not anzahl:
+            statistik[kennzahl] = {}
+            continue
+        differenz = differenzen[f"{kennzahl}_differenz"]
+        je_gruppe = np.bincount(gruppe_idx, weights=differenz, minlength=len(GRUPPEN))
+        vorhanden = np.bincount(gruppe_idx, minlength=len(GRUPPEN)) > 0
+        statistik[kennzahl] = {
+            "summe_alt": round(float(differenzen[f"{kennzahl}_alt"].sum()), 2),
+            "summe_neu": round(float(differenzen[f"{kennzahl}_neu"].sum()), 2),
+            "summe_differenz": round(float(differenz.sum()), 2),
+            "mittel_differenz": round(float(differenz.mean()), 2),
+            "median_differenz": round(float(np.median(differenz)), 2),
+            "min_differenz": float(differenz.min()),
+            "max_differenz": float(differenz.max()),
+            "mittel_differenz_prozent": round(float(differenzen[f"{kennzahl}_differenz_prozent"].mean()), 2),
+            "anteil_gestiegen": round(float((differenz > 0).mean()), 4),
+            "anteil_gesunken": round(float((differenz < 0).mean()), 4),
+            "summe_differenz_je_gruppe": {
+                GRUPPEN[i]: round(float(je_gruppe[i]), 2) for i in np.flatnonzero(vorhanden).tolist()
+            },
+        }
+    return statistik
@@ -0,0 +1,713 @@
+"""
+Vektorisierte Berechnungskerne für Beamte NRW
+Array-Varianten von Gehalt, Steuer, Ruhegehalt und DU-Rente für Kennfelder
+und Batch-Läufe.
+
+Die Kerne rechnen mit denselben Konstanten und Rundungspunkten wie die
+Skalar-Funktionen in calculator/ und data/, arbeiten aber auf numpy-Arrays
+(beliebig broadcastbar) statt auf Einzelwerten.
+"""
+
+import numpy as np
+
+from calculator.regelwerk import get_regelwerk
+from data.besoldung import (
+    BESOLDUNG_A,
+    berechne_stufe_nach_dienstjahren,
+    get_grundgehalt,
+    get_max_stufe
+)
+from data.familienzuschlag import (
+    get_familienzuschlag_stufe1,
+    get_besoldungsgruppe_kategorie,
+    STANDARD_MIETENSTUFE,
+    FAMILIENZUSCHLAG_STUFE2,
+    FAMILIENZUSCHLAG_STUFE3,
+    FAMILIENZUSCHLAG_STUFE4,
+    FAMILIENZUSCHLAG_STUFE5,
+    FAMILIENZUSCHLAG_ERHOEHUNG
+)
+from data.lohnsteuer import (
+    KIRCHENSTEUERSATZ_STANDARD,
+    VERSORGUNGSFREIBETRAG_ERSTES_JAHR,
+    VERSORGUNGSFREIBETRAG_LETZTES_JAHR,
+    VERSORGUNGSFREIBETRAG_STUFEN,
+    get_steuerklassen_faktor,
+    get_versorgungsfreibetrag_parameter
+)
+from data.parameter import get_parameter
+from data.zulagen import get_strukturzulage
+from calculator.tabellenspeicher import lade_veroeffentlichte_tabellen
+
+
+# Reihenfolge der Besoldungsgruppen = Zeilenindex aller Lookup-Tabellen
+GRUPPEN = tuple(BESOLDUNG_A.keys())
+GRUPPEN_INDEX = {gruppe: i for i, gruppe in enumerate(GRUPPEN)}
+
+# Stufen 0-12 als Spaltenindex (ungültige Stufen werden wie in
+# get_grundgehalt auf den gültigen Bereich begrenzt)
+MAX_STUFE_INDEX = 12
+
+# Maximale Projektionsdauer in Jahren für die Stufenentwicklung
+MAX_PROJEKTIONSJAHRE = 60
+
+
+def _baue_grundgehalt_tabelle() -> np.ndarray:
+    """Grundgehalt je (Gruppe, Stufe), Stufe bereits begrenzt."""
+    tabelle = np.zeros((len(GRUPPEN), MAX_STUFE_INDEX + 1))
+    for i, gruppe in enumerate(GRUPPEN):
+        for stufe in range(MAX_STUFE_INDEX + 1):
+            tabelle[i, stufe] = get_grundgehalt(gruppe, stufe)
+    return tabelle
+
+
+def _baue_stufen_tabelle() -> np.ndarray:
+    """Erfahrungsstufe je (Gruppe, Ausgangsstufe, zusätzliche Jahre)."""
+    tabelle = np.zeros(
+        (len(GRUPPEN), MAX_STUFE_INDEX + 1, MAX_PROJEKTIONSJAHRE + 1),
+        dtype=np.int64
+    )
+    for i, gruppe in enumerate(GRUPPEN):
+        for stufe in range(MAX_STUFE_INDEX + 1):
+            for jahre in range(MAX_PROJEKTIONSJAHRE + 1):
+                tabelle[i, stufe, jahre] = berechne_stufe_nach_dienstjahren(
+                    gruppe, stufe, jahre
+                )
+    return tabelle
+
+
+def _baue_kinder_tabelle() -> tuple:
+    """
+    Familienzuschlag mit Kindern je (Gruppe, Kinder 0-4, Mietenstufe 0-7)
+    und Erhöhungsbetrag je (Gruppe, Mietenstufe) ab dem 5. Kind.
+    """
+    stufen = [None, FAMILIENZUSCHLAG_STUFE2, FAMILIENZUSCHLAG_STUFE3,
+              FAMILIENZUSCHLAG_STUFE4, FAMILIENZUSCHLAG_STUFE5]
+    basis = np.zeros((len(GRUPPEN), 5, 8))
+    erhoehung = np.zeros((len(GRUPPEN), 8))
+    for i, gruppe in enumerate(GRUPPEN):
+        kategorie = get_besoldungsgruppe_kategorie(gruppe)
+        for mietenstufe in range(1, 8):
+            for kinder in range(1, 5):
+                basis[i, kinder, mietenstufe] = stufen[kinder][kategorie][mietenstufe]
+            erhoehung[i, mietenstufe] = FAMILIENZUSCHLAG_ERHOEHUNG[kategorie][mietenstufe]
+    return basis, erhoehung
+
+
+def _baue_tabellen() -> dict:
+    """Baut alle Lookup-Tabellen aus den Tarifdaten auf."""
+    kinder_basis, kinder_erhoehung = _baue_kinder_tabelle()
+    return {
+        "GRUNDGEHALT_TABELLE": _baue_grundgehalt_tabelle(),
+        "STUFEN_TABELLE": _baue_stufen_tabelle(),
+        "STRUKTURZULAGE_TABELLE": np.array([get_strukturzulage(g) for g in GRUPPEN]),
+        "FAMILIENZUSCHLAG_STUFE1_TABELLE": np.array([get_familienzuschlag_stufe1(g) for g in GRUPPEN]),
+        "MAX_STUFE_TABELLE": np.array([get_max_stufe(g) for g in GRUPPEN], dtype=np.int64),
+        "KINDER_BASIS_TABELLE": kinder_basis,
+        "KINDER_ERHOEHUNG_TABELLE": kinder_erhoehung,
+        "STEUERKLASSEN_FAKTOR_TABELLE": np.array([get_steuerklassen_faktor(k) for k in range(7)]),
+        # Prozentsatz, Höchstbetrag, Zuschlag je Jahr des Versorgungsbeginns
+        "VERSORGUNGSFREIBETRAG_TABELLE": np.array([
+            get_versorgungsfreibetrag_parameter(jahr)
+            for jahr in range(VERSORGUNGSFREIBETRAG_ERSTES_JAHR, VERSORGUNGSFREIBETRAG_LETZTES_JAHR + 1)
+        ], dtype=float),
+    }
+
+
+# Lookup-Tabellen: aus dem Shared Memory eingeblendet, falls veröffentlicht
+# (siehe calculator/tabellenspeicher.py), sonst einmalig beim Import aufgebaut
+_tabellen = lade_veroeffentlichte_tabellen()
+TABELLEN_GETEILT = _tabellen is not None
+if not TABELLEN_GETEILT:
+    _tabellen = _baue_tabellen()
+
+GRUNDGEHALT_TABELLE = _tabellen["GRUNDGEHALT_TABELLE"]
+STUFEN_TABELLE = _tabellen["STUFEN_TABELLE"]
+STRUKTURZULAGE_TABELLE = _tabellen["STRUKTURZULAGE_TABELLE"]
+FAMILIENZUSCHLAG_STUFE1_TABELLE = _tabellen["FAMILIENZUSCHLAG_STUFE1_TABELLE"]
+MAX_STUFE_TABELLE = _tabellen["MAX_STUFE_TABELLE"]
+KINDER_BASIS_TABELLE = _tabellen["KINDER_BASIS_TABELLE"]
+KINDER_ERHOEHUNG_TABELLE = _tabellen["KINDER_ERHOEHUNG_TABELLE"]
+STEUERKLASSEN_FAKTOR_TABELLE = _tabellen["STEUERKLASSEN_FAKTOR_TABELLE"]
+VERSORGUNGSFREIBETRAG_TABELLE = _tabellen["VERSORGUNGSFREIBETRAG_TABELLE"]
+
+# Steuerparameter der aktiven Parameterversion (siehe data/parameter.py);
+# die Kerne nehmen alternativ die Parameter einer anderen Version entgegen
+PARAMETER = get_parameter()
+
+
+def gruppen_index(besoldungsgruppen) -> np.ndarray:
+    """
+    Wandelt Besoldungsgruppen in Zeilenindizes der Lookup-Tabellen um.
+
+    Args:
+        besoldungsgruppen: Einzelner Code oder Folge von Codes, z.B. ["A13", "A9"]
+
+    Returns:
+        Integer-Array mit Gruppenindizes
+    """
+    if isinstance(besoldungsgruppen, str):
+        besoldungsgruppen = [besoldungsgruppen]
+    try:
+        return np.array([GRUPPEN_INDEX[g] for g in besoldungsgruppen], dtype=np.int64)
+    except KeyError as e:
+        raise ValueError(f"Besoldungsgruppe {e.args[0]} nicht gefunden")
+
+
+def _runde(werte: np.ndarray) -> np.ndarray:
+    """
+    Rundet auf Cent (entspricht round(x, 2) der Skalar-Funktionen).
+
+    np.round rechnet über x * 100 und weicht dadurch an knappen
+    Halb-Cent-Grenzen (z.B. 50.225) von round() ab. Diese wenigen Werte
+    werden mit dem eingebauten round() nachgerechnet.
+    """
+    werte = np.asarray(werte, dtype=float)
+    gerundet = np.round(werte, 2)
+    skaliert = werte * 100
+    knapp = np.abs(skaliert - np.floor(skaliert) - 0.5) < 1e-6
+    if np.any(knapp):
+        gerundet = np.array(gerundet)
+        gerundet[knapp] = [round(float(w), 2) for w in np.broadcast_to(werte, knapp.shape)[knapp]]
+    return gerundet
+
+
+def berechne_dienstjahre_vec(
+    jahr_verbeamtung,
+    jahr_ende,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0
+) -> np.ndarray:
+    """
+    Vektorisierte Variante von berechne_dienstjahre.
+
+    Returns:
+        Ruhegehaltsfähige Dienstjahre als Array
+    """
+    gesamtjahre = np.asarray(jahr_ende) - np.asarray(jahr_verbeamtung)
+    teilzeitjahre = np.asarray(teilzeitjahre, dtype=float)
+    return gesamtjahre - teilzeitjahre + teilzeitjahre * np.asarray(teilzeitanteil)
+
+
+def berechne_stufe_vec(gruppe_idx, stufe, zusaetzliche_jahre) -> np.ndarray:
+    """
+    Vektorisierte Stufenentwicklung über die vorberechnete Stufen-Tabelle.
+
+    Args:
+        gruppe_idx: Gruppenindizes (siehe gruppen_index)
+        stufe: Aktuelle Erfahrungsstufe
+        zusaetzliche_jahre: Anzahl zusätzlicher Dienstjahre (>= 0)
+
+    Returns:
+        Erfahrungsstufe nach den zusätzlichen Jahren
+    """
+    stufe = np.clip(np.asarray(stufe, dtype=np.int64), 0, MAX_STUFE_INDEX)
+    jahre = np.clip(np.asarray(zusaetzliche_jahre, dtype=np.int64), 0, MAX_PROJEKTIONSJAHRE)
+    return STUFEN_TABELLE[gruppe_idx, stufe, jahre]
+
+
+def berechne_ruhegehaltsfaehige_bezuege_vec(
+    gruppe_idx,
+    stufe,
+    verheiratet=False,
+    arbeitszeit_faktor=1.0,
+    tabellen=None
+) -> np.ndarray:
+    """
+    Vektorisierte Variante von berechne_ruhegehaltsfaehige_bezuege.
+
+    Args:
+        tabellen: Besoldungstabellen (Standard: die dieses Moduls; siehe
+            calculator/tarifvergleich.py für gestapelte Tarifstände)
+
+    Returns:
+        Ruhegehaltsfähige Bezüge in Euro (auf Cent gerundet)
+    """
+    tabellen = tabellen or _tabellen
+    stufe = np.clip(np.asarray(stufe, dtype=np.int64), 0, MAX_STUFE_INDEX)
+    familienzuschlag = np.where(
+        np.asarray(verheiratet, dtype=bool),
+        tabellen["FAMILIENZUSCHLAG_STUFE1_TABELLE"][..., gruppe_idx],
+        0.0
+    )
+    bezuege = (
+        tabellen["GRUNDGEHALT_TABELLE"][..., gruppe_idx, stufe]
+        + tabellen["STRUKTURZULAGE_TABELLE"][..., gruppe_idx]
+        + familienzuschlag
+    )
+    return _runde(bezuege * np.asarray(arbeitszeit_faktor))
+
+
+def berechne_ruhegehalt_vec(
+    gruppe_idx,
+    stufe,
+    geburtsjahr,
+    jahr_verbeamtung,
+    jahr_pension,
+    aktuelles_jahr: int,
+    verheiratet=False,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0,
+    arbeitszeit_faktor=1.0,
+    ist_polizei_feuerwehr=False,
+    regeln=None,
+    tabellen=None
+) -> dict:
+    """
+    Vektorisierte Variante von berechne_ruhegehalt.
+    Alle Argumente dürfen Arrays sein und werden gegeneinander gebroadcastet.
+
+    Args:
+        aktuelles_jahr: Bezugsjahr für die Stufenprojektion
+        regeln: Regelwerk (siehe calculator/regelwerk.py, Standard: NRW)
+        tabellen: Besoldungstabellen (Standard: die dieses Moduls)
+
+    Returns:
+        Dictionary mit Arrays der wichtigsten Berechnungsergebnisse
+    """
+    regeln = regeln or get_regelwerk()
+    jahr_pension = np.asarray(jahr_pension)
+    alter_pension = jahr_pension - np.asarray(geburtsjahr)
+    regelaltersgrenze = np.where(
+        np.asarray(ist_polizei_feuerwehr, dtype=bool),
+        regeln.regelaltersgrenze_polizei,
+        regeln.regelaltersgrenze_normal
+    )
+
+    dienstjahre = berechne_dienstjahre_vec(
+        jahr_verbeamtung, jahr_pension, teilzeitjahre, teilzeitanteil
+    )
+
+    # Erfahrungsstufe bei Pensionierung
+    jahre_bis_pension = np.maximum(0, jahr_pension - aktuelles_jahr)
+    stufe_bei_pension = berechne_stufe_vec(gruppe_idx, stufe, jahre_bis_pension)
+
+    # Ruhegehaltssatz (0 bei weniger als 5 Dienstjahren)
+    ruhegehaltssatz = _runde(np.clip(
+        dienstjahre * regeln.ruhegehaltssatz_pro_jahr, regeln.min_ruhegehaltssatz, regeln.max_ruhegehaltssatz
+    ))
+    ruhegehaltssatz = np.where(dienstjahre < regeln.min_dienstjahre, 0.0, ruhegehaltssatz)
+
+    # Versorgungsabschlag
+    jahre_vor_grenze = regelaltersgrenze - alter_pension
+    versorgungsabschlag = np.where(
+        jahre_vor_grenze <= 0,
+        0.0,
+        np.minimum(jahre_vor_grenze * regeln.abschlag_pro_jahr, regeln.max_abschlag)
+    )
+
+    effektiver_satz = ruhegehaltssatz * (1 - versorgungsabschlag / 100)
+
+    ruhegehaltsfaehige_bezuege = berechne_ruhegehaltsfaehige_bezuege_vec(
+        gruppe_idx, stufe_bei_pension, verheiratet, arbeitszeit_faktor, tabellen
+    )
+
+    ruhegehalt_brutto = ruhegehaltsfaehige_bezuege * (effektiver_satz / 100)
+
+    return {
+        "alter_pension": alter_pension,
+        "regelaltersgrenze": regelaltersgrenze,
+        "dienstjahre": _runde(dienstjahre),
+        "ruhegehaltssatz": ruhegehaltssatz,
+        "versorgungsabschlag_prozent": _runde(versorgungsabschlag),
+        "effektiver_ruhegehaltssatz": _runde(effektiver_satz),
+        "ruhegehaltsfaehige_bezuege": ruhegehaltsfaehige_bezuege,
+        "ruhegehalt_brutto": _runde(ruhegehalt_brutto),
+        "ist_vorzeitig": alter_pension < regelaltersgrenze,
+        "jahre_vor_grenze": np.maximum(0, jahre_vor_grenze),
+        "stufe_bei_pension": stufe_bei_pension,
+        "max_stufe": MAX_STUFE_TABELLE[gruppe_idx],
+    }
+
+
+def berechne_du_rente_vec(
+    gruppe_idx,
+    stufe,
+    geburtsjahr,
+    jahr_verbeamtung,
+    jahr_du,
+    verheiratet=False,
+    teilzeitjahre=0.0,
+    teilzeitanteil=1.0,
+    arbeitszeit_faktor=1.0,
+    regeln=None
+) -> dict:
+    """
+    Vektorisierte Variante von berechne_du_rente.
+    Alle Argumente dürfen Arrays sein und werden gegeneinander gebroadcastet.
+
+    Args:
+        regeln: Regelwerk (siehe calculator/regelwerk.py, Standard: NRW)
+
+    Returns:
+        Dictionary mit Arrays der wichtigsten Berechnungsergebnisse
+    """
+    regeln = regeln or get_regelwerk()
+    jahr_du = np.asarray(jahr_du)
+    alter_bei_du = jahr_du - np.asarray(geburtsjahr)
+
+    ist_dienstjahre = berechne_dienstjahre_vec(
+        jahr_verbeamtung, jahr_du, teilzeitjahre, teilzeitanteil
+    )
+    hat_anspruch = ist_dienstjahre >= regeln.wartezeit_jahre
+    mindestversorgung = regeln.mindestversorgung
+
+    # Zurechnungszeit (2/3 der Zeit bis zur Grenze)
+    grenze = np.where(
+        jahr_du < regeln.zurechnungszeit_uebergangsjahr,
+        regeln.zurechnungszeit_grenze_alt,
+        regeln.zurechnungszeit_grenze_neu
+    )
+    zurechnungszeit = np.maximum(0, grenze - alter_bei_du) * regeln.zurechnungszeit_faktor
+    gesamt_dienstjahre = ist_dienstjahre + zurechnungszeit
+
+    ruhegehaltssatz = np.clip(
+        gesamt_dienstjahre * regeln.ruhegehaltssatz_pro_jahr, regeln.min_ruhegehaltssatz, regeln.max_ruhegehaltssatz
+    )
+
+    du_abschlag = np.minimum(
+        np.maximum(0, regeln.du_abschlag_altersgrenze - alter_bei_du) * regeln.abschlag_pro_jahr,
+        regeln.max_abschlag
+    )
+    effektiver_satz = ruhegehaltssatz * (1 - du_abschlag / 100)
+
+    ruhegehaltsfaehige_bezuege = berechne_ruhegehaltsfaehige_bezuege_vec(
+        gruppe_idx, stufe, verheiratet, arbeitszeit_faktor
+    )
+
+    du_rente_brutto = ruhegehaltsfaehige_bezuege * (effektiver_satz / 100)
+    wird_mindestversorgung = hat_anspruch & (du_rente_brutto < mindestversorgung)
+    du_rente_brutto = np.maximum(du_rente_brutto, mindestversorgung)
+
+    return {
+        "alter_bei_du": alter_bei_du,
+        "ist_dienstjahre": _runde(ist_dienstjahre),
+        "zurechnungszeit": np.where(hat_anspruch, _runde(zurechnungszeit), 0.0),
+        "gesamt_dienstjahre": _runde(np.where(hat_anspruch, gesamt_dienstjahre, ist_dienstjahre)),
+        "ruhegehaltssatz_roh": np.where(hat_anspruch, _runde(gesamt_dienstjahre * regeln.ruhegehaltssatz_pro_jahr), 0.0),
+        "ruhegehaltssatz": np.where(hat_anspruch, _runde(ruhegehaltssatz), 0.0),
+        "du_abschlag_prozent": np.where(hat_anspruch, _runde(du_abschlag), 0.0),
+        "effektiver_ruhegehaltssatz": np.where(hat_anspruch, _runde(effektiver_satz), 0.0),
+        "ruhegehaltsfaehige_bezuege": np.where(hat_anspruch, ruhegehaltsfaehige_bezuege, 0.0),
+        "du_rente_brutto": np.where(hat_anspruch, _runde(du_rente_brutto), 0.0),
+        "mindestversorgung": np.full(np.shape(hat_anspruch), mindestversorgung),
+        "wird_mindestversorgung": wird_mindestversorgung,
+        "hat_anspruch": hat_anspruch,
+        "fehlende_dienstjahre": np.where(hat_anspruch, 0.0, _runde(regeln.wartezeit_jahre - ist_dienstjahre)),
+    }
+
+
+def _familienzuschlag_mit_kindern(gruppe_idx, anzahl_kinder, mietenstufe, tabellen) -> np.ndarray:
+    """Stufe 2-5 plus Erhöhungsbeträge (ungerundet, wie in data/familienzuschlag.py)."""
+    kinder = np.asarray(anzahl_kinder, dtype=np.int64)
+    mietenstufe = np.clip(np.asarray(mietenstufe, dtype=np.int64), 1, 7)
+    basis = tabellen["KINDER_BASIS_TABELLE"][..., gruppe_idx, np.clip(kinder, 0, 4), mietenstufe]
+    weitere = np.maximum(0, kinder - 4)
+    return np.where(
+        weitere > 0,
+        basis + tabellen["KINDER_ERHOEHUNG_TABELLE"][..., gruppe_idx, mietenstufe] * weitere,
+        basis
+    )
+
+
+def berechne_familienzuschlag_vec(gruppe_idx, verheiratet, anzahl_kinder, mietenstufe, tabellen=None) -> dict:
+    """
+    Vektorisierte Variante von get_familienzuschlag_gesamt und get_kinderzuschlag.
+
+    Args:
+        tabellen: Besoldungstabellen (Standard: die dieses Moduls)
+
+    Returns:
+        Dictionary mit Arrays "familienzuschlag_gesamt", "familienzuschlag_stufe1"
+        und "kinderzuschlag"
+    """
+    tabellen = tabellen or _tabellen
+    verheiratet = np.asarray(verheiratet, dtype=bool)
+    kinder = np.asarray(anzahl_kinder, dtype=np.int64)
+    stufe1 = tabellen["FAMILIENZUSCHLAG_STUFE1_TABELLE"][..., gruppe_idx]
+    mit_kindern = _familienzuschlag_mit_kindern(gruppe_idx, kinder, mietenstufe, tabellen)
+
+    gesamt = np.where(
+        kinder == 0,
+        np.where(verheiratet, stufe1, 0.0),
+        _runde(np.where(verheiratet, mit_kindern, mit_kindern - stufe1))
+    )
+    kinderzuschlag = np.where(kinder == 0, 0.0, _runde(mit_kindern - stufe1))
+
+    return {
+        "familienzuschlag_gesamt": gesamt,
+        "familienzuschlag_stufe1": np.where(verheiratet, stufe1, 0.0),
+        "kinderzuschlag": kinderzuschlag,
+    }
+
+
+def berechne_bruttogehalt_vec(
+    gruppe_idx,
+    stufe,
+    verheiratet=False,
+    anzahl_kinder=0,
+    mietenstufe=STANDARD_MIETENSTUFE,
+    arbeitszeit_faktor=1.0,
+    tabellen=None
+) -> dict:
+    """
+    Vektorisierte Variante von berechne_bruttogehalt.
+
+    Args:
+        tabellen: Besoldungstabellen (Standard: die dieses Moduls)
+
+    Returns:
+        Dictionary mit Arrays aller Gehaltsbestandteile
+    """
+    tabellen = tabellen or _tabellen
+    stufe = np.clip(np.asarray(stufe, dtype=np.int64), 0, MAX_STUFE_INDEX)
+    grundgehalt = tabellen["GRUNDGEHALT_TABELLE"][..., gruppe_idx, stufe]
+    strukturzulage = tabellen["STRUKTURZULAGE_TABELLE"][..., gruppe_idx]
+    familie = berechne_familienzuschlag_vec(gruppe_idx, verheiratet, anzahl_kinder, mietenstufe, tabellen)
+
+    brutto_vollzeit = grundgehalt + strukturzulage + familie["familienzuschlag_gesamt"]
+    brutto_teilzeit = _runde(brutto_vollzeit * np.asarray(arbeitszeit_faktor))
+
+    return {
+        "grundgehalt": grundgehalt,
+        "strukturzulage": strukturzulage,
+        "familienzuschlag_stufe1": familie["familienzuschlag_stufe1"],
+        "kinderzuschlag": familie["kinderzuschlag"],
+        "familienzuschlag_gesamt": familie["familienzuschlag_gesamt"],
+        "brutto_vollzeit": _runde(brutto_vollzeit),
+        "brutto": brutto_teilzeit,
+    }
+
+
+def berechne_einkommensteuer_vec(zu_versteuerndes_einkommen, tarif=None) -> np.ndarray:
+    """
+    Vektorisierte Variante von berechne_einkommensteuer (Tarif 2024).
+
+    Args:
+        tarif: Abschnitt "einkommensteuer" einer Parameterversion (Standard:
+            aktive Version); Werte dürfen Arrays sein
+
+    Returns:
+        Einkommensteuer in Euro (Jahresbetrag) als Array
+    """
+    t = tarif or PARAMETER["einkommensteuer"]
+    zve = np.asarray(zu_versteuerndes_einkommen, dtype=float)
+    y = (zve - t["grundfreibetrag"]) / 10000
+    z = (zve - t["zone_2_bis"]) / 10000
+    steuer = np.select(
+        [zve <= t["grundfreibetrag"], zve <= t["zone_2_bis"], zve <= t["zone_3_bis"], zve <= t["zone_4_bis"]],
+        [
+            0.0,
+            (t["zone_2_a"] * y + t["zone_2_b"]) * y,
+            (t["zone_3_a"] * z + t["zone_3_b"]) * z + t["zone_3_c"],
+            t["zone_4_satz"] * zve - t["zone_4_abzug"]
+        ],
+        t["zone_5_satz"] * zve - t["zone_5_abzug"]
+    )
+    return np.maximum(0, _runde(steuer))
+
+
+def berechne_steuern_monatlich_vec(
+    zve,
+    steuerklasse,
+    kirchensteuer=False,
+    kirchensteuersatz=None,
+    tarif=None
+) -> dict:
+    """
+    Vektorisierte Variante von berechne_steuern_monatlich.
+
+    Args:
+        kirchensteuersatz: Kirchensteuersatz in Prozent (Standard: Satz der
+            aktiven Parameterversion)
+        tarif: Einkommensteuertarif (siehe berechne_einkommensteuer_vec)
+
+    Returns:
+        Dictionary mit Arrays der monatlichen Steuerbeträge
+    """
+    steuerklasse = np.asarray(steuerklasse, dtype=np.int64)
+    faktor = STEUERKLASSEN_FAKTOR_TABELLE[np.clip(steuerklasse, 0, 6)]
+    einkommensteuer_jahr = berechne_einkommensteuer_vec(zve, tarif) * faktor
+    if kirchensteuersatz is None:
+        kirchensteuersatz = KIRCHENSTEUERSATZ_STANDARD
+
+    # Solidaritätszuschlag mit Gleitzone bis zur 1,5-fachen Grenze
+    soli_grenze = np.where((steuerklasse == 3) | (steuerklasse == 4), 36260, 18130)
+    soli_prozent = np.where(
+        einkommensteuer_jahr < soli_grenze * 1.5,
+        ((einkommensteuer_jahr / soli_grenze) - 1) * 11.9,
+        5.5
+    )
+    soli_jahr = np.where(
+        einkommensteuer_jahr > soli_grenze,
+        einkommensteuer_jahr * (soli_prozent / 100),
+        0.0
+    )
+
+    kirche_jahr = np.where(np.asarray(kirchensteuer, dtype=bool), einkommensteuer_jahr * (kirchensteuersatz / 100), 0.0)
+
+    lohnsteuer_monat = einkommensteuer_jahr / 12
+    soli_monat = soli_jahr / 12
+    kirche_monat = kirche_jahr / 12
+
+    return {
+        "lohnsteuer": _runde(lohnsteuer_monat),
+        "solidaritaetszuschlag": _runde(soli_monat),
+        "kirchensteuer": _runde(kirche_monat),
+        "gesamt": _runde(lohnsteuer_monat + soli_monat + kirche_monat),
+    }
+
+
+def berechne_lohnsteuer_monatlich_vec(brutto_monatlich, steuerklasse, kirchensteuer=False, parameter=None) -> dict:
+    """
+    Vektorisierte Variante von berechne_lohnsteuer_monatlich.
+
+    Args:
+        parameter: Parameterversion (Standard: aktive Version, siehe
+            data/parameter.py); Werte dürfen Arrays sein
+
+    Returns:
+        Dictionary mit Arrays der monatlichen Steuerbeträge
+    """
+    parameter = parameter or PARAMETER
+    lohnsteuer = parameter["lohnsteuer"]
+    jahresbrutto = np.asarray(brutto_monatlich, dtype=float) * lohnsteuer["monate_beamte"]
+    zve = (
+        jahresbrutto - lohnsteuer["werbungskosten_pauschale"] - lohnsteuer["sonderausgaben_pauschale"]
+        - jahresbrutto * lohnsteuer["vorsorge_anteil_beamte"]
+    )
+
+    steuern = berechne_steuern_monatlich_vec(
+        zve, steuerklasse, kirchensteuer, lohnsteuer["kirchensteuersatz_standard"], tarif=parameter["einkommensteuer"]
+    )
+
+    return {
+        **steuern,
+        "jahresbrutto": _runde(jahresbrutto),
+        "zve": _runde(zve),
+    }
+
+
+def berechne_netto_vec(brutto_monatlich, steuerklasse, kirchensteuer=False, pkv_beitrag=0.0, parameter=None) -> dict:
+    """
+    Vektorisierte Variante von berechne_netto.
+
+    Args:
+        parameter: Parameterversion (siehe berechne_lohnsteuer_monatlich_vec)
+
+    Returns:
+        Dictionary mit Arrays von Brutto, Abzügen und Netto
+    """
+    brutto = np.asarray(brutto_monatlich, dtype=float)
+    steuern = berechne_lohnsteuer_monatlich_vec(brutto, steuerklasse, kirchensteuer, parameter)
+    pkv = np.maximum(0.0, np.asarray(pkv_beitrag, dtype=float))
+
+    abzuege_gesamt = steuern["gesamt"] + pkv
+    netto = brutto - abzuege_gesamt
+
+    return {
+        "brutto": _runde(brutto),
+        "lohnsteuer": steuern["lohnsteuer"],
+        "solidaritaetszuschlag": steuern["solidaritaetszuschlag"],
+        "kirchensteuer": steuern["kirchensteuer"],
+        "steuern_gesamt": steuern["gesamt"],
+        "pkv_beitrag": _runde(pkv),
+        "abzuege_gesamt": _runde(abzuege_gesamt),
+        "netto": _runde(netto),
+    }
+
+
+def _versorgungsfreibetrag_vec(jahr_versorgungsbeginn, abschnitt: dict) -> tuple:
+    """
+    Vektorisierte Variante von get_versorgungsfreibetrag_parameter für eine
+    beliebige Parameterversion; die Werte des Abschnitts dürfen Arrays sein
+    (gestapelte Tarifstände).
+
+    Returns:
+        Tuple (Prozentsatz, Höchstbetrag, Zuschlag) als Arrays
+    """
+    jahr = np.maximum(np.asarray(jahr_versorgungsbeginn, dtype=np.int64), abschnitt["erstes_jahr"])
+    prozent = np.asarray(abschnitt["prozent"], dtype=float)
+    hoechstbetrag = np.asarray(abschnitt["hoechstbetrag"], dtype=float)
+    zuschlag = np.asarray(abschnitt["zuschlag"], dtype=float)
+    von = abschnitt["erstes_jahr"]
+    for stufe in VERSORGUNGSFREIBETRAG_STUFEN:
+        bis = abschnitt[f"stufe_{stufe}_bis"]
+        n = np.maximum(0, np.minimum(jahr, bis) - von)
+        prozent = prozent - abschnitt[f"stufe_{stufe}_prozent"] * n
+        hoechstbetrag = hoechstbetrag - abschnitt[f"stufe_{stufe}_hoechstbetrag"] * n
+        zuschlag = zuschlag - abschnitt[f"stufe_{stufe}_zuschlag"] * n
+        von = bis
+    return np.maximum(0.0, np.round(prozent, 1)), hoechstbetrag, zuschlag
+
+
+def berechne_netto_pension_vec(
+    ruhegehalt_monatlich,
+    jahr_versorgungsbeginn,
+    steuerklasse,
+    kirchensteuer=False,
+    pkv_beitrag=0.0,
+    parameter=None,
+    kirchensteuersatz=None
+) -> dict:
+    """
+    Vektorisierte Variante von berechne_netto_pension. Der
+    Versorgungsfreibetrag der aktiven Parameterversion wird per Jahr des
+    Versorgungsbeginns aus VERSORGUNGSFREIBETRAG_TABELLE nachgeschlagen,
+    für andere Versionen aus deren Abschmelzstufen berechnet.
+
+    Args:
+        parameter: Parameterversion (siehe berechne_lohnsteuer_monatlich_vec)
+        kirchensteuersatz: Kirchensteuersatz in Prozent (skalar oder je
+            Zeile, z.B. aus dem Regelwerk; Standard: Satz der
+            Parameterversion)
+
+    Returns:
+        Dictionary mit Arrays von Brutto, Freibeträgen, Abzügen und Netto
+    """
+    lohnsteuer = (parameter or PARAMETER)["lohnsteuer"]
+    tarif = (parameter or PARAMETER)["einkommensteuer"]
+    abschnitt = (parameter or PARAMETER)["versorgungsfreibetrag"]
+    if kirchensteuersatz is None:
+        kirchensteuersatz = lohnsteuer["kirchensteuersatz_standard"]
+    brutto = np.asarray(ruhegehalt_monatlich, dtype=float)
+    jahresbezug = brutto * 12
+
+    if abschnitt is PARAMETER["versorgungsfreibetrag"]:
+        zeile = np.clip(
+            np.asarray(jahr_versorgungsbeginn, dtype=np.int64) - VERSORGUNGSFREIBETRAG_ERSTES_JAHR,
+            0, len(VERSORGUNGSFREIBETRAG_TABELLE) - 1
+        )
+        freibetrag_parameter = VERSORGUNGSFREIBETRAG_TABELLE[zeile]
+        prozent, hoechstbetrag, zuschlag_max = (freibetrag_parameter[..., i] for i in range(3))
+    else:
+        prozent, hoechstbetrag, zuschlag_max = _versorgungsfreibetrag_vec(jahr_versorgungsbeginn, abschnitt)
+    freibetrag = np.minimum(jahresbezug * prozent / 100, hoechstbetrag)
+    zuschlag = np.minimum(zuschlag_max, np.maximum(0.0, jahresbezug - freibetrag))
+    freibetrag = _runde(freibetrag)
+    zuschlag = _runde(zuschlag)
+
+    zve = np.maximum(
+        0.0,
+        jahresbezug - freibetrag - zuschlag - abschnitt["werbungskosten_pauschale"]
+        - lohnsteuer["sonderausgaben_pauschale"] - jahresbezug * lohnsteuer["vorsorge_anteil_beamte"]
+    )
+    steuern = berechne_steuern_monatlich_vec(zve, steuerklasse, kirchensteuer, kirchensteuersatz, tarif=tarif)
+    pkv = np.maximum(0.0, np.asarray(pkv_beitrag, dtype=float))
+
+    abzuege_gesamt = steuern["gesamt"] + pkv
+    netto = brutto - abzuege_gesamt
+
+    return {
+        "brutto": _runde(brutto),
+        "versorgungsfreibetrag": freibetrag,
+        "zuschlag_versorgungsfreibetrag": zuschlag,
+        "zve": _runde(zve),
+        "lohnsteuer": steuern["lohnsteuer"],
+        "solidaritaetszuschlag": steuern["solidaritaetszuschlag"],
+        "kirchensteuer": steuern["kirchensteuer"],
+        "steuern_gesamt": steuern["gesamt"],
+        "pkv_beitrag": _runde(pkv),
+        "abzuege_gesamt": _runde(abzuege_gesamt),
+        "netto": _runde(netto),
+    }
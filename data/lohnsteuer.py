@@ -1,10 +1,27 @@
 """
 Lohnsteuertabelle 2024 - vereinfachte Berechnung
 Für Beamte (keine Sozialversicherung)
+
+Tarifparameter stehen in der aktiven Parameterdatei (data/parameterdateien/).
 """
 
+from data.parameter import get_parameter
+
+
+_TARIF = get_parameter()["einkommensteuer"]
+_LOHNSTEUER = get_parameter()["lohnsteuer"]
+_VERSORGUNGSFREIBETRAG = get_parameter()["versorgungsfreibetrag"]
+
 # Grundfreibetrag 2024
-GRUNDFREIBETRAG = 11604
+GRUNDFREIBETRAG = _TARIF["grundfreibetrag"]
+
+# Kirchensteuer in Prozent der Einkommensteuer (8 % in Bayern und
+# Baden-Württemberg, sonst 9 %)
+KIRCHENSTEUERSATZ_STANDARD = _LOHNSTEUER["kirchensteuersatz_standard"]
+KIRCHENSTEUERSATZ = {
+    "Bayern": _LOHNSTEUER["kirchensteuersatz_ermaessigt"],
+    "Baden-Württemberg": _LOHNSTEUER["kirchensteuersatz_ermaessigt"],
+}
 
 # Steuersätze nach Zonen (vereinfacht für 2024)
 # Zone 1: 0 bis Grundfreibetrag: 0%
@@ -12,6 +29,26 @@ GRUNDFREIBETRAG = 11604
 # Zone 3: 17006€ bis 66760€: 24% bis 42%
 # Zone 4: 66761€ bis 277825€: 42%
 # Zone 5: ab 277826€: 45%
+ZONE_2_BIS = _TARIF["zone_2_bis"]
+ZONE_2_A = _TARIF["zone_2_a"]
+ZONE_2_B = _TARIF["zone_2_b"]
+ZONE_3_BIS = _TARIF["zone_3_bis"]
+ZONE_3_A = _TARIF["zone_3_a"]
+ZONE_3_B = _TARIF["zone_3_b"]
+ZONE_3_C = _TARIF["zone_3_c"]
+ZONE_4_BIS = _TARIF["zone_4_bis"]
+ZONE_4_SATZ = _TARIF["zone_4_satz"]
+ZONE_4_ABZUG = _TARIF["zone_4_abzug"]
+ZONE_5_SATZ = _TARIF["zone_5_satz"]
+ZONE_5_ABZUG = _TARIF["zone_5_abzug"]
+
+# Monatsgehälter pro Jahr (12 Monate plus Sonderzahlung im November)
+MONATE_BEAMTE = _LOHNSTEUER["monate_beamte"]
+
+# Pauschalen und Vorsorgeanteil (Krankenversicherung) der Beamten
+WERBUNGSKOSTEN_PAUSCHALE = _LOHNSTEUER["werbungskosten_pauschale"]
+SONDERAUSGABEN_PAUSCHALE = _LOHNSTEUER["sonderausgaben_pauschale"]
+VORSORGE_ANTEIL_BEAMTE = _LOHNSTEUER["vorsorge_anteil_beamte"]
 
 
 def berechne_einkommensteuer(zu_versteuerndes_einkommen: float) -> float:
@@ -30,20 +67,20 @@ def berechne_einkommensteuer(zu_versteuerndes_einkommen: float) -> float:
         return 0.0
 
     # Progressionszonen nach § 32a EStG 2024
-    if zve <= 17005:
+    if zve <= ZONE_2_BIS:
         # Zone 2: Progressionszone 1
         y = (zve - GRUNDFREIBETRAG) / 10000
-        steuer = (979.18 * y + 1400) * y
-    elif zve <= 66760:
+        steuer = (ZONE_2_A * y + ZONE_2_B) * y
+    elif zve <= ZONE_3_BIS:
         # Zone 3: Progressionszone 2
-        z = (zve - 17005) / 10000
-        steuer = (192.59 * z + 2397) * z + 966.53
-    elif zve <= 277825:
+        z = (zve - ZONE_2_BIS) / 10000
+        steuer = (ZONE_3_A * z + ZONE_3_B) * z + ZONE_3_C
+    elif zve <= ZONE_4_BIS:
         # Zone 4: Proportionalzone 1
-        steuer = 0.42 * zve - 10636.31
+        steuer = ZONE_4_SATZ * zve - ZONE_4_ABZUG
     else:
         # Zone 5: Proportionalzone 2 (Reichensteuer)
-        steuer = 0.45 * zve - 18971.06
+        steuer = ZONE_5_SATZ * zve - ZONE_5_ABZUG
 
     return max(0, round(steuer, 2))
 
@@ -71,43 +108,38 @@ def get_steuerklassen_faktor(steuerklasse: int) -> float:
     return faktoren.get(steuerklasse, 1.0)
 
 
-def berechne_lohnsteuer_monatlich(
-    brutto_monatlich: float,
+def get_kirchensteuersatz(bundesland: str = "NRW") -> float:
+    """
+    Gibt den Kirchensteuersatz eines Bundeslands zurück.
+
+    Args:
+        bundesland: z.B. "NRW" oder "Bayern"
+
+    Returns:
+        Kirchensteuersatz in Prozent der Einkommensteuer
+    """
+    return KIRCHENSTEUERSATZ.get(bundesland, KIRCHENSTEUERSATZ_STANDARD)
+
+
+def berechne_steuern_monatlich(
+    zve: float,
     steuerklasse: int,
     kirchensteuer: bool = False,
-    bundesland: str = "NRW"
+    kirchensteuersatz: float = KIRCHENSTEUERSATZ_STANDARD
 ) -> dict:
     """
-    Berechnet die monatliche Lohnsteuer für einen Beamten.
+    Berechnet Lohnsteuer, Solidaritätszuschlag und Kirchensteuer pro Monat
+    aus dem zu versteuernden Jahreseinkommen.
 
     Args:
-        brutto_monatlich: Monatliches Bruttogehalt
+        zve: Zu versteuerndes Einkommen (Jahr)
         steuerklasse: Steuerklasse 1-6
         kirchensteuer: True wenn Kirchensteuer zu zahlen ist
-        bundesland: Bundesland für Kirchensteuersatz
+        kirchensteuersatz: Kirchensteuersatz in Prozent (siehe get_kirchensteuersatz)
 
     Returns:
-        Dictionary mit Steuerbeträgen
+        Dictionary mit monatlichen Steuerbeträgen
     """
-    # Jahresbrutto berechnen (12 Monate, kein 13. Gehalt bei Beamten)
-    # Aber: Sonderzahlung im November (ca. 30% eines Monatsgehalts)
-    # Vereinfacht: 12.3 Monate
-    jahresbrutto = brutto_monatlich * 12.3
-
-    # Werbungskostenpauschale (1230€ für 2024)
-    werbungskosten = 1230
-
-    # Sonderausgabenpauschale
-    sonderausgaben = 36
-
-    # Zu versteuerndes Einkommen
-    # Bei Beamten: keine Sozialversicherung, aber Vorsorgeaufwendungen
-    # Vereinfacht: Krankenversicherung ca. 4% des Bruttos
-    krankenversicherung_jahres = jahresbrutto * 0.04
-
-    # Zu versteuerndes Einkommen
-    zve = jahresbrutto - werbungskosten - sonderausgaben - krankenversicherung_jahres
-
     # Steuerklassen-Anpassung
     faktor = get_steuerklassen_faktor(steuerklasse)
     steuer_basis = berechne_einkommensteuer(zve)
@@ -130,9 +162,9 @@ def berechne_lohnsteuer_monatlich(
     else:
         soli_jahr = 0
 
-    # Kirchensteuer (9% in NRW)
+    # Kirchensteuer
     if kirchensteuer:
-        kirche_jahr = einkommensteuer_jahr * 0.09
+        kirche_jahr = einkommensteuer_jahr * (kirchensteuersatz / 100)
     else:
         kirche_jahr = 0
 
@@ -146,6 +178,114 @@ def berechne_lohnsteuer_monatlich(
         "solidaritaetszuschlag": round(soli_monat, 2),
         "kirchensteuer": round(kirche_monat, 2),
         "gesamt": round(lohnsteuer_monat + soli_monat + kirche_monat, 2),
+    }
+
+
+def berechne_lohnsteuer_monatlich(
+    brutto_monatlich: float,
+    steuerklasse: int,
+    kirchensteuer: bool = False,
+    bundesland: str = "NRW"
+) -> dict:
+    """
+    Berechnet die monatliche Lohnsteuer für einen Beamten.
+
+    Args:
+        brutto_monatlich: Monatliches Bruttogehalt
+        steuerklasse: Steuerklasse 1-6
+        kirchensteuer: True wenn Kirchensteuer zu zahlen ist
+        bundesland: Bundesland für Kirchensteuersatz
+
+    Returns:
+        Dictionary mit Steuerbeträgen
+    """
+    # Jahresbrutto berechnen (12 Monate, kein 13. Gehalt bei Beamten)
+    # Aber: Sonderzahlung im November (ca. 30% eines Monatsgehalts)
+    # Vereinfacht: 12.3 Monate
+    jahresbrutto = brutto_monatlich * MONATE_BEAMTE
+
+    # Werbungskostenpauschale (1230€ für 2024)
+    werbungskosten = WERBUNGSKOSTEN_PAUSCHALE
+
+    # Sonderausgabenpauschale
+    sonderausgaben = SONDERAUSGABEN_PAUSCHALE
+
+    # Zu versteuerndes Einkommen
+    # Bei Beamten: keine Sozialversicherung, aber Vorsorgeaufwendungen
+    # Vereinfacht: Krankenversicherung ca. 4% des Bruttos
+    krankenversicherung_jahres = jahresbrutto * VORSORGE_ANTEIL_BEAMTE
+
+    # Zu versteuerndes Einkommen
+    zve = jahresbrutto - werbungskosten - sonderausgaben - krankenversicherung_jahres
+
+    steuern = berechne_steuern_monatlich(zve, steuerklasse, kirchensteuer, get_kirchensteuersatz(bundesland))
+
+    return {
+        **steuern,
         "jahresbrutto": round(jahresbrutto, 2),
         "zve": round(zve, 2),
     }
+
+
+# Versorgungsfreibetrag und Zuschlag nach § 19 Abs. 2 EStG
+# (Kohorte = Jahr des Versorgungsbeginns, gilt lebenslang unverändert);
+# Abschmelzstufen aus der Parameterdatei, Stand 2026:
+# 2005-2020: 40 % / 3.000 € / 900 €, jährlich -1,6 %-Punkte / -120 € / -36 €
+# 2021-2023: jährlich -0,8 %-Punkte / -60 € / -18 €
+# ab 2024 (Wachstumschancengesetz): jährlich -0,4 %-Punkte / -30 € / -9 €, 0 ab 2057
+VERSORGUNGSFREIBETRAG_ERSTES_JAHR = _VERSORGUNGSFREIBETRAG["erstes_jahr"]
+VERSORGUNGSFREIBETRAG_LETZTES_JAHR = _VERSORGUNGSFREIBETRAG["stufe_3_bis"]
+
+# Werbungskosten-Pauschbetrag für Versorgungsbezüge (§ 9a Satz 1 Nr. 1 Buchst. b EStG)
+WERBUNGSKOSTEN_VERSORGUNG = _VERSORGUNGSFREIBETRAG["werbungskosten_pauschale"]
+
+# Abschmelzstufen des Versorgungsfreibetrags
+VERSORGUNGSFREIBETRAG_STUFEN = (1, 2, 3)
+
+
+def get_versorgungsfreibetrag_parameter(jahr_versorgungsbeginn: int, parameter: dict = None) -> tuple:
+    """
+    Gibt Prozentsatz, Höchstbetrag und Zuschlag des Versorgungsfreibetrags
+    für das Jahr des Versorgungsbeginns zurück.
+
+    Args:
+        jahr_versorgungsbeginn: Jahr des Versorgungsbeginns
+        parameter: Abschnitt versorgungsfreibetrag einer Parameterversion
+            (Standard: aktive Version)
+
+    Returns:
+        Tuple (Prozentsatz, Höchstbetrag in Euro, Zuschlag in Euro)
+    """
+    p = parameter or _VERSORGUNGSFREIBETRAG
+    jahr = max(jahr_versorgungsbeginn, p["erstes_jahr"])
+    prozent, hoechstbetrag, zuschlag = p["prozent"], p["hoechstbetrag"], p["zuschlag"]
+    von = p["erstes_jahr"]
+    for stufe in VERSORGUNGSFREIBETRAG_STUFEN:
+        bis = p[f"stufe_{stufe}_bis"]
+        n = max(0, min(jahr, bis) - von)
+        prozent -= p[f"stufe_{stufe}_prozent"] * n
+        hoechstbetrag -= p[f"stufe_{stufe}_hoechstbetrag"] * n
+        zuschlag -= p[f"stufe_{stufe}_zuschlag"] * n
+        von = bis
+    return max(0.0, round(prozent, 1)), hoechstbetrag, zuschlag
+
+
+def berechne_versorgungsfreibetrag(versorgungsbezug_jahr: float, jahr_versorgungsbeginn: int) -> dict:
+    """
+    Berechnet Versorgungsfreibetrag und Zuschlag für einen Jahresbezug.
+
+    Args:
+        versorgungsbezug_jahr: Versorgungsbezüge im Jahr (Bemessungsgrundlage)
+        jahr_versorgungsbeginn: Jahr des Versorgungsbeginns
+
+    Returns:
+        Dictionary mit Freibetrag und Zuschlag (Jahresbeträge)
+    """
+    prozent, hoechstbetrag, zuschlag = get_versorgungsfreibetrag_parameter(jahr_versorgungsbeginn)
+    freibetrag = min(versorgungsbezug_jahr * prozent / 100, hoechstbetrag)
+    # Der Zuschlag darf die Bezüge nicht unter 0 mindern
+    zuschlag = min(zuschlag, max(0.0, versorgungsbezug_jahr - freibetrag))
+    return {
+        "versorgungsfreibetrag": round(freibetrag, 2),
+        "zuschlag_versorgungsfreibetrag": round(zuschlag, 2),
+    }
@@ -0,0 +1,347 @@
+"""
+Versionierte Rechenparameter aus Parameterdateien
+Die Parameter von Versorgung, Dienstunfähigkeit, Einkommen-/Lohnsteuer
+(inkl. Kirchensteuer und Versorgungsfreibetrag) und Kindergeld stehen nicht
+im Code, sondern je Version in einer JSON-Datei unter
+data/parameterdateien/<version>.json. Für ein neues Jahr wird eine
+neue Datei angelegt; der Code bleibt unverändert.
+
+Ein Build-Schritt prüft alle Dateien gegen SCHEMA und schreibt einen
+kompakten Snapshot (marshal), der beim Start ohne JSON-Parsing und ohne
+erneute Prüfung geladen wird:
+
+    python -m data.parameter            # prüft, schreibt Snapshot, gibt Pfad aus
+
+Der Snapshot enthält den Stand der Parameterdateien (Namen, Größe,
+Änderungszeit); passt er nicht (Datei geändert, neue Version, anderer
+Python-Interpreter), werden die Dateien wie ohne Snapshot direkt gelesen und
+geprüft. Die Prüfung kommt so mit einem stat() je Datei aus, ohne die
+Dateien zu lesen.
+
+Aktiv ist die neueste Version oder die über BEAMTENRECHNER_PARAMETER
+gewählte.
+"""
+
+import datetime
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import sys
+from fractions import Fraction
+from functools import lru_cache
+
+
+# Umgebungsvariable mit der aktiven Parameterversion (z.B. "2026")
+PARAMETER_UMGEBUNGSVARIABLE = "BEAMTENRECHNER_PARAMETER"
+
+# Verzeichnis der Parameterdateien und Pfad des Snapshots
+PARAMETER_VERZEICHNIS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parameterdateien")
+SNAPSHOT_DATEI = os.path.join(PARAMETER_VERZEICHNIS, "parameter.snapshot")
+
+# Kennung am Dateianfang des Snapshots
+DATEI_KENNUNG = b"BRNRWPAR"
+
+# Abschnitt -> Parameter -> (Art, Minimum, Maximum)
+# Art "zahl" erlaubt auch Brüche als Text ("2/3")
+SCHEMA = {
+    "versorgung": {
+        "ruhegehaltssatz_pro_jahr": ("zahl", 0, 100),
+        "max_ruhegehaltssatz": ("zahl", 0, 100),
+        "min_ruhegehaltssatz": ("zahl", 0, 100),
+        "min_dienstjahre": ("ganzzahl", 0, 50),
+        "regelaltersgrenze_normal": ("ganzzahl", 50, 80),
+        "regelaltersgrenze_polizei": ("ganzzahl", 50, 80),
+        "antragsaltersgrenze_normal": ("ganzzahl", 50, 80),
+        "antragsaltersgrenze_polizei": ("ganzzahl", 50, 80),
+        "abschlag_pro_jahr": ("zahl", 0, 100),
+        "max_abschlag": ("zahl", 0, 100),
+    },
+    "dienstunfaehigkeit": {
+        "zurechnungszeit_grenze_alt": ("ganzzahl", 50, 80),
+        "zurechnungszeit_grenze_neu": ("ganzzahl", 50, 80),
+        "zurechnungszeit_uebergangsjahr": ("ganzzahl", 1900, 2150),
+        "zurechnungszeit_faktor": ("zahl", 0, 1),
+        "du_abschlag_altersgrenze": ("ganzzahl", 50, 80),
+        "mindestversorgungssatz": ("zahl", 0, 100),
+        "wartezeit_jahre": ("ganzzahl", 0, 50),
+    },
+    "einkommensteuer": {
+        "grundfreibetrag": ("zahl", 0, None),
+        "zone_2_bis": ("zahl", 0, None),
+        "zone_2_a": ("zahl", 0, None),
+        "zone_2_b": ("zahl", 0, None),
+        "zone_3_bis": ("zahl", 0, None),
+        "zone_3_a": ("zahl", 0, None),
+        "zone_3_b": ("zahl", 0, None),
+        "zone_3_c": ("zahl", 0, None),
+        "zone_4_bis": ("zahl", 0, None),
+        "zone_4_satz": ("zahl", 0, 1),
+        "zone_4_abzug": ("zahl", 0, None),
+        "zone_5_satz": ("zahl", 0, 1),
+        "zone_5_abzug": ("zahl", 0, None),
+    },
+    "lohnsteuer": {
+        "monate_beamte": ("zahl", 12, 14),
+        "werbungskosten_pauschale": ("zahl", 0, None),
+        "sonderausgaben_pauschale": ("zahl", 0, None),
+        "vorsorge_anteil_beamte": ("zahl", 0, 1),
+        # Kirchensteuer in Prozent der Einkommensteuer (ermäßigt: Bayern,
+        # Baden-Württemberg)
+        "kirchensteuersatz_standard": ("zahl", 0, 100),
+        "kirchensteuersatz_ermaessigt": ("zahl", 0, 100),
+    },
+    # Versorgungsfreibetrag und Zuschlag nach § 19 Abs. 2 EStG je Jahr des
+    # Versorgungsbeginns: Startwerte im ersten Jahr, danach drei Abschmelz-
+    # stufen mit jährlichem Abzug bis einschließlich stufe_<n>_bis
+    "versorgungsfreibetrag": {
+        "erstes_jahr": ("ganzzahl", 1900, 2150),
+        "prozent": ("zahl", 0, 100),
+        "hoechstbetrag": ("zahl", 0, None),
+        "zuschlag": ("zahl", 0, None),
+        "stufe_1_bis": ("ganzzahl", 1900, 2150),
+        "stufe_1_prozent": ("zahl", 0, 100),
+        "stufe_1_hoechstbetrag": ("zahl", 0, None),
+        "stufe_1_zuschlag": ("zahl", 0, None),
+        "stufe_2_bis": ("ganzzahl", 1900, 2150),
+        "stufe_2_prozent": ("zahl", 0, 100),
+        "stufe_2_hoechstbetrag": ("zahl", 0, None),
+        "stufe_2_zuschlag": ("zahl", 0, None),
+        "stufe_3_bis": ("ganzzahl", 1900, 2150),
+        "stufe_3_prozent": ("zahl", 0, 100),
+        "stufe_3_hoechstbetrag": ("zahl", 0, None),
+        "stufe_3_zuschlag": ("zahl", 0, None),
+        # Werbungskosten-Pauschbetrag für Versorgungsbezüge (§ 9a Satz 1 Nr. 1 Buchst. b EStG)
+        "werbungskosten_pauschale": ("zahl", 0, None),
+    },
+    "kindergeld": {
+        "monatlich": ("zahl", 0, None),
+    },
+}
+
+# Paare (kleiner, größer) innerhalb eines Abschnitts, die aufsteigend sein müssen
+REIHENFOLGEN = (
+    ("versorgung", "min_ruhegehaltssatz", "max_ruhegehaltssatz"),
+    ("versorgung", "abschlag_pro_jahr", "max_abschlag"),
+    ("versorgung", "antragsaltersgrenze_normal", "regelaltersgrenze_normal"),
+    ("dienstunfaehigkeit", "zurechnungszeit_grenze_alt", "zurechnungszeit_grenze_neu"),
+    ("einkommensteuer", "grundfreibetrag", "zone_2_bis"),
+    ("einkommensteuer", "zone_2_bis", "zone_3_bis"),
+    ("einkommensteuer", "zone_3_bis", "zone_4_bis"),
+    ("versorgungsfreibetrag", "erstes_jahr", "stufe_1_bis"),
+    ("versorgungsfreibetrag", "stufe_1_bis", "stufe_2_bis"),
+    ("versorgungsfreibetrag", "stufe_2_bis", "stufe_3_bis"),
+)
+
+
+def _pruefe_wert(ort: str, art: str, minimum, maximum, wert):
+    """Prüft einen Parameterwert; Brüche als Text werden in float umgewandelt."""
+    if art == "zahl" and isinstance(wert, str):
+        try:
+            wert = float(Fraction(wert))
+        except (ValueError, ZeroDivisionError):
+            raise ValueError(f"{ort} ungültig: {wert!r} (keine Zahl)")
+    if isinstance(wert, bool) or not isinstance(wert, int if art == "ganzzahl" else (int, float)):
+        raise ValueError(f"{ort} ungültig: {wert!r} (keine {'Ganzzahl' if art == 'ganzzahl' else 'Zahl'})")
+    if (minimum is not None and wert < minimum) or (maximum is not None and wert > maximum):
+        raise ValueError(f"{ort} ungültig: {wert!r} (außerhalb [{minimum}, {maximum}])")
+    return wert
+
+
+def pruefe_parameter(daten: dict, quelle: str) -> dict:
+    """
+    Prüft den Inhalt einer Parameterdatei gegen SCHEMA.
+
+    Args:
+        daten: Eingelesenes JSON-Objekt
+        quelle: Dateiname für Fehlermeldungen
+
+    Returns:
+        Geprüfte Parameter (Abschnitt -> Name -> Wert) mit version und gueltig_ab
+
+    Raises:
+        ValueError: Bei fehlenden, unbekannten oder ungültigen Parametern
+    """
+    if not isinstance(daten, dict):
+        raise ValueError(f"Parameterdatei {quelle} ungültig: kein Objekt")
+    try:
+        datetime.date.fromisoformat(daten.get("gueltig_ab"))
+    except (TypeError, ValueError):
+        raise ValueError(f"Parameterdatei {quelle}: gueltig_ab {daten.get('gueltig_ab')!r} ungültig")
+
+    unbekannt = set(daten) - set(SCHEMA) - {"version", "gueltig_ab", "beschreibung"}
+    if unbekannt:
+        raise ValueError(f"Parameterdatei {quelle}: unbekannte Abschnitte {sorted(unbekannt)}")
+
+    parameter = {"version": str(daten.get("version")), "gueltig_ab": daten["gueltig_ab"]}
+    for abschnitt, felder in SCHEMA.items():
+        werte = daten.get(abschnitt)
+        if not isinstance(werte, dict):
+            raise ValueError(f"Parameterdatei {quelle}: Abschnitt {abschnitt} fehlt")
+        fehlend = [name for name in felder if name not in werte]
+        unbekannt = [name for name in werte if name not in felder]
+        if fehlend or unbekannt:
+            raise ValueError(
+                f"Parameterdatei {quelle}, Abschnitt {abschnitt}: fehlend {fehlend}, unbekannt {unbekannt}"
+            )
+        parameter[abschnitt] = {
+            name: _pruefe_wert(f"Parameterdatei {quelle}: {abschnitt}.{name}", *felder[name], werte[name])
+            for name in felder
+        }
+
+    for abschnitt, kleiner, groesser in REIHENFOLGEN:
+        if parameter[abschnitt][kleiner] > parameter[abschnitt][groesser]:
+            raise ValueError(f"Parameterdatei {quelle}: {abschnitt}.{kleiner} größer als {groesser}")
+    return parameter
+
+
+def _parameterdateien(verzeichnis: str) -> list:
+    """Sortierte Pfade aller Parameterdateien eines Verzeichnisses."""
+    return [
+        os.path.join(verzeichnis, datei)
+        for datei in sorted(os.listdir(verzeichnis))
+        if datei.endswith(".json")
+    ]
+
+
+def get_quellen_pruefsumme(verzeichnis: str = PARAMETER_VERZEICHNIS) -> str:
+    """
+    Prüfsumme über Namen und Inhalt aller Parameterdateien.
+
+    Returns:
+        Kurzer Hash (auch Teil der Tarifversion, siehe calculator/ergebniscache.py)
+    """
+    pruefsumme = hashlib.sha256()
+    for pfad in _parameterdateien(verzeichnis):
+        pruefsumme.update(os.path.basename(pfad).encode("utf-8"))
+        with open(pfad, "rb") as datei:
+            pruefsumme.update(datei.read())
+    return pruefsumme.hexdigest()[:16]
+
+
+def lies_parameterdateien(verzeichnis: str = PARAMETER_VERZEICHNIS) -> dict:
+    """
+    Liest und prüft alle Parameterdateien (langsamer Weg ohne Snapshot).
+
+    Returns:
+        Dictionary Version -> geprüfte Parameter
+
+    Raises:
+        ValueError: Bei ungültigen Dateien oder wenn keine vorhanden ist
+    """
+    versionen = {}
+    for pfad in _parameterdateien(verzeichnis):
+        name = os.path.basename(pfad)
+        with open(pfad, encoding="utf-8") as datei:
+            try:
+                daten = json.load(datei)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Parameterdatei {name} ungültig: {e}")
+        parameter = pruefe_parameter(daten, name)
+        if parameter["version"] != name[:-len(".json")]:
+            raise ValueError(f"Parameterdatei {name}: version {parameter['version']} passt nicht zum Dateinamen")
+        versionen[parameter["version"]] = parameter
+    if not versionen:
+        raise ValueError(f"Parameterdateien in {verzeichnis} nicht gefunden")
+    return versionen
+
+
+def _quellen_stand(verzeichnis: str = PARAMETER_VERZEICHNIS) -> str:
+    """Stand der Parameterdateien aus Namen, Größe und Änderungszeit (ohne sie zu lesen)."""
+    stand = hashlib.sha256()
+    for pfad in _parameterdateien(verzeichnis):
+        info = os.stat(pfad)
+        stand.update(f"{os.path.basename(pfad)}:{info.st_size}:{info.st_mtime_ns};".encode("utf-8"))
+    return stand.hexdigest()[:16]
+
+
+def _snapshot_kennung(stand: str) -> bytes:
+    """Kennung, Stand der Quellen und marshal-Format (Python-Version)."""
+    return DATEI_KENNUNG + importlib.util.MAGIC_NUMBER + stand.encode("ascii")
+
+
+def baue_snapshot(verzeichnis: str = PARAMETER_VERZEICHNIS, pfad: str = SNAPSHOT_DATEI) -> str:
+    """
+    Build-Schritt: prüft alle Parameterdateien und schreibt den Snapshot
+    (atomar über Umbenennen).
+
+    Args:
+        verzeichnis: Verzeichnis der Parameterdateien
+        pfad: Zieldatei
+
+    Returns:
+        Pfad des Snapshots
+
+    Raises:
+        ValueError: Bei ungültigen Parameterdateien
+    """
+    stand = _quellen_stand(verzeichnis)
+    versionen = lies_parameterdateien(verzeichnis)
+    temp_pfad = f"{pfad}.{os.getpid()}.tmp"
+    with open(temp_pfad, "wb") as datei:
+        datei.write(_snapshot_kennung(stand))
+        datei.write(marshal.dumps(versionen))
+    os.replace(temp_pfad, pfad)
+    return pfad
+
+
+def lade_snapshot(pfad: str = SNAPSHOT_DATEI, verzeichnis: str = PARAMETER_VERZEICHNIS):
+    """
+    Lädt den Snapshot, wenn er zu den aktuellen Parameterdateien passt.
+
+    Returns:
+        Dictionary Version -> Parameter, oder None wenn kein passender
+        Snapshot vorhanden ist
+    """
+    kennung = _snapshot_kennung(_quellen_stand(verzeichnis))
+    try:
+        with open(pfad, "rb") as datei:
+            inhalt = datei.read()
+    except OSError:
+        return None
+    if not inhalt.startswith(kennung):
+        return None
+    try:
+        return marshal.loads(inhalt[len(kennung):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_parameterversionen() -> dict:
+    """
+    Gibt alle Parameterversionen zurück (aus dem Snapshot, sonst aus den
+    Parameterdateien; einmal je Prozess).
+
+    Returns:
+        Dictionary Version -> Parameter
+    """
+    versionen = lade_snapshot()
+    return versionen if versionen is not None else lies_parameterdateien()
+
+
+def get_parameterversion() -> str:
+    """Name der aktiven Parameterversion (Umgebungsvariable, sonst die neueste)."""
+    return os.environ.get(PARAMETER_UMGEBUNGSVARIABLE) or max(get_parameterversionen())
+
+
+def get_parameter(version: str = None) -> dict:
+    """
+    Gibt die Parameter einer Version zurück.
+
+    Args:
+        version: z.B. "2026" (Standard: aktive Version)
+
+    Returns:
+        Dictionary Abschnitt -> Name -> Wert (siehe SCHEMA)
+    """
+    version = version or get_parameterversion()
+    versionen = get_parameterversionen()
+    if version not in versionen:
+        raise ValueError(f"Parameterversion {version} nicht gefunden")
+    return versionen[version]
+
+
+if __name__ == "__main__":
+    print(baue_snapshot(*sys.argv[1:3]))
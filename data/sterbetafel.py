@@ -0,0 +1,59 @@
+"""
+Sterbetafel für Barwertberechnungen
+Einjährige Sterbewahrscheinlichkeiten q(x) nach Alter und Geschlecht.
+
+Die Werte sind eine Gompertz-Makeham-Näherung an die Periodensterbetafel
+2021/2023 des Statistischen Bundesamts (Lebenserwartung mit 65: Männer
+ca. 17,9, Frauen ca. 21,2 Jahre). Sie genügen für Haushaltsplanung und
+Vergleichsrechnungen, ersetzen aber keine versicherungsmathematische
+Richttafel.
+
+Sterbeintensität: mu(x) = a + b * exp(c * x), q(x) = 1 - exp(-mu(x))
+"""
+
+import math
+
+
+# Höchstalter der Tafel (q = 1)
+MAX_ALTER = 110
+
+# Gompertz-Makeham-Parameter (a, b, c) je Tafel
+STERBEPARAMETER = {
+    "maennlich": (0.0003, 3.1e-5, 0.095),
+    "weiblich": (0.0002, 9.2e-6, 0.105),
+}
+
+# Reihenfolge der Tafeln (Index für vektorisierte Berechnungen)
+STERBETAFELN = ("maennlich", "weiblich", "unisex")
+
+
+def _baue_tafel(a: float, b: float, c: float) -> list:
+    """Sterbewahrscheinlichkeiten für die Alter 0 bis MAX_ALTER."""
+    tafel = [1 - math.exp(-(a + b * math.exp(c * alter))) for alter in range(MAX_ALTER)]
+    return [round(q, 6) for q in tafel] + [1.0]
+
+
+STERBEWAHRSCHEINLICHKEITEN = {
+    name: _baue_tafel(*parameter) for name, parameter in STERBEPARAMETER.items()
+}
+# Unisex: Mittel aus Männer- und Frauentafel
+STERBEWAHRSCHEINLICHKEITEN["unisex"] = [
+    round((m + w) / 2, 6)
+    for m, w in zip(STERBEWAHRSCHEINLICHKEITEN["maennlich"], STERBEWAHRSCHEINLICHKEITEN["weiblich"])
+]
+
+
+def get_sterbewahrscheinlichkeit(alter: int, tafel: str = "unisex") -> float:
+    """
+    Gibt die einjährige Sterbewahrscheinlichkeit für ein Alter zurück.
+
+    Args:
+        alter: Vollendetes Lebensjahr (ab MAX_ALTER gilt q = 1)
+        tafel: "maennlich", "weiblich" oder "unisex"
+
+    Returns:
+        Sterbewahrscheinlichkeit q(x)
+    """
+    if tafel not in STERBEWAHRSCHEINLICHKEITEN:
+        raise ValueError(f"Sterbetafel {tafel} nicht gefunden")
+    return STERBEWAHRSCHEINLICHKEITEN[tafel][max(0, min(alter, MAX_ALTER))]
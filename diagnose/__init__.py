@@ -0,0 +1 @@
+# Diagnose modules for Beamtenrechner NRW
@@ -0,0 +1,330 @@
+"""
+Laufzeitmessung für den Beamtenpensions-Rechner NRW
+Optionale Instrumentierung aller öffentlichen Funktionen in calculator/,
+data/, export/ und ui/: Aufrufzahl, Gesamtzeit (inklusive Unteraufrufe),
+Eigenzeit und Zeit pro Aufruf.
+
+Im ausgeschalteten Zustand wird nichts umgehängt - die Funktionen laufen
+unverändert und ohne jeden Zusatzaufwand. aktivieren() ersetzt die
+Funktionen in allen geladenen Projektmodulen (auch dort, wo sie per
+"from ... import" gebunden wurden) durch messende Hüllen; deaktivieren()
+stellt die Originale wieder her.
+
+Neben der prozessweiten Statistik sammelt starte_lauf() die Messwerte
+eines einzelnen Durchlaufs (z.B. eines Streamlit-Reruns) getrennt je
+Kontext bzw. Thread; gleichzeitige Sitzungen sehen nur ihre eigenen Werte.
+
+Zusätzlich:
+    messung(name)           Kontextmanager für beliebige Code-Blöcke
+    schreibe_flamegraph()   Gefaltete Stacks (flamegraph.pl, speedscope)
+    cprofile(pfad)          Kontextmanager für einen cProfile-Dump (.prof)
+
+Aktivierung beim Import über die Umgebungsvariable BEAMTENRECHNER_PROFILING=1.
+"""
+
+import contextvars
+import cProfile
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Pakete, deren öffentliche Funktionen instrumentiert werden
+INSTRUMENTIERTE_PAKETE = ("calculator", "data", "export", "ui")
+
+# Umgebungsvariable zur Aktivierung beim Import
+UMGEBUNGSVARIABLE = "BEAMTENRECHNER_PROFILING"
+
+_uhr = time.perf_counter
+
+_aktiv = False
+_sperre = threading.Lock()
+_lokal = threading.local()
+
+# Name -> [Aufrufe, Gesamtzeit, Eigenzeit, Maximum]
+_statistik = {}
+
+# Aufrufstapel (Tupel von Namen) -> Eigenzeit
+_stapel_zeiten = {}
+
+# id(Originalfunktion) -> (Originalfunktion, messende Hülle)
+_huellen = {}
+
+# Ersetzte Referenzen: (Namensraum, Attributname, Originalfunktion)
+_originale = []
+
+# Bereits instrumentierte Projektmodule (Namen)
+_module = set()
+
+# Messwerte des aktuellen Durchlaufs (siehe starte_lauf), je Kontext
+_lauf = contextvars.ContextVar("beamtenrechner_lauf", default=None)
+
+
+def ist_aktiv() -> bool:
+    """Gibt zurück, ob die Instrumentierung eingeschaltet ist."""
+    return _aktiv
+
+
+def _stapel() -> list:
+    stapel = getattr(_lokal, "stapel", None)
+    if stapel is None:
+        stapel = _lokal.stapel = []
+    return stapel
+
+
+def _verbuche(statistik: dict, stapel_zeiten: dict, name: str, dauer: float, eigen: float, pfad: tuple):
+    eintrag = statistik.get(name)
+    if eintrag is None:
+        statistik[name] = [1, dauer, eigen, dauer]
+    else:
+        eintrag[0] += 1
+        eintrag[1] += dauer
+        eintrag[2] += eigen
+        if dauer > eintrag[3]:
+            eintrag[3] = dauer
+    stapel_zeiten[pfad] = stapel_zeiten.get(pfad, 0.0) + eigen
+
+
+def _erfasse(name: str, dauer: float, kinder: float, pfad: tuple):
+    """Verbucht einen abgeschlossenen Aufruf (prozessweit und im aktuellen Lauf)."""
+    eigen = dauer - kinder
+    with _sperre:
+        _verbuche(_statistik, _stapel_zeiten, name, dauer, eigen, pfad)
+    lauf = _lauf.get()
+    if lauf is not None:
+        # Ein Lauf gehört genau einem Kontext, daher ohne Sperre
+        _verbuche(lauf["statistik"], lauf["stapel_zeiten"], name, dauer, eigen, pfad)
+
+
+def starte_lauf() -> dict:
+    """
+    Beginnt einen neuen Messlauf für den aktuellen Kontext (Thread bzw.
+    Task). Messwerte anderer Läufe und die prozessweite Statistik bleiben
+    unberührt.
+
+    Returns:
+        Messwerte des Laufs (für get_statistik und schreibe_flamegraph)
+    """
+    lauf = {"statistik": {}, "stapel_zeiten": {}}
+    _lauf.set(lauf)
+    return lauf
+
+
+@contextmanager
+def messung(name: str):
+    """
+    Misst einen Code-Block unter dem angegebenen Namen.
+
+    Ist die Instrumentierung ausgeschaltet, wird nichts gemessen.
+
+    Args:
+        name: Bezeichnung in der Auswertung (z.B. "app.diagramme")
+    """
+    if not _aktiv:
+        yield
+        return
+
+    stapel = _stapel()
+    # Eintrag: [Name, Zeit der Unteraufrufe]
+    rahmen = [name, 0.0]
+    stapel.append(rahmen)
+    start = _uhr()
+    try:
+        yield
+    finally:
+        dauer = _uhr() - start
+        pfad = tuple(r[0] for r in stapel)
+        stapel.pop()
+        if stapel:
+            stapel[-1][1] += dauer
+        _erfasse(name, dauer, rahmen[1], pfad)
+
+
+def _huelle(funktion, name: str):
+    """Erzeugt eine messende Hülle um eine Funktion."""
+
+    @functools.wraps(funktion)
+    def gemessen(*args, **kwargs):
+        stapel = _stapel()
+        rahmen = [name, 0.0]
+        stapel.append(rahmen)
+        start = _uhr()
+        try:
+            return funktion(*args, **kwargs)
+        finally:
+            dauer = _uhr() - start
+            pfad = tuple(r[0] for r in stapel)
+            stapel.pop()
+            if stapel:
+                stapel[-1][1] += dauer
+            _erfasse(name, dauer, rahmen[1], pfad)
+
+    # lru_cache-Methoden (cache_clear, cache_info) weiterreichen
+    for attribut in ("cache_clear", "cache_info"):
+        if hasattr(funktion, attribut):
+            setattr(gemessen, attribut, getattr(funktion, attribut))
+    gemessen._instrumentiert = funktion
+    return gemessen
+
+
+def _ist_projektmodul(modulname: str) -> bool:
+    return modulname.split(".", 1)[0] in INSTRUMENTIERTE_PAKETE
+
+
+def _oeffentliche_funktionen(modul) -> dict:
+    """Öffentliche, im Modul selbst definierte Funktionen."""
+    funktionen = {}
+    for attribut, objekt in vars(modul).items():
+        if attribut.startswith("_") or inspect.isclass(objekt) or not callable(objekt):
+            continue
+        if hasattr(objekt, "_instrumentiert"):
+            continue
+        if getattr(objekt, "__module__", None) != modul.__name__:
+            continue
+        funktionen[attribut] = objekt
+    return funktionen
+
+
+def aktivieren(namensraum: dict = None):
+    """
+    Schaltet die Instrumentierung ein.
+
+    Ersetzt alle öffentlichen Funktionen der geladenen Projektmodule sowie
+    deren per "from ... import" gebundene Kopien in anderen Projektmodulen
+    durch messende Hüllen. Erneute Aufrufe erfassen nachgeladene Module
+    und kehren sofort zurück, wenn keine neuen geladen wurden.
+
+    Args:
+        namensraum: Zusätzlicher Namensraum, dessen Funktionsreferenzen
+            ebenfalls ersetzt werden (z.B. globals() der Streamlit-App)
+    """
+    global _aktiv
+    with _sperre:
+        module = [m for n, m in list(sys.modules.items()) if m is not None and _ist_projektmodul(n)]
+        if _aktiv and namensraum is None and all(m.__name__ in _module for m in module):
+            return
+        _module.update(m.__name__ for m in module)
+
+        for modul in module:
+            for attribut, funktion in _oeffentliche_funktionen(modul).items():
+                if id(funktion) not in _huellen:
+                    name = f"{modul.__name__}.{attribut}"
+                    _huellen[id(funktion)] = (funktion, _huelle(funktion, name))
+
+        namensraeume = [vars(modul) for modul in module]
+        if namensraum is not None:
+            namensraeume.append(namensraum)
+        for ziel in namensraeume:
+            for attribut, objekt in list(ziel.items()):
+                huelle = _huellen.get(id(objekt))
+                if huelle is not None and huelle[0] is objekt:
+                    _originale.append((ziel, attribut, objekt))
+                    ziel[attribut] = huelle[1]
+        _aktiv = True
+
+
+def deaktivieren():
+    """Schaltet die Instrumentierung aus und stellt die Originalfunktionen wieder her."""
+    global _aktiv
+    with _sperre:
+        for ziel, attribut, funktion in _originale:
+            if getattr(ziel.get(attribut), "_instrumentiert", None) is funktion:
+                ziel[attribut] = funktion
+        _originale.clear()
+        _huellen.clear()
+        _module.clear()
+        _aktiv = False
+
+
+def zuruecksetzen():
+    """Verwirft alle bisher prozessweit erfassten Messwerte."""
+    with _sperre:
+        _statistik.clear()
+        _stapel_zeiten.clear()
+
+
+def get_statistik(lauf: dict = None) -> list:
+    """
+    Gibt die erfassten Messwerte zurück, absteigend nach Gesamtzeit.
+
+    Args:
+        lauf: Messwerte eines Laufs (siehe starte_lauf); ohne Angabe die
+            prozessweite Statistik
+
+    Returns:
+        Liste von Dictionaries mit name, aufrufe, gesamt_ms, eigen_ms,
+        pro_aufruf_ms und max_ms
+    """
+    statistik = _statistik if lauf is None else lauf["statistik"]
+    with _sperre:
+        eintraege = [(name, list(werte)) for name, werte in statistik.items()]
+
+    ergebnis = [
+        {
+            "name": name,
+            "aufrufe": aufrufe,
+            "gesamt_ms": round(gesamt * 1000, 3),
+            "eigen_ms": round(eigen * 1000, 3),
+            "pro_aufruf_ms": round(gesamt / aufrufe * 1000, 4),
+            "max_ms": round(maximum * 1000, 3),
+        }
+        for name, (aufrufe, gesamt, eigen, maximum) in eintraege
+    ]
+    ergebnis.sort(key=lambda e: e["gesamt_ms"], reverse=True)
+    return ergebnis
+
+
+def schreibe_flamegraph(ziel, lauf: dict = None) -> int:
+    """
+    Schreibt die Eigenzeiten als gefaltete Stacks ("a;b;c <Mikrosekunden>").
+
+    Das Format lesen flamegraph.pl, inferno und speedscope.
+
+    Args:
+        ziel: Dateipfad oder Text-Stream
+        lauf: Messwerte eines Laufs (siehe starte_lauf); ohne Angabe die
+            prozessweite Statistik
+
+    Returns:
+        Anzahl geschriebener Stacks
+    """
+    stapel_zeiten = _stapel_zeiten if lauf is None else lauf["stapel_zeiten"]
+    with _sperre:
+        zeilen = [
+            f"{';'.join(pfad)} {max(0, round(zeit * 1_000_000))}\n"
+            for pfad, zeit in sorted(stapel_zeiten.items())
+        ]
+
+    if isinstance(ziel, (str, os.PathLike)):
+        with open(ziel, "w", encoding="utf-8") as datei:
+            datei.writelines(zeilen)
+    else:
+        ziel.writelines(zeilen)
+    return len(zeilen)
+
+
+@contextmanager
+def cprofile(pfad: str):
+    """
+    Zeichnet den Block mit cProfile auf und speichert die Statistik.
+
+    Die .prof-Datei lässt sich mit pstats, snakeviz oder flameprof auswerten.
+
+    Args:
+        pfad: Zieldatei
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(pfad)
+
+
+if os.environ.get(UMGEBUNGSVARIABLE) == "1":
+    aktivieren()
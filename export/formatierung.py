@@ -0,0 +1,35 @@
+"""
+Zahlenformatierung im deutschen Format
+Gemeinsame Euro-Formatierung für App und PDF-Export.
+"""
+
+from functools import lru_cache
+
+
+# Tausender- und Dezimaltrennzeichen in einem Durchlauf tauschen ("1,234.56" -> "1.234,56")
+_DEUTSCHE_TRENNZEICHEN = str.maketrans(",.", ".,")
+
+# Anzahl gecachter Beträge (Tabellen und Reports wiederholen viele Werte)
+FORMAT_CACHE_GROESSE = 4096
+
+
+@lru_cache(maxsize=FORMAT_CACHE_GROESSE)
+def format_euro(betrag: float) -> str:
+    """Formatiert einen Betrag als Euro-String im deutschen Format."""
+    return f"{betrag:,.2f} €".translate(_DEUTSCHE_TRENNZEICHEN)
+
+
+def format_euro_liste(betraege) -> list:
+    """
+    Formatiert mehrere Beträge als Euro-Strings im deutschen Format.
+
+    Args:
+        betraege: Liste, Tupel oder 1-D-numpy-Array von Beträgen
+
+    Returns:
+        Liste formatierter Strings
+    """
+    if hasattr(betraege, "tolist"):
+        # numpy-Array: einmalig in Python-Floats umwandeln
+        betraege = betraege.tolist()
+    return list(map(format_euro, betraege))
@@ -0,0 +1,359 @@
+"""
+Massen-Export von PDF-Reports für Beamtenpensions-Rechner NRW
+Erstellt personalisierte Reports für viele Beamte (z.B. Jahresmitteilung).
+
+Die Reports werden in Paketen auf mehrere Prozesse verteilt und direkt auf
+die Platte geschrieben. Es sind immer nur wenige Pakete gleichzeitig in
+Arbeit, der Speicherbedarf hängt daher nicht von der Anzahl der Reports ab.
+
+Jedes Profil wird vorab einmal geprüft und normalisiert (siehe
+calculator/eingaben.py); ungültige Profile werden übersprungen und im
+Fehlerbericht (fehlerbericht.json im Zielverzeichnis) aufgeführt.
+
+Aufruf: python -m export.pdf_bulk profile.jsonl ausgabe/ [--modus sammel]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+from reportlab.platypus import PageBreak
+from reportlab.platypus.flowables import Flowable
+
+from calculator.gehalt import berechne_bruttogehalt
+from calculator.steuer import berechne_netto
+from calculator.pension import (
+    berechne_ruhegehalt,
+    REGELALTERSGRENZE_NORMAL,
+    REGELALTERSGRENZE_POLIZEI
+)
+from calculator.dienstunfaehigkeit import berechne_du_rente
+from calculator.stichtag import get_aktuelles_jahr
+from calculator.batch import PROFIL_FELDER
+from calculator.eingaben import pruefe_eintrag
+from data.familienzuschlag import STANDARD_MIETENSTUFE
+from export.pdf_report import erstelle_dokument, erstelle_report_elemente
+
+
+# Export-Modi
+MODUS_EINZELN = "einzeln"  # Eine PDF-Datei pro Beamtem
+MODUS_SAMMEL = "sammel"    # Sammel-PDFs mit Lesezeichen pro Beamtem
+
+# Reports pro Sammel-PDF (begrenzt den Speicher pro Datei)
+BERICHTE_PRO_SAMMELDATEI = 500
+
+# Reports pro Arbeitspaket im Einzel-Modus
+BERICHTE_PRO_PAKET = 50
+
+# Geprüfte Felder eines Profils (siehe calculator/eingaben.py)
+BERICHT_FELDER = PROFIL_FELDER + (
+    "anzahl_kinder", "mietenstufe", "steuerklasse", "kirchensteuer", "pkv_beitrag", "ist_polizei_feuerwehr"
+)
+
+# Dateiname des Fehlerberichts im Zielverzeichnis
+FEHLERBERICHT_DATEI = "fehlerbericht.json"
+
+# Zeichen, die in Dateinamen der Einzelreports durch "_" ersetzt werden
+_UNSICHERE_ZEICHEN = re.compile(r"[^\w.-]+")
+
+# Maximale Länge des Titelanteils im Dateinamen
+MAX_TITEL_LAENGE = 80
+
+
+class _Lesezeichen(Flowable):
+    """Unsichtbares Flowable, das ein PDF-Lesezeichen auf der aktuellen Seite setzt."""
+
+    def __init__(self, titel: str, schluessel: str):
+        super().__init__()
+        self.titel = titel
+        self.schluessel = schluessel
+        self.width = self.height = 0
+
+    def draw(self):
+        self.canv.bookmarkPage(self.schluessel)
+        self.canv.addOutlineEntry(self.titel, self.schluessel, level=0)
+
+
+def erstelle_report_daten(profil: dict, aktuelles_jahr: int = None) -> dict:
+    """
+    Berechnet alle Report-Daten für ein Beamtenprofil (wie in app.py).
+
+    Args:
+        profil: Dictionary mit den Eingaben (geburtsjahr, jahr_verbeamtung,
+            besoldungsgruppe, stufe, ...); fehlende optionale Felder erhalten
+            die Standardwerte der App
+        aktuelles_jahr: Bezugsjahr (Standard: Stichtag)
+
+    Returns:
+        Dictionary im Format von erstelle_pdf_report
+    """
+    aktuelles_jahr = get_aktuelles_jahr(aktuelles_jahr)
+
+    ist_polizei_feuerwehr = profil.get("ist_polizei_feuerwehr", False)
+    regelaltersgrenze = REGELALTERSGRENZE_POLIZEI if ist_polizei_feuerwehr else REGELALTERSGRENZE_NORMAL
+
+    daten = {
+        "geburtsjahr": profil["geburtsjahr"],
+        "jahr_verbeamtung": profil["jahr_verbeamtung"],
+        "besoldungsgruppe": profil["besoldungsgruppe"],
+        "stufe": profil["stufe"],
+        "verheiratet": profil.get("verheiratet", False),
+        "anzahl_kinder": profil.get("anzahl_kinder", 0),
+        "steuerklasse": profil.get("steuerklasse", 1),
+        "teilzeitjahre": profil.get("teilzeitjahre", 0.0),
+        "teilzeitanteil": profil.get("teilzeitanteil", 1.0),
+        "arbeitszeit_faktor": profil.get("arbeitszeit_faktor", 1.0),
+        "ist_polizei_feuerwehr": ist_polizei_feuerwehr,
+        "gewuenschtes_pensionsalter": profil.get("gewuenschtes_pensionsalter", regelaltersgrenze),
+        "du_szenario_jahr": profil.get("du_szenario_jahr", aktuelles_jahr + 1),
+    }
+    mietenstufe = profil.get("mietenstufe", STANDARD_MIETENSTUFE)
+
+    gemeinsam = dict(
+        besoldungsgruppe=daten["besoldungsgruppe"],
+        stufe=daten["stufe"],
+        geburtsjahr=daten["geburtsjahr"],
+        jahr_verbeamtung=daten["jahr_verbeamtung"],
+        verheiratet=daten["verheiratet"],
+        mietenstufe=mietenstufe,
+        teilzeitjahre=daten["teilzeitjahre"],
+        teilzeitanteil=daten["teilzeitanteil"],
+        arbeitszeit_faktor=daten["arbeitszeit_faktor"],
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr
+    )
+
+    gehalt = berechne_bruttogehalt(
+        besoldungsgruppe=daten["besoldungsgruppe"],
+        stufe=daten["stufe"],
+        verheiratet=daten["verheiratet"],
+        anzahl_kinder=daten["anzahl_kinder"],
+        mietenstufe=mietenstufe,
+        arbeitszeit_faktor=daten["arbeitszeit_faktor"]
+    )
+    daten["gehalt"] = gehalt
+    daten["netto_daten"] = berechne_netto(
+        brutto_monatlich=gehalt["brutto"],
+        steuerklasse=daten["steuerklasse"],
+        kirchensteuer=profil.get("kirchensteuer", False),
+        pkv_beitrag=profil.get("pkv_beitrag")
+    )
+    daten["pension"] = berechne_ruhegehalt(
+        jahr_pension=daten["geburtsjahr"] + daten["gewuenschtes_pensionsalter"],
+        aktuelles_jahr=aktuelles_jahr,
+        **gemeinsam
+    )
+    daten["du_rente"] = berechne_du_rente(jahr_du=daten["du_szenario_jahr"], **gemeinsam)
+    daten["versorgungsluecke"] = gehalt["brutto"] - daten["du_rente"]["du_rente_brutto"]
+
+    return daten
+
+
+def _bericht_titel(nummer: int, profil: dict) -> str:
+    """Titel bzw. Dateiname eines Reports (Personalnummer, Name oder laufende Nummer)."""
+    return str(profil.get("personalnummer") or profil.get("name") or f"bericht_{nummer:06d}")
+
+
+def _bericht_dateiname(nummer: int, profil: dict) -> str:
+    """
+    Dateiname eines Einzelreports: laufende Nummer plus bereinigter Titel.
+
+    Der Titel wird auf Buchstaben, Ziffern, ".", "_" und "-" reduziert (kein
+    Verlassen des Zielverzeichnisses); die Nummer vorneweg macht den Namen
+    eindeutig, auch bei doppelten Personalnummern oder Namen.
+    """
+    sicher = _UNSICHERE_ZEICHEN.sub("_", _bericht_titel(nummer, profil))
+    sicher = sicher.strip("._")[:MAX_TITEL_LAENGE] or "bericht"
+    return f"{nummer:06d}_{sicher}.pdf"
+
+
+def _schreibe_einzelberichte(paket: list, ziel_verzeichnis: str, aktuelles_jahr: int) -> tuple:
+    """
+    Arbeitspaket Einzel-Modus: schreibt jeden Report in eine eigene Datei.
+
+    Returns:
+        Tupel (Anzahl Reports, Anzahl Dateien, Anzahl Seiten)
+    """
+    seiten = 0
+    for nummer, profil in paket:
+        pfad = os.path.join(ziel_verzeichnis, _bericht_dateiname(nummer, profil))
+        doc = erstelle_dokument(pfad)
+        doc.build(erstelle_report_elemente(erstelle_report_daten(profil, aktuelles_jahr)))
+        seiten += doc.page
+    return len(paket), len(paket), seiten
+
+
+def _schreibe_sammelbericht(paket: list, ziel_verzeichnis: str, aktuelles_jahr: int) -> tuple:
+    """
+    Arbeitspaket Sammel-Modus: schreibt alle Reports des Pakets in eine
+    Datei, mit einem Lesezeichen pro Report.
+
+    Returns:
+        Tupel (Anzahl Reports, Anzahl Dateien, Anzahl Seiten)
+    """
+    elemente = []
+    for nummer, profil in paket:
+        elemente.append(_Lesezeichen(_bericht_titel(nummer, profil), f"bericht_{nummer}"))
+        elemente.extend(erstelle_report_elemente(erstelle_report_daten(profil, aktuelles_jahr)))
+        elemente.append(PageBreak())
+    elemente.pop()  # Kein Seitenumbruch nach dem letzten Report
+
+    erste_nummer = paket[0][0]
+    pfad = os.path.join(ziel_verzeichnis, f"sammelbericht_{erste_nummer:06d}.pdf")
+    doc = erstelle_dokument(pfad)
+    doc.build(elemente)
+    return len(paket), 1, doc.page
+
+
+def _gepruefte_profile(profile, fehler: list):
+    """
+    Prüft und normalisiert die Profile einzeln beim Lesen.
+
+    Ungültige Profile werden mit ihrer Nummer in fehler eingetragen und
+    übersprungen; die Nummern der übrigen bleiben erhalten.
+    """
+    for nummer, profil in enumerate(profile, start=1):
+        if not isinstance(profil, dict):
+            fehler.append({"nummer": nummer, "titel": None, "meldungen": ["Eintrag ist kein Objekt"]})
+            continue
+        # Steuerklasse ist im Report optional (Standard 1)
+        normalisiert, profil_fehler = pruefe_eintrag({"steuerklasse": 1, **profil}, BERICHT_FELDER)
+        if profil_fehler:
+            fehler.append({
+                "nummer": nummer,
+                "titel": _bericht_titel(nummer, profil),
+                "meldungen": [f["meldung"] for f in profil_fehler],
+            })
+            continue
+        yield nummer, {**profil, **normalisiert}
+
+
+def _pakete(profile, groesse: int, fehler: list):
+    """Teilt die (ggf. sehr lange) Profilfolge in geprüfte, nummerierte Pakete auf."""
+    nummeriert = _gepruefte_profile(profile, fehler)
+    while True:
+        paket = list(islice(nummeriert, groesse))
+        if not paket:
+            return
+        yield paket
+
+
+def erstelle_pdf_reports(
+    profile,
+    ziel_verzeichnis: str,
+    modus: str = MODUS_EINZELN,
+    prozesse: int = None,
+    berichte_pro_sammeldatei: int = BERICHTE_PRO_SAMMELDATEI
+) -> dict:
+    """
+    Erstellt PDF-Reports für viele Beamte und schreibt sie in ein Verzeichnis.
+
+    Args:
+        profile: Iterierbare Folge von Profil-Dictionaries (siehe
+            erstelle_report_daten); wird nur paketweise gelesen
+        ziel_verzeichnis: Ausgabeverzeichnis (wird bei Bedarf angelegt)
+        modus: "einzeln" (eine Datei pro Report) oder "sammel"
+            (Sammel-PDFs mit Lesezeichen)
+        prozesse: Anzahl Worker-Prozesse (Standard: Anzahl CPUs, 1 = ohne Pool)
+        berichte_pro_sammeldatei: Maximale Reports pro Sammel-PDF
+
+    Returns:
+        Dictionary mit Anzahl Reports, Dateien, Seiten, Dauer, Seiten/Sekunde
+        und den übersprungenen (ungültigen) Profilen
+    """
+    if modus == MODUS_EINZELN:
+        arbeit, paketgroesse = _schreibe_einzelberichte, BERICHTE_PRO_PAKET
+    elif modus == MODUS_SAMMEL:
+        arbeit, paketgroesse = _schreibe_sammelbericht, berichte_pro_sammeldatei
+    else:
+        raise ValueError(f"Unbekannter Export-Modus {modus}")
+
+    os.makedirs(ziel_verzeichnis, exist_ok=True)
+    prozesse = prozesse or os.cpu_count() or 1
+    # Stichtag einmal auflösen und an alle Worker weitergeben
+    aktuelles_jahr = get_aktuelles_jahr()
+
+    berichte = dateien = seiten = 0
+    fehler = []
+    start = time.perf_counter()
+
+    if prozesse == 1:
+        for paket in _pakete(profile, paketgroesse, fehler):
+            b, d, s = arbeit(paket, ziel_verzeichnis, aktuelles_jahr)
+            berichte, dateien, seiten = berichte + b, dateien + d, seiten + s
+    else:
+        with ProcessPoolExecutor(max_workers=prozesse) as pool:
+            laufend = set()
+            for paket in _pakete(profile, paketgroesse, fehler):
+                # Nur wenige Pakete gleichzeitig in Arbeit halten
+                if len(laufend) >= 2 * prozesse:
+                    fertig, laufend = wait(laufend, return_when=FIRST_COMPLETED)
+                    for future in fertig:
+                        b, d, s = future.result()
+                        berichte, dateien, seiten = berichte + b, dateien + d, seiten + s
+                laufend.add(pool.submit(arbeit, paket, ziel_verzeichnis, aktuelles_jahr))
+            for future in laufend:
+                b, d, s = future.result()
+                berichte, dateien, seiten = berichte + b, dateien + d, seiten + s
+
+    dauer = time.perf_counter() - start
+
+    return {
+        "berichte": berichte,
+        "dateien": dateien,
+        "seiten": seiten,
+        "dauer_s": round(dauer, 2),
+        "seiten_pro_sekunde": round(seiten / dauer, 1) if dauer > 0 else 0.0,
+        "berichte_pro_sekunde": round(berichte / dauer, 1) if dauer > 0 else 0.0,
+        "fehlerhaft": len(fehler),
+        "fehler": fehler,
+    }
+
+
+def _lese_profile(pfad: str):
+    """Liest Profile zeilenweise aus einer JSON-Lines-Datei ("-" = stdin)."""
+    datei = sys.stdin if pfad == "-" else open(pfad, encoding="utf-8")
+    try:
+        for zeile in datei:
+            if zeile.strip():
+                yield json.loads(zeile)
+    finally:
+        if datei is not sys.stdin:
+            datei.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Massen-Export von PDF-Reports")
+    parser.add_argument("profile", help="JSON-Lines-Datei mit einem Profil pro Zeile (- für stdin)")
+    parser.add_argument("ziel", help="Ausgabeverzeichnis")
+    parser.add_argument("--modus", choices=[MODUS_EINZELN, MODUS_SAMMEL], default=MODUS_EINZELN)
+    parser.add_argument("--prozesse", type=int, default=None)
+    parser.add_argument("--pro-datei", type=int, default=BERICHTE_PRO_SAMMELDATEI,
+                        help="Reports pro Sammel-PDF")
+    args = parser.parse_args()
+
+    statistik = erstelle_pdf_reports(
+        _lese_profile(args.profile),
+        args.ziel,
+        modus=args.modus,
+        prozesse=args.prozesse,
+        berichte_pro_sammeldatei=args.pro_datei
+    )
+    print(
+        f"{statistik['berichte']} Reports, {statistik['dateien']} Dateien, "
+        f"{statistik['seiten']} Seiten in {statistik['dauer_s']:.2f} s "
+        f"({statistik['seiten_pro_sekunde']:.1f} Seiten/s)"
+    )
+    if statistik["fehler"]:
+        pfad = os.path.join(args.ziel, FEHLERBERICHT_DATEI)
+        with open(pfad, "w", encoding="utf-8") as datei:
+            json.dump(statistik["fehler"], datei, ensure_ascii=False, indent=2)
+        print(f"{statistik['fehlerhaft']} Profile übersprungen, siehe {pfad}")
+
+
+if __name__ == "__main__":
+    main()
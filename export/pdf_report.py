@@ -5,7 +5,7 @@ Erstellt professionelle PDF-Reports mit Grafiken
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import cm, mm
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
@@ -13,22 +13,224 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from io import BytesIO
+import os
+from functools import lru_cache
 import datetime
 
-
-def erstelle_pdf_report(daten: dict) -> bytes:
+from export.formatierung import format_euro
+
+
+# Blockgröße für gestreamte Reports
+CHUNK_GROESSE = 64 * 1024
+
+# Eingebettete Diagramme: Breite im PDF, JPEG-Qualität, Anzahl gecachter Bilder
+DIAGRAMM_BREITE = 16 * cm
+DIAGRAMM_JPEG_QUALITAET = 92
+DIAGRAMM_CACHE_GROESSE = 32
+
+# Tabellenvorlagen (von allen Reports geteilt)
+TABELLENSTIL_EINGABE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#3498db")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor("#ecf0f1")),
+    ('GRID', (0, 0), (-1, -1), 1, colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
+])
+
+TABELLENSTIL_GEHALT = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#27ae60")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
+])
+
+TABELLENSTIL_NETTO = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#9b59b6")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
+])
+
+TABELLENSTIL_PENSION = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#f39c12")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
+])
+
+TABELLENSTIL_DU = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#e74c3c")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -2), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
+])
+
+TABELLENSTIL_LUECKE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#c0392b")),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 20),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 20),
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+    ('BOX', (0, 0), (-1, -1), 3, colors.HexColor("#922b21")),
+])
+
+TABELLENSTIL_VERGLEICH = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
+])
+
+
+def erstelle_pdf_report(daten: dict, diagramme: list = None) -> bytes:
     """
     Erstellt einen PDF-Report mit allen Berechnungsergebnissen.
 
     Args:
         daten: Dictionary mit allen Berechnungsdaten
+        diagramme: Optionale Liste von (Titel, Bild-Bytes) für eingebettete Grafiken
 
     Returns:
         PDF als Bytes
     """
     buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
+    schreibe_pdf_report(daten, buffer, diagramme)
+
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+
+    return pdf_bytes
+
+
+def schreibe_pdf_report(daten: dict, ziel, diagramme: list = None) -> int:
+    """
+    Schreibt einen PDF-Report direkt in eine Datei oder ein Datei-Objekt,
+    ohne Zwischenpuffer und ohne zusätzliche Kopie des Dokuments.
+
+    Args:
+        daten: Dictionary mit allen Berechnungsdaten
+        ziel: Dateiname oder beschreibbares Datei-Objekt (z.B. Datei, Socket-Wrapper)
+        diagramme: Optionale Liste von (Titel, Bild-Bytes) für eingebettete Grafiken
+
+    Returns:
+        Anzahl Seiten
+    """
+    doc = erstelle_dokument(ziel)
+    doc.build(erstelle_report_elemente(daten, diagramme))
+    return doc.page
+
+
+def iter_pdf_report(daten: dict, chunk_groesse: int = CHUNK_GROESSE, diagramme: list = None):
+    """
+    Erzeugt einen PDF-Report als Folge von Byte-Blöcken (z.B. für HTTP-Streaming).
+    Die Blöcke sind Sichten auf das fertige Dokument, es wird nichts kopiert.
+
+    Args:
+        daten: Dictionary mit allen Berechnungsdaten
+        chunk_groesse: Größe der Blöcke in Bytes
+        diagramme: Optionale Liste von (Titel, Bild-Bytes) für eingebettete Grafiken
+
+    Yields:
+        memoryview-Blöcke des PDFs
+    """
+    sammler = _BlockSammler()
+    schreibe_pdf_report(daten, sammler, diagramme)
+    for block in sammler.bloecke:
+        ansicht = memoryview(block)
+        for start in range(0, len(ansicht), chunk_groesse):
+            yield ansicht[start:start + chunk_groesse]
+
+
+class _BlockSammler:
+    """Minimales Datei-Objekt, das geschriebene Blöcke ohne Kopie aufbewahrt."""
+
+    name = "<pdf-stream>"
+
+    def __init__(self):
+        self.bloecke = []
+
+    def write(self, daten) -> int:
+        self.bloecke.append(daten)
+        return len(daten)
+
+
+@lru_cache(maxsize=DIAGRAMM_CACHE_GROESSE)
+def lade_diagramm(bild_bytes: bytes) -> tuple:
+    """
+    Bereitet eine Grafik einmalig für die Einbettung vor.
+
+    JPEG-Daten übernimmt ReportLab unverändert in das PDF. Andere Formate
+    (z.B. PNG aus Plotly/kaleido) werden deshalb einmalig auf weißem
+    Hintergrund nach JPEG gewandelt; alle weiteren Reports mit derselben
+    Grafik betten die fertigen Daten ohne erneute Kodierung ein.
+
+    Args:
+        bild_bytes: Bilddaten (PNG, JPEG, ...)
+
+    Returns:
+        Tupel (JPEG-Bytes, Breite in Pixel, Höhe in Pixel)
+    """
+    from PIL import Image as PILImage
+
+    bild = PILImage.open(BytesIO(bild_bytes))
+    if bild.format == "JPEG":
+        return bild_bytes, bild.width, bild.height
+
+    hintergrund = PILImage.new("RGB", bild.size, "white")
+    bild = bild.convert("RGBA")
+    hintergrund.paste(bild, mask=bild.getchannel("A"))
+    ausgabe = BytesIO()
+    hintergrund.save(ausgabe, format="JPEG", quality=DIAGRAMM_JPEG_QUALITAET)
+    return ausgabe.getvalue(), bild.width, bild.height
+
+
+def erstelle_dokument(ziel) -> SimpleDocTemplate:
+    """
+    Erstellt die Dokumentvorlage (A4, 2 cm Ränder) für einen Report.
+
+    Args:
+        ziel: Dateiname oder beschreibbares Datei-Objekt
+
+    Returns:
+        ReportLab-Dokumentvorlage
+    """
+    return SimpleDocTemplate(
+        ziel,
         pagesize=A4,
         rightMargin=2 * cm,
         leftMargin=2 * cm,
@@ -36,55 +238,20 @@ def erstelle_pdf_report(daten: dict) -> bytes:
         bottomMargin=2 * cm
     )
 
-    # Styles
-    styles = getSampleStyleSheet()
 
-    # Custom Styles
-    styles.add(ParagraphStyle(
-        name='TitleCustom',
-        parent=styles['Title'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor=colors.HexColor("#2c3e50")
-    ))
-
-    styles.add(ParagraphStyle(
-        name='Heading1Custom',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=10,
-        textColor=colors.HexColor("#34495e")
-    ))
-
-    styles.add(ParagraphStyle(
-        name='Heading2Custom',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceBefore=15,
-        spaceAfter=8,
-        textColor=colors.HexColor("#34495e")
-    ))
+def erstelle_report_elemente(daten: dict, diagramme: list = None) -> list:
+    """
+    Erstellt die Flowables eines Reports (ohne Dokument).
+    Styles und Tabellenvorlagen werden von allen Reports geteilt.
 
-    styles.add(ParagraphStyle(
-        name='WarningBox',
-        parent=styles['Normal'],
-        fontSize=14,
-        spaceBefore=10,
-        spaceAfter=10,
-        textColor=colors.white,
-        backColor=colors.HexColor("#e74c3c"),
-        borderPadding=10,
-        alignment=TA_CENTER
-    ))
+    Args:
+        daten: Dictionary mit allen Berechnungsdaten
+        diagramme: Optionale Liste von (Titel, Bild-Bytes) für eingebettete Grafiken
 
-    styles.add(ParagraphStyle(
-        name='Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.gray,
-        alignment=TA_CENTER
-    ))
+    Returns:
+        Liste von ReportLab-Flowables
+    """
+    styles = get_report_styles()
 
     # Elemente sammeln
     elements = []
@@ -119,17 +286,7 @@ def erstelle_pdf_report(daten: dict) -> bytes:
     ]
 
     table_eingabe = Table(eingabe_daten, colWidths=[8 * cm, 6 * cm])
-    table_eingabe.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#3498db")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor("#ecf0f1")),
-        ('GRID', (0, 0), (-1, -1), 1, colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
-    ]))
+    table_eingabe.setStyle(TABELLENSTIL_EINGABE)
     elements.append(table_eingabe)
     elements.append(Spacer(1, 20))
 
@@ -150,18 +307,7 @@ def erstelle_pdf_report(daten: dict) -> bytes:
     ]
 
     table_gehalt = Table(gehalt_daten, colWidths=[8 * cm, 6 * cm])
-    table_gehalt.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#27ae60")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
-    ]))
+    table_gehalt.setStyle(TABELLENSTIL_GEHALT)
     elements.append(table_gehalt)
     elements.append(Spacer(1, 10))
 
@@ -177,18 +323,7 @@ def erstelle_pdf_report(daten: dict) -> bytes:
     ]
 
     table_netto = Table(netto_daten, colWidths=[8 * cm, 6 * cm])
-    table_netto.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#9b59b6")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
-    ]))
+    table_netto.setStyle(TABELLENSTIL_NETTO)
     elements.append(table_netto)
     elements.append(Spacer(1, 20))
 
@@ -210,18 +345,7 @@ def erstelle_pdf_report(daten: dict) -> bytes:
     ]
 
     table_pension = Table(pension_daten, colWidths=[8 * cm, 6 * cm])
-    table_pension.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#f39c12")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
-    ]))
+    table_pension.setStyle(TABELLENSTIL_PENSION)
     elements.append(table_pension)
     elements.append(Spacer(1, 20))
 
@@ -246,18 +370,7 @@ def erstelle_pdf_report(daten: dict) -> bytes:
     ]
 
     table_du = Table(du_daten, colWidths=[8 * cm, 6 * cm])
-    table_du.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#e74c3c")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -2), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
-    ]))
+    table_du.setStyle(TABELLENSTIL_DU)
     elements.append(table_du)
     elements.append(Spacer(1, 30))
 
@@ -276,26 +389,10 @@ def erstelle_pdf_report(daten: dict) -> bytes:
         Das sind <b>{format_euro(versorgungsluecke * 12)}</b> pro Jahr!
         """
 
-        luecke_daten = [[Paragraph(luecke_text, ParagraphStyle(
-            name='LueckeText',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.white,
-            alignment=TA_CENTER,
-            leading=18
-        ))]]
+        luecke_daten = [[Paragraph(luecke_text, styles['LueckeText'])]]
 
         table_luecke = Table(luecke_daten, colWidths=[14 * cm])
-        table_luecke.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#c0392b")),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 20),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 20),
-            ('TOPPADDING', (0, 0), (-1, -1), 20),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-            ('BOX', (0, 0), (-1, -1), 3, colors.HexColor("#922b21")),
-        ]))
+        table_luecke.setStyle(TABELLENSTIL_LUECKE)
         elements.append(table_luecke)
     else:
         elements.append(Paragraph(
@@ -317,20 +414,24 @@ def erstelle_pdf_report(daten: dict) -> bytes:
     ]
 
     table_vergleich = Table(vergleich_daten, colWidths=[5 * cm, 4 * cm, 5 * cm])
-    table_vergleich.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.white),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor("#ecf0f1"), colors.white]),
-    ]))
+    table_vergleich.setStyle(TABELLENSTIL_VERGLEICH)
     elements.append(table_vergleich)
     elements.append(Spacer(1, 30))
 
+    # 7. Diagramme (optional)
+    if diagramme:
+        elements.append(Paragraph("7. Diagramme", styles['Heading1Custom']))
+        for titel, bild_bytes in diagramme:
+            jpeg_bytes, breite, hoehe = lade_diagramm(bild_bytes)
+            elements.append(Paragraph(titel, styles['Heading2Custom']))
+            elements.append(Image(
+                BytesIO(jpeg_bytes),
+                width=DIAGRAMM_BREITE,
+                height=DIAGRAMM_BREITE * hoehe / breite
+            ))
+            elements.append(Spacer(1, 10))
+        elements.append(Spacer(1, 20))
+
     # Footer
     elements.append(HRFlowable(width="100%", thickness=1, color=colors.gray))
     elements.append(Spacer(1, 10))
@@ -340,15 +441,103 @@ def erstelle_pdf_report(daten: dict) -> bytes:
         styles['Footer']
     ))
 
-    # PDF erstellen
-    doc.build(elements)
+    return elements
 
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
 
-    return pdf_bytes
+@lru_cache(maxsize=None)
+def get_report_styles() -> StyleSheet1:
+    """
+    Gibt das (einmalig aufgebaute) Stylesheet für alle Reports zurück.
+    """
+    styles = getSampleStyleSheet()
+
+    # Custom Styles
+    styles.add(ParagraphStyle(
+        name='TitleCustom',
+        parent=styles['Title'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.HexColor("#2c3e50")
+    ))
+
+    styles.add(ParagraphStyle(
+        name='Heading1Custom',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor=colors.HexColor("#34495e")
+    ))
+
+    styles.add(ParagraphStyle(
+        name='Heading2Custom',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceBefore=15,
+        spaceAfter=8,
+        textColor=colors.HexColor("#34495e")
+    ))
+
+    styles.add(ParagraphStyle(
+        name='WarningBox',
+        parent=styles['Normal'],
+        fontSize=14,
+        spaceBefore=10,
+        spaceAfter=10,
+        textColor=colors.white,
+        backColor=colors.HexColor("#e74c3c"),
+        borderPadding=10,
+        alignment=TA_CENTER
+    ))
+
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.gray,
+        alignment=TA_CENTER
+    ))
+
+    styles.add(ParagraphStyle(
+        name='LueckeText',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.white,
+        alignment=TA_CENTER,
+        leading=18
+    ))
+
+    return styles
+
+
+def main():
+    import argparse
+    import json
+    import sys
+
+    from export.pdf_bulk import erstelle_report_daten
+
+    parser = argparse.ArgumentParser(description="PDF-Report für ein Beamtenprofil erstellen")
+    parser.add_argument("profil", help="JSON-Datei mit dem Profil")
+    parser.add_argument("ziel", help="Ausgabedatei (- für stdout)")
+    parser.add_argument("--diagramm", action="append", default=[],
+                        help="Bilddatei, die als Diagramm eingebettet wird (mehrfach möglich)")
+    args = parser.parse_args()
+
+    with open(args.profil, encoding="utf-8") as datei:
+        daten = erstelle_report_daten(json.load(datei))
+
+    diagramme = []
+    for pfad in args.diagramm:
+        with open(pfad, "rb") as datei:
+            diagramme.append((os.path.splitext(os.path.basename(pfad))[0], datei.read()))
+
+    if args.ziel == "-":
+        for block in iter_pdf_report(daten, diagramme=diagramme):
+            sys.stdout.buffer.write(block)
+    else:
+        schreibe_pdf_report(daten, args.ziel, diagramme)
 
 
-def format_euro(betrag: float) -> str:
-    """Formatiert einen Betrag als Euro-String im deutschen Format."""
-    return f"{betrag:,.2f} €".replace(",", "X").replace(".", ",").replace("X", ".")
+if __name__ == "__main__":
+    main()
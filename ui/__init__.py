@@ -0,0 +1 @@
+# UI modules for Beamtenrechner NRW
@@ -0,0 +1,127 @@
+"""
+Datenfluss-Graph für den Beamtenpensions-Rechner NRW
+Deklariert Berechnungen als Knoten, deren Parameter-Namen ihre Eingaben
+sind: entweder Werte aus der Sidebar oder Ergebnisse anderer Knoten.
+
+Bei jedem Streamlit-Durchlauf wird ein Knoten nur dann neu berechnet, wenn
+sich mindestens einer seiner Eingabewerte gegenüber dem letzten Durchlauf
+geändert hat; sonst wird das Ergebnis aus dem Speicher (st.session_state)
+übernommen. Knoten werden erst bei Zugriff ausgewertet.
+
+Optional wird ein persistenter Cache (calculator/ergebniscache.py) zwischen
+Sitzungsspeicher und Berechnung geschaltet; gleiche Profile aus anderen
+Sitzungen oder vor einem Neustart werden dann ohne Neuberechnung geliefert.
+
+Beispiel:
+    graph = Datenfluss()
+
+    @graph.knoten
+    def netto_daten(gehalt, steuerklasse):
+        return berechne_netto(gehalt["brutto"], steuerklasse)
+
+    lauf = graph.lauf(eingaben, st.session_state)
+    netto = lauf["netto_daten"]
+"""
+
+import inspect
+
+
+# Schlüssel im Speicher (st.session_state) für die Knotenergebnisse
+SPEICHER_SCHLUESSEL = "_datenfluss"
+
+
+class Datenfluss:
+    """
+    Menge von Berechnungsknoten und deren Abhängigkeiten.
+
+    Args:
+        persistenter_cache: Optionaler ErgebnisCache für alle Knoten
+    """
+
+    def __init__(self, persistenter_cache=None):
+        self._knoten = {}
+        self.persistenter_cache = persistenter_cache
+
+    def knoten(self, funktion):
+        """
+        Registriert eine Funktion als Knoten (als Dekorator verwendbar).
+
+        Der Funktionsname ist der Knotenname, die Parameter-Namen sind die
+        Eingaben des Knotens.
+        """
+        parameter = tuple(inspect.signature(funktion).parameters)
+        self._knoten[funktion.__name__] = (funktion, parameter)
+        return funktion
+
+    def get_abhaengigkeiten(self) -> dict:
+        """
+        Gibt die Eingaben aller Knoten zurück.
+
+        Returns:
+            Dictionary Knotenname -> Tuple der Eingabenamen
+        """
+        return {name: parameter for name, (_, parameter) in self._knoten.items()}
+
+    def lauf(self, eingaben: dict, speicher, schluessel: str = SPEICHER_SCHLUESSEL) -> "Lauf":
+        """
+        Startet einen Auswertungsdurchlauf.
+
+        Args:
+            eingaben: Aktuelle Eingabewerte (Name -> Wert)
+            speicher: Dict-artiger Speicher, der Durchläufe überdauert
+                (z.B. st.session_state)
+            schluessel: Schlüssel der Knotenergebnisse im Speicher
+
+        Returns:
+            Lauf, über den die Knotenergebnisse abgefragt werden
+        """
+        if schluessel not in speicher:
+            speicher[schluessel] = {}
+        return Lauf(self, eingaben, speicher[schluessel])
+
+
+class Lauf:
+    """
+    Ein Auswertungsdurchlauf: wertet Knoten bei Zugriff aus und merkt sich,
+    welche Knoten neu berechnet und welche wiederverwendet wurden.
+    """
+
+    def __init__(self, graph: Datenfluss, eingaben: dict, ergebnisse: dict):
+        self._graph = graph
+        self._eingaben = eingaben
+        # Knotenname -> (Eingabewerte, Ergebnis) aus früheren Durchläufen
+        self._ergebnisse = ergebnisse
+        self._werte = {}
+        self.neu_berechnet = []
+        self.wiederverwendet = []
+        self.aus_cache = []
+
+    def __getitem__(self, name: str):
+        if name in self._eingaben:
+            return self._eingaben[name]
+        if name in self._werte:
+            return self._werte[name]
+
+        if name not in self._graph._knoten:
+            raise ValueError(f"Knoten {name} nicht gefunden")
+        funktion, parameter = self._graph._knoten[name]
+        argumente = {p: self[p] for p in parameter}
+
+        gespeichert = self._ergebnisse.get(name)
+        if gespeichert is not None and gespeichert[0] == argumente:
+            wert = gespeichert[1]
+            self.wiederverwendet.append(name)
+        else:
+            cache = self._graph.persistenter_cache
+            gefunden, wert = cache.get(name, argumente) if cache is not None else (False, None)
+            if gefunden:
+                self.aus_cache.append(name)
+            else:
+                wert = funktion(**argumente)
+                if cache is not None:
+                    cache.set(name, argumente, wert)
+                self.neu_berechnet.append(name)
+            self._ergebnisse[name] = (argumente, wert)
+
+        self._werte[name] = wert
+        return wert
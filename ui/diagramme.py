@@ -0,0 +1,205 @@
+"""
+Plotly-Diagramme für den Beamtenpensions-Rechner NRW
+Baut alle Figuren der App aus wiederverwendbaren Layout-Vorlagen.
+
+Die Werte werden als kompakte numerische Arrays übertragen; die
+Beschriftung im deutschen Euro-Format übernimmt Plotly im Browser
+(texttemplate + separators), statt pro Balken vorformatierte Strings
+mitzuschicken. Gleiche Eingaben liefern dieselbe (gecachte) Figur.
+Die zurückgegebenen Figuren werden geteilt und dürfen nicht verändert werden.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+# Farben
+FARBE_BRUTTO = "#2e7d32"
+FARBE_NETTO = "#2e7d32"
+FARBE_GRAU = "#757575"
+FARBE_DU = "#c62828"
+FARBE_PENSION = "#f57c00"
+FARBE_LUECKE = "#c62828"
+
+# Euro-Beschriftung im Browser: "1.234,56 €"
+EURO_TEMPLATE = "%{y:,.2f} €"
+
+# Dezimal- und Tausendertrennzeichen für das deutsche Zahlenformat
+DEUTSCHE_TRENNZEICHEN = ",."
+
+# Maximale Anzahl gecachter Figuren pro Diagrammtyp
+CACHE_GROESSE = 32
+
+
+@lru_cache(maxsize=None)
+def _layout_vorlage(
+    hoehe: int,
+    rand_oben: int = 30,
+    rand_unten: int = 20,
+    x_titel: str = None,
+    legende: bool = False,
+    gestapelt: bool = False
+) -> go.Layout:
+    """
+    Gibt die (gecachte) Layout-Vorlage für ein Diagramm zurück.
+
+    Args:
+        hoehe: Höhe in Pixeln
+        rand_oben: Oberer Rand in Pixeln
+        rand_unten: Unterer Rand in Pixeln
+        x_titel: Titel der x-Achse (optional)
+        legende: True für horizontale Legende oberhalb
+        gestapelt: True für gestapelte Balken
+
+    Returns:
+        Plotly-Layout
+    """
+    layout = dict(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=20, r=20, t=rand_oben, b=rand_unten),
+        height=hoehe,
+        separators=DEUTSCHE_TRENNZEICHEN,
+        yaxis=dict(showgrid=True, gridwidth=1),
+        xaxis=dict(showgrid=False, title=x_titel),
+        showlegend=legende
+    )
+    if legende:
+        layout["legend"] = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    if gestapelt:
+        layout["barmode"] = "stack"
+    return go.Layout(layout)
+
+
+def _balken(x, y, farbe, schriftgroesse: int, name: str = None) -> go.Bar:
+    """Balken-Trace mit clientseitiger Euro-Beschriftung."""
+    return go.Bar(
+        name=name,
+        x=list(x),
+        y=np.asarray(y, dtype=float),
+        marker_color=farbe if isinstance(farbe, str) else list(farbe),
+        texttemplate=EURO_TEMPLATE,
+        textposition="inside",
+        textfont=dict(color="white", size=schriftgroesse)
+    )
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_versorgungsluecke(brutto: float, du_rente: float) -> go.Figure:
+    """Balkendiagramm Brutto vs. DU-Rente."""
+    return go.Figure(
+        data=[_balken(["Brutto", "DU-Rente"], [brutto, du_rente], (FARBE_BRUTTO, FARBE_DU), 11)],
+        layout=_layout_vorlage(200)
+    )
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_du_szenarien(labels: tuple, du_werte: tuple, luecke_werte: tuple) -> go.Figure:
+    """Gestapelte Balken DU-Rente + Lücke für mehrere DU-Zeitpunkte."""
+    return go.Figure(
+        data=[
+            _balken(labels, du_werte, FARBE_BRUTTO, 9, name="DU-Rente"),
+            _balken(labels, luecke_werte, FARBE_LUECKE, 9, name="Lücke"),
+        ],
+        layout=_layout_vorlage(220, rand_unten=30, x_titel="DU-Szenario", legende=True, gestapelt=True)
+    )
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_pensionsluecke(brutto: float, pension: float) -> go.Figure:
+    """Balkendiagramm Brutto vs. Pension."""
+    return go.Figure(
+        data=[_balken(["Brutto", "Pension"], [brutto, pension], (FARBE_BRUTTO, FARBE_PENSION), 11)],
+        layout=_layout_vorlage(200)
+    )
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_pensionsluecke_verlauf(labels: tuple, pension_werte: tuple, luecke_werte: tuple) -> go.Figure:
+    """Gestapelte Balken Pension + Lücke nach Pensionsalter."""
+    return go.Figure(
+        data=[
+            _balken(labels, pension_werte, FARBE_PENSION, 9, name="Pension"),
+            _balken(labels, luecke_werte, FARBE_LUECKE, 9, name="Lücke"),
+        ],
+        layout=_layout_vorlage(220, rand_unten=30, x_titel="Pensionsalter", legende=True, gestapelt=True)
+    )
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_pensionsentwicklung(alter: tuple, pension_werte: tuple, abschlaege: tuple) -> go.Figure:
+    """Balken der Pension nach Alter, rot mit Abschlag, grün ohne."""
+    farben = tuple(FARBE_DU if a > 0 else FARBE_BRUTTO for a in abschlaege)
+    return go.Figure(
+        data=[_balken(alter, pension_werte, farben, 9)],
+        layout=_layout_vorlage(250, rand_oben=10, rand_unten=30, x_titel="Pensionsalter")
+    )
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_vergleich(brutto: float, netto: float, du_rente: float, pension: float) -> go.Figure:
+    """Vergleich Brutto, Netto, DU-Rente und Altersrente."""
+    return go.Figure(
+        data=[_balken(
+            ["Brutto", "Netto", "DU-Rente", "Altersrente"],
+            [brutto, netto, du_rente, pension],
+            (FARBE_GRAU, FARBE_NETTO, FARBE_DU, FARBE_PENSION),
+            11
+        )],
+        layout=_layout_vorlage(280, rand_oben=20, rand_unten=30)
+    )
+
+
+def diagramm_kennfeld(werte, spalten: tuple, zeilen: tuple, zeilen_titel: str) -> go.Figure:
+    """
+    Heatmap eines Kennfelds (Zeilen × Arbeitszeit-Faktor).
+
+    Args:
+        werte: 2-D-Array der Monatsbeträge
+        spalten: Arbeitszeit-Faktoren
+        zeilen: Pensionsalter bzw. DU-Jahre
+        zeilen_titel: Titel der y-Achse
+    """
+    fig = go.Figure(
+        data=[go.Heatmap(
+            z=np.asarray(werte, dtype=float),
+            x=[f"{f * 100:.0f}%" for f in spalten],
+            y=list(zeilen),
+            colorscale="RdYlGn",
+            hovertemplate="Arbeitszeit %{x}<br>" + zeilen_titel + " %{y}<br>%{z:,.2f} €<extra></extra>",
+            colorbar=dict(title="€/Monat")
+        )],
+        layout=_layout_vorlage(420, rand_oben=20, rand_unten=30, x_titel="Arbeitszeit-Faktor")
+    )
+    fig.update_yaxes(title=zeilen_titel, autorange="reversed" if zeilen_titel == "DU-Jahr" else True)
+    return fig
+
+
+@lru_cache(maxsize=CACHE_GROESSE)
+def diagramm_befoerderungsjahr(stationen: tuple, jahre: tuple, werte: tuple, titel: str) -> go.Figure:
+    """
+    Linien des besten erreichbaren Zielwerts je Beförderungsjahr.
+
+    Args:
+        stationen: Beförderungsämter (eine Linie pro Amt)
+        jahre: Pro Amt die möglichen Beförderungsjahre
+        werte: Pro Amt der beste Zielwert je Beförderungsjahr
+        titel: Titel der y-Achse
+    """
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                name=amt,
+                x=list(x),
+                y=np.asarray(y, dtype=float),
+                mode="lines+markers",
+                hovertemplate=amt + " ab %{x}<br>%{y:,.2f} €<extra></extra>"
+            )
+            for amt, x, y in zip(stationen, jahre, werte)
+        ],
+        layout=_layout_vorlage(260, rand_oben=20, rand_unten=30, x_titel="Beförderungsjahr", legende=True)
+    )
+    fig.update_yaxes(title=titel)
+    return fig
@@ -0,0 +1,181 @@
+"""
+Berechnungsgraph der Streamlit-App
+Jeder Knoten ist eine Berechnung der App; die Parameter-Namen entsprechen
+den Sidebar-Eingaben bzw. anderen Knoten (siehe ui/datenfluss.py).
+
+So wirkt z.B. eine Änderung von kirchensteuer oder pkv_beitrag nur auf
+netto_daten, eine Änderung von du_szenario_jahr nur auf du_rente.
+"""
+
+from calculator.gehalt import berechne_bruttogehalt
+from calculator.steuer import berechne_netto
+from calculator.pension import berechne_ruhegehalt, berechne_pension_nach_alter
+from calculator.dienstunfaehigkeit import berechne_du_rente
+from calculator.ergebniscache import get_standard_cache
+from ui.datenfluss import Datenfluss
+
+
+# Jahre ab heute für den DU-Szenarien-Vergleich
+DU_SZENARIO_OFFSETS = (0, 5, 10, 15, 20)
+
+# Persistenter Cache nur, wenn BEAMTENRECHNER_CACHE gesetzt ist
+RECHENGRAPH = Datenfluss(persistenter_cache=get_standard_cache())
+
+
+@RECHENGRAPH.knoten
+def gehalt(besoldungsgruppe, stufe, verheiratet, anzahl_kinder, mietenstufe, arbeitszeit_faktor):
+    """Aktuelles Bruttogehalt."""
+    return berechne_bruttogehalt(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        verheiratet=verheiratet,
+        anzahl_kinder=anzahl_kinder,
+        mietenstufe=mietenstufe,
+        arbeitszeit_faktor=arbeitszeit_faktor
+    )
+
+
+@RECHENGRAPH.knoten
+def netto_daten(gehalt, steuerklasse, kirchensteuer, pkv_beitrag):
+    """Aktuelles Netto."""
+    return berechne_netto(
+        brutto_monatlich=gehalt["brutto"],
+        steuerklasse=steuerklasse,
+        kirchensteuer=kirchensteuer,
+        pkv_beitrag=pkv_beitrag
+    )
+
+
+@RECHENGRAPH.knoten
+def pension(besoldungsgruppe, stufe, geburtsjahr, jahr_verbeamtung, gewuenschtes_pensionsalter,
+            verheiratet, mietenstufe, teilzeitjahre, teilzeitanteil, arbeitszeit_faktor,
+            ist_polizei_feuerwehr, aktuelles_jahr):
+    """Ruhegehalt zum gewünschten Pensionsalter."""
+    return berechne_ruhegehalt(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_pension=geburtsjahr + gewuenschtes_pensionsalter,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+        aktuelles_jahr=aktuelles_jahr
+    )
+
+
+@RECHENGRAPH.knoten
+def du_rente(besoldungsgruppe, stufe, geburtsjahr, jahr_verbeamtung, du_szenario_jahr,
+             verheiratet, mietenstufe, teilzeitjahre, teilzeitanteil, arbeitszeit_faktor,
+             ist_polizei_feuerwehr):
+    """DU-Rente im gewählten DU-Szenario-Jahr."""
+    return berechne_du_rente(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        jahr_du=du_szenario_jahr,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr
+    )
+
+
+@RECHENGRAPH.knoten
+def du_szenarien(gehalt, besoldungsgruppe, stufe, geburtsjahr, jahr_verbeamtung, verheiratet,
+                 mietenstufe, teilzeitjahre, teilzeitanteil, arbeitszeit_faktor,
+                 ist_polizei_feuerwehr, aktuelles_jahr, regelaltersgrenze):
+    """DU-Rente und Lücke bei DU heute und in 5/10/15/20 Jahren."""
+    aktuelles_alter = aktuelles_jahr - geburtsjahr
+    szenarien = []
+    for jahre_offset in DU_SZENARIO_OFFSETS:
+        if aktuelles_alter + jahre_offset < regelaltersgrenze:
+            szenario_jahr = aktuelles_jahr + jahre_offset
+            szenario_du = berechne_du_rente(
+                besoldungsgruppe=besoldungsgruppe,
+                stufe=stufe,
+                geburtsjahr=geburtsjahr,
+                jahr_verbeamtung=jahr_verbeamtung,
+                jahr_du=szenario_jahr,
+                verheiratet=verheiratet,
+                mietenstufe=mietenstufe,
+                teilzeitjahre=teilzeitjahre,
+                teilzeitanteil=teilzeitanteil,
+                arbeitszeit_faktor=arbeitszeit_faktor,
+                ist_polizei_feuerwehr=ist_polizei_feuerwehr
+            )
+            szenarien.append({
+                "jahre": jahre_offset,
+                "jahr": szenario_jahr,
+                "alter": aktuelles_alter + jahre_offset,
+                "du_rente": szenario_du['du_rente_brutto'],
+                "hat_anspruch": szenario_du.get('hat_anspruch', True),
+                "luecke": gehalt['brutto'] - szenario_du['du_rente_brutto'] if szenario_du.get('hat_anspruch', True) else gehalt['brutto'],
+                "jahre_bis_pension": regelaltersgrenze - (aktuelles_alter + jahre_offset)
+            })
+    return szenarien
+
+
+@RECHENGRAPH.knoten
+def pension_szenarien(gehalt, besoldungsgruppe, stufe, geburtsjahr, jahr_verbeamtung, verheiratet,
+                      mietenstufe, teilzeitjahre, teilzeitanteil, arbeitszeit_faktor,
+                      ist_polizei_feuerwehr, lebenserwartung, aktuelles_jahr):
+    """Pension und Lücke für jedes mögliche Pensionsalter."""
+    pension_szenarien = []
+    von_alter = 55 if ist_polizei_feuerwehr else 63
+    bis_alter = 60 if ist_polizei_feuerwehr else 67
+
+    for alter in range(von_alter, bis_alter + 1):
+        p = berechne_ruhegehalt(
+            besoldungsgruppe=besoldungsgruppe,
+            stufe=stufe,
+            geburtsjahr=geburtsjahr,
+            jahr_verbeamtung=jahr_verbeamtung,
+            jahr_pension=geburtsjahr + alter,
+            verheiratet=verheiratet,
+            mietenstufe=mietenstufe,
+            teilzeitjahre=teilzeitjahre,
+            teilzeitanteil=teilzeitanteil,
+            arbeitszeit_faktor=arbeitszeit_faktor,
+            ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+            aktuelles_jahr=aktuelles_jahr
+        )
+        luecke_p = gehalt['brutto'] - p['ruhegehalt_brutto']
+        jahre_pension_p = max(0, lebenserwartung - alter)
+        pension_szenarien.append({
+            "alter": alter,
+            "pension": p['ruhegehalt_brutto'],
+            "abschlag": p['versorgungsabschlag_prozent'],
+            "luecke": luecke_p,
+            "gesamtluecke": luecke_p * 12 * jahre_pension_p if luecke_p > 0 else 0
+        })
+    return pension_szenarien
+
+
+@RECHENGRAPH.knoten
+def pension_verlauf(besoldungsgruppe, stufe, geburtsjahr, jahr_verbeamtung, verheiratet,
+                    mietenstufe, teilzeitjahre, teilzeitanteil, arbeitszeit_faktor,
+                    ist_polizei_feuerwehr, aktuelles_jahr):
+    """Pensionsentwicklung nach Alter (ab Antragsaltersgrenze bis 67)."""
+    # Antragsaltersgrenze: 63 für normale Beamte, 55 für Polizei/FW (Übersicht)
+    return berechne_pension_nach_alter(
+        besoldungsgruppe=besoldungsgruppe,
+        stufe=stufe,
+        geburtsjahr=geburtsjahr,
+        jahr_verbeamtung=jahr_verbeamtung,
+        verheiratet=verheiratet,
+        mietenstufe=mietenstufe,
+        teilzeitjahre=teilzeitjahre,
+        teilzeitanteil=teilzeitanteil,
+        arbeitszeit_faktor=arbeitszeit_faktor,
+        ist_polizei_feuerwehr=ist_polizei_feuerwehr,
+        von_alter=55 if ist_polizei_feuerwehr else 63,
+        bis_alter=67,
+        aktuelles_jahr=aktuelles_jahr
+    )